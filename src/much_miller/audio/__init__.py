@@ -0,0 +1 @@
+"""Audio capture module for Much Miller."""
@@ -0,0 +1,7 @@
+"""Audio adapters (concrete implementations)."""
+
+from much_miller.audio.adapters.array_frame_source import ArrayFrameSource
+from much_miller.audio.adapters.pyaudio_frame_source import PyAudioFrameSource
+from much_miller.audio.adapters.resampling_frame_source import ResamplingFrameSource
+
+__all__ = ["ArrayFrameSource", "PyAudioFrameSource", "ResamplingFrameSource"]
@@ -0,0 +1,61 @@
+"""Frame source that replays audio held in memory."""
+
+import time
+
+import numpy as np
+
+from much_miller.audio.ports import FrameSourcePort
+
+
+class ArrayFrameSource(FrameSourcePort):
+    """Replays an int16 sample array as fixed-size frames.
+
+    Used for tests and offline replay. The final partial frame is padded
+    with silence. With realtime=True each read sleeps for the frame's
+    duration, which imitates a microphone.
+    """
+
+    def __init__(
+        self,
+        samples: np.ndarray,
+        sample_rate: int = 16000,
+        frame_size: int = 1280,
+        realtime: bool = False,
+    ) -> None:
+        self._samples = np.asarray(samples, dtype=np.int16)
+        self._sample_rate = sample_rate
+        self._frame_size = frame_size
+        self._realtime = realtime
+        self._offset = 0
+        self._closed = False
+
+    @property
+    def sample_rate(self) -> int:
+        """Return the sample rate of the frames in Hz."""
+        return self._sample_rate
+
+    @property
+    def frame_size(self) -> int:
+        """Return the number of samples in each frame."""
+        return self._frame_size
+
+    def start(self) -> None:
+        """Rewind to the start of the samples."""
+        self._offset = 0
+        self._closed = False
+
+    def read_frame(self) -> np.ndarray | None:
+        """Return the next frame, or None when the samples run out."""
+        if self._closed or self._offset >= len(self._samples):
+            return None
+        frame = self._samples[self._offset:self._offset + self._frame_size]
+        self._offset += self._frame_size
+        if len(frame) < self._frame_size:
+            frame = np.pad(frame, (0, self._frame_size - len(frame)))
+        if self._realtime:
+            time.sleep(self._frame_size / self._sample_rate)
+        return frame
+
+    def close(self) -> None:
+        """Stop returning frames."""
+        self._closed = True
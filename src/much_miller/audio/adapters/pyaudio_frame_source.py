@@ -0,0 +1,108 @@
+"""Frame source adapter using PyAudio."""
+
+import queue
+from typing import Any
+
+import numpy as np
+
+from much_miller.audio.ports import FrameSourcePort
+
+_PA_CONTINUE = 0  # pyaudio.paContinue
+_PA_INPUT_OVERFLOW = 2  # pyaudio.paInputOverflow
+
+
+class PyAudioFrameSource(FrameSourcePort):
+    """Captures frames from a microphone through a single PyAudio stream.
+
+    The stream runs in callback mode: PortAudio's thread only copies each
+    frame into a bounded queue, so slow consumers never block capture.
+    Overflows reported by the driver and frames dropped because the queue
+    was full are counted.
+    """
+
+    def __init__(
+        self,
+        device_index: int | None = None,
+        sample_rate: int = 16000,
+        frame_size: int = 1280,
+        max_queued_frames: int = 32,
+    ) -> None:
+        self._device_index = device_index
+        self._sample_rate = sample_rate
+        self._frame_size = frame_size
+        self._frames: queue.Queue[np.ndarray | None] = queue.Queue(maxsize=max_queued_frames)
+        self._overflows = 0
+        self._dropped = 0
+        self._audio: Any = None
+        self._stream: Any = None
+
+    @property
+    def sample_rate(self) -> int:
+        """Return the sample rate of the frames in Hz."""
+        return self._sample_rate
+
+    @property
+    def frame_size(self) -> int:
+        """Return the number of samples in each frame."""
+        return self._frame_size
+
+    @property
+    def overflows(self) -> int:
+        """Return the number of input overflows reported by the driver."""
+        return self._overflows
+
+    @property
+    def dropped(self) -> int:
+        """Return the number of frames dropped because nobody read them."""
+        return self._dropped
+
+    def start(self) -> None:
+        """Open the input stream."""
+        import pyaudio
+
+        self._audio = pyaudio.PyAudio()
+        self._stream = self._audio.open(
+            format=pyaudio.paInt16,
+            channels=1,
+            rate=self._sample_rate,
+            input=True,
+            input_device_index=self._device_index,
+            frames_per_buffer=self._frame_size,
+            stream_callback=self._on_audio,
+        )
+
+    def read_frame(self) -> np.ndarray | None:
+        """Block until the next frame has been captured."""
+        if self._stream is None and self._frames.empty():
+            return None
+        return self._frames.get()
+
+    def close(self) -> None:
+        """Close the input stream."""
+        if self._stream is not None:
+            self._stream.stop_stream()
+            self._stream.close()
+            self._stream = None
+        if self._audio is not None:
+            self._audio.terminate()
+            self._audio = None
+        try:
+            self._frames.put_nowait(None)
+        except queue.Full:
+            pass
+
+    def _on_audio(
+        self,
+        in_data: bytes | None,
+        frame_count: int,
+        time_info: Any,
+        status_flags: int,
+    ) -> tuple[None, int]:
+        if status_flags & _PA_INPUT_OVERFLOW:
+            self._overflows += 1
+        if in_data is not None:
+            try:
+                self._frames.put_nowait(np.frombuffer(in_data, dtype=np.int16))
+            except queue.Full:
+                self._dropped += 1
+        return None, _PA_CONTINUE
@@ -0,0 +1,78 @@
+"""Frame source that resamples another source's frames."""
+
+import numpy as np
+
+from much_miller.audio.ports import FrameSourcePort
+from much_miller.audio.resampler import Resampler
+
+
+class ResamplingFrameSource(FrameSourcePort):
+    """Delivers another frame source's audio at a different sample rate.
+
+    Lets the microphone be opened at its native rate (often 44.1 or
+    48 kHz) instead of asking the driver to resample, and converts once,
+    in the reading thread, to the rate every consumer expects. The
+    wrapped source's frame size must resample to a whole frame.
+    """
+
+    def __init__(self, source: FrameSourcePort, sample_rate: int = 16000) -> None:
+        """Initialize the adapter.
+
+        Args:
+            source: Source capturing at its native rate
+            sample_rate: Rate of the frames delivered
+
+        Raises:
+            ValueError: If the source's frames don't resample to whole frames
+        """
+        frame_size, remainder = divmod(source.frame_size * sample_rate, source.sample_rate)
+        if remainder:
+            raise ValueError(
+                f"{source.frame_size} samples at {source.sample_rate} Hz is not a whole "
+                f"number of samples at {sample_rate} Hz"
+            )
+        self._source = source
+        self._sample_rate = sample_rate
+        self._frame_size = frame_size
+        self._resampler = Resampler(source.sample_rate, sample_rate)
+
+    @property
+    def sample_rate(self) -> int:
+        """Return the sample rate of the frames in Hz."""
+        return self._sample_rate
+
+    @property
+    def frame_size(self) -> int:
+        """Return the number of samples in each frame."""
+        return self._frame_size
+
+    @property
+    def native_rate(self) -> int:
+        """Return the rate the wrapped source captures at."""
+        return self._source.sample_rate
+
+    @property
+    def overflows(self) -> int:
+        """Return the wrapped source's overflow count."""
+        return self._source.overflows
+
+    @property
+    def dropped(self) -> int:
+        """Return the wrapped source's dropped frame count."""
+        return self._source.dropped
+
+    def start(self) -> None:
+        """Start the wrapped source with fresh filter state."""
+        self._resampler.reset()
+        self._source.start()
+
+    def read_frame(self) -> np.ndarray | None:
+        """Read and resample the next frame."""
+        frame = self._source.read_frame()
+        if frame is None:
+            return None
+        return self._resampler.process(frame)
+
+    def close(self) -> None:
+        """Close the wrapped source."""
+        self._source.close()
@@ -0,0 +1,250 @@
+"""Shared microphone capture feeding several consumers."""
+
+import queue
+import threading
+from typing import Iterator
+
+import numpy as np
+
+from much_miller.audio.ports import FrameSourcePort
+from much_miller.audio.ring_buffer import RingBuffer
+
+_END = (-1, None)
+
+
+class Subscription:
+    """A consumer's view of the capture stream.
+
+    Frames are queued as they are captured. If the consumer falls behind
+    and the queue fills up, the oldest frame is dropped and counted.
+    """
+
+    def __init__(self, hub: "CaptureHub", max_frames: int) -> None:
+        self._hub = hub
+        self._queue: queue.Queue[tuple[int, np.ndarray | None]] = queue.Queue(
+            maxsize=max_frames
+        )
+        self._dropped = 0
+        self._closed = False
+        self._ended = False
+        self._position = 0
+
+    @property
+    def position(self) -> int:
+        """Return the hub position one past the last frame read."""
+        return self._position
+
+    @property
+    def dropped(self) -> int:
+        """Return the number of frames dropped because the queue was full."""
+        return self._dropped
+
+    @property
+    def depth(self) -> int:
+        """Return the number of frames waiting to be read."""
+        return self._queue.qsize()
+
+    @property
+    def closed(self) -> bool:
+        """Return True once the subscription has been closed."""
+        return self._closed
+
+    @property
+    def ended(self) -> bool:
+        """Return True once the end of the stream has been read."""
+        return self._ended
+
+    def read(self, timeout: float | None = None) -> np.ndarray | None:
+        """Return the next frame.
+
+        Args:
+            timeout: Seconds to wait, or None to wait for ever
+
+        Returns:
+            The next frame, or None if the stream ended or the wait timed out
+        """
+        if self._closed and self._queue.empty():
+            return None
+        try:
+            position, frame = self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        if frame is None:
+            self._ended = True
+        else:
+            self._position = position
+        return frame
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        while True:
+            frame = self.read()
+            if frame is None:
+                return
+            yield frame
+
+    def close(self) -> None:
+        """Detach from the hub; pending frames can still be read."""
+        if not self._closed:
+            self._hub._unsubscribe(self)
+            self._push(_END)
+            self._closed = True
+
+    def _push(self, item: tuple[int, np.ndarray | None]) -> None:
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                    self._dropped += 1
+                except queue.Empty:
+                    pass
+
+
+class CaptureHub:
+    """Owns the one open capture stream and fans it out to consumers.
+
+    A background thread reads frames from the source, appends them to a
+    ring buffer and queues them for every subscriber. New subscribers can
+    ask for a pre-roll of audio captured before they subscribed.
+    """
+
+    def __init__(
+        self,
+        source: FrameSourcePort,
+        ring_seconds: float = 10.0,
+        max_queued_frames: int = 64,
+    ) -> None:
+        """Initialize the hub.
+
+        Args:
+            source: Where frames come from
+            ring_seconds: Seconds of audio kept for pre-roll
+            max_queued_frames: Queue length per subscriber before dropping
+        """
+        self._source = source
+        self._ring = RingBuffer(int(source.sample_rate * ring_seconds))
+        self._max_queued_frames = max_queued_frames
+        self._subscriptions: list[Subscription] = []
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._running = False
+        self._finished = threading.Event()
+
+    @property
+    def sample_rate(self) -> int:
+        """Return the sample rate of captured audio in Hz."""
+        return self._source.sample_rate
+
+    @property
+    def frame_size(self) -> int:
+        """Return the number of samples in each frame."""
+        return self._source.frame_size
+
+    @property
+    def overflows(self) -> int:
+        """Return the number of times the source lost captured audio."""
+        return self._source.overflows
+
+    @property
+    def dropped(self) -> int:
+        """Return the number of frames the source dropped before the hub read them."""
+        return self._source.dropped
+
+    @property
+    def position(self) -> int:
+        """Return the absolute sample position of the newest audio."""
+        with self._lock:
+            return self._ring.position
+
+    def start(self) -> None:
+        """Open the source and start capturing."""
+        if self._thread is not None:
+            return
+        self._source.start()
+        self._running = True
+        self._finished.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="capture-hub", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop capturing, close the source and end every subscription."""
+        self._running = False
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._source.close()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait until the source runs out of audio.
+
+        Returns:
+            True if capture has finished
+        """
+        return self._finished.wait(timeout)
+
+    def subscribe(
+        self,
+        preroll_seconds: float = 0.0,
+        from_position: int | None = None,
+        max_frames: int | None = None,
+    ) -> Subscription:
+        """Attach a new consumer.
+
+        Args:
+            preroll_seconds: Seconds of audio before from_position to queue
+                first, limited to what the ring buffer still holds
+            from_position: Absolute sample position the pre-roll is measured
+                back from (defaults to now); audio from there up to now is
+                queued as well
+            max_frames: Queue length before dropping (defaults to the
+                hub's max_queued_frames)
+
+        Returns:
+            A subscription that receives every subsequent frame
+        """
+        subscription = Subscription(self, max_frames or self._max_queued_frames)
+        with self._lock:
+            now = self._ring.position
+            anchor = now if from_position is None else from_position
+            start = anchor - int(preroll_seconds * self.sample_rate)
+            backlog = self._ring.read(start, now)
+            backlog_start = now - len(backlog)
+            for offset in range(0, len(backlog), self.frame_size):
+                frame = backlog[offset:offset + self.frame_size]
+                subscription._push((backlog_start + offset + len(frame), frame))
+            if self._finished.is_set():
+                subscription._push(_END)
+                subscription._closed = True
+            else:
+                self._subscriptions.append(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    def _run(self) -> None:
+        try:
+            while self._running:
+                frame = self._source.read_frame()
+                if frame is None:
+                    break
+                with self._lock:
+                    self._ring.write(frame)
+                    position = self._ring.position
+                    subscriptions = list(self._subscriptions)
+                for subscription in subscriptions:
+                    subscription._push((position, frame))
+        finally:
+            with self._lock:
+                subscriptions = list(self._subscriptions)
+                self._subscriptions.clear()
+                self._finished.set()
+            for subscription in subscriptions:
+                subscription._push(_END)
+                subscription._closed = True
@@ -0,0 +1,101 @@
+"""Preallocated frames passed from a capture callback to a reader."""
+
+import queue
+
+import numpy as np
+
+
+class FramePool:
+    """A ring of preallocated int16 frames shared by a writer and one reader.
+
+    The capture callback copies each block of audio into the next free
+    frame with put(); the reader takes frames in order with get(). No
+    memory is allocated per frame. A frame returned by get() stays valid
+    until the reader's next get(), so a reader that keeps frames longer
+    must copy them.
+
+    When the reader falls behind and every frame is in use, put() drops
+    the new audio and counts it rather than overwriting a queued frame.
+    """
+
+    def __init__(self, frame_size: int, count: int = 8) -> None:
+        """Initialize the pool.
+
+        Args:
+            frame_size: Samples in each frame
+            count: Frames preallocated (at least 2)
+        """
+        if count < 2:
+            raise ValueError("count must be at least 2")
+        self._frames = np.zeros((count, frame_size), dtype=np.int16)
+        # One frame is always held by the reader, so count - 1 can queue
+        self._ready: queue.Queue[int | None] = queue.Queue(maxsize=count - 1)
+        self._next = 0
+        self._dropped = 0
+        self._closed = False
+
+    @property
+    def frame_size(self) -> int:
+        """Return the number of samples in each frame."""
+        return self._frames.shape[1]
+
+    @property
+    def dropped(self) -> int:
+        """Return the number of frames dropped because the reader was behind."""
+        return self._dropped
+
+    def put(self, samples: np.ndarray) -> bool:
+        """Copy samples into the next free frame and queue it for the reader.
+
+        Args:
+            samples: frame_size samples (shorter blocks are zero padded)
+
+        Returns:
+            False if the frame was dropped because none was free, or the
+            pool is closed
+        """
+        if self._closed:
+            return False
+        if self._ready.full():
+            self._dropped += 1
+            return False
+        frame = self._frames[self._next]
+        count = min(len(samples), len(frame))
+        frame[:count] = samples[:count]
+        frame[count:] = 0
+        self._ready.put_nowait(self._next)
+        self._next = (self._next + 1) % len(self._frames)
+        return True
+
+    def get(self, timeout: float | None = None) -> np.ndarray | None:
+        """Return the next frame, waiting up to timeout seconds.
+
+        Returns:
+            The frame, or None on timeout or after close()
+        """
+        try:
+            index = self._ready.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        if index is None:
+            # Leave the marker for any later get()
+            self._ready.put_nowait(None)
+            return None
+        return self._frames[index]
+
+    def close(self) -> None:
+        """Stop accepting frames and wake the reader.
+
+        get() returns None once the queued frames have been read; if the
+        queue was full the oldest is discarded to make room for the marker.
+        """
+        self._closed = True
+        while True:
+            try:
+                self._ready.put_nowait(None)
+                return
+            except queue.Full:
+                try:
+                    self._ready.get_nowait()
+                except queue.Empty:
+                    pass
@@ -0,0 +1,10 @@
+"""Signal level measurements."""
+
+import numpy as np
+
+
+def rms(frame: np.ndarray) -> float:
+    """Return the root mean square level of int16 samples."""
+    if not len(frame):
+        return 0.0
+    return float(np.sqrt(np.mean(frame.astype(np.float32) ** 2)))
@@ -0,0 +1,53 @@
+"""The microphone, opened in the format the wake word models expect.
+
+Every consumer of captured audio (wake word, transcription, session
+recording) takes RATE Hz mono int16 frames of CHUNK samples. Devices that
+only capture at another rate are resampled in software.
+"""
+
+import os
+
+from much_miller.audio.adapters import PyAudioFrameSource, ResamplingFrameSource
+from much_miller.audio.ports import FrameSourcePort
+from much_miller.audio.resampler import input_frame_size
+
+CHUNK = 1280  # 80ms at 16kHz for openWakeWord
+RATE = 16000
+
+
+def find_device_by_name(name: str) -> int | None:
+    """Find audio device index by partial name match (case-insensitive)."""
+    import sounddevice as sd
+
+    for i, dev in enumerate(sd.query_devices()):
+        if name.lower() in dev["name"].lower() and dev["max_input_channels"] > 0:
+            return i
+    return None
+
+
+def list_input_devices() -> None:
+    """List available input devices."""
+    import sounddevice as sd
+
+    print("Available input devices:\n")
+    for i, dev in enumerate(sd.query_devices()):
+        if dev["max_input_channels"] > 0:
+            print(f"  [{i}] {dev['name']}")
+    print()
+
+
+def create_frame_source(device_index: int | None, native_rate: int) -> FrameSourcePort:
+    """Open the microphone at native_rate, resampling to RATE if they differ.
+
+    MUCH_MILLER_CAPTURE_RATE overrides the rate the device is opened at;
+    set it to 16000 to have the driver resample instead.
+    """
+    capture_rate = int(os.environ.get("MUCH_MILLER_CAPTURE_RATE", native_rate))
+    if capture_rate == RATE:
+        return PyAudioFrameSource(device_index, sample_rate=RATE, frame_size=CHUNK)
+    source = PyAudioFrameSource(
+        device_index,
+        sample_rate=capture_rate,
+        frame_size=input_frame_size(CHUNK, capture_rate, RATE),
+    )
+    return ResamplingFrameSource(source, sample_rate=RATE)
@@ -0,0 +1,5 @@
+"""Audio ports (abstract interfaces)."""
+
+from much_miller.audio.ports.frame_source import FrameSourcePort
+
+__all__ = ["FrameSourcePort"]
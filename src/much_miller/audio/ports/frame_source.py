@@ -0,0 +1,56 @@
+"""Abstract base class for a continuous source of audio frames."""
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+
+class FrameSourcePort(ABC):
+    """Abstract base class for continuous audio capture.
+
+    A frame source delivers mono int16 audio in fixed-size frames from a
+    stream that stays open between reads.
+    """
+
+    @property
+    @abstractmethod
+    def sample_rate(self) -> int:
+        """Return the sample rate of the frames in Hz."""
+
+    @property
+    @abstractmethod
+    def frame_size(self) -> int:
+        """Return the number of samples in each frame."""
+
+    @property
+    def overflows(self) -> int:
+        """Return the number of times captured audio was lost.
+
+        Sources that cannot lose audio report 0.
+        """
+        return 0
+
+    @property
+    def dropped(self) -> int:
+        """Return the number of frames captured but dropped before being read.
+
+        Sources that do not queue frames report 0.
+        """
+        return 0
+
+    @abstractmethod
+    def start(self) -> None:
+        """Open the underlying stream."""
+
+    @abstractmethod
+    def read_frame(self) -> np.ndarray | None:
+        """Block until the next frame is available.
+
+        Returns:
+            A frame of frame_size int16 samples, or None when the source
+            has no more audio
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """Close the underlying stream."""
@@ -0,0 +1,77 @@
+"""Fixed-size ring buffer of audio samples."""
+
+import numpy as np
+
+
+class RingBuffer:
+    """Holds the most recent samples of a stream in preallocated memory.
+
+    Samples are addressed by absolute position: the number of samples
+    written before them since the buffer was created.
+    """
+
+    def __init__(self, capacity: int, dtype: type = np.int16) -> None:
+        """Initialize the buffer.
+
+        Args:
+            capacity: Number of samples kept
+            dtype: Sample type
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self._data = np.zeros(capacity, dtype=dtype)
+        self._capacity = capacity
+        self._position = 0
+
+    @property
+    def capacity(self) -> int:
+        """Return the number of samples the buffer keeps."""
+        return self._capacity
+
+    @property
+    def position(self) -> int:
+        """Return the absolute position one past the newest sample."""
+        return self._position
+
+    @property
+    def oldest(self) -> int:
+        """Return the absolute position of the oldest sample still held."""
+        return max(0, self._position - self._capacity)
+
+    def write(self, samples: np.ndarray) -> None:
+        """Append samples, overwriting the oldest ones when full."""
+        count = len(samples)
+        if count > self._capacity:
+            self._position += count - self._capacity
+            samples = samples[-self._capacity:]
+            count = self._capacity
+        start = self._position % self._capacity
+        first = min(count, self._capacity - start)
+        self._data[start:start + first] = samples[:first]
+        self._data[:count - first] = samples[first:]
+        self._position += count
+
+    def read(self, start: int, end: int | None = None) -> np.ndarray:
+        """Return a copy of the samples between two absolute positions.
+
+        Args:
+            start: First position; clamped to the oldest sample held
+            end: Position one past the last sample (defaults to newest)
+
+        Returns:
+            The samples in order
+        """
+        end = self._position if end is None else min(end, self._position)
+        start = max(start, self.oldest)
+        if start >= end:
+            return np.zeros(0, dtype=self._data.dtype)
+        first = start % self._capacity
+        count = end - start
+        if first + count <= self._capacity:
+            return self._data[first:first + count].copy()
+        head = self._data[first:]
+        return np.concatenate((head, self._data[:count - len(head)]))
+
+    def latest(self, count: int) -> np.ndarray:
+        """Return a copy of the newest count samples."""
+        return self.read(self._position - count)
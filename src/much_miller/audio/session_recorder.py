@@ -0,0 +1,297 @@
+"""Recording what the microphone heard, for offline tuning and replay.
+
+SessionRecorder subscribes to the capture hub and copies every frame into
+fixed-size, memory-mapped segment files of raw int16 samples:
+
+    sessions/
+        00000000000000000000.pcm   samples from position 0
+        00000000000000960000.pcm   samples from position 960000
+        events.jsonl               wake words, commands, ...
+
+A segment's file name is the position of its first sample, counted in
+samples like capture hub positions, so audio and events share one
+timeline. Writing a frame is a copy into the page cache; the kernel
+writes it out in the background, and the recorder runs in its own
+thread, so the capture loop never waits on the disk.
+When segments exceed the disk budget the oldest are deleted. A directory
+reused by a later run carries on where the last one stopped, so its
+positions never collide with older segments.
+
+load_session() maps the segments back read-only, so audio reaches a
+benchmark or notebook without being copied:
+
+    session = load_session(Path("sessions"))
+    for event in session.events_of("wake"):
+        clip = session.audio(event.position - 32000, event.position + 16000)
+"""
+
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from much_miller.audio.capture_hub import CaptureHub
+
+EVENTS_FILE = "events.jsonl"
+SEGMENT_SUFFIX = ".pcm"
+
+
+def segment_name(position: int) -> str:
+    """Return the file name of the segment starting at position."""
+    return f"{position:020d}{SEGMENT_SUFFIX}"
+
+
+class SessionRecorder:
+    """Writes captured audio to memory-mapped segments with an event index."""
+
+    def __init__(
+        self,
+        directory: Path,
+        sample_rate: int = 16000,
+        segment_seconds: float = 60.0,
+        max_bytes: int = 512 * 1024 * 1024,
+    ) -> None:
+        """Initialize the recorder.
+
+        Args:
+            directory: Directory for segments and events.jsonl
+            sample_rate: Sample rate of the recorded audio
+            segment_seconds: Length of each segment file
+            max_bytes: Disk budget for segments; the oldest are deleted
+        """
+        self._directory = directory
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._segment_samples = int(segment_seconds * sample_rate)
+        self._max_bytes = max_bytes
+        self._segment: np.memmap | None = None
+        self._segment_path: Path | None = None
+        self._filled = 0
+        self._base = _recorded_end(directory)
+        self._position = self._base
+        self._events = (directory / EVENTS_FILE).open("a")
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._subscription: Any = None
+        self.deleted_segments = 0
+        self._events.write(
+            json.dumps(
+                {
+                    "kind": "session",
+                    "position": self._base,
+                    "time": time.time(),
+                    "sample_rate": sample_rate,
+                }
+            )
+            + "\n"
+        )
+
+    @property
+    def position(self) -> int:
+        """Return the session position one past the last sample written."""
+        return self._position
+
+    @property
+    def base(self) -> int:
+        """Return the session position of hub position 0 in this run."""
+        return self._base
+
+    def attach(self, hub: CaptureHub) -> None:
+        """Record everything the hub captures from now on, in a background thread."""
+        self._subscription = hub.subscribe(max_frames=256)
+        self._thread = threading.Thread(target=self._run, name="session-recorder", daemon=True)
+        self._thread.start()
+
+    def write(self, frame: np.ndarray, position: int) -> None:
+        """Append a frame that ends at the given hub position.
+
+        A gap in positions (frames dropped upstream) starts a new segment,
+        so every segment holds contiguous audio.
+        """
+        position += self._base
+        start = position - len(frame)
+        if self._segment is not None and start != self._position:
+            self._finish_segment()
+        offset = 0
+        while offset < len(frame):
+            if self._segment is None:
+                self._open_segment(start + offset)
+            assert self._segment is not None
+            count = min(len(frame) - offset, self._segment_samples - self._filled)
+            self._segment[self._filled:self._filled + count] = frame[offset:offset + count]
+            self._filled += count
+            offset += count
+            if self._filled == self._segment_samples:
+                self._finish_segment()
+        self._position = position
+
+    def mark(self, kind: str, position: int | None = None, **attributes: Any) -> None:
+        """Add an event to the index.
+
+        Args:
+            kind: Event kind, e.g. "wake" or "command"
+            position: Hub position of the event (defaults to the latest
+                sample recorded)
+            **attributes: Extra JSON-serialisable fields
+        """
+        event = {
+            "kind": kind,
+            "position": self._position if position is None else self._base + position,
+            "time": time.time(),
+            **attributes,
+        }
+        with self._lock:
+            self._events.write(json.dumps(event) + "\n")
+            self._events.flush()
+
+    def close(self) -> None:
+        """Stop recording, trimming the last segment to the audio written."""
+        if self._subscription is not None:
+            self._subscription.close()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        self._finish_segment()
+        with self._lock:
+            self._events.close()
+
+    def _run(self) -> None:
+        subscription = self._subscription
+        for frame in subscription:
+            self.write(frame, subscription.position)
+
+    def _open_segment(self, start: int) -> None:
+        self._segment_path = self._directory / segment_name(start)
+        self._segment = np.memmap(
+            self._segment_path, dtype=np.int16, mode="w+", shape=(self._segment_samples,)
+        )
+        self._filled = 0
+
+    def _finish_segment(self) -> None:
+        if self._segment is None or self._segment_path is None:
+            return
+        self._segment.flush()
+        del self._segment
+        self._segment = None
+        if self._filled < self._segment_samples:
+            with self._segment_path.open("r+b") as segment_file:
+                segment_file.truncate(self._filled * 2)
+        self._segment_path = None
+        self._enforce_budget()
+
+    def _enforce_budget(self) -> None:
+        segments = sorted(self._directory.glob(f"*{SEGMENT_SUFFIX}"))
+        sizes = [path.stat().st_size for path in segments]
+        total = sum(sizes)
+        for path, size in zip(segments, sizes):
+            if total <= self._max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            self.deleted_segments += 1
+
+
+def _recorded_end(directory: Path) -> int:
+    ends = [
+        int(path.stem) + path.stat().st_size // 2
+        for path in directory.glob(f"*{SEGMENT_SUFFIX}")
+    ]
+    try:
+        for line in (directory / EVENTS_FILE).read_text().splitlines():
+            ends.append(json.loads(line).get("position", 0))
+    except (OSError, ValueError):
+        pass
+    return max(ends, default=0)
+
+
+@dataclass(frozen=True)
+class Event:
+    """An entry from events.jsonl."""
+
+    kind: str
+    position: int
+    time: float
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class Segment:
+    """Contiguous recorded audio, mapped read-only from its file."""
+
+    start: int
+    samples: np.ndarray
+
+    @property
+    def end(self) -> int:
+        """Return the session position one past the last sample."""
+        return self.start + len(self.samples)
+
+
+@dataclass
+class Session:
+    """Recorded segments and events, on one timeline of sample positions."""
+
+    sample_rate: int
+    segments: list[Segment]
+    events: list[Event]
+
+    def events_of(self, kind: str) -> list[Event]:
+        """Return the events of one kind, in order."""
+        return [event for event in self.events if event.kind == kind]
+
+    def audio(self, start: int, end: int) -> np.ndarray:
+        """Return the samples between two session positions.
+
+        A range inside one segment is a view of the mapped file (no copy);
+        otherwise the samples are copied, with any position not recorded
+        (before the first segment, between segments or after the last)
+        left as silence, so the result always has end - start samples.
+        """
+        start = max(start, 0)
+        end = max(end, start)
+        pieces: list[tuple[int, np.ndarray]] = []
+        for segment in self.segments:
+            if segment.end <= start or segment.start >= end:
+                continue
+            low = max(start, segment.start)
+            high = min(end, segment.end)
+            pieces.append((low, segment.samples[low - segment.start:high - segment.start]))
+        if len(pieces) == 1 and pieces[0][0] == start and len(pieces[0][1]) == end - start:
+            return pieces[0][1]
+        joined = np.zeros(end - start, dtype=np.int16)
+        for low, samples in pieces:
+            joined[low - start:low - start + len(samples)] = samples
+        return joined
+
+
+def load_session(directory: Path) -> Session:
+    """Map a recorded session's segments and read its events."""
+    sample_rate = 16000
+    events: list[Event] = []
+    events_path = directory / EVENTS_FILE
+    if events_path.exists():
+        for line in events_path.read_text().splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue  # a line cut short by a crash
+            kind = entry.pop("kind", None)
+            if kind == "session":
+                sample_rate = entry.get("sample_rate", sample_rate)
+                continue
+            if kind is None or "position" not in entry:
+                continue
+            events.append(
+                Event(kind, entry.pop("position"), entry.pop("time", 0.0), attributes=entry)
+            )
+
+    segments = []
+    for path in sorted(directory.glob(f"*{SEGMENT_SUFFIX}")):
+        if path.stat().st_size < 2:
+            continue
+        samples = np.memmap(path, dtype=np.int16, mode="r")
+        segments.append(Segment(int(path.stem), samples))
+    return Session(sample_rate, segments, events)
@@ -0,0 +1,73 @@
+"""WAV encoding and decoding for int16 mono audio."""
+
+import io
+import wave
+from typing import BinaryIO
+
+import numpy as np
+
+
+def encode_wav(samples: np.ndarray, sample_rate: int) -> bytes:
+    """Return int16 mono samples as WAV bytes."""
+    sink = WavSink(sample_rate)
+    sink.write(samples)
+    return sink.getvalue()
+
+
+def read_wav(wav_bytes: bytes) -> tuple[np.ndarray, int]:
+    """Decode 16-bit WAV bytes, mixing multiple channels down to mono.
+
+    Returns:
+        The int16 samples and their sample rate
+    """
+    with wave.open(io.BytesIO(wav_bytes), "rb") as wav_file:
+        channels = wav_file.getnchannels()
+        sample_rate = wav_file.getframerate()
+        samples = np.frombuffer(wav_file.readframes(wav_file.getnframes()), dtype=np.int16)
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1).astype(np.int16)
+    return samples, sample_rate
+
+
+class WavSink:
+    """Writes streamed int16 frames into a WAV container.
+
+    Frames are encoded as they are written, so a stream can be recorded
+    to a file without holding it in memory. With no target the WAV is
+    built in memory and returned by getvalue().
+    """
+
+    def __init__(self, sample_rate: int, target: BinaryIO | None = None) -> None:
+        """Initialize the sink.
+
+        Args:
+            sample_rate: Sample rate of the frames in Hz
+            target: Writable binary file, or None to encode in memory
+        """
+        self._buffer = io.BytesIO() if target is None else None
+        self._wav = wave.open(target or self._buffer, "wb")
+        self._wav.setnchannels(1)
+        self._wav.setsampwidth(2)
+        self._wav.setframerate(sample_rate)
+        self._samples = 0
+
+    @property
+    def samples(self) -> int:
+        """Return the number of samples written so far."""
+        return self._samples
+
+    def write(self, frame: np.ndarray) -> None:
+        """Append a frame of int16 samples."""
+        self._wav.writeframesraw(np.ascontiguousarray(frame, dtype=np.int16).data)
+        self._samples += len(frame)
+
+    def close(self) -> None:
+        """Finish the WAV header; the target file is left open."""
+        self._wav.close()
+
+    def getvalue(self) -> bytes:
+        """Close the sink and return the in-memory WAV bytes."""
+        if self._buffer is None:
+            raise ValueError("WavSink was given a target file")
+        self.close()
+        return self._buffer.getvalue()
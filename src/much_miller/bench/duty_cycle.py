@@ -0,0 +1,298 @@
+"""Wake word detection under CPU load, with and without duty cycling.
+
+Replays each fixture of a replay manifest (see much_miller.bench.replay)
+in real time through a capture hub and WakeWordDetector while other
+processes burn the CPU, once at full rate and once with a DutyCycler,
+and prints what each run heard and how much audio it lost:
+
+    python -m much_miller.bench.duty_cycle fixtures/manifest.json \\
+        --burn 4 --load-start 1 --load-seconds 5 --keep hey_jarvis
+
+--slow-ms instead delays each prediction during the load window, by that
+much for every 80 ms of audio and every wake word model scored, plus
+--call-ms for each predict() call, which gives the same result on any
+machine. The delay follows openWakeWord's costs: the embedding and each
+model run once per 80 ms of audio whatever the stride, so only the
+per-call part is saved by scoring frames together, and running fewer
+models saves their share.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+from much_miller.audio.adapters.array_frame_source import ArrayFrameSource
+from much_miller.audio.capture_hub import CaptureHub
+from much_miller.audio.microphone import CHUNK, RATE
+from much_miller.bench.replay import decode_wav, load_manifest
+from much_miller.wake_word.detector import DEFAULT_THRESHOLD, WakeModel, WakeWordDetector
+from much_miller.wake_word.duty_cycle import DutyCycler, ModelSubset, default_modes
+
+
+def _burn(stop: Any) -> None:
+    while not stop.is_set():
+        sum(range(10_000))
+
+
+class CpuBurner:
+    """Processes spinning on the CPU, standing in for Whisper and mpv."""
+
+    def __init__(self, workers: int | None = None) -> None:
+        """Initialize the burner, idle.
+
+        Args:
+            workers: Processes to run (one per CPU by default)
+        """
+        self._workers = workers or os.cpu_count() or 1
+        self._context = multiprocessing.get_context("spawn")
+        self._stop = self._context.Event()
+        self._processes: list[Any] = []
+
+    def start(self) -> None:
+        """Start burning."""
+        self._stop.clear()
+        self._processes = [
+            self._context.Process(target=_burn, args=(self._stop,), daemon=True)
+            for _ in range(self._workers)
+        ]
+        for process in self._processes:
+            process.start()
+
+    def stop(self) -> None:
+        """Stop burning and wait for the processes to exit."""
+        self._stop.set()
+        for process in self._processes:
+            process.join()
+        self._processes = []
+
+
+class SlowedWakeModel:
+    """A wake model whose predictions take longer during a window of time.
+
+    Each predict() call in the window first sleeps for delay(x), as if
+    other work had the CPU. The window is timed from the first call.
+    """
+
+    def __init__(
+        self,
+        model: WakeModel,
+        delay_seconds: float,
+        start_seconds: float = 0.0,
+        load_seconds: float = float("inf"),
+        clock: Callable[[], float] = time.monotonic,
+        call_seconds: float = 0.0,
+    ) -> None:
+        """Initialize the wrapper.
+
+        Args:
+            model: Wake model to slow down
+            delay_seconds: Extra time each wake word model takes per
+                CHUNK samples (80 ms) in the window
+            start_seconds: Time after the first call the window opens
+            load_seconds: Length of the window
+            clock: Monotonic time in seconds
+            call_seconds: Extra time each call in the window takes,
+                however much audio it scores
+        """
+        self._model = model
+        self._delay = delay_seconds
+        self._call = call_seconds
+        self._start = start_seconds
+        self._end = start_seconds + load_seconds
+        self._clock = clock
+        self._first: float | None = None
+
+    def delay(self, x: np.ndarray) -> float:
+        """Return the extra time scoring x takes while the window is open.
+
+        A model without a models dict (see ModelSubset) counts as one.
+        """
+        models = len(getattr(self._model, "models", None) or {}) or 1
+        return self._call + self._delay * models * len(x) / CHUNK
+
+    def predict(self, x: np.ndarray) -> dict[str, float]:
+        """Score audio, slowly while the window is open."""
+        now = self._clock()
+        if self._first is None:
+            self._first = now
+        if self._start <= now - self._first < self._end:
+            time.sleep(self.delay(x))
+        return self._model.predict(x)
+
+    def select(self, names: frozenset[str] | None) -> None:
+        """Pass model selection on, if the wrapped model supports it."""
+        select = getattr(self._model, "select", None)
+        if callable(select):
+            select(names)
+
+    def reset(self) -> None:
+        """Pass a reset on, if the wrapped model supports it."""
+        reset = getattr(self._model, "reset", None)
+        if callable(reset):
+            reset()
+
+
+@dataclass
+class LoadedReplay:
+    """What the detector heard while replaying audio under load."""
+
+    audio_seconds: float
+    detections: list[float] = field(default_factory=list)
+    frames: int = 0
+    strided_frames: int = 0
+    dropped_frames: int = 0
+    max_queue_depth: int = 0
+    changes: list[str] = field(default_factory=list)
+    final_mode: str = "full"
+
+    def summary(self) -> dict[str, Any]:
+        """Return the result with rounded figures, for printing."""
+        return {
+            **asdict(self),
+            "detections": [round(seconds, 2) for seconds in self.detections],
+        }
+
+
+def replay_under_load(
+    samples: np.ndarray,
+    wake_model: WakeModel,
+    duty: DutyCycler | None = None,
+    burner: CpuBurner | None = None,
+    load_start: float = 0.0,
+    load_seconds: float = float("inf"),
+    threshold: float = DEFAULT_THRESHOLD,
+    frame_size: int = CHUNK,
+    max_queued_frames: int = 32,
+) -> LoadedReplay:
+    """Replay audio in real time through a detector, with optional CPU load.
+
+    Args:
+        samples: int16 audio at RATE
+        wake_model: Wake word model (reset first, if it can be)
+        duty: Duty cycler, or None to score every frame
+        burner: Burns the CPU from load_start for load_seconds, or None
+        load_start: Seconds into the replay the burner starts
+        load_seconds: Seconds the burner runs
+        threshold: Score above which a wake word fires
+        frame_size: Samples per frame
+        max_queued_frames: Frames queued before the oldest are dropped
+
+    Returns:
+        The time of each detection, the audio lost and the mode changes
+    """
+    reset = getattr(wake_model, "reset", None)
+    if callable(reset):
+        reset()
+    hub = CaptureHub(ArrayFrameSource(samples, RATE, frame_size, realtime=True))
+    detector = WakeWordDetector(
+        hub, wake_model, threshold, max_queued_frames=max_queued_frames, duty=duty
+    )
+    result = LoadedReplay(audio_seconds=len(samples) / RATE)
+    timers = []
+    if burner is not None:
+        timers = [
+            threading.Timer(load_start, burner.start),
+            threading.Timer(load_start + min(load_seconds, result.audio_seconds), burner.stop),
+        ]
+    hub.start()
+    for timer in timers:
+        timer.start()
+    try:
+        while (detection := detector.listen()) is not None:
+            result.detections.append(detection.position / RATE)
+    finally:
+        hub.stop()
+        for timer in timers:
+            timer.join()
+    stats = detector.stats
+    result.frames = stats.frames
+    result.strided_frames = stats.strided_frames
+    result.dropped_frames = stats.dropped_frames
+    result.max_queue_depth = stats.max_queue_depth
+    result.final_mode = stats.duty_mode
+    if duty is not None:
+        result.changes = [change.describe() for change in duty.changes]
+    return result
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m much_miller.bench.duty_cycle",
+        description="Replay wake word fixtures in real time under CPU load.",
+    )
+    parser.add_argument("manifest", type=Path, help="fixture manifest JSON")
+    parser.add_argument("--burn", type=int, help="processes burning the CPU (default: one per CPU)")
+    parser.add_argument(
+        "--slow-ms",
+        type=float,
+        help="instead of burning, delay predictions this much per model per 80 ms of audio",
+    )
+    parser.add_argument(
+        "--call-ms", type=float, default=0.0, help="with --slow-ms, also delay each call this much"
+    )
+    parser.add_argument("--load-start", type=float, default=1.0, help="seconds into each fixture")
+    parser.add_argument("--load-seconds", type=float, default=5.0)
+    parser.add_argument(
+        "--keep", nargs="+", metavar="MODEL", help="wake word models run under the heaviest load"
+    )
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--frame-size", type=int, default=CHUNK)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Print one JSON line per fixture, with and without duty cycling."""
+    from openwakeword.model import Model as WakeWordModel
+
+    args = parse_args(argv)
+    model = ModelSubset(WakeWordModel())
+    for fixture in load_manifest(args.manifest):
+        samples = decode_wav(fixture.path.read_bytes())
+        for adaptive in (False, True):
+            wake_model: WakeModel = model
+            burner = None
+            if args.slow_ms is not None:
+                wake_model = SlowedWakeModel(
+                    model,
+                    args.slow_ms / 1000,
+                    args.load_start,
+                    args.load_seconds,
+                    call_seconds=args.call_ms / 1000,
+                )
+            else:
+                burner = CpuBurner(args.burn)
+            model.select(None)
+            duty = DutyCycler(default_modes(args.keep)) if adaptive else None
+            result = replay_under_load(
+                samples,
+                wake_model,
+                duty,
+                burner,
+                args.load_start,
+                args.load_seconds,
+                args.threshold,
+                args.frame_size,
+            )
+            print(
+                json.dumps(
+                    {
+                        "fixture": fixture.path.name,
+                        "wake": fixture.wake,
+                        "adaptive": adaptive,
+                        **result.summary(),
+                    }
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
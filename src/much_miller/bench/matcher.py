@@ -0,0 +1,99 @@
+"""Benchmark the station matcher against a linear substring scan.
+
+Generates a synthetic catalogue of station and podcast names, then times
+building the matcher and matching transcripts against it:
+
+    python -m much_miller.bench.matcher --phrases 5000 --queries 2000
+
+The linear scan is what parse_station used to do: test every name with
+"name in text" in catalogue order.
+"""
+
+import argparse
+import random
+import time
+
+from much_miller.phrase_matcher import PhraseMatcher
+
+_SYLLABLES = ["ka", "lo", "mi", "ra", "ten", "vo", "su", "bel", "dor", "fin", "ga", "pre"]
+_KINDS = ["radio", "fm", "podcast", "news", "sounds", "live", "talk", "jazz"]
+
+
+def catalogue(size: int, seed: int = 0) -> dict[str, str]:
+    """Return size distinct synthetic names mapped to station IDs."""
+    rng = random.Random(seed)
+    names: dict[str, str] = {}
+    while len(names) < size:
+        place = "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4)))
+        name = f"{place} {rng.choice(_KINDS)}"
+        if rng.random() < 0.5:
+            name += f" {rng.randint(1, 9)}"
+        names.setdefault(name, f"station_{len(names)}")
+    return names
+
+
+def queries(names: list[str], count: int, seed: int = 1) -> list[str]:
+    """Return play commands, a quarter of them for unknown stations."""
+    rng = random.Random(seed)
+    commands = []
+    for _ in range(count):
+        if rng.random() < 0.25:
+            commands.append("play something i have never heard of please")
+        else:
+            commands.append(f"play {rng.choice(names)} please")
+    return commands
+
+
+def linear_scan(stations: dict[str, str], text: str) -> str | None:
+    """Return the first station whose name is a substring of text."""
+    text_lower = text.lower()
+    for name, station_id in stations.items():
+        if name in text_lower:
+            return station_id
+    return None
+
+
+def run(phrase_count: int, query_count: int) -> dict[str, float]:
+    """Time building and matching; returns timings in milliseconds."""
+    stations = catalogue(phrase_count)
+    commands = queries(list(stations), query_count)
+
+    started = time.perf_counter()
+    matcher = PhraseMatcher(stations)
+    build = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for text in commands:
+        matcher.match(text)
+    compiled = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for text in commands:
+        linear_scan(stations, text)
+    linear = time.perf_counter() - started
+
+    return {
+        "build_ms": build * 1000,
+        "matcher_us_per_query": compiled / query_count * 1e6,
+        "linear_us_per_query": linear / query_count * 1e6,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Print matcher timings for the requested catalogue size."""
+    parser = argparse.ArgumentParser(
+        prog="python -m much_miller.bench.matcher",
+        description="Compare the compiled station matcher with a linear scan.",
+    )
+    parser.add_argument("--phrases", type=int, default=5000)
+    parser.add_argument("--queries", type=int, default=2000)
+    args = parser.parse_args(argv)
+    timings = run(args.phrases, args.queries)
+    print(f"{args.phrases} phrases, {args.queries} queries")
+    print(f"build          {timings['build_ms']:10.1f} ms")
+    print(f"matcher        {timings['matcher_us_per_query']:10.1f} us/query")
+    print(f"linear scan    {timings['linear_us_per_query']:10.1f} us/query")
+
+
+if __name__ == "__main__":
+    main()
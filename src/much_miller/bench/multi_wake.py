@@ -0,0 +1,95 @@
+"""Per-device wake word cost as microphones are added.
+
+Runs openWakeWord on 1, 2, 4 ... streams of the same audio, once with
+one stacked batch per frame and once with a separate Model per stream,
+and prints the inference time per device frame for each:
+
+    python -m much_miller.bench.multi_wake jarvis_radio_3.wav --streams 1 2 4 8
+
+With no WAV file, low-level noise is used. Batching pays off when the
+per-device time stays flat as streams are added.
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from much_miller.bench.replay import decode_wav
+from much_miller.wake_word.multi_detector import BatchWakeModel
+from much_miller.wake_word.stacked_model import FRAME_SIZE
+
+
+def time_model(model: BatchWakeModel, samples: np.ndarray, streams: int) -> float:
+    """Return the mean inference time per device frame in milliseconds."""
+    frames = len(samples) // FRAME_SIZE
+    elapsed = 0.0
+    for index in range(frames):
+        frame = samples[index * FRAME_SIZE:(index + 1) * FRAME_SIZE]
+        batch = np.repeat(frame[None, :], streams, axis=0)
+        started = time.perf_counter()
+        model.predict_batch(batch)
+        elapsed += time.perf_counter() - started
+    return elapsed / (frames * streams) * 1000
+
+
+def compare(
+    samples: np.ndarray,
+    counts: list[int],
+    stacked: Callable[[int], BatchWakeModel],
+    separate: Callable[[int], BatchWakeModel],
+) -> list[dict[str, float]]:
+    """Time stacked and separate models for each number of streams."""
+    rows = []
+    for streams in counts:
+        rows.append(
+            {
+                "streams": streams,
+                "stacked_ms": round(time_model(stacked(streams), samples, streams), 3),
+                "separate_ms": round(time_model(separate(streams), samples, streams), 3),
+            }
+        )
+    return rows
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m much_miller.bench.multi_wake",
+        description="Time batched wake word inference as devices are added.",
+    )
+    parser.add_argument("wav", type=Path, nargs="?", help="audio to replay on every stream")
+    parser.add_argument("--streams", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--seconds", type=float, default=10.0, help="noise length with no WAV")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Print per-device inference time for each number of streams."""
+    from openwakeword.model import Model as WakeWordModel
+
+    from much_miller.wake_word.stacked_model import SeparateWakeModels, load_stacked_model
+
+    args = parse_args(argv)
+    if args.wav is not None:
+        samples = decode_wav(args.wav.read_bytes())
+    else:
+        rng = np.random.default_rng(0)
+        samples = rng.integers(-300, 300, int(args.seconds * 16000)).astype(np.int16)
+    rows = compare(
+        samples,
+        args.streams,
+        load_stacked_model,
+        lambda streams: SeparateWakeModels(
+            [WakeWordModel(inference_framework="onnx") for _ in range(streams)]
+        ),
+    )
+    for row in rows:
+        print(json.dumps(row))
+
+
+if __name__ == "__main__":
+    main()
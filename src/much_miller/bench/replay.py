@@ -0,0 +1,532 @@
+"""Offline replay benchmark driven by recorded WAV fixtures.
+
+Feeds recorded audio through wake word detection, transcription and
+handle_command faster than real time, with no microphone:
+
+    python -m much_miller.bench.replay fixtures/manifest.json \\
+        --baseline fixtures/baseline.json
+
+The manifest lists WAV files and what should happen for each:
+
+    {"fixtures": [
+        {"wav": "jarvis_radio_3.wav", "wake": true, "wake_end": 1.2,
+         "command": "play bbc_radio_three"},
+        {"wav": "tv_news.wav", "wake": false}
+    ]}
+
+"command" is "play <station_id>", "stop" or omitted for no command, and
+"wake_end" is the time in seconds at which the wake word finishes, used
+for detection latency. Commands run against FakeRadioPlayer and
+FakeSpeaker; the radio starts each fixture playing so "stop" applies.
+
+--policy and --verifier-model replay with two-stage wake detection (see
+much_miller.wake_word.verification); --compare-staged also replays with a
+single frame over threshold and reports the false accepts and CPU saved.
+"""
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+from much_miller.audio.adapters.array_frame_source import ArrayFrameSource
+from much_miller.audio.capture_hub import CaptureHub, Subscription
+from much_miller.audio.microphone import CHUNK, RATE
+from much_miller.audio.wav import read_wav
+from much_miller.commands import handle_command
+from much_miller.radio.adapters import FakeRadioPlayer
+from much_miller.transcription.adapters import (
+    FallbackTranscriber,
+    FasterWhisperTranscriber,
+    HttpTranscriber,
+)
+from much_miller.transcription.ports import TranscriberPort
+from much_miller.transcription.session import PREROLL_SECONDS
+from much_miller.wake_word.adapters.fake_speaker import FakeSpeaker
+from much_miller.wake_word.detector import (
+    DEFAULT_THRESHOLD,
+    Detection,
+    WakeModel,
+    WakeWordDetector,
+    WakeWordStats,
+)
+from much_miller.wake_word.energy_gate import EnergyGate
+from much_miller.wake_word.verification import (
+    TranscriptVerifier,
+    WakeTrigger,
+    WakeVerifier,
+    parse_policies,
+)
+
+Transcribe = Callable[[np.ndarray], str]
+
+
+@dataclass
+class Fixture:
+    """One recorded WAV file and its expected outcome."""
+
+    path: Path
+    wake: bool
+    command: str | None = None
+    wake_end: float | None = None
+
+
+@dataclass
+class FixtureResult:
+    """What happened when one fixture was replayed."""
+
+    name: str
+    expected_wake: bool
+    detected: str | None
+    detected_at: float | None
+    latency: float | None
+    transcript: str | None
+    expected_command: str | None
+    command: str | None
+
+
+@dataclass
+class ReplayReport:
+    """Aggregate results of a replay run."""
+
+    audio_seconds: float = 0.0
+    wake_seconds: float = 0.0
+    wake_frames: int = 0
+    wake_inferences: int = 0
+    triggers: int = 0
+    rejected: int = 0
+    verify_seconds: float = 0.0
+    transcribe_seconds: float = 0.0
+    transcribed_seconds: float = 0.0
+    results: list[FixtureResult] = field(default_factory=list)
+
+    @property
+    def false_accepts(self) -> int:
+        """Fixtures without a wake word where one was detected."""
+        return sum(1 for r in self.results if r.detected and not r.expected_wake)
+
+    @property
+    def false_rejects(self) -> int:
+        """Fixtures with a wake word where none was detected."""
+        return sum(1 for r in self.results if r.expected_wake and not r.detected)
+
+    @property
+    def false_accept_rate(self) -> float:
+        """Fraction of fixtures without a wake word where one was detected."""
+        negatives = sum(1 for r in self.results if not r.expected_wake)
+        return self.false_accepts / negatives if negatives else 0.0
+
+    @property
+    def pipeline_runs(self) -> int:
+        """Detections that went on to greeting and transcription."""
+        return sum(1 for r in self.results if r.detected)
+
+    @property
+    def pipeline_seconds(self) -> float | None:
+        """Mean transcription time per detection, if transcription ran."""
+        transcribed = sum(1 for r in self.results if r.transcript is not None)
+        return self.transcribe_seconds / transcribed if transcribed else None
+
+    @property
+    def command_accuracy(self) -> float:
+        """Fraction of wake fixtures whose command outcome was as expected."""
+        scored = [r for r in self.results if r.expected_wake]
+        if not scored:
+            return 1.0
+        return sum(1 for r in scored if r.command == r.expected_command) / len(scored)
+
+    @property
+    def wake_rtf(self) -> float:
+        """Wake word inference time divided by audio duration."""
+        return self.wake_seconds / self.audio_seconds if self.audio_seconds else 0.0
+
+    @property
+    def transcribe_rtf(self) -> float:
+        """Transcription time divided by the duration transcribed."""
+        if not self.transcribed_seconds:
+            return 0.0
+        return self.transcribe_seconds / self.transcribed_seconds
+
+    @property
+    def inference_saved(self) -> float:
+        """Fraction of wake word frames the energy gate skipped."""
+        if not self.wake_frames:
+            return 0.0
+        return max(0.0, 1 - self.wake_inferences / self.wake_frames)
+
+    @property
+    def mean_latency(self) -> float | None:
+        """Mean seconds from the end of the wake word to detection."""
+        latencies = [r.latency for r in self.results if r.latency is not None]
+        return sum(latencies) / len(latencies) if latencies else None
+
+    def summary(self) -> dict[str, Any]:
+        """Return the headline metrics."""
+        return {
+            "fixtures": len(self.results),
+            "audio_seconds": round(self.audio_seconds, 3),
+            "wake_rtf": round(self.wake_rtf, 4),
+            "inference_saved": round(self.inference_saved, 4),
+            "transcribe_rtf": round(self.transcribe_rtf, 4),
+            "mean_latency": None if self.mean_latency is None else round(self.mean_latency, 3),
+            "false_accepts": self.false_accepts,
+            "false_accept_rate": round(self.false_accept_rate, 4),
+            "false_rejects": self.false_rejects,
+            "triggers": self.triggers,
+            "rejected": self.rejected,
+            "verify_seconds": round(self.verify_seconds, 3),
+            "command_accuracy": round(self.command_accuracy, 4),
+        }
+
+
+def load_manifest(path: Path) -> list[Fixture]:
+    """Read fixtures from a manifest; WAV paths are relative to it."""
+    manifest = json.loads(path.read_text())
+    return [
+        Fixture(
+            path=path.parent / entry["wav"],
+            wake=bool(entry.get("wake", False)),
+            command=entry.get("command"),
+            wake_end=entry.get("wake_end"),
+        )
+        for entry in manifest["fixtures"]
+    ]
+
+
+def decode_wav(wav_bytes: bytes, sample_rate: int = RATE) -> np.ndarray:
+    """Decode mono or stereo 16-bit WAV bytes to int16 samples at sample_rate."""
+    samples, rate = read_wav(wav_bytes)
+    if rate != sample_rate:
+        from scipy.signal import resample_poly
+
+        resampled = resample_poly(samples.astype(np.float32), sample_rate, rate)
+        samples = np.clip(resampled, -32768, 32767).astype(np.int16)
+    return samples
+
+
+class _ReplayHub(CaptureHub):
+    """Capture hub that starts reading when the detector subscribes.
+
+    The source is not paced in real time, so starting it any earlier
+    would lose the first frames before the detector was listening.
+    """
+
+    def subscribe(
+        self,
+        preroll_seconds: float = 0.0,
+        from_position: int | None = None,
+        max_frames: int | None = None,
+    ) -> Subscription:
+        """Attach a new consumer, then start capturing."""
+        subscription = super().subscribe(preroll_seconds, from_position, max_frames)
+        self.start()
+        return subscription
+
+
+def radio_outcome(radio: FakeRadioPlayer) -> str | None:
+    """Describe what a command did to the fake radio."""
+    if radio.play_calls:
+        return f"play {radio.play_calls[-1][0]}"
+    if radio.stop_calls:
+        return "stop"
+    return None
+
+
+class ReplayBenchmark:
+    """Replays fixtures through wake word detection and command handling."""
+
+    def __init__(
+        self,
+        wake_model: WakeModel,
+        transcribe: Transcribe | None = None,
+        threshold: float = DEFAULT_THRESHOLD,
+        frame_size: int = CHUNK,
+        preroll_seconds: float = PREROLL_SECONDS,
+        gate: EnergyGate | None = None,
+        trigger: WakeTrigger | None = None,
+        verifier: WakeVerifier | None = None,
+        verify_seconds: float = 1.5,
+    ) -> None:
+        """Initialize the benchmark.
+
+        Args:
+            wake_model: openWakeWord model (or any object with predict)
+            transcribe: Turns int16 16 kHz samples into text, or None to
+                skip transcription and command handling
+            threshold: Wake word score threshold
+            frame_size: Samples per wake word frame
+            preroll_seconds: Audio before the detection kept for transcription
+            gate: Energy gate in front of the wake word model, if any
+            trigger: Per-model thresholds, smoothing and persistence
+                (stage one), or None for threshold on a single frame
+            verifier: Confirms triggers from their audio (stage two), if any
+            verify_seconds: Audio up to a trigger passed to the verifier
+        """
+        self._wake_model = wake_model
+        self._transcribe = transcribe
+        self._threshold = threshold
+        self._frame_size = frame_size
+        self._preroll_seconds = preroll_seconds
+        self._gate = gate
+        self._trigger = trigger
+        self._verifier = verifier
+        self._verify_seconds = verify_seconds
+
+    def run(self, fixtures: list[Fixture]) -> ReplayReport:
+        """Replay every fixture and collect the results."""
+        report = ReplayReport()
+        for fixture in fixtures:
+            report.results.append(self.run_fixture(fixture, report))
+        return report
+
+    def run_fixture(self, fixture: Fixture, report: ReplayReport) -> FixtureResult:
+        """Replay one fixture, adding its timings to the report."""
+        samples = decode_wav(fixture.path.read_bytes())
+        report.audio_seconds += len(samples) / RATE
+
+        reset = getattr(self._wake_model, "reset", None)
+        if callable(reset):
+            reset()
+        detection, stats = self._detect(samples)
+        position = None if detection is None else detection.position
+        frames = len(samples) if position is None else position
+        report.wake_frames += -(-frames // self._frame_size)
+        report.wake_inferences += stats.frames
+        report.wake_seconds += stats.inference_seconds
+        report.triggers += stats.triggers
+        report.rejected += stats.rejected
+        report.verify_seconds += stats.verify_seconds
+
+        detected = None if detection is None else detection.model_name
+        detected_at = None if position is None else position / RATE
+        latency = None
+        if detected_at is not None and fixture.wake_end is not None:
+            latency = detected_at - fixture.wake_end
+
+        transcript = None
+        command = None
+        if position is not None and self._transcribe is not None:
+            start = max(0, position - int(self._preroll_seconds * RATE))
+            utterance = samples[start:]
+            started = time.perf_counter()
+            transcript = self._transcribe(utterance).strip()
+            report.transcribe_seconds += time.perf_counter() - started
+            report.transcribed_seconds += len(utterance) / RATE
+            command = self._run_command(transcript)
+
+        return FixtureResult(
+            name=fixture.path.name,
+            expected_wake=fixture.wake,
+            detected=detected,
+            detected_at=detected_at,
+            latency=latency,
+            transcript=transcript,
+            expected_command=fixture.command,
+            command=command,
+        )
+
+    def _detect(self, samples: np.ndarray) -> tuple[Detection | None, WakeWordStats]:
+        """Run the fixture through a WakeWordDetector as fast as it will go."""
+        hub = _ReplayHub(ArrayFrameSource(samples, RATE, self._frame_size))
+        detector = WakeWordDetector(
+            hub,
+            self._wake_model,
+            self._threshold,
+            # Room for every frame, so none are dropped while inference catches up
+            max_queued_frames=len(samples) // self._frame_size + 2,
+            gate=self._gate,
+            trigger=self._trigger,
+            verifier=self._verifier,
+            verify_seconds=self._verify_seconds,
+        )
+        try:
+            detection = detector.listen()
+        finally:
+            hub.stop()
+        return detection, detector.stats
+
+    @staticmethod
+    def _run_command(transcript: str) -> str | None:
+        radio = FakeRadioPlayer()
+        radio.play("bbc_radio_fourfm", "radio 4")
+        radio.play_calls.clear()
+        handle_command(transcript, radio, FakeSpeaker())
+        return radio_outcome(radio)
+
+
+def compare(
+    summary: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerance: float = 0.2,
+) -> list[str]:
+    """List the ways a run is worse than the baseline.
+
+    Real-time factors and latency may grow by the tolerance fraction;
+    false accepts/rejects may not rise and accuracy may not fall.
+    """
+    regressions = []
+    for key in ("wake_rtf", "transcribe_rtf", "mean_latency"):
+        old, new = baseline.get(key), summary.get(key)
+        if old is not None and new is not None and new > old * (1 + tolerance) + 1e-9:
+            regressions.append(f"{key}: {old} -> {new}")
+    for key in ("false_accepts", "false_rejects"):
+        if summary[key] > baseline.get(key, summary[key]):
+            regressions.append(f"{key}: {baseline[key]} -> {summary[key]}")
+    if summary["command_accuracy"] < baseline.get("command_accuracy", 0.0):
+        regressions.append(
+            f"command_accuracy: {baseline['command_accuracy']} -> {summary['command_accuracy']}"
+        )
+    return regressions
+
+
+def compare_gate(gated: dict[str, Any], ungated: dict[str, Any]) -> dict[str, Any]:
+    """Summarise what the energy gate saved and what it cost in recall."""
+    return {
+        "inference_saved": gated["inference_saved"],
+        "wake_rtf": f"{ungated['wake_rtf']} -> {gated['wake_rtf']}",
+        "false_rejects": f"{ungated['false_rejects']} -> {gated['false_rejects']}",
+        "false_accepts": f"{ungated['false_accepts']} -> {gated['false_accepts']}",
+    }
+
+
+def compare_staged(staged: ReplayReport, single: ReplayReport) -> dict[str, Any]:
+    """Summarise what two-stage detection saved against a single-frame threshold.
+
+    CPU saved is the transcription time the pipeline runs avoided would
+    have cost (at the single-stage run's mean per detection), less the
+    time spent verifying.
+    """
+    avoided = single.pipeline_runs - staged.pipeline_runs
+    cpu_saved = None
+    if single.pipeline_seconds is not None:
+        cpu_saved = round(avoided * single.pipeline_seconds - staged.verify_seconds, 3)
+    return {
+        "pipeline_runs": f"{single.pipeline_runs} -> {staged.pipeline_runs}",
+        "false_accept_rate": (
+            f"{round(single.false_accept_rate, 4)} -> {round(staged.false_accept_rate, 4)}"
+        ),
+        "false_rejects": f"{single.false_rejects} -> {staged.false_rejects}",
+        "rejected_triggers": staged.rejected,
+        "verify_seconds": round(staged.verify_seconds, 3),
+        "cpu_seconds_saved": cpu_saved,
+    }
+
+
+def create_transcriber(
+    model_size: str,
+    compute_type: str,
+    url: str | None = None,
+) -> TranscriberPort:
+    """Return local faster-whisper, or a remote service falling back to it."""
+    local = FasterWhisperTranscriber(model_size, compute_type=compute_type)
+    if url:
+        return FallbackTranscriber(HttpTranscriber(url), local)
+    return local
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m much_miller.bench.replay",
+        description="Replay WAV fixtures through the Much pipeline.",
+    )
+    parser.add_argument("manifest", type=Path, help="fixture manifest JSON")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--frame-size", type=int, default=CHUNK)
+    parser.add_argument("--whisper-model", default="small")
+    parser.add_argument("--compute-type", default="int8")
+    parser.add_argument("--transcriber-url", help="transcription-service to try first")
+    parser.add_argument("--no-transcribe", action="store_true", help="wake word only")
+    parser.add_argument("--gate", action="store_true", help="energy gate the wake word model")
+    parser.add_argument("--gate-level", type=float, default=300.0, help="RMS that opens the gate")
+    parser.add_argument(
+        "--compare-gate", action="store_true", help="also run without the gate and compare"
+    )
+    parser.add_argument(
+        "--policy",
+        metavar="SPEC",
+        help='per-model threshold/smoothing/persist frames, e.g. "alexa=0.7/4/3 default=0.5/2/2"',
+    )
+    parser.add_argument(
+        "--verifier-model", metavar="SIZE", help="confirm triggers with this Whisper, e.g. tiny.en"
+    )
+    parser.add_argument(
+        "--compare-staged",
+        action="store_true",
+        help="also run with a single-frame threshold and no verifier, and compare",
+    )
+    parser.add_argument("--baseline", type=Path, help="fail if worse than this summary")
+    parser.add_argument("--save-baseline", type=Path, help="write the summary here")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--verbose", action="store_true", help="print each fixture")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark; returns a non-zero exit code on regression."""
+    args = parse_args(argv)
+    from openwakeword.model import Model as WakeWordModel
+
+    transcribe = None
+    if not args.no_transcribe:
+        transcriber = create_transcriber(
+            args.whisper_model, args.compute_type, args.transcriber_url
+        )
+        transcribe = transcriber.transcribe
+    fixtures = load_manifest(args.manifest)
+    gate = None
+    if args.gate or args.compare_gate:
+        gate = EnergyGate(
+            args.frame_size / RATE, open_level=args.gate_level, close_level=args.gate_level * 2 / 3
+        )
+    trigger = WakeTrigger(parse_policies(args.policy)) if args.policy else None
+    verifier = None
+    if args.verifier_model:
+        verifier = TranscriptVerifier(
+            FasterWhisperTranscriber(args.verifier_model, stage="wake_verifier")
+        )
+    wake_model = WakeWordModel()
+    benchmark = ReplayBenchmark(
+        wake_model,
+        transcribe,
+        threshold=args.threshold,
+        frame_size=args.frame_size,
+        gate=gate,
+        trigger=trigger,
+        verifier=verifier,
+    )
+    report = benchmark.run(fixtures)
+
+    if args.verbose:
+        for result in report.results:
+            print(json.dumps(asdict(result)))
+    summary = report.summary()
+    print(json.dumps(summary, indent=2))
+    if args.compare_gate:
+        ungated = ReplayBenchmark(
+            wake_model, None, threshold=args.threshold, frame_size=args.frame_size
+        ).run(fixtures)
+        print(json.dumps({"gate": compare_gate(summary, ungated.summary())}, indent=2))
+    if args.compare_staged:
+        single = ReplayBenchmark(
+            wake_model, transcribe, threshold=args.threshold, frame_size=args.frame_size, gate=gate
+        ).run(fixtures)
+        print(json.dumps({"staged": compare_staged(report, single)}, indent=2))
+
+    if args.save_baseline:
+        args.save_baseline.write_text(json.dumps(summary, indent=2) + "\n")
+    if args.baseline:
+        regressions = compare(summary, json.loads(args.baseline.read_text()), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""Load test for server mode: many simulated rooms, one set of engines.
+
+Replays recorded WAV files from 1, 2, 4 ... simulated rooms at once
+against an in-process server, reusing the same warm engines for every
+run, and reports how latency and batching change with the number of
+rooms:
+
+    python -m much_miller.bench.server_load jarvis_radio_3.wav tv_news.wav \\
+        --clients 1 2 4 8
+
+Client i replays WAV i modulo the number of files.
+"""
+
+import argparse
+import asyncio
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+
+from much_miller.bench.replay import decode_wav
+from much_miller.server.replay_client import ClientResult, replay
+from much_miller.server.transcription_queue import TranscriptionQueue
+from much_miller.server.wake_engine import WakeEngine
+from much_miller.server.wake_server import Synthesizer, WakeServer
+
+
+@dataclass
+class LoadResult:
+    """How the server coped with a number of rooms at once."""
+
+    clients: int
+    audio_seconds: float
+    wall_seconds: float
+    transcripts: int
+    p50_latency: float | None
+    p95_latency: float | None
+    mean_wake_batch: float
+    mean_wake_frame_ms: float
+    mean_transcription_batch: float
+
+    @property
+    def throughput(self) -> float:
+        """Return seconds of audio served per second of wall time."""
+        return self.audio_seconds / self.wall_seconds if self.wall_seconds else 0.0
+
+    def summary(self) -> dict[str, float | int | None]:
+        """Return the result with rounded figures, for printing."""
+        return {
+            key: round(value, 3) if isinstance(value, float) else value
+            for key, value in {**asdict(self), "throughput": self.throughput}.items()
+        }
+
+
+def percentile(values: list[float], fraction: float) -> float | None:
+    """Return the value below which the given fraction of values fall."""
+    if not values:
+        return None
+    return float(np.percentile(values, fraction * 100))
+
+
+async def run_clients(
+    wake: WakeEngine,
+    transcription: TranscriptionQueue,
+    audio: list[np.ndarray],
+    clients: int,
+    synthesizer: Synthesizer | None = None,
+    speed: float = 1.0,
+) -> LoadResult:
+    """Replay audio from several simulated rooms against one server.
+
+    Args:
+        wake: Warm wake word engine
+        transcription: Started transcription queue
+        audio: Recordings; client i replays audio[i % len(audio)]
+        clients: Number of simultaneous rooms
+        synthesizer: Renders spoken replies, or None for text only
+        speed: Multiple of real time each room streams at
+
+    Returns:
+        Latency, throughput and batching for this number of rooms
+    """
+    server = WakeServer(wake, transcription, synthesizer)
+    wake_before = (wake.stats.batches, wake.stats.frames, wake.stats.seconds)
+    queue_before = (transcription.stats.batches, transcription.stats.requests)
+    port = await server.start_tcp("127.0.0.1", 0)
+    try:
+        results: list[ClientResult] = await asyncio.gather(
+            *[
+                replay(
+                    audio[i % len(audio)],
+                    f"room-{i}",
+                    port,
+                    speed=speed,
+                    speech=synthesizer is not None,
+                )
+                for i in range(clients)
+            ]
+        )
+    finally:
+        await server.close()
+    batches = wake.stats.batches - wake_before[0]
+    frames = wake.stats.frames - wake_before[1]
+    seconds = wake.stats.seconds - wake_before[2]
+    transcription_batches = transcription.stats.batches - queue_before[0]
+    requests = transcription.stats.requests - queue_before[1]
+    latencies = [latency for result in results for latency in result.latencies]
+    return LoadResult(
+        clients=clients,
+        audio_seconds=sum(result.audio_seconds for result in results),
+        wall_seconds=max(result.wall_seconds for result in results),
+        transcripts=sum(len(result.of("transcript")) for result in results),
+        p50_latency=percentile(latencies, 0.5),
+        p95_latency=percentile(latencies, 0.95),
+        mean_wake_batch=frames / batches if batches else 0.0,
+        mean_wake_frame_ms=seconds / frames * 1000 if frames else 0.0,
+        mean_transcription_batch=requests / transcription_batches if transcription_batches else 0.0,
+    )
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m much_miller.bench.server_load",
+        description="Replay WAV files from many simulated rooms against one server.",
+    )
+    parser.add_argument("wavs", type=Path, nargs="+", help="recordings to replay")
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--speed", type=float, default=1.0, help="multiple of real time")
+    parser.add_argument("--max-batch", type=int, default=4)
+    parser.add_argument("--speech", action="store_true", help="also render spoken replies")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the load test and print one JSON line per client count."""
+    from much_miller.server.__main__ import create_engines
+
+    args = parse_args(argv)
+    audio = [decode_wav(path.read_bytes()) for path in args.wavs]
+    wake, transcription, synthesizer = create_engines(args.speech, args.max_batch)
+    try:
+        for clients in args.clients:
+            result = asyncio.run(
+                run_clients(wake, transcription, audio, clients, synthesizer, args.speed)
+            )
+            print(json.dumps(result.summary()))
+    finally:
+        transcription.close()
+
+
+if __name__ == "__main__":
+    main()
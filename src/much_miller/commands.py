@@ -0,0 +1,171 @@
+"""Voice commands: what a transcript asks for, and how Much answers it.
+
+parse_command() turns a transcript into a Command, which is all the
+single-room loop, the asyncio orchestrator and the server need to act:
+
+    command = parse_command("Play radio for.")
+    command.action        # "play"
+    command.station_id    # "bbc_radio_fourfm"
+    command.reply         # "Playing radio 4"
+
+Each caller then carries the action out its own way: the loops drive
+their radio player (handle_command() for the single-room loop), while
+the server sends the action to the client.
+"""
+
+from dataclasses import dataclass
+
+from much_miller.phrase_matcher import PhraseMatcher
+from much_miller.radio.ports import RadioPlayerPort
+from much_miller.telemetry import metrics
+from much_miller.wake_word.ports import SpeakerPort
+
+END_KEYWORD = "over"
+GREETING = "Hello Romilly"
+
+PLAY = "play"
+STOP = "stop"
+OVER = "over"
+
+# Station name mappings (spoken phrase -> BBC station ID)
+STATIONS = {
+    "radio 3": "bbc_radio_three",
+    "radio three": "bbc_radio_three",
+    "radio 4": "bbc_radio_fourfm",
+    "radio four": "bbc_radio_fourfm",
+    "world service": "bbc_world_service",
+    "news": "bbc_sounds_news",
+    "bbc news": "bbc_sounds_news",
+}
+
+# Compiled once; tolerates mishearings such as "radio for"
+STATION_MATCHER = PhraseMatcher(STATIONS)
+
+_COMMANDS = {
+    handled: metrics.counter(
+        "much_miller_commands_total",
+        "Commands, by whether they were understood",
+        handled=str(handled).lower(),
+    )
+    for handled in (True, False)
+}
+
+
+@dataclass(frozen=True)
+class Command:
+    """What a transcript asks for.
+
+    A play command for a station Much does not know has no station_id.
+    """
+
+    action: str
+    station_id: str | None = None
+    station_name: str | None = None
+
+    @property
+    def known(self) -> bool:
+        """Return False for a play command naming no known station."""
+        return self.action != PLAY or self.station_id is not None
+
+    @property
+    def reply(self) -> str:
+        """Return what Much says in answer ("" for nothing)."""
+        if self.action == PLAY:
+            return f"Playing {self.station_name}" if self.known else "I don't know that station"
+        if self.action == STOP:
+            return "Stopped"
+        return ""
+
+    @property
+    def key(self) -> str | None:
+        """Return "play <station_id>" or "stop", or None if it runs nothing."""
+        if self.action == PLAY and self.known:
+            return f"play {self.station_id}"
+        if self.action == STOP:
+            return "stop"
+        return None
+
+
+def parse_station(text: str) -> tuple[str, str] | None:
+    """Extract station ID from command text.
+
+    The longest station name in the text wins, so "bbc news" is
+    preferred to "news".
+
+    Returns (station_id, display_name) or None if no station found.
+    """
+    match = STATION_MATCHER.match(text)
+    if match is None:
+        return None
+    return match.value, match.phrase
+
+
+def parse_command(text: str) -> Command | None:
+    """Work out what a transcript asks for.
+
+    A transcript ending in END_KEYWORD ends the conversation, whatever
+    comes before it.
+
+    Returns:
+        The command, or None if the transcript is not one
+    """
+    lower = text.lower().strip()
+    if lower.rstrip(" .!?").endswith(END_KEYWORD):
+        return Command(OVER)
+    if lower.startswith("play"):
+        station = parse_station(lower)
+        if station is None:
+            return Command(PLAY)
+        return Command(PLAY, *station)
+    if lower.startswith("stop"):
+        return Command(STOP)
+    return None
+
+
+def command_key(text: str) -> str | None:
+    """Identify a command that is safe to run from a partial transcript.
+
+    Returns "play <station_id>" or "stop", or None for anything else,
+    including a play command for an unknown station.
+    """
+    command = parse_command(text)
+    return command.key if command is not None else None
+
+
+def count_command(handled: bool) -> None:
+    """Count a final transcript by whether it was handled as a command."""
+    _COMMANDS[handled].inc()
+
+
+def fixed_replies() -> list[str]:
+    """Return every reply that does not depend on anything but the command."""
+    replies = [Command(STOP).reply, Command(PLAY).reply]
+    replies.extend(f"Playing {name}" for name in STATION_MATCHER.phrases())
+    return replies
+
+
+def handle_command(
+    text: str,
+    radio: RadioPlayerPort,
+    speaker: SpeakerPort | None,
+) -> bool:
+    """Handle a voice command.
+
+    Returns True if command was recognised and handled.
+    """
+    command = parse_command(text)
+    if command is None or command.action == OVER:
+        return False
+
+    if command.action == PLAY and command.station_id is not None:
+        radio.play(command.station_id, command.station_name)
+    elif command.action == STOP:
+        if not radio.is_playing():
+            return True
+        radio.stop()
+
+    if speaker:
+        speaker.say(command.reply)
+    else:
+        print(f"[{command.reply}]")
+    return True
@@ -0,0 +1,173 @@
+"""Thread counts and CPU pinning for each inference engine.
+
+openWakeWord and Piper (ONNX Runtime), faster-whisper (CTranslate2) and
+mpv each size their thread pools for the whole machine, so on a small
+board they compete for the same cores. A budget gives each engine a
+thread count and, optionally, a set of CPUs:
+
+    MUCH_MILLER_CPU_BUDGET="wake=@0, whisper=3@1-3, piper=2/1@1-3, mpv=@3"
+
+Each entry is engine=threads[/inter_threads][@cpus]. When the wake word
+is pinned, engines without their own CPUs are kept off its cores, so the
+wake word path always has a core to itself.
+
+Threads inherit the affinity of the thread that starts them, so engines
+are pinned by loading them, and running them, inside pinned().
+"""
+
+import os
+import re
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from typing import Any, Iterator
+
+ENGINES = ("wake", "whisper", "piper", "mpv")
+
+
+def parse_cpus(text: str) -> frozenset[int]:
+    """Parse a CPU list such as "0,2-3" into a set of CPU numbers.
+
+    Raises:
+        ValueError: If the list is malformed
+    """
+    cpus: set[int] = set()
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        first, _, last = part.partition("-")
+        cpus.update(range(int(first), int(last or first) + 1))
+    if not cpus:
+        raise ValueError(f"empty CPU list: {text!r}")
+    return frozenset(cpus)
+
+
+def available_cpus() -> frozenset[int]:
+    """Return the CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return frozenset(os.sched_getaffinity(0))
+    return frozenset(range(os.cpu_count() or 1))
+
+
+@contextmanager
+def pinned(cpus: frozenset[int] | None) -> Iterator[None]:
+    """Run the enclosed block, and threads it starts, on the given CPUs.
+
+    Only the calling thread is changed, and its affinity is restored on
+    exit. With no CPUs, or where affinity is unsupported, it does nothing.
+    """
+    if not cpus or not hasattr(os, "sched_setaffinity"):
+        yield
+        return
+    previous = os.sched_getaffinity(0)
+    os.sched_setaffinity(0, cpus)
+    try:
+        yield
+    finally:
+        os.sched_setaffinity(0, previous)
+
+
+def pin_process(pid: int, cpus: frozenset[int] | None) -> None:
+    """Move a child process, such as mpv, onto the given CPUs.
+
+    Threads the process has already started keep their old affinity, so
+    call this straight after starting it.
+    """
+    if cpus and hasattr(os, "sched_setaffinity"):
+        try:
+            os.sched_setaffinity(pid, cpus)
+        except ProcessLookupError:
+            pass
+
+
+@dataclass(frozen=True)
+class EngineBudget:
+    """Threads and CPUs for one engine; None leaves the engine's default."""
+
+    threads: int | None = None
+    inter_threads: int | None = None
+    cpus: frozenset[int] | None = None
+
+    def session_options(self) -> Any:
+        """Return ONNX Runtime session options with these thread counts."""
+        import onnxruntime
+
+        options = onnxruntime.SessionOptions()
+        if self.threads is not None:
+            options.intra_op_num_threads = self.threads
+        if self.inter_threads is not None:
+            options.inter_op_num_threads = self.inter_threads
+        return options
+
+    def describe(self) -> str:
+        """Return the budget in spec form, e.g. "2/1@0-1"."""
+        text = "" if self.threads is None else str(self.threads)
+        if self.inter_threads is not None:
+            text += f"/{self.inter_threads}"
+        if self.cpus:
+            text += "@" + ",".join(str(cpu) for cpu in sorted(self.cpus))
+        return text or "default"
+
+
+@dataclass(frozen=True)
+class CpuBudget:
+    """Budgets for the wake word, Whisper, Piper and mpv."""
+
+    engines: dict[str, EngineBudget] = field(default_factory=dict)
+
+    @classmethod
+    def parse(cls, spec: str) -> "CpuBudget":
+        """Parse a comma- or space-separated list of engine=threads[/inter][@cpus].
+
+        Raises:
+            ValueError: For an unknown engine or malformed entry
+        """
+        engines: dict[str, EngineBudget] = {}
+        # CPU lists contain commas too, so entries are split before "name="
+        for entry in re.split(r"[\s,]+(?=\w+=)", spec.strip(" ,")):
+            if not entry:
+                continue
+            name, _, value = entry.strip(" ,").partition("=")
+            if name not in ENGINES:
+                raise ValueError(f"unknown engine {name!r}; expected one of {ENGINES}")
+            threads_text, _, cpus_text = value.partition("@")
+            threads, _, inter = threads_text.partition("/")
+            engines[name] = EngineBudget(
+                threads=int(threads) if threads else None,
+                inter_threads=int(inter) if inter else None,
+                cpus=parse_cpus(cpus_text) if cpus_text else None,
+            )
+        return cls(engines)
+
+    @classmethod
+    def from_env(cls, override: str | None = None) -> "CpuBudget":
+        """Read MUCH_MILLER_CPU_BUDGET, or use override (e.g. from the CLI)."""
+        spec = override if override is not None else os.environ.get("MUCH_MILLER_CPU_BUDGET", "")
+        return cls.parse(spec).resolved()
+
+    def get(self, engine: str) -> EngineBudget:
+        """Return the budget for an engine (the default if none was set)."""
+        return self.engines.get(engine, EngineBudget())
+
+    def resolved(self, cpus: frozenset[int] | None = None) -> "CpuBudget":
+        """Keep engines without CPUs of their own off the wake word's CPUs.
+
+        Args:
+            cpus: CPUs available (defaults to this process's affinity)
+        """
+        wake_cpus = self.get("wake").cpus
+        if not wake_cpus:
+            return self
+        others = (cpus or available_cpus()) - wake_cpus
+        if not others:
+            return self
+        engines = dict(self.engines)
+        for name in ENGINES:
+            budget = self.get(name)
+            if name != "wake" and not budget.cpus:
+                engines[name] = replace(budget, cpus=others)
+        return CpuBudget(engines)
+
+    def describe(self) -> str:
+        """Return one line summarising every engine's budget."""
+        return " ".join(f"{name}={self.get(name).describe()}" for name in ENGINES)
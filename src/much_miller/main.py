@@ -9,194 +9,540 @@ Flow:
 5. When transcription ends with "over", return to wake word listening
 """
 
+import argparse
 import os
-import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, TypeVar
 
 # Suppress JACK warnings
 os.environ["JACK_NO_START_SERVER"] = "1"
 
-import numpy as np
-import pyaudio
-import sounddevice as sd
 from dotenv import load_dotenv
-from openwakeword.model import Model as WakeWordModel
-from RealtimeSTT import AudioToTextRecorder
 
-from much_miller.radio.adapters import BBCRadioPlayer
+from much_miller.audio.capture_hub import CaptureHub
+from much_miller.audio.microphone import (
+    CHUNK,
+    RATE,
+    create_frame_source,
+    find_device_by_name,
+    list_input_devices,
+)
+from much_miller.audio.session_recorder import SessionRecorder
+from much_miller.radio.adapters import BBCRadioPlayer, MpvIpcRadioPlayer
 from much_miller.radio.ports import RadioPlayerPort
-from much_miller.wake_word.adapters import PiperSpeaker
+from much_miller.cpu_budget import CpuBudget, EngineBudget, pinned
+from much_miller.commands import (
+    GREETING,
+    OVER,
+    STATIONS,
+    command_key,
+    count_command,
+    fixed_replies,
+    handle_command,
+    parse_command,
+)
+from much_miller.transcription.calibration import (
+    WHISPER_COMPUTE_TYPE,
+    WHISPER_MODEL,
+    WhisperConfig,
+    choose_whisper,
+)
+from much_miller.transcription.eager import EagerCommandDispatcher
+from much_miller.transcription.ports import TranscriberPort
+from much_miller.transcription.session import PREROLL_SECONDS, TranscriptionSession
+from much_miller.transcription.utterance_recorder import UtteranceRecorder
+from much_miller.wake_word.detector import DEFAULT_THRESHOLD, WakeWordDetector
+from much_miller.wake_word.duty_cycle import DutyCycler, ModelSubset, default_modes
+from much_miller.wake_word.energy_gate import EnergyGate
+from much_miller.wake_word.phrase_cache import PhraseCache
+from much_miller.wake_word.verification import TranscriptVerifier, WakeTrigger, parse_policies
+from much_miller.startup_profile import StartupProfiler
+from much_miller.telemetry import cpu_profile, metrics, tracing
+from much_miller.wake_word.adapters.speech_queue import URGENT, SpeechQueue
 from much_miller.wake_word.ports import SpeakerPort
 
-CHUNK = 1280  # 80ms at 16kHz for openWakeWord
-FORMAT = pyaudio.paInt16
-CHANNELS = 1
-RATE = 16000
-WAKE_WORD_THRESHOLD = 0.5
-END_KEYWORD = "over"
-
-# Station name mappings (spoken phrase -> BBC station ID)
-STATIONS = {
-    "radio 3": "bbc_radio_three",
-    "radio three": "bbc_radio_three",
-    "radio 4": "bbc_radio_fourfm",
-    "radio four": "bbc_radio_fourfm",
-    "radio for": "bbc_radio_fourfm",  # common mishearing
-    "world service": "bbc_world_service",
-    "news": "bbc_sounds_news",
-    "bbc news": "bbc_sounds_news",
-}
-
-
-def parse_station(text: str) -> tuple[str, str] | None:
-    """Extract station ID from command text.
-
-    Returns (station_id, display_name) or None if no station found.
+# Heavy dependencies (sounddevice, openWakeWord, RealtimeSTT, Piper) are
+# imported where they are first used, so listing devices stays quick.
+if TYPE_CHECKING:
+    from openwakeword.model import Model as WakeWordModel
+    from RealtimeSTT import AudioToTextRecorder
+
+T = TypeVar("T")
+
+TTS_CACHE_DIR = Path.home() / ".cache" / "much-miller" / "tts"
+REALTIME_MODEL = "tiny.en"  # Partial transcripts for eager commands
+
+def fixed_phrases() -> list[str]:
+    """Return the replies Much gives that do not depend on what was heard."""
+    return [GREETING, *fixed_replies()]
+
+
+def create_transcription_session(
+    hub: CaptureHub,
+    keep_warm: bool = True,
+    preroll_seconds: float = PREROLL_SECONDS,
+    on_partial: Callable[[str], None] | None = None,
+    transcriber: TranscriberPort | None = None,
+    budget: EngineBudget | None = None,
+    whisper: WhisperConfig | None = None,
+) -> TranscriptionSession:
+    """Create a transcription session fed from the capture hub.
+
+    Args:
+        hub: Capture hub to feed audio from
+        keep_warm: Keep Whisper loaded between wake cycles
+        preroll_seconds: Audio before the wake word to transcribe
+        on_partial: Called with stabilised partial text while the user
+            is speaking; enables realtime transcription
+        transcriber: Transcribe whole utterances with this instead of
+            RealtimeSTT (on_partial is then unused)
+        budget: CPUs for RealtimeSTT's transcription process
+        whisper: Model and compute type for RealtimeSTT (default small/int8)
     """
-    text_lower = text.lower()
-    for name, station_id in STATIONS.items():
-        if name in text_lower:
-            return station_id, name
-    return None
-
-
-def handle_command(
-    text: str,
-    radio: RadioPlayerPort,
-    speaker: SpeakerPort | None,
-) -> bool:
-    """Handle a voice command.
-
-    Returns True if command was recognised and handled.
-    """
-    text_lower = text.lower().strip()
-
-    # Play command
-    if text_lower.startswith("play"):
-        station = parse_station(text_lower)
-        if station:
-            station_id, station_name = station
-            radio.play(station_id, station_name)
-            if speaker:
-                speaker.say(f"Playing {station_name}")
-            else:
-                print(f"[Playing {station_name}]")
-            return True
-        else:
-            if speaker:
-                speaker.say("I don't know that station")
-            else:
-                print("[Unknown station]")
-            return True
-
-    # Stop command
-    if text_lower.startswith("stop"):
-        if radio.is_playing():
-            radio.stop()
-            if speaker:
-                speaker.say("Stopped")
-            else:
-                print("[Stopped]")
-        return True
-
-    return False
-
-
-def find_device_by_name(name: str) -> int | None:
-    """Find audio device index by partial name match (case-insensitive)."""
-    for i, dev in enumerate(sd.query_devices()):
-        if name.lower() in dev["name"].lower() and dev["max_input_channels"] > 0:
-            return i
-    return None
-
-
-def list_input_devices() -> None:
-    """List available input devices."""
-    print("Available input devices:\n")
-    for i, dev in enumerate(sd.query_devices()):
-        if dev["max_input_channels"] > 0:
-            print(f"  [{i}] {dev['name']}")
-    print()
-
-
-def listen_for_wake_word(
-    device_index: int,
-    wake_model: WakeWordModel,
-) -> str:
-    """Listen for wake word and return which one was detected."""
-    audio = pyaudio.PyAudio()
-    stream = audio.open(
-        format=FORMAT,
-        channels=CHANNELS,
-        rate=RATE,
-        input=True,
-        input_device_index=device_index,
-        frames_per_buffer=CHUNK,
+    whisper = whisper or WhisperConfig(WHISPER_MODEL, WHISPER_COMPUTE_TYPE)
+
+    def build_recorder() -> "AudioToTextRecorder | UtteranceRecorder":
+        if transcriber is not None:
+            return UtteranceRecorder(transcriber, sample_rate=hub.sample_rate)
+
+        from RealtimeSTT import AudioToTextRecorder
+
+        realtime: dict[str, object] = {}
+        if on_partial is not None:
+            realtime = {
+                "enable_realtime_transcription": True,
+                "realtime_model_type": REALTIME_MODEL,
+                "on_realtime_transcription_stabilized": on_partial,
+            }
+        # RealtimeSTT starts its own transcription process, which inherits
+        # this thread's affinity
+        with pinned(budget.cpus if budget else None), cpu_profile.track("whisper"):
+            return AudioToTextRecorder(
+                model=whisper.model_size,
+                language="en",
+                compute_type=whisper.compute_type,
+                use_microphone=False,
+                on_recording_start=session.utterance_started,
+                on_recording_stop=session.utterance_ended,
+                **realtime,
+            )
+
+    session = TranscriptionSession(
+        build_recorder,
+        keep_warm=keep_warm,
+        hub=hub,
+        preroll_seconds=preroll_seconds,
     )
-
-    detected_word = None
-    try:
-        while detected_word is None:
-            audio_data = stream.read(CHUNK, exception_on_overflow=False)
-            audio_array = np.frombuffer(audio_data, dtype=np.int16)
-            predictions = wake_model.predict(audio_array)
-
-            for model_name, score in predictions.items():  # type: ignore[union-attr]
-                if score > WAKE_WORD_THRESHOLD:
-                    detected_word = model_name
-                    break
-    finally:
-        stream.stop_stream()
-        stream.close()
-        audio.terminate()
-
-    return detected_word
+    return session
 
 
 def transcribe_until_over(
-    device_index: int,
+    session: TranscriptionSession,
     radio: RadioPlayerPort,
     speaker: SpeakerPort | None,
+    detected_at: float | None = None,
+    wake_position: int | None = None,
+    dispatcher: EagerCommandDispatcher | None = None,
+    recorder: SessionRecorder | None = None,
 ) -> None:
-    """Transcribe speech until user says 'over'."""
-    recorder = AudioToTextRecorder(
-        model="small",
-        language="en",
-        compute_type="int8",
-        input_device_index=device_index,
-    )
+    """Transcribe speech until user says 'over'.
+
+    After a command is handled, its spoken reply is allowed to finish and
+    the audio heard meanwhile is dropped before listening again, so the
+    reply is not transcribed as a command. 'over' cuts any reply short.
+
+    Args:
+        session: Transcription session (resumed here, paused on return)
+        radio: Radio player for commands
+        speaker: Speaker for confirmations, or None to print them
+        detected_at: time.perf_counter() when the wake word fired
+        wake_position: Capture hub position when the wake word fired
+        dispatcher: Runs commands from partial transcripts, or None to
+            wait for the final text
+        recorder: Session recorder to mark commands in, if recording
+    """
+    if dispatcher is not None:
+        dispatcher.begin(lambda partial: handle_command(partial, radio, speaker))
+    session.resume(started_at=detected_at, from_position=wake_position)
 
     print("Listening... (say 'over' to stop)\n")
 
     try:
         while True:
-            text = recorder.text()
+            started = time.perf_counter()
+            text = session.text()
+            tracing.record("transcribe", started, chars=len(text or ""))
             if text:
                 text = text.strip()
                 print(f">>> {text}")
+                if recorder is not None:
+                    recorder.mark("command", text=text)
+                handled_early = dispatcher is not None and not dispatcher.claim_final(text)
 
                 # Check for end keyword
-                if text.lower().endswith(END_KEYWORD):
+                command = parse_command(text)
+                if command is not None and command.action == OVER:
                     print("\n[Heard 'over' - returning to wake word mode]\n")
+                    if speaker is not None:
+                        speaker.interrupt()
                     break
 
                 # Try to handle as command
-                handle_command(text, radio, speaker)
+                handled = handled_early
+                if not handled_early:
+                    with tracing.span("command") as span:
+                        span["handled"] = handle_command(text, radio, speaker)
+                    count_command(span["handled"])
+                    handled = span["handled"]
+
+                if handled and speaker is not None:
+                    # Let the reply finish, then drop what the microphone heard
+                    # of it, so "Playing Radio 4" is not run as a command
+                    if isinstance(speaker, SpeechQueue):
+                        speaker.wait()
+                    session.clear()
 
     finally:
-        recorder.shutdown()
+        if dispatcher is not None:
+            dispatcher.end()
+        latency = session.first_transcript_latency
+        if latency is not None:
+            print(f"[Wake to first transcript: {latency:.2f}s]")
+        session.pause()
+        tracing.end_trace()
+
+
+def create_radio_player(budget: EngineBudget | None = None) -> RadioPlayerPort:
+    """Create the player selected by MUCH_MILLER_RADIO_MODE.
+
+    "ipc" keeps one mpv running and switches stations over its IPC
+    socket; anything else starts a new mpv for each station.
+    """
+    cpus = budget.cpus if budget else None
+    if os.environ.get("MUCH_MILLER_RADIO_MODE", "process") != "ipc":
+        return BBCRadioPlayer(cpus=cpus)
+    player = MpvIpcRadioPlayer(cpus=cpus)
+    player.start()
+    player.prefetch(sorted(set(STATIONS.values())))
+    return player
+
+
+def create_wake_gate() -> EnergyGate | None:
+    """Create the energy gate enabled by MUCH_MILLER_WAKE_GATE=1, if any.
+
+    MUCH_MILLER_WAKE_GATE_LEVEL sets the int16 RMS level that opens it.
+    """
+    if os.environ.get("MUCH_MILLER_WAKE_GATE", "0") != "1":
+        return None
+    level = float(os.environ.get("MUCH_MILLER_WAKE_GATE_LEVEL", "300"))
+    return EnergyGate(CHUNK / RATE, open_level=level, close_level=level * 2 / 3)
+
+
+def create_wake_trigger() -> WakeTrigger | None:
+    """Create the staged trigger set by MUCH_MILLER_WAKE_POLICY, if any.
+
+    The policy gives each model a threshold, smoothing window and number
+    of frames the score must persist, e.g. "alexa=0.7/4/3 default=0.5/2/2".
+    """
+    spec = os.environ.get("MUCH_MILLER_WAKE_POLICY", "")
+    if not spec:
+        return None
+    return WakeTrigger(parse_policies(spec))
+
+
+def create_wake_duty(wake_words: list[str]) -> DutyCycler | None:
+    """Create the duty cycler enabled by MUCH_MILLER_WAKE_DUTY=1, if any.
+
+    While wake word inference lags behind capture, frames are scored
+    several at a time and, if MUCH_MILLER_WAKE_DUTY_KEEP lists models
+    (e.g. "hey_jarvis"), only those models are run. Each change is logged.
+
+    Args:
+        wake_words: The models loaded
+
+    Raises:
+        ValueError: If MUCH_MILLER_WAKE_DUTY_KEEP names a model not loaded
+    """
+    if os.environ.get("MUCH_MILLER_WAKE_DUTY", "0") != "1":
+        return None
+    keep = os.environ.get("MUCH_MILLER_WAKE_DUTY_KEEP", "").replace(",", " ").split()
+    unknown = sorted(set(keep) - set(wake_words))
+    if unknown:
+        raise ValueError(f"MUCH_MILLER_WAKE_DUTY_KEEP names unknown models: {unknown}")
+    return DutyCycler(
+        default_modes(keep or None), on_change=lambda change: print(f"[{change.describe()}]")
+    )
+
+
+def create_wake_verifier(budget: EngineBudget | None = None) -> TranscriptVerifier | None:
+    """Create the verifier enabled by MUCH_MILLER_WAKE_VERIFIER, if any.
+
+    Its value is the Whisper model that transcribes the wake audio, e.g.
+    "tiny.en"; the model loads with the wake word models.
+    """
+    model_size = os.environ.get("MUCH_MILLER_WAKE_VERIFIER", "")
+    if not model_size:
+        return None
+    from much_miller.transcription.adapters import FasterWhisperTranscriber
+
+    budget = budget or EngineBudget()
+    return TranscriptVerifier(
+        FasterWhisperTranscriber(
+            model_size,
+            cpu_threads=budget.threads or 1,
+            cpus=budget.cpus,
+            stage="wake_verifier",
+        )
+    )
+
+
+def create_session_recorder() -> SessionRecorder | None:
+    """Create the recorder enabled by MUCH_MILLER_SESSION_DIR, if any.
+
+    MUCH_MILLER_SESSION_MAX_MB sets the disk budget for its segments.
+    """
+    directory = os.environ.get("MUCH_MILLER_SESSION_DIR")
+    if not directory:
+        return None
+    max_mb = float(os.environ.get("MUCH_MILLER_SESSION_MAX_MB", "512"))
+    return SessionRecorder(Path(directory), RATE, max_bytes=int(max_mb * 1024 * 1024))
+
+
+def create_transcriber(
+    budget: EngineBudget | None = None,
+    whisper: WhisperConfig | None = None,
+) -> TranscriberPort | None:
+    """Create the transcriber selected by MUCH_MILLER_TRANSCRIBER.
+
+    "local" runs faster-whisper in-process per utterance; "http" sends
+    utterances to MUCH_MILLER_TRANSCRIBER_URL, falling back to local when
+    the service is down or slow. Anything else (the default) returns None
+    and RealtimeSTT is used.
+    """
+    from much_miller.transcription.adapters import (
+        FallbackTranscriber,
+        FasterWhisperTranscriber,
+        HttpTranscriber,
+    )
+
+    mode = os.environ.get("MUCH_MILLER_TRANSCRIBER", "realtimestt")
+    if mode not in ("local", "http"):
+        return None
+    budget = budget or EngineBudget()
+    whisper = whisper or WhisperConfig(WHISPER_MODEL, WHISPER_COMPUTE_TYPE)
+    local = FasterWhisperTranscriber(
+        whisper.model_size,
+        compute_type=whisper.compute_type,
+        cpu_threads=budget.threads or 0,
+        num_workers=budget.inter_threads or 1,
+        cpus=budget.cpus,
+    )
+    if mode == "local":
+        return local
+    url = os.environ.get("MUCH_MILLER_TRANSCRIBER_URL", "")
+    if not url:
+        print("Warning: MUCH_MILLER_TRANSCRIBER_URL not set, transcribing locally")
+        return local
+    return FallbackTranscriber(HttpTranscriber(url, timeout=5.0), local)
+
+
+def load_speaker(budget: EngineBudget | None = None) -> SpeakerPort | None:
+    """Load the Piper voice named by MUCH_MILLER_MODEL_PATH, if any."""
+    model_path_str = os.environ.get("MUCH_MILLER_MODEL_PATH")
+    if not model_path_str:
+        print("Warning: MUCH_MILLER_MODEL_PATH not set, TTS disabled")
+        return None
+    model_path = Path(model_path_str)
+    if not model_path.exists():
+        print(f"Warning: TTS model not found at {model_path}")
+        return None
+
+    from much_miller.wake_word.adapters import PiperSpeaker
+
+    streaming = os.environ.get("MUCH_MILLER_TTS_STREAMING", "1") != "0"
+    cache_dir = Path(os.environ.get("MUCH_MILLER_TTS_CACHE", TTS_CACHE_DIR))
+    print(f"Loading TTS model: {model_path}")
+    speaker = PiperSpeaker(
+        model_path=model_path,
+        streaming=streaming,
+        cache=PhraseCache(cache_dir),
+        budget=budget,
+    )
+    rendered = speaker.prerender(fixed_phrases())
+    print(f"Pre-rendered {rendered} phrases into {cache_dir}")
+    return speaker
 
 
-def main() -> None:
+def create_speech_queue(speaker: SpeakerPort | None) -> SpeakerPort | None:
+    """Queue replies on a worker thread unless MUCH_MILLER_SPEECH_QUEUE=0.
+
+    With the queue, say() returns at once, so spoken confirmations no
+    longer hold up the command loop.
+    """
+    if speaker is None or os.environ.get("MUCH_MILLER_SPEECH_QUEUE", "1") == "0":
+        return speaker
+    return SpeechQueue(speaker)
+
+
+def start_metrics(
+    port: int | None, hub: CaptureHub, detector: WakeWordDetector
+) -> "metrics.MetricsServer | None":
+    """Serve metrics and health on localhost, if a port was given.
+
+    Args:
+        port: TCP port, from --metrics-port or MUCH_MILLER_METRICS_PORT
+        hub: Capture hub whose input overflows and drops are exported
+        detector: Wake word detector whose dropped frames are checked
+    """
+    if port is None:
+        env_port = os.environ.get("MUCH_MILLER_METRICS_PORT")
+        if not env_port:
+            return None
+        port = int(env_port)
+    metrics.gauge(
+        "much_miller_input_overflows_total",
+        "Audio input overflows reported by the driver",
+        lambda: hub.overflows,
+        "counter",
+    )
+    metrics.gauge(
+        "much_miller_input_dropped_frames_total",
+        "Captured frames the audio source dropped before they were read",
+        lambda: hub.dropped,
+        "counter",
+    )
+    metrics.add_check("capture", metrics.LossCheck(lambda: hub.overflows, "input overflows"))
+    metrics.add_check(
+        "capture_queue", metrics.LossCheck(lambda: hub.dropped, "input frames dropped")
+    )
+    metrics.add_check(
+        "wake",
+        metrics.LossCheck(lambda: detector.stats.dropped_frames, "wake word frames dropped"),
+    )
+    server = metrics.serve(port)
+    print(f"Metrics on http://127.0.0.1:{server.port}/metrics (health: /health)")
+    return server
+
+
+def load_wake_model(
+    budget: EngineBudget | None = None, verifier: TranscriptVerifier | None = None
+) -> "WakeWordModel":
+    """Load the openWakeWord models (and verifier), pinned to the wake word's CPUs.
+
+    openWakeWord runs its ONNX sessions single-threaded in the caller's
+    thread, so only the CPUs in the budget apply.
+    """
+    from openwakeword.model import Model as WakeWordModel
+
+    print("Loading wake word models...")
+    with pinned(budget.cpus if budget else None), cpu_profile.track("wake"):
+        if verifier is not None:
+            verifier.load()
+        return WakeWordModel()
+
+
+def in_phase(profiler: StartupProfiler, name: str, load: Callable[[], T]) -> T:
+    """Run a loader as a named startup phase."""
+    with profiler.phase(name):
+        return load()
+
+
+def run_async(
+    detector: WakeWordDetector,
+    session: TranscriptionSession,
+    radio: RadioPlayerPort,
+    speaker: SpeakerPort | None,
+    recorder: SessionRecorder | None = None,
+    dispatcher: EagerCommandDispatcher | None = None,
+) -> None:
+    """Run the asyncio orchestrator until capture stops."""
+    import asyncio
+
+    from much_miller.orchestrator import Orchestrator
+    from much_miller.radio.adapters import ThreadedRadioPlayer
+    from much_miller.wake_word.adapters import QueuedSpeaker, ThreadedSpeaker
+    from much_miller.wake_word.ports import AsyncSpeakerPort
+
+    async_speaker: AsyncSpeakerPort | None = None
+    if isinstance(speaker, SpeechQueue):
+        async_speaker = QueuedSpeaker(speaker)
+    elif speaker is not None:
+        async_speaker = ThreadedSpeaker(speaker)
+    orchestrator = Orchestrator(
+        detector,
+        session,
+        ThreadedRadioPlayer(radio),
+        async_speaker,
+        recorder=recorder,
+        dispatcher=dispatcher,
+    )
+    asyncio.run(orchestrator.run())
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m much_miller.main",
+        description="Much Miller voice assistant.",
+    )
+    parser.add_argument(
+        "device",
+        nargs="?",
+        help="input device name (partial match) or index",
+    )
+    parser.add_argument(
+        "--startup-profile",
+        action="store_true",
+        help="print time and memory for each startup phase",
+    )
+    parser.add_argument(
+        "--cpu-budget",
+        metavar="SPEC",
+        help='threads and CPUs per engine, e.g. "wake=@0 whisper=3@1-3" '
+        "(overrides MUCH_MILLER_CPU_BUDGET)",
+    )
+    parser.add_argument(
+        "--cpu-profile",
+        action="store_true",
+        help="report CPU use per engine after each turn and on exit",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        metavar="PORT",
+        help="serve Prometheus metrics and /health on localhost "
+        "(overrides MUCH_MILLER_METRICS_PORT)",
+    )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="overlap greeting, transcription and radio on an asyncio loop",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
     """Main entry point."""
+    args = parse_args(argv)
+    profiler = StartupProfiler(enabled=args.startup_profile)
+    profiler.mark("interpreter + imports")
+
     load_dotenv()
 
+    trace_file = os.environ.get("MUCH_MILLER_TRACE_FILE")
+    if trace_file:
+        tracing.configure(Path(trace_file))
+
+    budget = CpuBudget.from_env(args.cpu_budget)
+    if budget.engines:
+        print(f"CPU budget: {budget.describe()}")
+    cpu_profile.configure(args.cpu_profile)
+
     # Get device from command line or environment
-    device_arg = None
-    if len(sys.argv) > 1:
-        device_arg = sys.argv[1]
-    else:
-        device_arg = os.environ.get("MUCH_MILLER_DEVICE")
+    device_arg = args.device or os.environ.get("MUCH_MILLER_DEVICE")
 
     if device_arg is None:
         list_input_devices()
@@ -205,37 +551,76 @@ def main() -> None:
         return
 
     # Resolve device index
-    if device_arg.isdigit():
-        device_index = int(device_arg)
-    else:
-        device_index = find_device_by_name(device_arg)
-        if device_index is None:
-            print(f"No input device matching '{device_arg}' found.")
-            list_input_devices()
-            return
+    with profiler.phase("audio devices"):
+        import sounddevice as sd
 
-    device_info = sd.query_devices(device_index)
-    print(f"Using device: [{device_index}] {device_info['name']}\n")
+        if device_arg.isdigit():
+            device_index = int(device_arg)
+        else:
+            device_index = find_device_by_name(device_arg)
+            if device_index is None:
+                print(f"No input device matching '{device_arg}' found.")
+                list_input_devices()
+                return
 
-    # Initialize radio player
-    radio: RadioPlayerPort = BBCRadioPlayer()
+        device_info = sd.query_devices(device_index)
+    native_rate = int(device_info["default_samplerate"])
+    print(f"Using device: [{device_index}] {device_info['name']} ({native_rate} Hz)\n")
 
-    # Initialize TTS speaker
-    speaker: SpeakerPort | None = None
-    model_path_str = os.environ.get("MUCH_MILLER_MODEL_PATH")
-    if model_path_str:
-        model_path = Path(model_path_str)
-        if model_path.exists():
-            print(f"Loading TTS model: {model_path}")
-            speaker = PiperSpeaker(model_path=model_path)
-        else:
-            print(f"Warning: TTS model not found at {model_path}")
-    else:
-        print("Warning: MUCH_MILLER_MODEL_PATH not set, TTS disabled")
+    # Initialize radio player
+    with profiler.phase("radio"):
+        radio = create_radio_player(budget.get("mpv"))
+
+    # One capture stream shared by wake word detection and transcription
+    hub = CaptureHub(create_frame_source(device_index, native_rate))
+    recorder = create_session_recorder()
+    if recorder is not None:
+        recorder.attach(hub)
+        print(f"Recording session audio to {os.environ['MUCH_MILLER_SESSION_DIR']}")
+
+    # Whisper is loaded once; it is paused and resumed between wake cycles
+    keep_warm = os.environ.get("MUCH_MILLER_KEEP_WARM", "1") != "0"
+    preroll = float(os.environ.get("MUCH_MILLER_PREROLL", PREROLL_SECONDS))
+    dispatcher = None
+    if os.environ.get("MUCH_MILLER_EAGER_COMMANDS", "0") == "1":
+        dispatcher = EagerCommandDispatcher(command_key)
+    whisper = choose_whisper(budget.get("whisper"))
+    print(f"Loading transcription model ({whisper.describe()}, keep warm: {keep_warm})...")
+    transcriber = create_transcriber(budget.get("whisper"), whisper)
+    session = create_transcription_session(
+        hub,
+        keep_warm=keep_warm,
+        preroll_seconds=preroll,
+        on_partial=dispatcher.on_partial if dispatcher is not None else None,
+        transcriber=transcriber,
+        budget=budget.get("whisper"),
+        whisper=whisper,
+    )
 
-    # Load wake word model
-    print("Loading wake word models...")
-    wake_model = WakeWordModel()
+    def start_transcription() -> None:
+        if transcriber is not None:
+            transcriber.load()
+        session.start()
+
+    verifier = create_wake_verifier(budget.get("wake"))
+
+    # Load Piper, openWakeWord and Whisper in parallel (one at a time when
+    # profiling CPU, so the threads each one starts are attributed to it)
+    workers = 1 if cpu_profile.enabled() else 3
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="startup") as pool:
+        speaker_future = pool.submit(
+            in_phase, profiler, "piper + phrase cache", lambda: load_speaker(budget.get("piper"))
+        )
+        wake_future = pool.submit(
+            in_phase,
+            profiler,
+            "wake word models",
+            lambda: load_wake_model(budget.get("wake"), verifier),
+        )
+        session_future = pool.submit(in_phase, profiler, "whisper", start_transcription)
+    speaker = speaker_future.result()
+    wake_model = wake_future.result()
+    session_future.result()
     wake_words = list(wake_model.models.keys())
     print(f"Wake words: {wake_words}\n")
 
@@ -247,23 +632,76 @@ def main() -> None:
     print("Ctrl+C to quit")
     print("=" * 50 + "\n")
 
+    if profiler.enabled:
+        profiler.mark("ready")
+        print(profiler.report() + "\n")
+
+    duty = create_wake_duty(wake_words)
+    detector = WakeWordDetector(
+        hub,
+        ModelSubset(wake_model) if duty is not None else wake_model,
+        threshold=DEFAULT_THRESHOLD,
+        gate=create_wake_gate(),
+        cpus=budget.get("wake").cpus,
+        trigger=create_wake_trigger(),
+        verifier=verifier,
+        duty=duty,
+    )
+    metrics_server = start_metrics(args.metrics_port, hub, detector)
+    hub.start()
+    speaker = create_speech_queue(speaker)
     try:
+        if args.use_async:
+            run_async(detector, session, radio, speaker, recorder, dispatcher)
+            return
         while True:
             # Phase 1: Listen for wake word
             print("Listening for wake word...")
-            detected = listen_for_wake_word(device_index, wake_model)
-            print(f"\n*** Wake word detected: {detected} ***\n")
+            detection = detector.listen()
+            if detection is None:
+                print("Audio capture stopped")
+                break
+            detected_at = time.perf_counter()
+            print(f"\n*** Wake word detected: {detection.model_name} ***\n")
+            if recorder is not None:
+                recorder.mark("wake", detection.position, model=detection.model_name)
+            stats = detector.last_listen
+            if stats.behind_realtime:
+                print(f"[Wake word path behind real time: {stats.describe()}]")
 
             # Phase 2: Respond with TTS
             if speaker is not None:
-                speaker.say("Hello Romilly")
+                with tracing.span("greet"):
+                    if isinstance(speaker, SpeechQueue):
+                        # Cut off anything still being said, then finish the
+                        # greeting before transcribing, so it is not heard
+                        speaker.speak(GREETING, priority=URGENT, preempt=True).result()
+                    else:
+                        speaker.say(GREETING)
 
             # Phase 3: Transcribe and handle commands until "over"
-            transcribe_until_over(device_index, radio, speaker)
+            transcribe_until_over(
+                session, radio, speaker, detected_at, detection.position, dispatcher, recorder
+            )
+            if cpu_profile.enabled():
+                print(cpu_profile.report() + "\n")
 
     except KeyboardInterrupt:
         radio.stop()
         print("\nGoodbye!")
+    finally:
+        session.shutdown()
+        hub.stop()
+        if recorder is not None:
+            recorder.close()
+        if isinstance(speaker, SpeechQueue):
+            speaker.close()
+        if metrics_server is not None:
+            metrics_server.stop()
+        radio.close()
+        if cpu_profile.enabled():
+            print(cpu_profile.report())
+        tracing.configure(None)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,260 @@
+"""asyncio orchestrator: listening, speaking and radio control overlap.
+
+The blocking loop in main.main() does one thing at a time: it greets,
+then starts transcribing, then handles a command, then speaks the reply.
+Here each of those is a task on one event loop:
+
+- transcription resumes as soon as the wake word fires, while the
+  greeting is still playing
+- a command's radio change and its spoken reply run together
+- speech is cancelled (barge-in) when the user says something, or says
+  the wake word again while Much is talking
+- once a command is handled, its reply is let finish and the audio heard
+  meanwhile is dropped, so "Playing radio 4" is not run as a command
+- with an EagerCommandDispatcher, commands run from partial transcripts
+  on the event loop, and the final text is reconciled as in main.py
+
+Blocking work (wake word inference, Whisper, mpv, audio output) runs in
+worker threads; the loop only coordinates.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Protocol
+
+from much_miller.audio.session_recorder import SessionRecorder
+from much_miller.commands import GREETING, OVER, PLAY, STOP, count_command, parse_command
+from much_miller.radio.ports import AsyncRadioPlayerPort
+from much_miller.telemetry import tracing
+from much_miller.transcription.eager import EagerCommandDispatcher
+from much_miller.transcription.session import TranscriptionSession
+from much_miller.wake_word.detector import Detection
+from much_miller.wake_word.ports import AsyncSpeakerPort
+
+
+class WakeListener(Protocol):
+    """The part of WakeWordDetector used by the orchestrator."""
+
+    def listen(self, stop: threading.Event | None = None) -> Detection | None: ...
+
+
+class Orchestrator:
+    """Runs wake word, speech, transcription and radio as concurrent tasks."""
+
+    def __init__(
+        self,
+        detector: WakeListener,
+        session: TranscriptionSession,
+        radio: AsyncRadioPlayerPort,
+        speaker: AsyncSpeakerPort | None,
+        greeting: str = GREETING,
+        recorder: SessionRecorder | None = None,
+        dispatcher: EagerCommandDispatcher | None = None,
+    ) -> None:
+        """Initialize the orchestrator.
+
+        Args:
+            detector: Wake word detector
+            session: Transcription session (resumed for each turn)
+            radio: Radio player for commands
+            speaker: Speaker for the greeting and replies, or None to print
+            greeting: What to say when the wake word fires
+            recorder: Session recorder to mark wake words and commands in
+            dispatcher: Runs commands from partial transcripts, or None to
+                wait for the final text
+        """
+        self._detector = detector
+        self._session = session
+        self._radio = radio
+        self._speaker = speaker
+        self._greeting = greeting
+        self._recorder = recorder
+        self._dispatcher = dispatcher
+        self._speech: asyncio.Task[None] | None = None
+        self.barge_ins = 0
+
+    async def run(self) -> None:
+        """Handle wake word turns until capture stops or the task is cancelled.
+
+        The transcription session is shut down on the way out, so no
+        worker thread is left blocked on it.
+        """
+        try:
+            while True:
+                print("Listening for wake word...")
+                detection = await self.listen()
+                if detection is None:
+                    print("Audio capture stopped")
+                    return
+                print(f"\n*** Wake word detected: {detection.model_name} ***\n")
+                if self._recorder is not None:
+                    self._recorder.mark("wake", detection.position, model=detection.model_name)
+                await self.turn(detection)
+        finally:
+            await self.interrupt_speech()
+            self._session.shutdown()
+
+    async def listen(self) -> Detection | None:
+        """Wait for the wake word without blocking the event loop."""
+        stop = threading.Event()
+
+        def listen_in_thread() -> tuple[Detection | None, tracing.Trace | None]:
+            detection = self._detector.listen(stop)
+            return detection, tracing.current_trace()
+
+        worker = asyncio.ensure_future(asyncio.to_thread(listen_in_thread))
+        try:
+            detection, trace = await asyncio.shield(worker)
+        finally:
+            stop.set()
+            # If cancelled, the thread is still inside detector.listen() until
+            # it sees stop; wait for it so the next listen() cannot overlap
+            await asyncio.gather(worker, return_exceptions=True)
+        # The detector starts the interaction's trace in the worker thread
+        tracing.use_trace(trace)
+        return detection
+
+    async def turn(self, detection: Detection, detected_at: float | None = None) -> None:
+        """Greet, then transcribe and handle commands until the user says "over".
+
+        Args:
+            detection: The wake word that started the turn
+            detected_at: time.perf_counter() when it fired (defaults to now)
+        """
+        detected_at = time.perf_counter() if detected_at is None else detected_at
+        if self._dispatcher is not None:
+            loop = asyncio.get_running_loop()
+            # Partials arrive on the recorder's thread; commands run on the loop
+            self._dispatcher.begin(
+                lambda partial: asyncio.run_coroutine_threadsafe(
+                    self.handle_command(partial), loop
+                ).result()
+            )
+        self.say(self._greeting, stage="greet")
+        self._session.resume(started_at=detected_at, from_position=detection.position)
+        barge_in = asyncio.create_task(self._barge_in_on_wake_word())
+        print("Listening... (say 'over' to stop)\n")
+        try:
+            while True:
+                started = time.perf_counter()
+                text = await asyncio.to_thread(self._session.text)
+                tracing.record("transcribe", started, chars=len(text or ""))
+                text = (text or "").strip()
+                if not text:
+                    continue
+                print(f">>> {text}")
+                if self._recorder is not None:
+                    self._recorder.mark("command", text=text)
+                # Off the loop: it waits for an eager command still running on it
+                handled_early = self._dispatcher is not None and not await asyncio.to_thread(
+                    self._dispatcher.claim_final, text
+                )
+                # The user is talking, so stop talking over them (unless
+                # this is the reply to what they said)
+                if not handled_early and await self.interrupt_speech():
+                    self.barge_ins += 1
+
+                command = parse_command(text)
+                if command is not None and command.action == OVER:
+                    print("\n[Heard 'over' - returning to wake word mode]\n")
+                    return
+
+                handled = handled_early
+                if not handled_early:
+                    with tracing.span("command") as span:
+                        span["handled"] = await self.handle_command(text)
+                    count_command(span["handled"])
+                    handled = span["handled"]
+                if handled and self._speaker is not None:
+                    # Let the reply finish, then drop what the microphone heard
+                    # of it before listening again
+                    await self.finish_speaking()
+                    self._session.clear()
+        finally:
+            if self._dispatcher is not None:
+                self._dispatcher.end()
+            barge_in.cancel()
+            await asyncio.gather(barge_in, return_exceptions=True)
+            latency = self._session.first_transcript_latency
+            if latency is not None:
+                print(f"[Wake to first transcript: {latency:.2f}s]")
+            self._session.pause()
+            tracing.end_trace()
+
+    async def handle_command(self, text: str) -> bool:
+        """Handle a voice command, changing the radio while replying.
+
+        Returns True if command was recognised and handled.
+        """
+        command = parse_command(text)
+        if command is None or command.action == OVER:
+            return False
+
+        if command.action == PLAY:
+            self.say(command.reply)
+            if command.station_id is not None:
+                await self._radio.play(command.station_id, command.station_name)
+            return True
+
+        if command.action == STOP and self._radio.is_playing():
+            await self._radio.stop()
+            self.say(command.reply)
+        return True
+
+    def say(self, text: str, stage: str = "say") -> asyncio.Task[None] | None:
+        """Start speaking in the background, replacing any current reply.
+
+        Returns:
+            The speech task, or None if there is no speaker
+        """
+        if self._speaker is None:
+            print(f"[{text}]")
+            return None
+        previous = self._speech
+        self._speech = asyncio.create_task(self._speak(text, stage, previous))
+        return self._speech
+
+    async def finish_speaking(self) -> None:
+        """Wait for the current reply, if any, to finish."""
+        if self._speech is not None:
+            await asyncio.gather(self._speech, return_exceptions=True)
+
+    async def interrupt_speech(self) -> bool:
+        """Cancel the current reply and wait for the audio to stop.
+
+        Returns:
+            True if a reply was cut short
+        """
+        speech = self._speech
+        self._speech = None
+        if speech is None or speech.done():
+            return False
+        speech.cancel()
+        await asyncio.gather(speech, return_exceptions=True)
+        return True
+
+    async def _speak(
+        self,
+        text: str,
+        stage: str,
+        previous: asyncio.Task[None] | None,
+    ) -> None:
+        if previous is not None and not previous.done():
+            previous.cancel()
+            await asyncio.gather(previous, return_exceptions=True)
+        assert self._speaker is not None
+        with tracing.span(stage, chars=len(text)) as span:
+            try:
+                await self._speaker.say(text)
+            except asyncio.CancelledError:
+                span["interrupted"] = True
+                raise
+
+    async def _barge_in_on_wake_word(self) -> None:
+        while True:
+            detection = await self.listen()
+            if detection is None:
+                return
+            if await self.interrupt_speech():
+                self.barge_ins += 1
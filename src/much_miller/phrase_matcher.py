@@ -0,0 +1,189 @@
+"""Compiled multi-phrase matcher for spoken commands.
+
+Phrases are matched word by word, not character by character, using an
+Aho-Corasick automaton built once over the phrases' words. A single pass
+over the transcript finds every phrase it contains, and the longest one
+wins, so "bbc news" beats "news".
+
+Words are normalised before matching so that common mishearings match
+without being listed: number words and their homophones become digits
+("three" -> "3", "for" -> "4"), and a word that is not in any phrase is
+replaced by the phrase word it is one edit away from ("radeo" -> "radio").
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Generic, Iterable, Sequence, TypeVar
+
+V = TypeVar("V")
+
+_WORD = re.compile(r"[a-z0-9']+")
+
+# Number words and words Whisper often hears in their place
+_HOMOPHONES = {
+    "zero": "0", "oh": "0",
+    "one": "1", "won": "1",
+    "two": "2", "to": "2", "too": "2",
+    "three": "3", "tree": "3",
+    "four": "4", "for": "4", "fore": "4",
+    "five": "5",
+    "six": "6",
+    "seven": "7",
+    "eight": "8", "ate": "8",
+    "nine": "9",
+    "ten": "10",
+}
+
+
+def words(text: str) -> list[str]:
+    """Split text into lower-case words."""
+    return _WORD.findall(text.lower())
+
+
+def canonical(word: str) -> str:
+    """Return the normalised form of a single word."""
+    return _HOMOPHONES.get(word, word)
+
+
+def edit_distance(a: Sequence[str], b: Sequence[str], limit: int) -> int:
+    """Return the Levenshtein distance, or limit + 1 once it exceeds limit.
+
+    Works on strings (characters) and on lists of words alike.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b),
+            ))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+@dataclass(frozen=True)
+class Match(Generic[V]):
+    """A phrase found in a transcript."""
+
+    value: V
+    phrase: str
+    start: int
+    end: int
+
+    @property
+    def length(self) -> int:
+        """Return the number of words matched."""
+        return self.end - self.start
+
+
+class PhraseMatcher(Generic[V]):
+    """Finds the longest known phrase in a transcript in one pass."""
+
+    def __init__(self, phrases: dict[str, V] | Iterable[tuple[str, V]]) -> None:
+        """Compile the phrases.
+
+        Args:
+            phrases: Phrase -> value. Phrases that normalise to the same
+                words keep the first phrase and value given.
+        """
+        items = phrases.items() if isinstance(phrases, dict) else phrases
+        self._children: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # (phrase, value, word count) for a phrase ending at each node
+        self._output: list[tuple[str, V, int] | None] = [None]
+        # Nearest node on the fail chain with an output
+        self._output_link: list[int] = [0]
+        for phrase, value in items:
+            self._add(phrase, value)
+        self._vocabulary = frozenset(
+            word for children in self._children for word in children
+        )
+        self._by_length: dict[int, list[str]] = {}
+        for word in sorted(self._vocabulary):
+            self._by_length.setdefault(len(word), []).append(word)
+        self._build_links()
+        self._nearest = lru_cache(maxsize=4096)(self._nearest_word)
+
+    def phrases(self) -> list[str]:
+        """Return the phrases kept after normalisation."""
+        return [output[0] for output in self._output if output is not None]
+
+    def find_all(self, text: str) -> list[Match[V]]:
+        """Return every phrase occurring in the text."""
+        matches: list[Match[V]] = []
+        node = 0
+        for index, word in enumerate(self._normalise(text)):
+            while node and word not in self._children[node]:
+                node = self._fail[node]
+            node = self._children[node].get(word, 0)
+            found = node if self._output[node] is not None else self._output_link[node]
+            while found:
+                phrase, value, length = self._output[found]  # type: ignore[misc]
+                matches.append(Match(value, phrase, index + 1 - length, index + 1))
+                found = self._output_link[found]
+        return matches
+
+    def match(self, text: str) -> Match[V] | None:
+        """Return the longest phrase in the text (earliest if tied), or None."""
+        best: Match[V] | None = None
+        for candidate in self.find_all(text):
+            if best is None or (candidate.length, -candidate.start) > (best.length, -best.start):
+                best = candidate
+        return best
+
+    def _normalise(self, text: str) -> list[str]:
+        return [self._nearest(canonical(word)) for word in words(text)]
+
+    def _nearest_word(self, word: str) -> str:
+        if word in self._vocabulary or word.isdigit() or len(word) < 4:
+            return word
+        limit = 1 if len(word) < 8 else 2
+        close = [
+            known
+            for length in range(len(word) - limit, len(word) + limit + 1)
+            for known in self._by_length.get(length, ())
+            if edit_distance(word, known, limit) <= limit
+        ]
+        return close[0] if len(close) == 1 else word
+
+    def _add(self, phrase: str, value: V) -> None:
+        phrase_words = [canonical(word) for word in words(phrase)]
+        if not phrase_words:
+            return
+        node = 0
+        for word in phrase_words:
+            child = self._children[node].get(word)
+            if child is None:
+                child = len(self._children)
+                self._children[node][word] = child
+                self._children.append({})
+                self._fail.append(0)
+                self._output.append(None)
+                self._output_link.append(0)
+            node = child
+        if self._output[node] is None:
+            self._output[node] = (phrase, value, len(phrase_words))
+
+    def _build_links(self) -> None:
+        queue = list(self._children[0].values())
+        while queue:
+            next_queue = []
+            for node in queue:
+                for word, child in self._children[node].items():
+                    fail = self._fail[node]
+                    while fail and word not in self._children[fail]:
+                        fail = self._fail[fail]
+                    self._fail[child] = self._children[fail].get(word, 0)
+                    target = self._fail[child]
+                    self._output_link[child] = (
+                        target if self._output[target] is not None else self._output_link[target]
+                    )
+                    next_queue.append(child)
+            queue = next_queue
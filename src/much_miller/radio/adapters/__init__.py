@@ -2,5 +2,7 @@
 
 from much_miller.radio.adapters.bbc_radio_player import BBCRadioPlayer
 from much_miller.radio.adapters.fake_radio_player import FakeRadioPlayer
+from much_miller.radio.adapters.mpv_ipc_radio_player import MpvIpcRadioPlayer
+from much_miller.radio.adapters.threaded_radio_player import ThreadedRadioPlayer
 
-__all__ = ["BBCRadioPlayer", "FakeRadioPlayer"]
+__all__ = ["BBCRadioPlayer", "FakeRadioPlayer", "MpvIpcRadioPlayer", "ThreadedRadioPlayer"]
@@ -2,13 +2,23 @@
 
 import subprocess
 
+from much_miller.cpu_budget import pin_process
 from much_miller.radio.ports import RadioPlayerPort
+from much_miller.telemetry import cpu_profile, metrics, tracing
+
+_STARTS = metrics.counter("much_miller_radio_process_starts_total", "mpv processes started")
 
 
 class BBCRadioPlayer(RadioPlayerPort):
     """Plays BBC radio streams via mpv."""
 
-    def __init__(self) -> None:
+    def __init__(self, cpus: frozenset[int] | None = None) -> None:
+        """Initialize the player.
+
+        Args:
+            cpus: CPUs each mpv process is pinned to, or None for any
+        """
+        self._cpus = cpus
         self._process: subprocess.Popen[bytes] | None = None
         self._current_station: str | None = None
 
@@ -24,19 +34,29 @@ class BBCRadioPlayer(RadioPlayerPort):
             station_id: The BBC station identifier (e.g., 'bbc_radio_three')
             station_name: Human-readable station name for display
         """
-        self.stop()
-        url = f"https://lsn.lv/bbcradio.m3u8?station={station_id}&bitrate=320000"
-        self._process = subprocess.Popen(
-            ["mpv", "--no-video", "--really-quiet", url],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
-        self._current_station = station_name
+        with tracing.span("radio.play", station=station_id):
+            self.stop()
+            url = f"https://lsn.lv/bbcradio.m3u8?station={station_id}&bitrate=320000"
+            self._process = subprocess.Popen(
+                ["mpv", "--no-video", "--really-quiet", url],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            pin_process(self._process.pid, self._cpus)
+            cpu_profile.add_process("mpv", self._process.pid)
+            _STARTS.inc()
+            self._current_station = station_name
 
     def stop(self) -> None:
         """Stop playback."""
         if self._process:
+            cpu_profile.process_ended(self._process.pid)
             self._process.terminate()
+            try:
+                self._process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
             self._process = None
             self._current_station = None
 
@@ -0,0 +1,263 @@
+"""BBC Radio player adapter driving one long-lived mpv over JSON IPC."""
+
+import json
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+import urllib.request
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from much_miller.cpu_budget import pin_process
+from much_miller.radio.ports import RadioPlayerPort
+from much_miller.telemetry import cpu_profile, metrics, tracing
+
+_STARTS = metrics.counter("much_miller_radio_process_starts_total", "mpv processes started")
+_RESTARTS = metrics.counter("much_miller_radio_restarts_total", "mpv restarts after it went away")
+
+STREAM_URL = "https://lsn.lv/bbcradio.m3u8?station={station_id}&bitrate=320000"
+
+
+def stream_url(station_id: str) -> str:
+    """Return the lsn.lv URL for a station."""
+    return STREAM_URL.format(station_id=station_id)
+
+
+def resolve_stream_url(station_id: str, timeout: float = 5.0) -> str:
+    """Follow lsn.lv's redirects to the station's HLS playlist URL.
+
+    Falls back to the lsn.lv URL if the lookup fails.
+    """
+    url = stream_url(station_id)
+    request = urllib.request.Request(url, method="HEAD")
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.geturl()
+    except OSError:
+        return url
+
+
+class MpvIpcRadioPlayer(RadioPlayerPort):
+    """Plays BBC radio streams through one mpv process kept idle between stations.
+
+    Starting mpv for every station costs process startup, a fresh TLS
+    handshake and playlist resolution. This player starts mpv once with
+    --idle and an IPC socket, and switches station with "loadfile". The
+    redirect from lsn.lv to the BBC playlist is resolved once per station
+    and cached for url_ttl seconds.
+
+    If mpv exits, it is reaped and restarted on the next command. close()
+    asks mpv to quit and kills it if it does not.
+
+    Commands may come from more than one thread (eager commands run on
+    the transcriber's thread), so each one holds a lock around the
+    socket until its reply has been read.
+    """
+
+    def __init__(
+        self,
+        mpv_command: list[str] | None = None,
+        resolve_url: Callable[[str], str] = resolve_stream_url,
+        url_ttl: float = 3600.0,
+        start_timeout: float = 5.0,
+        cpus: frozenset[int] | None = None,
+    ) -> None:
+        """Initialize the player; mpv is started on first use.
+
+        Args:
+            mpv_command: Command that starts mpv (default ["mpv"]); IPC
+                options are appended
+            resolve_url: Turns a station ID into the URL mpv should load
+            url_ttl: Seconds a resolved URL is reused
+            start_timeout: Seconds to wait for mpv's IPC socket
+            cpus: CPUs mpv is pinned to, or None for any
+        """
+        self._mpv_command = mpv_command or ["mpv"]
+        self._resolve_url = resolve_url
+        self._url_ttl = url_ttl
+        self._start_timeout = start_timeout
+        self._cpus = cpus
+        self._socket_dir = Path(tempfile.mkdtemp(prefix="much-miller-mpv-"))
+        self._socket_path = self._socket_dir / "mpv.sock"
+        self._process: subprocess.Popen[bytes] | None = None
+        self._connection: socket.socket | None = None
+        self._reader: Any = None
+        self._request_id = 0
+        self._lock = threading.Lock()
+        self._urls: dict[str, tuple[str, float]] = {}
+        self._urls_lock = threading.Lock()
+        self._current_station: str | None = None
+        self.restarts = 0
+
+    @property
+    def current_station(self) -> str | None:
+        """Return the name of the currently playing station, or None."""
+        return self._current_station
+
+    @property
+    def process_id(self) -> int | None:
+        """Return mpv's process ID, or None if it is not running."""
+        return self._process.pid if self._process is not None else None
+
+    def start(self) -> None:
+        """Start mpv now rather than on the first command."""
+        with self._lock:
+            self._ensure_running()
+
+    def prefetch(self, station_ids: Iterable[str]) -> threading.Thread:
+        """Resolve stream URLs in the background so first plays skip it."""
+        thread = threading.Thread(
+            target=lambda: [self.stream_url(station_id) for station_id in station_ids],
+            name="mpv-prefetch",
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    def stream_url(self, station_id: str) -> str:
+        """Return the cached stream URL for a station, resolving it if stale."""
+        now = time.monotonic()
+        with self._urls_lock:
+            cached = self._urls.get(station_id)
+        if cached is not None and now - cached[1] < self._url_ttl:
+            return cached[0]
+        url = self._resolve_url(station_id)
+        with self._urls_lock:
+            self._urls[station_id] = (url, now)
+        return url
+
+    def play(self, station_id: str, station_name: str) -> None:
+        """Switch mpv to a station.
+
+        Args:
+            station_id: The BBC station identifier (e.g., 'bbc_radio_three')
+            station_name: Human-readable station name for display
+        """
+        with tracing.span("radio.play", station=station_id, mode="ipc"):
+            self.command("loadfile", self.stream_url(station_id), "replace")
+            self._current_station = station_name
+
+    def stop(self) -> None:
+        """Stop playback, leaving mpv idle."""
+        if self._current_station is None:
+            return
+        self._current_station = None
+        if self._alive():
+            self.command("stop")
+
+    def is_playing(self) -> bool:
+        """Check if currently playing."""
+        return self._current_station is not None and self._alive()
+
+    def command(self, *args: Any) -> Any:
+        """Send an IPC command, restarting mpv once if it has gone away.
+
+        Returns:
+            The command's "data" field, if any
+
+        Raises:
+            RuntimeError: If mpv reports an error
+        """
+        with self._lock:
+            try:
+                self._ensure_running()
+                return self._send(list(args))
+            except (OSError, EOFError):
+                self._reap()
+                self.restarts += 1
+                _RESTARTS.inc()
+                self._ensure_running()
+                return self._send(list(args))
+
+    def close(self) -> None:
+        """Quit mpv and remove the IPC socket."""
+        with self._lock:
+            if self._alive():
+                try:
+                    self._send(["quit"])
+                except (OSError, EOFError, RuntimeError):
+                    pass
+            self._reap()
+        self._current_station = None
+        shutil.rmtree(self._socket_dir, ignore_errors=True)
+
+    def _alive(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    def _ensure_running(self) -> None:
+        if self._alive() and self._connection is not None:
+            return
+        self._reap()
+        self._socket_path.unlink(missing_ok=True)
+        self._process = subprocess.Popen(
+            [
+                *self._mpv_command,
+                "--idle=yes",
+                "--no-video",
+                "--really-quiet",
+                f"--input-ipc-server={self._socket_path}",
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        pin_process(self._process.pid, self._cpus)
+        cpu_profile.add_process("mpv", self._process.pid)
+        _STARTS.inc()
+        self._connection = self._connect()
+        self._reader = self._connection.makefile("rb")
+
+    def _connect(self) -> socket.socket:
+        deadline = time.monotonic() + self._start_timeout
+        while True:
+            if self._process is not None and self._process.poll() is not None:
+                raise RuntimeError(f"mpv exited with code {self._process.returncode}")
+            connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                connection.connect(str(self._socket_path))
+                return connection
+            except OSError:
+                connection.close()
+                if time.monotonic() > deadline:
+                    self._reap()
+                    raise RuntimeError("mpv IPC socket did not appear")
+                time.sleep(0.01)
+
+    def _send(self, command: list[Any]) -> Any:
+        if self._connection is None:
+            raise EOFError("not connected to mpv")
+        self._request_id += 1
+        request_id = self._request_id
+        message = json.dumps({"command": command, "request_id": request_id}) + "\n"
+        self._connection.sendall(message.encode())
+        while True:
+            line = self._reader.readline()
+            if not line:
+                raise EOFError("mpv closed the IPC connection")
+            reply = json.loads(line)
+            if reply.get("request_id") != request_id:
+                continue  # an event, or a reply to an abandoned request
+            if reply.get("error") != "success":
+                raise RuntimeError(f"mpv {command[0]} failed: {reply.get('error')}")
+            return reply.get("data")
+
+    def _reap(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        if self._process is not None:
+            cpu_profile.process_ended(self._process.pid)
+            if self._process.poll() is None:
+                self._process.terminate()
+                try:
+                    self._process.wait(timeout=2)
+                except subprocess.TimeoutExpired:
+                    self._process.kill()
+                    self._process.wait()
+            self._process = None
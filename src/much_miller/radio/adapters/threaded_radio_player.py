@@ -0,0 +1,40 @@
+"""Async radio adapter running a blocking RadioPlayerPort in a worker thread."""
+
+import asyncio
+
+from much_miller.radio.ports import AsyncRadioPlayerPort, RadioPlayerPort
+
+
+class ThreadedRadioPlayer(AsyncRadioPlayerPort):
+    """Runs RadioPlayerPort calls in a thread so the event loop keeps going.
+
+    Calls are serialised, so a stop cannot overtake the play before it.
+    """
+
+    def __init__(self, player: RadioPlayerPort) -> None:
+        self._player = player
+        self._lock = asyncio.Lock()
+
+    @property
+    def current_station(self) -> str | None:
+        """Return the name of the currently playing station, or None."""
+        return self._player.current_station
+
+    async def play(self, station_id: str, station_name: str) -> None:
+        """Start playing a station.
+
+        Args:
+            station_id: The BBC station identifier (e.g., 'bbc_radio_three')
+            station_name: Human-readable station name for display
+        """
+        async with self._lock:
+            await asyncio.to_thread(self._player.play, station_id, station_name)
+
+    async def stop(self) -> None:
+        """Stop playback."""
+        async with self._lock:
+            await asyncio.to_thread(self._player.stop)
+
+    def is_playing(self) -> bool:
+        """Check if currently playing."""
+        return self._player.is_playing()
@@ -1,5 +1,6 @@
 """Radio ports (abstract interfaces)."""
 
+from much_miller.radio.ports.async_radio_player import AsyncRadioPlayerPort
 from much_miller.radio.ports.radio_player import RadioPlayerPort
 
-__all__ = ["RadioPlayerPort"]
+__all__ = ["AsyncRadioPlayerPort", "RadioPlayerPort"]
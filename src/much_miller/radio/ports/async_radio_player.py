@@ -0,0 +1,29 @@
+"""Abstract base class for radio playback from asyncio code."""
+
+from abc import ABC, abstractmethod
+
+
+class AsyncRadioPlayerPort(ABC):
+    """Async counterpart of RadioPlayerPort."""
+
+    @property
+    @abstractmethod
+    def current_station(self) -> str | None:
+        """Return the name of the currently playing station, or None."""
+
+    @abstractmethod
+    async def play(self, station_id: str, station_name: str) -> None:
+        """Start playing a station.
+
+        Args:
+            station_id: The station identifier for the stream URL
+            station_name: Human-readable station name for display
+        """
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Stop playback."""
+
+    @abstractmethod
+    def is_playing(self) -> bool:
+        """Check if currently playing."""
@@ -27,3 +27,6 @@ class RadioPlayerPort(ABC):
     @abstractmethod
     def is_playing(self) -> bool:
         """Check if currently playing."""
+
+    def close(self) -> None:
+        """Release the player's resources (nothing by default)."""
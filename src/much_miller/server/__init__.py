@@ -0,0 +1 @@
+"""Server mode: one warm set of engines shared by thin clients in each room."""
@@ -0,0 +1,108 @@
+"""Run the server: python -m much_miller.server --port 8765."""
+
+import argparse
+import asyncio
+import os
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+from much_miller.audio.microphone import RATE
+from much_miller.server.transcription_queue import TranscriptionQueue
+from much_miller.server.wake_engine import WakeEngine
+from much_miller.server.wake_server import Synthesizer, WakeServer
+from much_miller.telemetry import metrics
+from much_miller.transcription.calibration import choose_whisper
+from much_miller.wake_word.detector import DEFAULT_THRESHOLD
+
+
+def load_synthesizer() -> Synthesizer | None:
+    """Load the Piper voice named by MUCH_MILLER_MODEL_PATH, if any.
+
+    Replies are rendered for clients to play, so the server opens no
+    audio output.
+    """
+    model_path_str = os.environ.get("MUCH_MILLER_MODEL_PATH")
+    if not model_path_str or not Path(model_path_str).exists():
+        print("Warning: MUCH_MILLER_MODEL_PATH not set or missing, replying with text only")
+        return None
+
+    from much_miller.wake_word.adapters import PiperSpeaker
+
+    print(f"Loading TTS model: {model_path_str}")
+    return PiperSpeaker(model_path=Path(model_path_str))
+
+
+def create_engines(
+    speech: bool = True, max_batch: int = 4
+) -> tuple[WakeEngine, TranscriptionQueue, Synthesizer | None]:
+    """Load the wake word models, Whisper and, optionally, the Piper voice once.
+
+    Whisper is chosen as in single-room mode (see choose_whisper).
+    """
+    from much_miller.transcription.adapters import FasterWhisperTranscriber
+    from much_miller.wake_word.stacked_model import load_stacked_model
+
+    print("Loading wake word models...")
+    # No streams yet: each client adds one when it connects
+    wake = WakeEngine(load_stacked_model(0), DEFAULT_THRESHOLD)
+    whisper = choose_whisper()
+    transcription = TranscriptionQueue(
+        FasterWhisperTranscriber(whisper.model_size, compute_type=whisper.compute_type),
+        max_batch=max_batch,
+        sample_rate=RATE,
+    )
+    print(f"Loading Whisper {whisper.describe()}...")
+    transcription.start()
+    return wake, transcription, load_synthesizer() if speech else None
+
+
+async def serve(args: argparse.Namespace) -> None:
+    """Serve clients until interrupted."""
+    wake, transcription, synthesizer = create_engines(not args.no_speech, args.max_batch)
+    server = WakeServer(wake, transcription, synthesizer, listen_seconds=args.listen_seconds)
+    metrics_server = metrics.serve(args.metrics_port) if args.metrics_port else None
+    try:
+        if args.unix:
+            await server.start_unix(str(args.unix))
+            print(f"Listening on {args.unix}")
+        else:
+            port = await server.start_tcp(args.host, args.port)
+            print(f"Listening on {args.host}:{port}")
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+        transcription.close()
+        if metrics_server is not None:
+            metrics_server.stop()
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m much_miller.server",
+        description="Serve wake word, transcription and replies to many rooms.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", type=Path, metavar="PATH", help="listen on a Unix socket")
+    parser.add_argument("--no-speech", action="store_true", help="reply with text only")
+    parser.add_argument(
+        "--max-batch", type=int, default=4, help="most utterances transcribed together"
+    )
+    parser.add_argument("--listen-seconds", type=float, default=8.0)
+    parser.add_argument("--metrics-port", type=int, metavar="PORT")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Main entry point."""
+    load_dotenv()
+    try:
+        asyncio.run(serve(parse_args(argv)))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
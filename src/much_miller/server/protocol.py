@@ -0,0 +1,81 @@
+"""Messages between room clients and the server.
+
+Clients and the server exchange length-prefixed messages over a local
+TCP or Unix socket: a one-byte kind, the payload length as a 4-byte
+big-endian integer, then the payload.
+
+    HELLO   client -> server  JSON: {"name": "kitchen", "speech": true}
+    AUDIO   client -> server  16 kHz mono int16 PCM, any length
+    EVENT   server -> client  JSON: {"event": "wake" | "transcript" | "reply" | ...}
+    SPEECH  server -> client  4-byte sample rate, then int16 PCM of a reply
+
+A client sends HELLO first, then streams AUDIO for as long as it is
+connected; closing the socket ends the session.
+"""
+
+import asyncio
+import json
+import struct
+from typing import Any
+
+HELLO = b"H"
+AUDIO = b"A"
+EVENT = b"E"
+SPEECH = b"S"
+
+KINDS = (HELLO, AUDIO, EVENT, SPEECH)
+MAX_PAYLOAD = 16 * 1024 * 1024
+
+_HEADER = struct.Struct(">cI")
+
+
+class ProtocolError(ValueError):
+    """Raised for a message that breaks the protocol."""
+
+
+def encode(kind: bytes, payload: bytes) -> bytes:
+    """Return one message ready to write to the socket."""
+    return _HEADER.pack(kind, len(payload)) + payload
+
+
+def encode_json(kind: bytes, message: dict[str, Any]) -> bytes:
+    """Return a HELLO or EVENT message carrying JSON."""
+    return encode(kind, json.dumps(message).encode())
+
+
+def encode_speech(pcm: bytes, sample_rate: int) -> bytes:
+    """Return a SPEECH message for int16 PCM at sample_rate."""
+    return encode(SPEECH, struct.pack(">I", sample_rate) + pcm)
+
+
+def decode_speech(payload: bytes) -> tuple[bytes, int]:
+    """Return the PCM and sample rate from a SPEECH payload."""
+    (sample_rate,) = struct.unpack(">I", payload[:4])
+    return payload[4:], sample_rate
+
+
+async def read_message(reader: asyncio.StreamReader) -> tuple[bytes, bytes] | None:
+    """Read the next message.
+
+    Returns:
+        (kind, payload), or None when the other end closed cleanly
+
+    Raises:
+        ProtocolError: For an unknown kind, an oversized payload or a
+            message cut off part way
+    """
+    try:
+        header = await reader.readexactly(_HEADER.size)
+    except asyncio.IncompleteReadError as e:
+        if not e.partial:
+            return None
+        raise ProtocolError("connection closed inside a message header") from e
+    kind, length = _HEADER.unpack(header)
+    if kind not in KINDS:
+        raise ProtocolError(f"unknown message kind {kind!r}")
+    if length > MAX_PAYLOAD:
+        raise ProtocolError(f"message of {length} bytes is too large")
+    try:
+        return kind, await reader.readexactly(length)
+    except asyncio.IncompleteReadError as e:
+        raise ProtocolError("connection closed inside a message") from e
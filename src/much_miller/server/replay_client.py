@@ -0,0 +1,127 @@
+"""A simulated room: streams recorded audio to the server and times the answers."""
+
+import asyncio
+import bisect
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from much_miller.server.protocol import (
+    AUDIO,
+    EVENT,
+    HELLO,
+    SPEECH,
+    decode_speech,
+    encode,
+    encode_json,
+    read_message,
+)
+
+
+@dataclass
+class ClientResult:
+    """What one simulated room sent and heard back."""
+
+    name: str
+    audio_seconds: float
+    wall_seconds: float = 0.0
+    events: list[dict[str, Any]] = field(default_factory=list)
+    latencies: list[float] = field(default_factory=list)
+    speech_seconds: float = 0.0
+
+    def of(self, event: str) -> list[dict[str, Any]]:
+        """Return the events of one kind, in order."""
+        return [message for message in self.events if message["event"] == event]
+
+
+async def replay(
+    samples: np.ndarray,
+    name: str,
+    port: int | None = None,
+    host: str = "127.0.0.1",
+    path: str | None = None,
+    speed: float = 1.0,
+    chunk_size: int = 1280,
+    speech: bool = False,
+    tail_seconds: float = 1.5,
+    sample_rate: int = 16000,
+) -> ClientResult:
+    """Stream audio to the server as a room client would.
+
+    Latency is measured from sending the last sample of an utterance to
+    receiving its transcript; the server reports where each utterance
+    ended, in samples.
+
+    Args:
+        samples: 16 kHz mono int16 audio to send
+        name: Client name, unique among connected clients
+        port: Server TCP port (or give path)
+        host: Server address
+        path: Server Unix socket path
+        speed: Multiple of real time to send at (0 for as fast as possible)
+        chunk_size: Samples per AUDIO message
+        speech: Ask for replies as audio as well as text
+        tail_seconds: Silence sent after the audio, so the last
+            utterance ends
+        sample_rate: Rate of the audio
+
+    Returns:
+        The events received and the latency of each transcript
+    """
+    if path is not None:
+        reader, writer = await asyncio.open_unix_connection(path)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+    audio = np.concatenate(
+        [samples.astype(np.int16), np.zeros(int(tail_seconds * sample_rate), dtype=np.int16)]
+    )
+    result = ClientResult(name, len(audio) / sample_rate)
+    sent_positions: list[int] = []
+    sent_times: list[float] = []
+    started = time.perf_counter()
+
+    async def send() -> None:
+        writer.write(encode_json(HELLO, {"name": name, "speech": speech}))
+        for offset in range(0, len(audio), chunk_size):
+            chunk = audio[offset:offset + chunk_size]
+            if speed > 0:
+                due = started + offset / sample_rate / speed
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            writer.write(encode(AUDIO, chunk.tobytes()))
+            await writer.drain()
+            sent_positions.append(offset + len(chunk))
+            sent_times.append(time.perf_counter())
+        if writer.can_write_eof():
+            writer.write_eof()
+
+    async def receive() -> None:
+        while (message := await read_message(reader)) is not None:
+            kind, payload = message
+            received = time.perf_counter()
+            if kind == SPEECH:
+                pcm, rate = decode_speech(payload)
+                result.speech_seconds += len(pcm) / 2 / rate
+                continue
+            if kind != EVENT:
+                continue
+            event = json.loads(payload)
+            event["received"] = received - started
+            result.events.append(event)
+            if event["event"] == "transcript":
+                index = bisect.bisect_left(sent_positions, event["position"])
+                if index < len(sent_times):
+                    result.latencies.append(received - sent_times[index])
+            if event["event"] in ("bye", "error"):
+                return
+
+    try:
+        await asyncio.gather(send(), receive())
+    finally:
+        writer.close()
+    result.wall_seconds = time.perf_counter() - started
+    return result
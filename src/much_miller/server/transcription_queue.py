@@ -0,0 +1,158 @@
+"""One warm transcriber shared by every client, fed in micro-batches."""
+
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+
+import numpy as np
+
+from much_miller.telemetry import metrics
+from much_miller.transcription.ports import TranscriberPort
+
+_WAIT = metrics.histogram(
+    "much_miller_server_transcription_wait_seconds", "Time utterances wait in the queue"
+)
+_BATCH_SIZE = metrics.histogram(
+    "much_miller_server_transcription_batch_size",
+    "Utterances transcribed together",
+    (1, 2, 3, 4, 6, 8, 12, 16),
+)
+
+_STOP = None
+
+
+@dataclass
+class TranscriptionQueueStats:
+    """Requests served, and how they were batched."""
+
+    requests: int = 0
+    batches: int = 0
+    wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    @property
+    def mean_batch(self) -> float:
+        """Return the mean number of utterances per batch."""
+        return self.requests / self.batches if self.batches else 0.0
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        """Return the mean time utterances spent queued."""
+        return self.wait_seconds / self.requests if self.requests else 0.0
+
+
+@dataclass
+class _Request:
+    samples: np.ndarray
+    queued_at: float
+    future: "Future[str]"
+
+
+class TranscriptionQueue:
+    """Queues utterances from many clients for one transcriber.
+
+    A worker thread owns the transcriber, so the model is loaded once and
+    stays warm. When an utterance arrives the worker waits batch_seconds
+    for others, then passes up to max_batch of them to transcribe_batch()
+    in one call; utterances that arrive while it is busy form the next
+    batch.
+    """
+
+    def __init__(
+        self,
+        transcriber: TranscriberPort,
+        max_batch: int = 4,
+        batch_seconds: float = 0.05,
+        sample_rate: int = 16000,
+    ) -> None:
+        """Initialize the queue; call start() to load the model and begin.
+
+        Args:
+            transcriber: The shared transcriber
+            max_batch: Most utterances transcribed together
+            batch_seconds: How long the first utterance waits for company
+            sample_rate: Rate of the queued audio
+        """
+        self._transcriber = transcriber
+        self._max_batch = max_batch
+        self._batch_seconds = batch_seconds
+        self._sample_rate = sample_rate
+        self._requests: queue.Queue[_Request | None] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self.stats = TranscriptionQueueStats()
+
+    @property
+    def depth(self) -> int:
+        """Return the number of utterances waiting."""
+        return self._requests.qsize()
+
+    def start(self) -> None:
+        """Load the transcriber and start the worker."""
+        self._transcriber.load()
+        self._thread = threading.Thread(target=self._run, name="transcription", daemon=True)
+        self._thread.start()
+
+    def submit(self, samples: np.ndarray) -> "Future[str]":
+        """Queue an utterance and return a future for its text."""
+        future: Future[str] = Future()
+        self._requests.put(_Request(samples, time.perf_counter(), future))
+        return future
+
+    async def transcribe(self, samples: np.ndarray) -> str:
+        """Queue an utterance and wait for its text without blocking the loop."""
+        return await asyncio.wrap_future(self.submit(samples))
+
+    def close(self) -> None:
+        """Stop the worker after the queued utterances and close the transcriber."""
+        if self._thread is not None:
+            self._requests.put(_STOP)
+            self._thread.join()
+            self._thread = None
+        self._transcriber.close()
+
+    def _run(self) -> None:
+        while True:
+            first = self._requests.get()
+            if first is _STOP:
+                return
+            batch = [first]
+            stopping = False
+            deadline = time.perf_counter() + self._batch_seconds
+            while len(batch) < self._max_batch:
+                remaining = deadline - time.perf_counter()
+                try:
+                    request = self._requests.get(timeout=max(remaining, 0.0))
+                except queue.Empty:
+                    break
+                if request is _STOP:
+                    stopping = True
+                    break
+                batch.append(request)
+            self._transcribe(batch)
+            if stopping:
+                return
+
+    def _transcribe(self, batch: list[_Request]) -> None:
+        started = time.perf_counter()
+        for request in batch:
+            wait = started - request.queued_at
+            self.stats.wait_seconds += wait
+            self.stats.max_wait_seconds = max(self.stats.max_wait_seconds, wait)
+            _WAIT.observe(wait)
+        self.stats.requests += len(batch)
+        self.stats.batches += 1
+        _BATCH_SIZE.observe(len(batch))
+        live = [request for request in batch if request.future.set_running_or_notify_cancel()]
+        try:
+            texts = self._transcriber.transcribe_batch(
+                [request.samples for request in live], self._sample_rate
+            )
+        except Exception as e:
+            for request in live:
+                request.future.set_exception(e)
+            return
+        for request, text in zip(live, texts):
+            request.future.set_result(text)
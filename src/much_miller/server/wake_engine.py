@@ -0,0 +1,154 @@
+"""One wake word engine serving every connected client."""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Protocol
+
+import numpy as np
+
+from much_miller.telemetry import metrics
+from much_miller.wake_word.detector import DEFAULT_THRESHOLD, detect_wake_word
+
+_BATCH = metrics.histogram(
+    "much_miller_server_wake_batch_seconds", "Wake word inference time per batch of clients"
+)
+
+
+@dataclass
+class WakeEngineStats:
+    """How many batches were run and how full they were."""
+
+    batches: int = 0
+    frames: int = 0
+    seconds: float = 0.0
+
+    @property
+    def mean_batch(self) -> float:
+        """Return the mean number of client frames per batch."""
+        return self.frames / self.batches if self.batches else 0.0
+
+    @property
+    def mean_frame_ms(self) -> float:
+        """Return the mean inference time per client frame in milliseconds."""
+        return self.seconds / self.frames * 1000 if self.frames else 0.0
+
+
+class StreamWakeModel(Protocol):
+    """Wake word models shared by streams, scoring any of them in one batch.
+
+    StackedWakeModel, with the ONNX models loaded once by
+    load_stacked_model(0), is the real one.
+    """
+
+    def add_stream(self) -> int: ...
+
+    def reset(self, stream: int | None = None) -> None: ...
+
+    def predict_streams(self, streams: list[int], frames: np.ndarray) -> list[dict[str, float]]: ...
+
+
+class WakeEngine:
+    """Runs wake word inference for many clients, one batch at a time.
+
+    The models are loaded once and shared. Each client only has its own
+    stream of features (openWakeWord keeps a rolling window per stream),
+    which costs nothing to add, so a client connecting does not hold up
+    the others. All inference runs in predict_batch() on one thread, as
+    one stacked call per model for every client in the batch, so the
+    engine uses one core however many rooms are connected. A batch holds
+    the next frame from every client that has one.
+
+    A departed client's stream is cleared and given to the next client.
+    remove() never waits for a batch in progress: the stream is freed the
+    next time the engine is used.
+    """
+
+    def __init__(
+        self,
+        model: StreamWakeModel,
+        threshold: float = DEFAULT_THRESHOLD,
+    ) -> None:
+        """Initialize the engine.
+
+        Args:
+            model: Shared wake word models
+            threshold: Score above which a wake word fires
+        """
+        self._model = model
+        self._threshold = threshold
+        self._streams: dict[str, int] = {}
+        self._free: list[int] = []
+        # Held while the model runs, so streams are not added mid-batch
+        self._lock = threading.Lock()
+        # Clients gone since the lock was last taken; appended without it
+        self._departed: deque[str] = deque()
+        self.stats = WakeEngineStats()
+
+    @property
+    def clients(self) -> list[str]:
+        """Return the clients with a stream."""
+        with self._lock:
+            self._free_departed()
+            return list(self._streams)
+
+    def add(self, client: str) -> None:
+        """Give a client a stream of its own."""
+        with self._lock:
+            self._free_departed()
+            if self._free:
+                stream = self._free.pop()
+                self._model.reset(stream)
+            else:
+                stream = self._model.add_stream()
+            self._streams[client] = stream
+
+    def remove(self, client: str) -> None:
+        """Free a client's stream for the next client, without waiting."""
+        self._departed.append(client)
+
+    def reset(self, client: str) -> None:
+        """Clear a client's scores, so a wake word does not fire twice."""
+        with self._lock:
+            self._free_departed()
+            stream = self._streams.get(client)
+            if stream is not None:
+                self._model.reset(stream)
+
+    def predict_batch(self, frames: dict[str, np.ndarray]) -> dict[str, tuple[str, float]]:
+        """Run one frame for each client, in one batch.
+
+        Args:
+            frames: The next frame from each client
+
+        Returns:
+            The wake word and score for each client where one fired
+        """
+        with self._lock:
+            self._free_departed()
+            clients = [client for client in frames if client in self._streams]
+            started = time.perf_counter()
+            predictions = []
+            if clients:
+                predictions = self._model.predict_streams(
+                    [self._streams[client] for client in clients],
+                    np.stack([frames[client] for client in clients]),
+                )
+            elapsed = time.perf_counter() - started
+        detections = {}
+        for client, prediction in zip(clients, predictions):
+            detection = detect_wake_word(prediction, self._threshold)
+            if detection is not None:
+                detections[client] = detection
+        self.stats.batches += 1
+        self.stats.frames += len(frames)
+        self.stats.seconds += elapsed
+        _BATCH.observe(elapsed)
+        return detections
+
+    def _free_departed(self) -> None:
+        while self._departed:
+            stream = self._streams.pop(self._departed.popleft(), None)
+            if stream is not None:
+                self._free.append(stream)
@@ -0,0 +1,330 @@
+"""Server mode: rooms stream audio to one process with warm engines.
+
+Each room runs a thin client that streams 16 kHz PCM (see protocol.py).
+The server keeps one wake word engine, one Whisper model and, optionally,
+one Piper voice for all of them:
+
+- wake word inference runs in batches holding the next frame from every
+  client still waiting for its wake word (WakeEngine)
+- after a wake word, the client's audio is cut into utterances, which
+  are queued for the shared transcriber and transcribed in micro-batches
+  (TranscriptionQueue)
+- each transcript is answered with a reply event, carrying the action
+  for the client to take (such as the station to play) and, if the
+  client asked for speech, the reply as Piper audio
+
+A client keeps talking to the server after its wake word until it says
+"over" or is silent for listen_seconds, as in the single-room loop.
+"""
+
+import asyncio
+import json
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+import numpy as np
+
+from much_miller.commands import OVER, parse_command
+from much_miller.server.protocol import (
+    AUDIO,
+    EVENT,
+    HELLO,
+    ProtocolError,
+    encode_json,
+    encode_speech,
+    read_message,
+)
+from much_miller.server.transcription_queue import TranscriptionQueue
+from much_miller.server.wake_engine import WakeEngine
+from much_miller.telemetry import metrics
+from much_miller.transcription.endpointer import Endpointer
+
+_CLIENTS = metrics.gauge("much_miller_server_clients", "Clients connected")
+
+
+class Synthesizer(Protocol):
+    """The part of PiperSpeaker used to answer clients with audio."""
+
+    @property
+    def sample_rate(self) -> int: ...
+
+    def render(self, text: str) -> bytes: ...
+
+
+@dataclass(frozen=True)
+class Reply:
+    """How the server answers a transcript."""
+
+    text: str
+    action: str | None = None
+    station_id: str | None = None
+
+
+def interpret(text: str) -> Reply:
+    """Work out the reply to a transcript (see much_miller.commands).
+
+    The action is left to the client: the server does not play the radio
+    in every room.
+    """
+    command = parse_command(text)
+    if command is None:
+        return Reply("")
+    if not command.known:
+        return Reply(command.reply)
+    return Reply(command.reply, command.action, command.station_id)
+
+
+@dataclass
+class _Client:
+    name: str
+    writer: asyncio.StreamWriter
+    speech: bool
+    endpointer: Endpointer
+    waking: bool = True
+    position: int = 0
+    idle_samples: int = 0
+    partial: bytearray = field(default_factory=bytearray)
+    pending: deque[tuple[int, np.ndarray]] = field(default_factory=deque)
+    tasks: set[asyncio.Task[None]] = field(default_factory=set)
+
+    async def send(self, message: bytes) -> None:
+        if self.writer.is_closing():
+            return
+        self.writer.write(message)
+        try:
+            await self.writer.drain()
+        except ConnectionError:
+            pass
+
+    async def event(self, event: str, **fields: Any) -> None:
+        await self.send(encode_json(EVENT, {"event": event, **fields}))
+
+
+class WakeServer:
+    """Serves many room clients from one set of warm engines."""
+
+    def __init__(
+        self,
+        wake: WakeEngine,
+        transcription: TranscriptionQueue,
+        synthesizer: Synthesizer | None = None,
+        frame_size: int = 1280,
+        sample_rate: int = 16000,
+        listen_seconds: float = 8.0,
+        max_pending_frames: int = 50,
+    ) -> None:
+        """Initialize the server; start the transcription queue separately.
+
+        Args:
+            wake: Shared wake word engine
+            transcription: Shared, started transcription queue
+            synthesizer: Renders replies as audio, or None for text only
+            frame_size: Samples per wake word frame
+            sample_rate: Rate of client audio
+            listen_seconds: Silence after which a client goes back to
+                waiting for its wake word
+            max_pending_frames: Frames a client may have waiting for wake
+                inference before the server stops reading from it, so a
+                client sending faster than inference is slowed by TCP
+                flow control rather than losing audio
+        """
+        self._wake = wake
+        self._transcription = transcription
+        self._synthesizer = synthesizer
+        self._synthesis_lock = threading.Lock()
+        self._frame_size = frame_size
+        self._sample_rate = sample_rate
+        self._listen_samples = int(listen_seconds * sample_rate)
+        self._max_pending = max_pending_frames
+        self._clients: dict[str, _Client] = {}
+        self._frames_ready = asyncio.Event()
+        self._batch_done = asyncio.Condition()
+        self._servers: list[asyncio.Server] = []
+        self._wake_task: asyncio.Task[None] | None = None
+
+    @property
+    def clients(self) -> list[str]:
+        """Return the names of the connected clients."""
+        return list(self._clients)
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 8765) -> int:
+        """Listen on a TCP port (0 picks a free one) and return the port."""
+        server = await asyncio.start_server(self._handle, host, port)
+        self._serving(server)
+        return server.sockets[0].getsockname()[1]
+
+    async def start_unix(self, path: str) -> None:
+        """Listen on a Unix socket."""
+        self._serving(await asyncio.start_unix_server(self._handle, path))
+
+    async def close(self) -> None:
+        """Stop listening and disconnect every client."""
+        for server in self._servers:
+            server.close()
+        for client in list(self._clients.values()):
+            client.writer.close()
+        for server in self._servers:
+            await server.wait_closed()
+        self._servers = []
+        if self._wake_task is not None:
+            self._wake_task.cancel()
+            await asyncio.gather(self._wake_task, return_exceptions=True)
+            self._wake_task = None
+
+    def _serving(self, server: asyncio.Server) -> None:
+        self._servers.append(server)
+        if self._wake_task is None:
+            self._wake_task = asyncio.create_task(self._wake_loop())
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        client: _Client | None = None
+        try:
+            hello = await read_message(reader)
+            if hello is None or hello[0] != HELLO:
+                raise ProtocolError("expected HELLO")
+            client = await self._connect(hello[1], writer)
+            while (message := await read_message(reader)) is not None:
+                kind, payload = message
+                if kind == AUDIO:
+                    self._on_audio(client, payload)
+                    await self._caught_up(client, self._max_pending)
+            # The client has finished sending; answer what it already said
+            await self._caught_up(client, 1)
+            while client.tasks:
+                await asyncio.gather(*list(client.tasks), return_exceptions=True)
+            await client.event("bye")
+        except (ProtocolError, ValueError) as e:
+            writer.write(encode_json(EVENT, {"event": "error", "message": str(e)}))
+        except ConnectionError:
+            pass
+        finally:
+            if client is not None:
+                self._disconnect(client)
+            writer.close()
+
+    async def _connect(self, hello: bytes, writer: asyncio.StreamWriter) -> _Client:
+        details = json.loads(hello)
+        name = str(details.get("name") or f"client-{id(writer):x}")
+        if name in self._clients:
+            raise ValueError(f"a client called {name!r} is already connected")
+        client = _Client(
+            name,
+            writer,
+            speech=bool(details.get("speech")) and self._synthesizer is not None,
+            endpointer=Endpointer(self._sample_rate),
+        )
+        self._clients[name] = client
+        _CLIENTS.set(len(self._clients))
+        # Waits for any batch in progress, so off the event loop
+        await asyncio.to_thread(self._wake.add, name)
+        await client.event("ready", frame_size=self._frame_size, sample_rate=self._sample_rate)
+        return client
+
+    def _disconnect(self, client: _Client) -> None:
+        for task in client.tasks:
+            task.cancel()
+        self._clients.pop(client.name, None)
+        self._wake.remove(client.name)
+        _CLIENTS.set(len(self._clients))
+
+    def _on_audio(self, client: _Client, payload: bytes) -> None:
+        client.partial.extend(payload)
+        frame_bytes = self._frame_size * 2
+        while len(client.partial) >= frame_bytes:
+            frame = np.frombuffer(bytes(client.partial[:frame_bytes]), dtype=np.int16)
+            del client.partial[:frame_bytes]
+            client.position += self._frame_size
+            if client.waking:
+                client.pending.append((client.position, frame))
+                self._frames_ready.set()
+            else:
+                self._on_command_frame(client, client.position, frame)
+
+    async def _caught_up(self, client: _Client, limit: int) -> None:
+        """Wait until fewer than limit frames wait for wake inference."""
+        async with self._batch_done:
+            await self._batch_done.wait_for(
+                lambda: not client.waking or len(client.pending) < limit
+            )
+
+    async def _wake_loop(self) -> None:
+        while True:
+            await self._frames_ready.wait()
+            self._frames_ready.clear()
+            while True:
+                batch: dict[str, np.ndarray] = {}
+                positions: dict[str, int] = {}
+                for client in self._clients.values():
+                    if client.waking and client.pending:
+                        positions[client.name], batch[client.name] = client.pending.popleft()
+                if not batch:
+                    break
+                detections = await asyncio.to_thread(self._wake.predict_batch, batch)
+                for name, (model_name, score) in detections.items():
+                    client = self._clients.get(name)
+                    if client is not None and client.waking:
+                        await self._woke(client, model_name, score, positions[name])
+                async with self._batch_done:
+                    self._batch_done.notify_all()
+
+    async def _woke(self, client: _Client, model_name: str, score: float, position: int) -> None:
+        self._wake.reset(client.name)
+        client.waking = False
+        client.idle_samples = 0
+        client.endpointer.reset()
+        await client.event("wake", model=model_name, score=round(score, 3), position=position)
+        # Audio that arrived while inference caught up belongs to the command
+        while client.pending and not client.waking:
+            frame_position, frame = client.pending.popleft()
+            self._on_command_frame(client, frame_position, frame)
+
+    def _on_command_frame(self, client: _Client, position: int, frame: np.ndarray) -> None:
+        utterance = client.endpointer.push(frame)
+        if utterance is None:
+            if client.endpointer.in_utterance:
+                client.idle_samples = 0
+                return
+            client.idle_samples += len(frame)
+            if client.idle_samples >= self._listen_samples and not client.tasks:
+                self._listen_for_wake_word(client)
+                self._send_later(client, client.event("timeout", position=position))
+            return
+        client.idle_samples = 0
+        task = asyncio.create_task(self._answer(client, utterance, position))
+        client.tasks.add(task)
+        task.add_done_callback(client.tasks.discard)
+
+    async def _answer(self, client: _Client, utterance: np.ndarray, position: int) -> None:
+        text = await self._transcription.transcribe(utterance)
+        await client.event("transcript", text=text, position=position)
+        reply = interpret(text)
+        if reply.action == OVER:
+            self._listen_for_wake_word(client)
+        await client.event(
+            "reply",
+            text=reply.text,
+            action=reply.action,
+            station_id=reply.station_id,
+            position=position,
+        )
+        if reply.text and client.speech and self._synthesizer is not None:
+            pcm = await asyncio.to_thread(self._render, reply.text)
+            await client.send(encode_speech(pcm, self._synthesizer.sample_rate))
+
+    def _listen_for_wake_word(self, client: _Client) -> None:
+        client.waking = True
+        client.idle_samples = 0
+        client.endpointer.reset()
+
+    def _render(self, text: str) -> bytes:
+        assert self._synthesizer is not None
+        # One voice; replies for different rooms take turns
+        with self._synthesis_lock:
+            return self._synthesizer.render(text)
+
+    def _send_later(self, client: _Client, sending: Any) -> None:
+        task = asyncio.create_task(sending)
+        client.tasks.add(task)
+        task.add_done_callback(client.tasks.discard)
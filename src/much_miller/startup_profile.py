@@ -0,0 +1,126 @@
+"""Per-phase time and memory report for Much's startup."""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator
+
+_MODULE_LOADED_AT = time.perf_counter()
+
+
+def process_age() -> float:
+    """Return seconds since the current process started.
+
+    Uses /proc on Linux, so interpreter startup and imports are included.
+    Elsewhere it falls back to the time since this module was imported.
+    """
+    try:
+        with open("/proc/self/stat") as stat_file:
+            # The command name may contain spaces; fields follow the last ')'
+            fields = stat_file.read().rsplit(")", 1)[1].split()
+        started_ticks = int(fields[19])
+        with open("/proc/uptime") as uptime_file:
+            uptime = float(uptime_file.read().split()[0])
+        return uptime - started_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, IndexError, ValueError):
+        return time.perf_counter() - _MODULE_LOADED_AT
+
+
+def resident_memory_bytes() -> int:
+    """Return the current resident set size of this process."""
+    try:
+        with open("/proc/self/statm") as statm_file:
+            resident_pages = int(statm_file.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, IndexError, ValueError):
+        import resource
+
+        # ru_maxrss is the peak, in kilobytes on Linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+@dataclass
+class Phase:
+    """One timed startup phase."""
+
+    name: str
+    started: float
+    finished: float
+    rss_bytes: int
+
+    @property
+    def duration(self) -> float:
+        """Return how long the phase took in seconds."""
+        return self.finished - self.started
+
+
+class StartupProfiler:
+    """Records how long each startup phase took and memory after it.
+
+    Times are seconds since the process started. Phases may run in
+    parallel threads, so their durations can add up to more than the
+    total. When disabled, phase() costs nothing beyond a context manager.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self._enabled = enabled
+        self._offset = process_age() - time.perf_counter()
+        self._phases: list[Phase] = []
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if phases are being recorded."""
+        return self._enabled
+
+    @property
+    def phases(self) -> list[Phase]:
+        """Return the recorded phases in the order they finished."""
+        return list(self._phases)
+
+    def now(self) -> float:
+        """Return seconds since the process started."""
+        return time.perf_counter() + self._offset
+
+    def mark(self, name: str, started: float = 0.0) -> None:
+        """Record a phase that ran from started until now.
+
+        Args:
+            name: Phase name
+            started: Seconds since process start (defaults to process start)
+        """
+        if self._enabled:
+            self._record(Phase(name, started, self.now(), resident_memory_bytes()))
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as a named phase."""
+        if not self._enabled:
+            yield
+            return
+        started = self.now()
+        try:
+            yield
+        finally:
+            self._record(Phase(name, started, self.now(), resident_memory_bytes()))
+
+    def report(self) -> str:
+        """Return the recorded phases as a table."""
+        lines = [
+            f"{'phase':<24}{'start s':>10}{'took s':>10}{'RSS MB':>10}",
+            "-" * 54,
+        ]
+        for phase in self._phases:
+            lines.append(
+                f"{phase.name:<24}{phase.started:>10.3f}{phase.duration:>10.3f}"
+                f"{phase.rss_bytes / 1024 / 1024:>10.1f}"
+            )
+        lines.append("-" * 54)
+        lines.append(f"{'total':<24}{'':>10}{self.now():>10.3f}")
+        return "\n".join(lines)
+
+    def _record(self, phase: Phase) -> None:
+        with self._lock:
+            self._phases.append(phase)
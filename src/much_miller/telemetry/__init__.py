@@ -0,0 +1 @@
+"""Tracing and metrics for Much Miller."""
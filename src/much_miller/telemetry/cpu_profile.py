@@ -0,0 +1,162 @@
+"""CPU time used by each engine (wake word, Whisper, Piper, mpv).
+
+Engines run in threads they share with other work and in threads their
+libraries start for themselves, so CPU use is attributed two ways:
+
+- time.thread_time() of the calling thread inside track(engine)
+- the whole lifetime of any thread that first appears during track(),
+  such as ONNX Runtime or CTranslate2 pool threads
+
+Child processes, such as mpv, are added by process ID. Everything else
+the process does is reported as "other":
+
+    cpu_profile.configure(True)
+    with cpu_profile.track("whisper"):
+        model.transcribe(audio)
+    print(cpu_profile.report())
+
+Threads started in another thread while a track() block is open are
+attributed to that block's engine, so engines should be loaded one at a
+time when profiling. Until configure() is called, track() does nothing.
+"""
+
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import ContextManager, Iterator
+
+_TASKS = Path("/proc/self/task")
+
+
+def _ticks_to_seconds(stat_text: str) -> float:
+    # The command name may contain spaces; utime and stime follow the last ')'
+    fields = stat_text.rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def _cpu_seconds(stat_path: Path) -> float | None:
+    try:
+        return _ticks_to_seconds(stat_path.read_text())
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def _thread_ids() -> set[int]:
+    try:
+        return {int(entry.name) for entry in _TASKS.iterdir()}
+    except OSError:
+        return set()
+
+
+class CpuProfiler:
+    """Accumulates CPU seconds per engine since it was created."""
+
+    def __init__(self) -> None:
+        self._started = time.monotonic()
+        self._process_started = time.process_time()
+        self._lock = threading.Lock()
+        self._tracked: dict[str, float] = defaultdict(float)
+        self._threads: dict[int, str] = {}
+        self._tracking_threads: set[int] = set()
+        self._processes: dict[int, str] = {}
+        self._ended: dict[str, float] = defaultdict(float)
+
+    @contextmanager
+    def track(self, engine: str) -> Iterator[None]:
+        """Attribute the enclosed block, and threads it starts, to engine."""
+        thread_id = threading.get_native_id()
+        before = _thread_ids()
+        started = time.thread_time()
+        try:
+            yield
+        finally:
+            elapsed = time.thread_time() - started
+            started_threads = _thread_ids() - before
+            with self._lock:
+                self._tracked[engine] += elapsed
+                self._tracking_threads.add(thread_id)
+                for new_thread in started_threads:
+                    self._threads.setdefault(new_thread, engine)
+
+    def add_process(self, engine: str, pid: int) -> None:
+        """Attribute a child process's CPU time to engine."""
+        with self._lock:
+            self._processes[pid] = engine
+
+    def process_ended(self, pid: int) -> None:
+        """Keep a child's CPU time; call before the process is reaped."""
+        seconds = _cpu_seconds(Path(f"/proc/{pid}/stat"))
+        with self._lock:
+            engine = self._processes.pop(pid, None)
+            if engine is not None and seconds is not None:
+                self._ended[engine] += seconds
+
+    def usage(self) -> dict[str, float]:
+        """Return CPU seconds used per engine, plus "other" for the rest."""
+        with self._lock:
+            seconds = defaultdict(float, self._tracked)
+            for thread_id, engine in self._threads.items():
+                if thread_id in self._tracking_threads:
+                    continue
+                thread_seconds = _cpu_seconds(_TASKS / str(thread_id) / "stat")
+                if thread_seconds is not None:
+                    seconds[engine] += thread_seconds
+            in_process = sum(seconds.values())
+            for engine, ended in self._ended.items():
+                seconds[engine] += ended
+            for pid, engine in self._processes.items():
+                process_seconds = _cpu_seconds(Path(f"/proc/{pid}/stat"))
+                if process_seconds is not None:
+                    seconds[engine] += process_seconds
+        total = time.process_time() - self._process_started
+        seconds["other"] = max(0.0, total - in_process)
+        return dict(seconds)
+
+    def report(self) -> str:
+        """Return a table of CPU seconds and share of one core per engine."""
+        wall = max(time.monotonic() - self._started, 1e-9)
+        lines = [f"CPU use over {wall:.0f}s (100% = one core):"]
+        for engine, seconds in sorted(self.usage().items(), key=lambda item: -item[1]):
+            lines.append(f"  {engine:<10} {seconds:8.2f}s {seconds / wall:7.1%}")
+        return "\n".join(lines)
+
+
+_profiler: CpuProfiler | None = None
+
+
+def configure(enabled: bool) -> None:
+    """Start (or stop) profiling; starting again resets the counts."""
+    global _profiler
+    _profiler = CpuProfiler() if enabled else None
+
+
+def enabled() -> bool:
+    """Return True if CPU use is being profiled."""
+    return _profiler is not None
+
+
+def track(engine: str) -> ContextManager[None]:
+    """Attribute the enclosed block to engine while profiling."""
+    if _profiler is None:
+        return nullcontext()
+    return _profiler.track(engine)
+
+
+def add_process(engine: str, pid: int) -> None:
+    """Attribute a child process to engine while profiling."""
+    if _profiler is not None:
+        _profiler.add_process(engine, pid)
+
+
+def process_ended(pid: int) -> None:
+    """Record a child process's final CPU time before it is reaped."""
+    if _profiler is not None:
+        _profiler.process_ended(pid)
+
+
+def report() -> str:
+    """Return the per-engine report, or "" when not profiling."""
+    return "" if _profiler is None else _profiler.report()
@@ -0,0 +1,548 @@
+"""Live metrics in Prometheus text format, served on localhost.
+
+Metrics are created once, at import time, by the modules that update
+them, and live in one process-wide registry:
+
+    _INFERENCE = metrics.histogram("much_miller_wake_inference_seconds", "...")
+    ...
+    _INFERENCE.observe(elapsed)
+
+Updates are lock-free: each thread adds into its own cells, which are
+only summed when the endpoint is scraped, so the wake word and
+transcription loops never wait on each other or on a scrape.
+
+Stages that must keep up with the microphone record a load: seconds of
+work per second of audio, smoothed. /health answers 503, naming the
+stage, while any load is at or above 1 or audio has recently been lost:
+
+    server = metrics.serve(9464)
+    # curl localhost:9464/metrics
+    # curl localhost:9464/health
+
+Until serve() is called nothing is exported, but the counters still
+accumulate, so the endpoint can be started at any time.
+"""
+
+import bisect
+import math
+import os
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, TypeVar
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SCORE_BUCKETS = (0.05, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0)
+RATIO_BUCKETS = (0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 5.0)
+
+
+M = TypeVar("M", bound="Metric")
+
+
+class _Cells:
+    """Per-thread lists of floats, summed on demand.
+
+    A thread only ever writes its own list, so writers need no lock; the
+    lock is taken once per thread, when its list is created, and while
+    collecting. When a thread ends, its list is folded into a running
+    total the next time the lock is taken, so short-lived threads do not
+    pile up.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._live: dict[int, list[float]] = {}
+        self._retired = [0.0] * size
+        # Lists of ended threads; appended to without the lock, since a
+        # thread may end while another holds it
+        self._ended: deque[list[float]] = deque()
+
+    @property
+    def threads(self) -> int:
+        """Return the number of threads whose lists are still kept apart."""
+        with self._lock:
+            self._fold_ended()
+            return len(self._live)
+
+    def mine(self) -> list[float]:
+        """Return the calling thread's cells."""
+        holder: _CellsHolder | None = getattr(self._local, "holder", None)
+        if holder is None:
+            holder = _CellsHolder([0.0] * self._size)
+            with self._lock:
+                self._fold_ended()
+                self._live[id(holder.cells)] = holder.cells
+            # The thread-local holder is dropped when the thread ends
+            weakref.finalize(holder, self._ended.append, holder.cells)
+            self._local.holder = holder
+        return holder.cells
+
+    def total(self) -> list[float]:
+        """Return the cells summed over every thread that has written."""
+        with self._lock:
+            self._fold_ended()
+            every = [self._retired, *self._live.values()]
+        return [math.fsum(cells[i] for cells in every) for i in range(self._size)]
+
+    def _fold_ended(self) -> None:
+        while self._ended:
+            cells = self._ended.popleft()
+            del self._live[id(cells)]
+            self._retired = [math.fsum(pair) for pair in zip(self._retired, cells)]
+
+
+class _CellsHolder:
+    """One thread's cells, held in thread-local storage."""
+
+    __slots__ = ("cells", "__weakref__")
+
+    def __init__(self, cells: list[float]) -> None:
+        self.cells = cells
+
+
+def _format_labels(labels: dict[str, str], extra: str = "") -> str:
+    parts = [f'{key}="{_escape(value)}"' for key, value in sorted(labels.items())]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Metric(ABC):
+    """A named time series with fixed labels."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labels: dict[str, str]) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+
+    @abstractmethod
+    def samples(self) -> list[tuple[str, str, float]]:
+        """Return (name suffix, label text, value) for each exported sample."""
+
+
+class Counter(Metric):
+    """A total that only goes up."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labels: dict[str, str]) -> None:
+        super().__init__(name, help_text, labels)
+        self._cells = _Cells(1)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Add to the total."""
+        self._cells.mine()[0] += amount
+
+    @property
+    def value(self) -> float:
+        """Return the total over all threads."""
+        return self._cells.total()[0]
+
+    def samples(self) -> list[tuple[str, str, float]]:
+        return [("", _format_labels(self.labels), self.value)]
+
+
+class Gauge(Metric):
+    """A value that is set, or read from a function when scraped."""
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: dict[str, str],
+        function: Callable[[], float] | None = None,
+        kind: str = "gauge",
+    ) -> None:
+        super().__init__(name, help_text, labels)
+        self._value = 0.0
+        self._function = function
+        self.kind = kind
+
+    def set(self, value: float) -> None:
+        """Set the value (a single assignment, safe from any thread)."""
+        self._value = value
+
+    @property
+    def value(self) -> float:
+        """Return the current value."""
+        return self._function() if self._function is not None else self._value
+
+    def samples(self) -> list[tuple[str, str, float]]:
+        return [("", _format_labels(self.labels), self.value)]
+
+
+class Histogram(Metric):
+    """Counts of observations in buckets, with their sum."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: dict[str, str],
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help_text, labels)
+        self._bounds = tuple(sorted(buckets))
+        # One cell per bucket, one for +Inf, then the sum
+        self._cells = _Cells(len(self._bounds) + 2)
+
+    def observe(self, value: float) -> None:
+        """Count one observation."""
+        cells = self._cells.mine()
+        cells[bisect.bisect_left(self._bounds, value)] += 1
+        cells[-1] += value
+
+    @property
+    def count(self) -> int:
+        """Return the number of observations."""
+        return int(sum(self._cells.total()[:-1]))
+
+    @property
+    def sum(self) -> float:
+        """Return the sum of all observations."""
+        return self._cells.total()[-1]
+
+    def samples(self) -> list[tuple[str, str, float]]:
+        totals = self._cells.total()
+        samples = []
+        cumulative = 0.0
+        for bound, count in zip((*self._bounds, math.inf), totals):
+            cumulative += count
+            le = f'le="{_number(bound)}"'
+            samples.append(("_bucket", _format_labels(self.labels, le), cumulative))
+        samples.append(("_sum", _format_labels(self.labels), totals[-1]))
+        samples.append(("_count", _format_labels(self.labels), cumulative))
+        return samples
+
+
+class StageLoad(Gauge):
+    """Seconds of work per second of audio for one stage, smoothed.
+
+    A load of 1 or more means the stage is falling behind real time. A
+    stage with no work for quiet_seconds is not behind anything, so its
+    load reads 0 and the next piece of work starts the average afresh;
+    one slow cold run cannot hold /health at 503 while the stage idles.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: dict[str, str],
+        smoothing: float = 0.05,
+        quiet_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(name, help_text, labels)
+        self._smoothing = smoothing
+        self._quiet_seconds = quiet_seconds
+        self._clock = clock
+        self._recorded_at: float | None = None
+
+    @property
+    def value(self) -> float:
+        """Return the smoothed load, or 0 once the stage has been quiet."""
+        if self._recorded_at is None or self._clock() - self._recorded_at > self._quiet_seconds:
+            return 0.0
+        return self._value
+
+    def record(self, work_seconds: float, audio_seconds: float) -> None:
+        """Fold one piece of work into the load."""
+        if audio_seconds <= 0:
+            return
+        load = work_seconds / audio_seconds
+        now = self._clock()
+        recent = self._recorded_at is not None and now - self._recorded_at <= self._quiet_seconds
+        if recent:
+            load = self._value + self._smoothing * (load - self._value)
+        self._recorded_at = now
+        self._value = load
+
+
+class LossCheck:
+    """Reports a problem while a loss counter has recently gone up."""
+
+    def __init__(
+        self,
+        read: Callable[[], float],
+        description: str,
+        window_seconds: float = 60.0,
+    ) -> None:
+        """Initialize the check.
+
+        Args:
+            read: Returns the running total of losses, e.g. overflows
+            description: What the losses are, for the health report
+            window_seconds: How long an increase keeps the check failing
+        """
+        self._read = read
+        self._description = description
+        self._window = window_seconds
+        self._last = read()
+        self._changed_at: float | None = None
+
+    def __call__(self) -> str | None:
+        value = self._read()
+        now = time.monotonic()
+        if value != self._last:
+            self._last = value
+            self._changed_at = now
+        if self._changed_at is not None and now - self._changed_at < self._window:
+            return f"{self._description} in the last {self._window:.0f}s"
+        return None
+
+
+class Registry:
+    """Every metric and health check in the process."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._metrics: dict[tuple[str, tuple[tuple[str, str], ...]], Metric] = {}
+        self._checks: dict[str, Callable[[], str | None]] = {}
+
+    def counter(self, name: str, help_text: str, **labels: str) -> Counter:
+        """Return the counter with this name and labels, creating it if new."""
+        return self._get(Counter, name, help_text, labels)
+
+    def gauge(
+        self,
+        name: str,
+        help_text: str,
+        function: Callable[[], float] | None = None,
+        kind: str = "gauge",
+        **labels: str,
+    ) -> Gauge:
+        """Return a gauge; with a function, its value is read when scraped.
+
+        Args:
+            name: Metric name
+            help_text: Description shown by Prometheus
+            function: Returns the value at scrape time
+            kind: Exported type, "counter" for a total kept elsewhere
+            **labels: Fixed labels
+        """
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            if function is not None or key not in self._metrics:
+                self._metrics[key] = Gauge(name, help_text, labels, function, kind)
+            return self._metrics[key]  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+        **labels: str,
+    ) -> Histogram:
+        """Return the histogram with this name and labels, creating it if new."""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            if key not in self._metrics:
+                self._metrics[key] = Histogram(name, help_text, labels, buckets)
+            return self._metrics[key]  # type: ignore[return-value]
+
+    def stage_load(self, stage: str) -> StageLoad:
+        """Return the load of a real-time stage, checked by health()."""
+        return self._get(
+            StageLoad,
+            "much_miller_stage_load",
+            "Seconds of work per second of audio (1 = falling behind)",
+            {"stage": stage},
+        )
+
+    def add_check(self, name: str, check: Callable[[], str | None]) -> None:
+        """Add a health check returning a problem, or None when healthy."""
+        with self._lock:
+            self._checks[name] = check
+
+    def health(self) -> list[str]:
+        """Return every problem found, or an empty list when healthy."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+            checks = list(self._checks.items())
+        problems = [
+            f"{metric.labels['stage']} behind real time (load {metric.value:.2f})"
+            for metric in metrics
+            if isinstance(metric, StageLoad) and metric.value >= 1.0
+        ]
+        for name, check in checks:
+            problem = check()
+            if problem:
+                problems.append(f"{name}: {problem}")
+        return problems
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines: list[str] = []
+        described: set[str] = set()
+        for metric in metrics:
+            if metric.name not in described:
+                described.add(metric.name)
+                lines.append(f"# HELP {metric.name} {metric.help_text}")
+                lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for suffix, labels, value in metric.samples():
+                lines.append(f"{metric.name}{suffix}{labels} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+    def _get(self, cls: type[M], name: str, help_text: str, labels: dict[str, str]) -> M:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            if key not in self._metrics:
+                self._metrics[key] = cls(name, help_text, labels)
+            return self._metrics[key]  # type: ignore[return-value]
+
+
+REGISTRY = Registry()
+
+
+def counter(name: str, help_text: str, **labels: str) -> Counter:
+    """Return a counter from the process-wide registry."""
+    return REGISTRY.counter(name, help_text, **labels)
+
+
+def gauge(
+    name: str,
+    help_text: str,
+    function: Callable[[], float] | None = None,
+    kind: str = "gauge",
+    **labels: str,
+) -> Gauge:
+    """Return a gauge from the process-wide registry."""
+    return REGISTRY.gauge(name, help_text, function, kind, **labels)
+
+
+def histogram(
+    name: str,
+    help_text: str,
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    **labels: str,
+) -> Histogram:
+    """Return a histogram from the process-wide registry."""
+    return REGISTRY.histogram(name, help_text, buckets, **labels)
+
+
+def stage_load(stage: str) -> StageLoad:
+    """Return a stage's load from the process-wide registry."""
+    return REGISTRY.stage_load(stage)
+
+
+def add_check(name: str, check: Callable[[], str | None]) -> None:
+    """Add a health check to the process-wide registry."""
+    REGISTRY.add_check(name, check)
+
+
+def _resident_bytes() -> float:
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, IndexError, ValueError):
+        return 0.0
+
+
+def add_process_metrics(registry: Registry = REGISTRY) -> None:
+    """Export this process's resident memory and CPU time."""
+    registry.gauge("process_resident_memory_bytes", "Resident memory size", _resident_bytes)
+    registry.gauge(
+        "process_cpu_seconds_total", "User and system CPU time", time.process_time, "counter"
+    )
+
+
+class MetricsServer:
+    """Serves /metrics and /health over HTTP from a background thread."""
+
+    def __init__(
+        self,
+        registry: Registry = REGISTRY,
+        port: int = 9464,
+        host: str = "127.0.0.1",
+    ) -> None:
+        """Bind the server; call start() to begin serving.
+
+        Args:
+            registry: Metrics and health checks to serve
+            port: TCP port (0 picks a free one)
+            host: Address to listen on; localhost keeps it off the network
+        """
+        self._registry = registry
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def port(self) -> int:
+        """Return the port being served."""
+        return self._server.server_address[1]
+
+    def start(self) -> None:
+        """Serve in a daemon thread."""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="metrics", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        registry = self._registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                path = self.path.split("?", 1)[0]
+                if path == "/metrics":
+                    self._reply(200, registry.render(), "text/plain; version=0.0.4")
+                elif path == "/health":
+                    problems = registry.health()
+                    body = "\n".join(problems) + "\n" if problems else "ok\n"
+                    self._reply(503 if problems else 200, body, "text/plain")
+                else:
+                    self._reply(404, "not found\n", "text/plain")
+
+            def _reply(self, status: int, body: str, content_type: str) -> None:
+                data = body.encode()
+                self.send_response(status)
+                self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass  # scrapes every few seconds would flood the console
+
+        return Handler
+
+
+def serve(port: int = 9464, host: str = "127.0.0.1") -> MetricsServer:
+    """Start serving the process-wide registry, with process metrics."""
+    add_process_metrics()
+    server = MetricsServer(REGISTRY, port, host)
+    server.start()
+    return server
@@ -0,0 +1,74 @@
+"""Summarise trace files as per-stage latency percentiles.
+
+Usage: python -m much_miller.telemetry.trace_summary traces.jsonl [...]
+
+Rotated siblings (traces.jsonl.1, traces.jsonl.2, ...) are read too.
+"""
+
+import argparse
+import json
+import math
+from collections import defaultdict
+from pathlib import Path
+
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Return the nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return math.nan
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def trace_files(path: Path) -> list[Path]:
+    """Return a trace file and its rotated siblings, oldest first."""
+    rotated = sorted(
+        path.parent.glob(f"{path.name}.*"),
+        key=lambda p: int(p.suffix[1:]) if p.suffix[1:].isdigit() else 0,
+        reverse=True,
+    )
+    return [p for p in rotated if p.suffix[1:].isdigit()] + ([path] if path.exists() else [])
+
+
+def load_durations(paths: list[Path]) -> dict[str, list[float]]:
+    """Read span durations in milliseconds, grouped by stage."""
+    durations: dict[str, list[float]] = defaultdict(list)
+    for path in paths:
+        for file_path in trace_files(path):
+            with open(file_path) as trace_file:
+                for line in trace_file:
+                    try:
+                        span = json.loads(line)
+                        durations[span["stage"]].append(float(span["ms"]))
+                    except (ValueError, KeyError):
+                        continue
+    return durations
+
+
+def summarise(durations: dict[str, list[float]]) -> str:
+    """Format a table of count and percentiles for each stage."""
+    header = f"{'stage':<20}{'count':>8}" + "".join(f"{f'p{p} ms':>12}" for p in PERCENTILES)
+    lines = [header, "-" * len(header)]
+    for stage in sorted(durations):
+        values = sorted(durations[stage])
+        row = f"{stage:<20}{len(values):>8}"
+        row += "".join(f"{percentile(values, p):>12.1f}" for p in PERCENTILES)
+        lines.append(row)
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Print a summary of the given trace files."""
+    parser = argparse.ArgumentParser(
+        prog="python -m much_miller.telemetry.trace_summary",
+        description="Print p50/p95/p99 latency for each traced stage.",
+    )
+    parser.add_argument("paths", nargs="+", type=Path, help="trace JSONL files")
+    args = parser.parse_args(argv)
+    print(summarise(load_durations(args.paths)))
+
+
+if __name__ == "__main__":
+    main()
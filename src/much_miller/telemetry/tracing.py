@@ -0,0 +1,189 @@
+"""Per-interaction latency tracing written to a rotating JSONL file.
+
+Each voice interaction gets a trace ID when the wake word fires. Stages
+record spans against the current trace, which is held in a context
+variable so adapters can add spans without it being passed around:
+
+    tracing.configure(Path("traces.jsonl"))
+    trace = tracing.start_trace()
+    with tracing.span("greet"):
+        speaker.say("Hello Romilly")
+
+Until configure() is called, or when no trace is active, spans cost one
+context variable lookup. Records are handed to a background thread that
+serialises and writes them, so the caller never waits on the disk.
+"""
+
+import json
+import logging
+import queue
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import Any, Iterator
+
+_STOP = None
+
+
+class Trace:
+    """Spans recorded for one voice interaction."""
+
+    def __init__(self, tracer: "Tracer", trace_id: str) -> None:
+        self._tracer = tracer
+        self.trace_id = trace_id
+
+    def record(
+        self,
+        stage: str,
+        started: float,
+        finished: float | None = None,
+        **attributes: Any,
+    ) -> None:
+        """Record a span that has already happened.
+
+        Args:
+            stage: Stage name, e.g. "wake" or "radio.play"
+            started: time.perf_counter() when the stage started
+            finished: time.perf_counter() when it finished (defaults to now)
+            **attributes: Extra JSON-serialisable fields
+        """
+        finished = time.perf_counter() if finished is None else finished
+        self._tracer._emit(self.trace_id, stage, started, finished, attributes)
+
+    @contextmanager
+    def span(self, stage: str, **attributes: Any) -> Iterator[dict[str, Any]]:
+        """Time the enclosed block; the yielded dict can take more attributes."""
+        started = time.perf_counter()
+        try:
+            yield attributes
+        finally:
+            self.record(stage, started, **attributes)
+
+
+class Tracer:
+    """Writes trace spans as JSON lines to a size-rotated file."""
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int = 5 * 1024 * 1024,
+        backup_count: int = 3,
+    ) -> None:
+        """Initialize the tracer and start its writer thread.
+
+        Args:
+            path: JSONL file to write
+            max_bytes: Size at which the file is rotated
+            backup_count: Number of rotated files kept (path.1, path.2, ...)
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._handler = RotatingFileHandler(
+            path, maxBytes=max_bytes, backupCount=backup_count
+        )
+        self._handler.setFormatter(logging.Formatter("%(message)s"))
+        self._queue: queue.SimpleQueue[tuple[Any, ...] | None] = queue.SimpleQueue()
+        # perf_counter has no epoch; this converts it to wall-clock time
+        self._epoch_offset = time.time() - time.perf_counter()
+        self._writer = threading.Thread(target=self._write, name="trace-writer", daemon=True)
+        self._writer.start()
+
+    def start_trace(self) -> Trace:
+        """Start a trace and make it current in this context."""
+        trace = Trace(self, uuid.uuid4().hex[:12])
+        _current_trace.set(trace)
+        return trace
+
+    def close(self) -> None:
+        """Flush pending spans and close the file."""
+        self._queue.put(_STOP)
+        self._writer.join()
+        self._handler.close()
+
+    def _emit(
+        self,
+        trace_id: str,
+        stage: str,
+        started: float,
+        finished: float,
+        attributes: dict[str, Any],
+    ) -> None:
+        self._queue.put((trace_id, stage, started, finished, attributes))
+
+    def _write(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            trace_id, stage, started, finished, attributes = item
+            line = json.dumps({
+                "trace": trace_id,
+                "stage": stage,
+                "ts": round(started + self._epoch_offset, 6),
+                "ms": round((finished - started) * 1000, 3),
+                **attributes,
+            })
+            self._handler.handle(logging.makeLogRecord({"msg": line}))
+
+
+_tracer: Tracer | None = None
+_current_trace: ContextVar[Trace | None] = ContextVar("much_miller_trace", default=None)
+
+
+def configure(path: Path | None, **options: Any) -> Tracer | None:
+    """Enable tracing to path, or disable it with None.
+
+    Args:
+        path: JSONL file to write, or None
+        **options: Passed to Tracer
+
+    Returns:
+        The active tracer, or None
+    """
+    global _tracer
+    if _tracer is not None:
+        _tracer.close()
+    _tracer = Tracer(path, **options) if path is not None else None
+    _current_trace.set(None)
+    return _tracer
+
+
+def start_trace() -> Trace | None:
+    """Start a new trace if tracing is enabled."""
+    return _tracer.start_trace() if _tracer is not None else None
+
+
+def current_trace() -> Trace | None:
+    """Return the trace active in this context, if any."""
+    return _current_trace.get()
+
+
+def use_trace(trace: Trace | None) -> None:
+    """Make a trace started in another context current in this one."""
+    _current_trace.set(trace)
+
+
+def end_trace() -> None:
+    """Clear the current trace."""
+    _current_trace.set(None)
+
+
+def record(stage: str, started: float, finished: float | None = None, **attributes: Any) -> None:
+    """Record a finished span on the current trace, if any."""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.record(stage, started, finished, **attributes)
+
+
+@contextmanager
+def span(stage: str, **attributes: Any) -> Iterator[dict[str, Any]]:
+    """Time the enclosed block on the current trace, if any."""
+    trace = _current_trace.get()
+    if trace is None:
+        yield attributes
+        return
+    with trace.span(stage, **attributes) as extra:
+        yield extra
@@ -0,0 +1 @@
+"""Speech-to-text module for Much Miller."""
@@ -0,0 +1,13 @@
+"""Transcription adapters (concrete implementations)."""
+
+from much_miller.transcription.adapters.fake_transcriber import FakeTranscriber
+from much_miller.transcription.adapters.fallback_transcriber import FallbackTranscriber
+from much_miller.transcription.adapters.faster_whisper_transcriber import FasterWhisperTranscriber
+from much_miller.transcription.adapters.http_transcriber import HttpTranscriber
+
+__all__ = [
+    "FakeTranscriber",
+    "FallbackTranscriber",
+    "FasterWhisperTranscriber",
+    "HttpTranscriber",
+]
@@ -0,0 +1,42 @@
+"""Fake transcriber for testing."""
+
+import time
+
+import numpy as np
+
+from much_miller.transcription.ports import TranscriberPort, TranscriptionError
+
+
+class FakeTranscriber(TranscriberPort):
+    """Fake transcriber that returns pre-configured text."""
+
+    def __init__(self, text: str = "", delay: float = 0.0) -> None:
+        """Initialize the fake.
+
+        Args:
+            text: Text returned for every utterance
+            delay: Seconds each call takes
+        """
+        self.text = text
+        self.delay = delay
+        self.failing = False
+        self.calls: list[tuple[int, int]] = []
+        self.batches: list[int] = []
+
+    def transcribe(self, samples: np.ndarray, sample_rate: int = 16000) -> str:
+        """Record the call and return the configured text.
+
+        Raises:
+            TranscriptionError: If failing is set
+        """
+        self.calls.append((len(samples), sample_rate))
+        if self.delay:
+            time.sleep(self.delay)
+        if self.failing:
+            raise TranscriptionError("fake transcriber failure")
+        return self.text
+
+    def transcribe_batch(self, utterances: list[np.ndarray], sample_rate: int = 16000) -> list[str]:
+        """Record the batch size, then transcribe each utterance."""
+        self.batches.append(len(utterances))
+        return super().transcribe_batch(utterances, sample_rate)
@@ -0,0 +1,129 @@
+"""Transcriber that prefers a remote service and falls back to a local one."""
+
+import threading
+import time
+
+import numpy as np
+
+from much_miller.telemetry import tracing
+from much_miller.transcription.ports import TranscriberPort, TranscriptionError
+
+
+class FallbackTranscriber(TranscriberPort):
+    """Routes utterances to the remote transcriber unless it is down or slow.
+
+    The real-time factor (seconds taken per second of audio) of each
+    backend is tracked as an exponentially weighted moving average. The
+    remote is used while its average is below slow_rtf and no worse than
+    the local average. When it fails, or becomes too slow, utterances go
+    to the local transcriber for cooldown seconds; the next utterance
+    after that probes the remote again, starting its average afresh.
+    """
+
+    def __init__(
+        self,
+        remote: TranscriberPort,
+        local: TranscriberPort,
+        slow_rtf: float = 0.5,
+        cooldown: float = 30.0,
+        smoothing: float = 0.3,
+        min_seconds: float = 0.5,
+    ) -> None:
+        """Initialize the router.
+
+        Args:
+            remote: Preferred transcriber, e.g. HttpTranscriber
+            local: Transcriber used when the remote is down or slow
+            slow_rtf: Remote real-time factor above which it is avoided
+            cooldown: Seconds to use the local transcriber before probing
+                the remote again
+            smoothing: Weight of the newest measurement in the averages
+            min_seconds: Utterances shorter than this count as this long,
+                so fixed per-request costs don't dominate short clips
+        """
+        self._remote = remote
+        self._local = local
+        self._slow_rtf = slow_rtf
+        self._cooldown = cooldown
+        self._smoothing = smoothing
+        self._min_seconds = min_seconds
+        self._lock = threading.Lock()
+        self._remote_rtf: float | None = None
+        self._local_rtf: float | None = None
+        self._avoid_remote_until = 0.0
+        self._probing = False
+        self.remote_calls = 0
+        self.local_calls = 0
+        self.remote_failures = 0
+
+    @property
+    def remote_rtf(self) -> float | None:
+        """Return the remote's average real-time factor, if measured."""
+        return self._remote_rtf
+
+    @property
+    def local_rtf(self) -> float | None:
+        """Return the local average real-time factor, if measured."""
+        return self._local_rtf
+
+    def prefers_remote(self) -> bool:
+        """Return True if the next utterance will be sent to the remote."""
+        with self._lock:
+            return time.monotonic() >= self._avoid_remote_until
+
+    def transcribe(self, samples: np.ndarray, sample_rate: int = 16000) -> str:
+        """Transcribe on the remote if it is healthy, otherwise locally."""
+        seconds = max(len(samples) / sample_rate, self._min_seconds)
+        if self.prefers_remote():
+            started = time.perf_counter()
+            try:
+                text = self._remote.transcribe(samples, sample_rate)
+            except TranscriptionError as e:
+                self.remote_failures += 1
+                self._avoid_remote()
+                tracing.record("transcriber", started, backend="remote", error=str(e))
+            else:
+                self.remote_calls += 1
+                self._measure_remote((time.perf_counter() - started) / seconds)
+                tracing.record("transcriber", started, backend="remote")
+                return text
+
+        started = time.perf_counter()
+        text = self._local.transcribe(samples, sample_rate)
+        self.local_calls += 1
+        rtf = (time.perf_counter() - started) / seconds
+        with self._lock:
+            self._local_rtf = self._average(self._local_rtf, rtf)
+        tracing.record("transcriber", started, backend="local")
+        return text
+
+    def load(self) -> None:
+        """Load the local model so fallback is immediate."""
+        self._local.load()
+
+    def close(self) -> None:
+        """Close both transcribers."""
+        self._remote.close()
+        self._local.close()
+
+    def _measure_remote(self, rtf: float) -> None:
+        with self._lock:
+            if self._probing:
+                self._remote_rtf = rtf
+                self._probing = False
+            else:
+                self._remote_rtf = self._average(self._remote_rtf, rtf)
+            too_slow = self._remote_rtf > self._slow_rtf
+            slower_than_local = self._local_rtf is not None and self._remote_rtf > self._local_rtf
+        if too_slow or slower_than_local:
+            self._avoid_remote()
+
+    def _avoid_remote(self) -> None:
+        with self._lock:
+            self._avoid_remote_until = time.monotonic() + self._cooldown
+            self._probing = True
+
+    def _average(self, average: float | None, value: float) -> float:
+        if average is None:
+            return value
+        return self._smoothing * value + (1 - self._smoothing) * average
@@ -0,0 +1,145 @@
+"""Local transcriber adapter using faster-whisper."""
+
+import threading
+import time
+from typing import Any
+
+import numpy as np
+
+from much_miller.cpu_budget import pinned
+from much_miller.telemetry import cpu_profile, metrics
+from much_miller.transcription.packing import pack, split_words
+from much_miller.transcription.ports import TranscriberPort
+
+RTF_HELP = "Transcription seconds per second of audio"
+
+
+class FasterWhisperTranscriber(TranscriberPort):
+    """Transcribes utterances in-process with faster-whisper on the CPU."""
+
+    def __init__(
+        self,
+        model_size: str = "small",
+        compute_type: str = "int8",
+        language: str = "en",
+        cpu_threads: int = 0,
+        num_workers: int = 1,
+        cpus: frozenset[int] | None = None,
+        stage: str = "whisper",
+    ) -> None:
+        """Initialize the transcriber; the model is loaded on first use.
+
+        Args:
+            model_size: Whisper model name, e.g. "small" or "base.en"
+            compute_type: CTranslate2 compute type
+            language: Language code passed to Whisper
+            cpu_threads: CTranslate2 threads per transcription (0 for its default)
+            num_workers: Transcriptions CTranslate2 can run in parallel
+            cpus: CPUs that loading and transcription are pinned to
+            stage: Stage its real-time factor and load are recorded under
+        """
+        self._model_size = model_size
+        self._compute_type = compute_type
+        self._language = language
+        self._cpu_threads = cpu_threads
+        self._num_workers = num_workers
+        self._cpus = cpus
+        self._model: Any = None
+        self._lock = threading.Lock()
+        self._rtf = metrics.histogram(
+            "much_miller_whisper_rtf", RTF_HELP, metrics.RATIO_BUCKETS, stage=stage
+        )
+        self._load_metric = metrics.stage_load(stage)
+
+    def load(self) -> None:
+        """Load the model now rather than on the first utterance."""
+        with self._lock, pinned(self._cpus), cpu_profile.track("whisper"):
+            self._load()
+
+    def transcribe(self, samples: np.ndarray, sample_rate: int = 16000) -> str:
+        """Transcribe a complete utterance.
+
+        Args:
+            samples: Mono int16 audio
+            sample_rate: Sample rate of the audio (resampled to 16 kHz)
+
+        Returns:
+            The transcribed text (may be empty)
+        """
+        audio = self._prepare(samples, sample_rate)
+        # One model instance; concurrent callers take turns
+        with self._lock, pinned(self._cpus), cpu_profile.track("whisper"):
+            model = self._load()
+            started = time.perf_counter()
+            segments, _ = model.transcribe(audio, language=self._language)
+            text = " ".join(segment.text.strip() for segment in segments).strip()
+            self._observe(time.perf_counter() - started, len(audio))
+        return text
+
+    def transcribe_batch(self, utterances: list[np.ndarray], sample_rate: int = 16000) -> list[str]:
+        """Transcribe several utterances, packing short ones into one window.
+
+        Utterances that fit in one 30-second Whisper window together are
+        transcribed in a single call with word timestamps, so they share
+        one encoder pass (see much_miller.transcription.packing).
+
+        Args:
+            utterances: Mono int16 audio for each utterance
+            sample_rate: Sample rate of the audio (resampled to 16 kHz)
+
+        Returns:
+            The text of each utterance, in order
+        """
+        audio = [self._prepare(samples, sample_rate) for samples in utterances]
+        texts = [""] * len(audio)
+        with self._lock, pinned(self._cpus), cpu_profile.track("whisper"):
+            model = self._load()
+            for packed in pack(audio):
+                started = time.perf_counter()
+                if len(packed.placements) == 1:
+                    segments, _ = model.transcribe(packed.audio, language=self._language)
+                    text = " ".join(segment.text.strip() for segment in segments).strip()
+                    texts[packed.placements[0].index] = text
+                else:
+                    segments, _ = model.transcribe(
+                        packed.audio,
+                        language=self._language,
+                        word_timestamps=True,
+                        condition_on_previous_text=False,
+                    )
+                    words = [
+                        (word.start, word.end, word.word)
+                        for segment in segments
+                        for word in segment.words or []
+                    ]
+                    for index, text in split_words(words, packed.placements).items():
+                        texts[index] = text
+                self._observe(time.perf_counter() - started, len(packed.audio))
+        return texts
+
+    def _prepare(self, samples: np.ndarray, sample_rate: int) -> np.ndarray:
+        audio = samples.astype(np.float32) / 32768.0
+        if sample_rate != 16000:
+            from scipy.signal import resample_poly
+
+            audio = resample_poly(audio, 16000, sample_rate).astype(np.float32)
+        return audio
+
+    def _observe(self, elapsed: float, samples: int) -> None:
+        seconds = samples / 16000
+        if seconds:
+            self._rtf.observe(elapsed / seconds)
+            self._load_metric.record(elapsed, seconds)
+
+    def _load(self) -> Any:
+        if self._model is None:
+            from faster_whisper import WhisperModel
+
+            self._model = WhisperModel(
+                self._model_size,
+                device="cpu",
+                compute_type=self._compute_type,
+                cpu_threads=self._cpu_threads,
+                num_workers=self._num_workers,
+            )
+        return self._model
@@ -0,0 +1,159 @@
+"""Remote transcriber adapter for the transcription-service HTTP API."""
+
+import http.client
+import json
+import queue
+import struct
+from typing import Callable, Iterator
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from much_miller.transcription.ports import TranscriberPort, TranscriptionError
+
+_BODY_CHUNK_BYTES = 32 * 1024
+
+BodyFactory = Callable[[], Iterator[bytes]] | None
+
+
+def wav_header(sample_count: int, sample_rate: int) -> bytes:
+    """Return a 44-byte header for mono 16-bit PCM of the given length."""
+    data_bytes = sample_count * 2
+    return (
+        b"RIFF" + struct.pack("<I", 36 + data_bytes) + b"WAVE"
+        + b"fmt " + struct.pack("<IHHIIHH", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16)
+        + b"data" + struct.pack("<I", data_bytes)
+    )
+
+
+def wav_body(samples: np.ndarray, sample_rate: int) -> Iterator[bytes]:
+    """Yield a WAV file in chunks without copying the samples into one buffer."""
+    pcm = memoryview(np.ascontiguousarray(samples, dtype="<i2")).cast("B")
+    yield wav_header(len(samples), sample_rate)
+    for offset in range(0, len(pcm), _BODY_CHUNK_BYTES):
+        yield pcm[offset:offset + _BODY_CHUNK_BYTES]
+
+
+class HttpTranscriber(TranscriberPort):
+    """Sends utterances to a transcription-service's /api/transcribe.
+
+    Connections are kept alive and pooled, so a request after the first
+    skips the TCP handshake. The WAV body is streamed from the sample
+    array in chunks. A pooled connection the server has since closed is
+    retried once on a fresh connection.
+    """
+
+    def __init__(self, base_url: str, timeout: float = 10.0, pool_size: int = 2) -> None:
+        """Initialize the client; no connection is made until first use.
+
+        Args:
+            base_url: Service URL, e.g. "http://polwarth:8000"
+            timeout: Seconds to wait for connect and for the response
+            pool_size: Idle connections kept open
+        """
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Not an http(s) URL: {base_url}")
+        self._https = parts.scheme == "https"
+        self._host = parts.hostname
+        self._port = parts.port
+        self._path = parts.path.rstrip("/") + "/api/transcribe"
+        self._health_path = parts.path.rstrip("/") + "/health"
+        self._timeout = timeout
+        self._pool: queue.LifoQueue[http.client.HTTPConnection] = queue.LifoQueue(pool_size)
+        self.connections_opened = 0
+
+    def transcribe(self, samples: np.ndarray, sample_rate: int = 16000) -> str:
+        """Transcribe an utterance on the remote service.
+
+        Raises:
+            TranscriptionError: If the service is unreachable, slow or fails
+        """
+        headers = {
+            "Content-Type": "audio/wav",
+            "Content-Length": str(44 + len(samples) * 2),
+        }
+        status, body = self._request(
+            "POST", self._path, lambda: wav_body(samples, sample_rate), headers
+        )
+        if status != 200:
+            raise TranscriptionError(f"transcription-service returned {status}")
+        try:
+            return str(json.loads(body)["text"]).strip()
+        except (ValueError, KeyError) as e:
+            raise TranscriptionError(f"Bad transcription-service reply: {e}") from e
+
+    def healthy(self) -> bool:
+        """Return True if the service answers its health check."""
+        try:
+            status, _ = self._request("GET", self._health_path, None, {})
+        except TranscriptionError:
+            return False
+        return status == 200
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        body_factory: BodyFactory,
+        headers: dict[str, str],
+    ) -> tuple[int, bytes]:
+        connection, reused = self._acquire()
+        try:
+            try:
+                return self._exchange(connection, method, path, body_factory, headers)
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                if not reused:
+                    raise
+                # The server closed an idle pooled connection; retry on a fresh one
+                connection.close()
+                connection = self._connect()
+                return self._exchange(connection, method, path, body_factory, headers)
+        except (OSError, http.client.HTTPException) as e:
+            connection.close()
+            raise TranscriptionError(f"transcription-service unavailable: {e}") from e
+
+    def _exchange(
+        self,
+        connection: http.client.HTTPConnection,
+        method: str,
+        path: str,
+        body_factory: BodyFactory,
+        headers: dict[str, str],
+    ) -> tuple[int, bytes]:
+        connection.request(
+            method, path, body=body_factory() if body_factory else None, headers=headers
+        )
+        response = connection.getresponse()
+        body = response.read()
+        if response.will_close:
+            connection.close()
+        else:
+            self._release(connection)
+        return response.status, body
+
+    def _acquire(self) -> tuple[http.client.HTTPConnection, bool]:
+        try:
+            return self._pool.get_nowait(), True
+        except queue.Empty:
+            return self._connect(), False
+
+    def _release(self, connection: http.client.HTTPConnection) -> None:
+        try:
+            self._pool.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def _connect(self) -> http.client.HTTPConnection:
+        self.connections_opened += 1
+        if self._https:
+            return http.client.HTTPSConnection(self._host, self._port, timeout=self._timeout)
+        return http.client.HTTPConnection(self._host, self._port, timeout=self._timeout)
@@ -0,0 +1,382 @@
+"""Choose the Whisper model and compute type from measured speed on this host.
+
+Calibration transcribes a fixed set of test utterances with each
+faster-whisper model size and compute type, measuring the real-time
+factor (seconds taken per second of audio) and word error rate. The
+results are cached per host, so startup reads them instead of
+benchmarking again:
+
+    python -m much_miller.transcription.calibration --target-rtf 0.5
+
+The test utterances are the phrases below, spoken by the Piper voice in
+MUCH_MILLER_MODEL_PATH, or recordings given with --audio (WAV files with
+a .txt transcript alongside each).
+
+At startup, choose_whisper() reads the cache and choose() picks the
+most accurate configuration whose real-time factor meets the target, or
+the fastest if none does.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from much_miller.audio.resampler import Resampler
+from much_miller.audio.wav import read_wav
+from much_miller.cpu_budget import EngineBudget
+from much_miller.phrase_matcher import canonical, edit_distance, words
+from much_miller.transcription.ports import TranscriberPort
+
+CACHE_PATH = Path.home() / ".cache" / "much-miller" / "calibration.json"
+
+# Used when this host has not been calibrated
+WHISPER_MODEL = "small"
+WHISPER_COMPUTE_TYPE = "int8"
+
+# Most accurate first; calibration measures accuracy, and this order
+# breaks ties
+MODEL_SIZES = ("medium.en", "small.en", "small", "base.en", "tiny.en")
+COMPUTE_TYPES = ("int8_float32", "int8", "int16", "float32")
+
+CALIBRATION_PHRASES = (
+    "Play radio three.",
+    "Play radio four please.",
+    "Stop the radio.",
+    "Play the world service news and then turn it up a little.",
+    "What is the weather going to be like in Edinburgh tomorrow morning?",
+    "Remind me to phone the garage about the car at half past four. Over.",
+)
+
+
+@dataclass(frozen=True)
+class WhisperConfig:
+    """A faster-whisper model size and compute type."""
+
+    model_size: str
+    compute_type: str
+
+    def describe(self) -> str:
+        """Return e.g. "small.en/int8"."""
+        return f"{self.model_size}/{self.compute_type}"
+
+
+@dataclass(frozen=True)
+class Clip:
+    """A test utterance: 16 kHz int16 audio and what was said."""
+
+    samples: np.ndarray
+    text: str
+
+    @property
+    def seconds(self) -> float:
+        """Return the duration of the audio."""
+        return len(self.samples) / 16000
+
+
+@dataclass
+class CalibrationResult:
+    """Measured speed and accuracy of one configuration."""
+
+    model_size: str
+    compute_type: str
+    rtf: float
+    wer: float
+    load_seconds: float
+
+    @property
+    def config(self) -> WhisperConfig:
+        """Return the configuration that was measured."""
+        return WhisperConfig(self.model_size, self.compute_type)
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """Return word edits needed per reference word, ignoring case and punctuation."""
+    expected = [canonical(word) for word in words(reference)]
+    heard = [canonical(word) for word in words(hypothesis)]
+    if not expected:
+        return float(bool(heard))
+    limit = max(len(expected), len(heard))
+    return edit_distance(expected, heard, limit) / len(expected)
+
+
+def host_id(cpu_threads: int = 0) -> str:
+    """Identify this host's CPU, so cached results are not used elsewhere.
+
+    Args:
+        cpu_threads: Whisper threads the results were measured with
+    """
+    cpu = platform.processor()
+    try:
+        for line in Path("/proc/cpuinfo").read_text().splitlines():
+            key, _, value = line.partition(":")
+            if key.strip() in ("model name", "Model", "Hardware"):
+                cpu = value.strip()
+                break
+    except OSError:
+        pass
+    fingerprint = f"{platform.machine()}|{cpu}|{os.cpu_count()}|{cpu_threads}"
+    digest = hashlib.sha256(fingerprint.encode()).hexdigest()[:8]
+    return f"{platform.node()}-{digest}"
+
+
+def choose(results: list[CalibrationResult], target_rtf: float) -> CalibrationResult | None:
+    """Pick the most accurate result that meets target_rtf.
+
+    Ties on accuracy go to the larger model, then the faster result. If
+    nothing meets the target, the fastest result is returned.
+    """
+    if not results:
+        return None
+    fast_enough = [result for result in results if result.rtf <= target_rtf]
+    if not fast_enough:
+        return min(results, key=lambda result: result.rtf)
+
+    def rank(result: CalibrationResult) -> tuple[float, int, float]:
+        size = MODEL_SIZES.index(result.model_size) if result.model_size in MODEL_SIZES else 99
+        return round(result.wer, 3), size, result.rtf
+
+    return min(fast_enough, key=rank)
+
+
+class CalibrationCache:
+    """Calibration results per host, in one JSON file."""
+
+    def __init__(self, path: Path = CACHE_PATH) -> None:
+        self._path = path
+
+    def load(self, host: str) -> list[CalibrationResult] | None:
+        """Return the results cached for host, or None."""
+        try:
+            entry = json.loads(self._path.read_text())[host]
+        except (OSError, ValueError, KeyError):
+            return None
+        return [CalibrationResult(**result) for result in entry["results"]]
+
+    def save(self, host: str, results: list[CalibrationResult]) -> None:
+        """Store results for host, keeping other hosts' entries."""
+        try:
+            hosts = json.loads(self._path.read_text())
+        except (OSError, ValueError):
+            hosts = {}
+        hosts[host] = {
+            "measured_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "results": [asdict(result) for result in results],
+        }
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self._path.with_suffix(".tmp")
+        temporary.write_text(json.dumps(hosts, indent=2) + "\n")
+        temporary.replace(self._path)
+
+
+def benchmark(
+    config: WhisperConfig,
+    clips: list[Clip],
+    create: Callable[[WhisperConfig], TranscriberPort],
+) -> CalibrationResult:
+    """Measure one configuration on the clips.
+
+    The model is loaded and warmed up on the first clip before timing.
+    """
+    transcriber = create(config)
+    started = time.perf_counter()
+    transcriber.load()
+    transcriber.transcribe(clips[0].samples)
+    load_seconds = time.perf_counter() - started
+
+    errors = 0.0
+    reference_words = 0
+    started = time.perf_counter()
+    for clip in clips:
+        heard = transcriber.transcribe(clip.samples)
+        expected = len(words(clip.text))
+        errors += word_error_rate(clip.text, heard) * expected
+        reference_words += expected
+    elapsed = time.perf_counter() - started
+    transcriber.close()
+
+    audio_seconds = sum(clip.seconds for clip in clips)
+    return CalibrationResult(
+        model_size=config.model_size,
+        compute_type=config.compute_type,
+        rtf=elapsed / audio_seconds,
+        wer=errors / max(reference_words, 1),
+        load_seconds=load_seconds,
+    )
+
+
+def calibrate(
+    clips: list[Clip],
+    create: Callable[[WhisperConfig], TranscriberPort],
+    configs: list[WhisperConfig],
+    give_up_rtf: float = 2.0,
+    on_result: Callable[[CalibrationResult], None] | None = None,
+) -> list[CalibrationResult]:
+    """Benchmark each configuration, skipping ones that cannot load.
+
+    Once a model size runs slower than give_up_rtf with every compute
+    type tried, larger sizes are not tried: they would only be slower.
+    """
+    results: list[CalibrationResult] = []
+    too_slow: set[str] = set()
+    for config in sorted(configs, key=_smallest_first):
+        if _larger_than_any(config.model_size, too_slow):
+            continue
+        try:
+            result = benchmark(config, clips, create)
+        except (OSError, RuntimeError, ValueError) as e:
+            print(f"  {config.describe()}: skipped ({e})")
+            continue
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+        same_size = [r for r in results if r.model_size == config.model_size]
+        if all(r.rtf > give_up_rtf for r in same_size):
+            too_slow.add(config.model_size)
+    return results
+
+
+def _smallest_first(config: WhisperConfig) -> tuple[int, int]:
+    size = MODEL_SIZES.index(config.model_size) if config.model_size in MODEL_SIZES else 0
+    known = config.compute_type in COMPUTE_TYPES
+    return -size, COMPUTE_TYPES.index(config.compute_type) if known else 0
+
+
+def _larger_than_any(model_size: str, sizes: set[str]) -> bool:
+    if model_size not in MODEL_SIZES:
+        return False
+    position = MODEL_SIZES.index(model_size)
+    return any(size in MODEL_SIZES and MODEL_SIZES.index(size) > position for size in sizes)
+
+
+def synthesized_clips(
+    voice_path: Path,
+    phrases: tuple[str, ...] = CALIBRATION_PHRASES,
+) -> list[Clip]:
+    """Speak the calibration phrases with a Piper voice, at 16 kHz."""
+    from piper import PiperVoice
+
+    voice = PiperVoice.load(str(voice_path))
+    clips = []
+    for text in phrases:
+        pcm = b"".join(chunk.audio_int16_bytes for chunk in voice.synthesize(text))
+        samples = np.frombuffer(pcm, dtype=np.int16)
+        clips.append(Clip(_at_16k(samples, voice.config.sample_rate), text))
+    return clips
+
+
+def recorded_clips(directory: Path) -> list[Clip]:
+    """Read WAV files that each have a .txt transcript alongside."""
+    clips = []
+    for wav_path in sorted(directory.glob("*.wav")):
+        transcript = wav_path.with_suffix(".txt")
+        if transcript.exists():
+            samples, rate = read_wav(wav_path.read_bytes())
+            clips.append(Clip(_at_16k(samples, rate), transcript.read_text().strip()))
+    return clips
+
+
+def _at_16k(samples: np.ndarray, rate: int) -> np.ndarray:
+    if rate == 16000:
+        return samples
+    return Resampler(rate, 16000).process(samples)
+
+
+def cached_choice(
+    target_rtf: float,
+    cpu_threads: int = 0,
+    cache: CalibrationCache | None = None,
+) -> CalibrationResult | None:
+    """Return the cached choice for this host, or None if never calibrated."""
+    results = (cache or CalibrationCache()).load(host_id(cpu_threads))
+    return choose(results, target_rtf) if results else None
+
+
+def choose_whisper(budget: EngineBudget | None = None) -> WhisperConfig:
+    """Pick the Whisper model and compute type for this host.
+
+    MUCH_MILLER_WHISPER_MODEL (and MUCH_MILLER_WHISPER_COMPUTE) override
+    the choice. Otherwise the most accurate calibrated configuration that
+    meets MUCH_MILLER_TARGET_RTF is used, falling back to small/int8 if
+    this host has not been calibrated. Startup never benchmarks.
+    """
+    model = os.environ.get("MUCH_MILLER_WHISPER_MODEL")
+    if model:
+        return WhisperConfig(model, os.environ.get("MUCH_MILLER_WHISPER_COMPUTE", "int8"))
+    target_rtf = float(os.environ.get("MUCH_MILLER_TARGET_RTF", "0.5"))
+    cpu_threads = budget.threads if budget and budget.threads else 0
+    chosen = cached_choice(target_rtf, cpu_threads)
+    if chosen is None:
+        print(
+            f"Whisper not calibrated on this host, using {WHISPER_MODEL}/{WHISPER_COMPUTE_TYPE} "
+            "(run python -m much_miller.transcription.calibration)"
+        )
+        return WhisperConfig(WHISPER_MODEL, WHISPER_COMPUTE_TYPE)
+    print(f"Whisper {chosen.config.describe()} from calibration (rtf {chosen.rtf:.2f})")
+    return chosen.config
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Calibrate, print the results and cache them for this host."""
+    parser = argparse.ArgumentParser(
+        prog="python -m much_miller.transcription.calibration",
+        description="Measure faster-whisper configurations on this host.",
+    )
+    parser.add_argument("--target-rtf", type=float, default=0.5)
+    parser.add_argument("--models", nargs="+", default=list(MODEL_SIZES))
+    parser.add_argument("--compute-types", nargs="+", default=["int8", "float32"])
+    parser.add_argument("--voice", type=Path, help="Piper voice (default MUCH_MILLER_MODEL_PATH)")
+    parser.add_argument("--audio", type=Path, help="directory of WAV files with .txt transcripts")
+    parser.add_argument("--cpu-threads", type=int, default=0, help="CTranslate2 threads")
+    parser.add_argument("--cache", type=Path, default=CACHE_PATH)
+    args = parser.parse_args(argv)
+
+    from much_miller.transcription.adapters import FasterWhisperTranscriber
+
+    if args.audio is not None:
+        clips = recorded_clips(args.audio)
+    else:
+        voice = args.voice or os.environ.get("MUCH_MILLER_MODEL_PATH")
+        if not voice:
+            print("Give --audio or --voice (or set MUCH_MILLER_MODEL_PATH)")
+            return 2
+        clips = synthesized_clips(Path(voice))
+    if not clips:
+        print("No test audio found")
+        return 2
+
+    def create(config: WhisperConfig) -> TranscriberPort:
+        return FasterWhisperTranscriber(
+            config.model_size, compute_type=config.compute_type, cpu_threads=args.cpu_threads
+        )
+
+    def show(result: CalibrationResult) -> None:
+        print(
+            f"  {result.config.describe():<22} rtf {result.rtf:6.3f}  "
+            f"wer {result.wer:6.1%}  load {result.load_seconds:5.1f}s"
+        )
+
+    configs = [WhisperConfig(m, c) for m in args.models for c in args.compute_types]
+    seconds = sum(clip.seconds for clip in clips)
+    print(f"Calibrating {len(configs)} configurations on {len(clips)} clips ({seconds:.1f}s)")
+    results = calibrate(clips, create, configs, on_result=show)
+
+    host = host_id(args.cpu_threads)
+    CalibrationCache(args.cache).save(host, results)
+    chosen = choose(results, args.target_rtf)
+    if chosen is not None:
+        print(f"Chosen for rtf <= {args.target_rtf}: {chosen.config.describe()}")
+    print(f"Saved to {args.cache} for {host}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+"""Run commands from realtime partial transcripts before the final text."""
+
+import threading
+import time
+from typing import Callable
+
+from much_miller.telemetry import tracing
+
+
+class EagerCommandDispatcher:
+    """Dispatches a command as soon as partial transcripts agree on it.
+
+    RealtimeSTT only returns the final text after end-of-speech silence,
+    which is most of the delay for a short command like "stop". With
+    realtime transcription enabled it also reports stabilised partial
+    text while the user is still speaking. The dispatcher runs a command
+    once the same command has been recognised in several consecutive
+    partials, then compares the final text with what it ran:
+
+    - same command: the final text is not handled again
+    - different command: the final text is handled, correcting the
+      eager one (so a misheard partial costs a second command, not a
+      missed one)
+    - no command: nothing more happens
+
+    Partials arrive on RealtimeSTT's thread and the final text on the
+    main thread, so all state is guarded by one lock, which is released
+    before a command runs. At most one command is run eagerly per
+    utterance. A final text that still needs handling waits for any
+    eager command in progress, so the two never run at once.
+    """
+
+    def __init__(
+        self,
+        command_key: Callable[[str], str | None],
+        stable_updates: int = 2,
+    ) -> None:
+        """Initialize the dispatcher.
+
+        Args:
+            command_key: Identifies the command text would run, e.g.
+                "play bbc_radio_three", or None if it is not a command
+                safe to run early
+            stable_updates: Consecutive partials that must agree before
+                the command is run
+        """
+        self._command_key = command_key
+        self._handle: Callable[[str], object] | None = None
+        self._stable_updates = stable_updates
+        self._lock = threading.Lock()
+        self._candidate: str | None = None
+        self._agreeing = 0
+        self._dispatched: str | None = None
+        self._trace: tracing.Trace | None = None
+        # Clear while an eager command is running
+        self._idle = threading.Event()
+        self._idle.set()
+        self.eager_commands = 0
+        self.corrections = 0
+
+    def begin(self, handle: Callable[[str], object]) -> None:
+        """Start a listening cycle.
+
+        Args:
+            handle: Runs the command for a piece of text. Eager spans are
+                added to the trace current in the calling context.
+        """
+        with self._lock:
+            self._reset()
+            self._handle = handle
+            self._trace = tracing.current_trace()
+
+    def end(self) -> None:
+        """Finish the listening cycle; later partials are ignored."""
+        with self._lock:
+            self._reset()
+            self._handle = None
+            self._trace = None
+
+    def on_partial(self, text: str) -> None:
+        """Take a partial transcript; may run its command.
+
+        Suitable as RealtimeSTT's on_realtime_transcription_stabilized.
+        """
+        key = self._command_key(text)
+        with self._lock:
+            if self._handle is None or self._dispatched is not None:
+                return
+            if key is None or key != self._candidate:
+                self._candidate = key
+                self._agreeing = 0 if key is None else 1
+            else:
+                self._agreeing += 1
+            if key is None or self._agreeing < self._stable_updates:
+                return
+            self._dispatched = key
+            self.eager_commands += 1
+            self._idle.clear()
+            handle, trace = self._handle, self._trace
+        # Run outside the lock: the command may take a while (radio IPC,
+        # speech), and end() and a final text it settles must not wait for it
+        started = time.perf_counter()
+        try:
+            handle(text)
+        finally:
+            self._idle.set()
+        if trace is not None:
+            trace.record("command", started, eager=True, key=key)
+
+    def claim_final(self, text: str) -> bool:
+        """Reconcile the final transcript of an utterance with any eager command.
+
+        If the final text still needs handling, waits first for any eager
+        command that is still running.
+
+        Returns:
+            True if the final text still needs to be handled
+        """
+        key = self._command_key(text)
+        with self._lock:
+            dispatched = self._dispatched
+            self._reset()
+        if dispatched is not None:
+            if key is None or key == dispatched:
+                return False
+            self.corrections += 1
+        self._idle.wait()
+        return True
+
+    def _reset(self) -> None:
+        self._candidate = None
+        self._agreeing = 0
+        self._dispatched = None
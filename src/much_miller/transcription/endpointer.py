@@ -0,0 +1,89 @@
+"""Cutting a stream of frames into utterances by level."""
+
+from collections import deque
+
+import numpy as np
+
+from much_miller.audio.levels import rms
+
+
+class Endpointer:
+    """Finds where each utterance starts and ends in a stream of frames.
+
+    An utterance starts when a frame is louder than speech_level and ends
+    after silence_seconds of quieter frames (or at max_seconds). A little
+    audio from before it started is kept, so the first word is not
+    clipped.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        speech_level: float = 500.0,
+        silence_seconds: float = 0.7,
+        lead_seconds: float = 0.2,
+        max_seconds: float = 15.0,
+    ) -> None:
+        """Initialize the endpointer.
+
+        Args:
+            sample_rate: Rate of the frames
+            speech_level: int16 RMS above which a frame counts as speech
+            silence_seconds: Quiet that ends an utterance
+            lead_seconds: Audio kept from before speech started
+            max_seconds: Longest utterance before it is cut
+        """
+        self._lead_limit = lead_seconds * sample_rate
+        self._silence_limit = silence_seconds * sample_rate
+        self._max_samples = max_seconds * sample_rate
+        self._speech_level = speech_level
+        self._lead: deque[np.ndarray] = deque()
+        self._lead_samples = 0
+        self._utterance: list[np.ndarray] = []
+        self._utterance_samples = 0
+        self._quiet_samples = 0
+
+    @property
+    def in_utterance(self) -> bool:
+        """Return True once speech has started and not yet ended."""
+        return bool(self._utterance)
+
+    def reset(self) -> None:
+        """Forget any utterance in progress and the lead audio."""
+        self._lead.clear()
+        self._lead_samples = 0
+        self._utterance = []
+        self._utterance_samples = 0
+        self._quiet_samples = 0
+
+    def push(self, frame: np.ndarray) -> np.ndarray | None:
+        """Take the next frame.
+
+        Frames are kept, not copied, so pass frames that are not reused.
+
+        Returns:
+            The whole utterance when this frame ends one, else None
+        """
+        loud = rms(frame) > self._speech_level
+        if not self._utterance:
+            if not loud:
+                self._lead.append(frame)
+                self._lead_samples += len(frame)
+                while self._lead and self._lead_samples - len(self._lead[0]) >= self._lead_limit:
+                    self._lead_samples -= len(self._lead.popleft())
+                return None
+            self._utterance.extend(self._lead)
+            self._utterance_samples = self._lead_samples
+            self._lead.clear()
+            self._lead_samples = 0
+        self._utterance.append(frame)
+        self._utterance_samples += len(frame)
+        self._quiet_samples = 0 if loud else self._quiet_samples + len(frame)
+        if (
+            self._quiet_samples >= self._silence_limit
+            or self._utterance_samples >= self._max_samples
+        ):
+            utterance = np.concatenate(self._utterance)
+            self.reset()
+            return utterance
+        return None
@@ -0,0 +1,107 @@
+"""Packing short utterances into one Whisper window.
+
+Whisper always encodes 30 seconds of audio, however short the utterance,
+so a two-second command costs as much encoder time as a 30-second one.
+Several short utterances from different clients can share one window:
+they are laid end to end with silence between them, transcribed in one
+call with word timestamps, and each word goes back to the utterance its
+midpoint falls in.
+"""
+
+from dataclasses import dataclass
+from typing import Iterable
+
+import numpy as np
+
+WINDOW_SECONDS = 28.0
+
+
+@dataclass(frozen=True)
+class Placement:
+    """Where one utterance sits in packed audio, in seconds."""
+
+    index: int
+    start: float
+    end: float
+
+
+@dataclass
+class Pack:
+    """Utterances laid end to end, with their placements."""
+
+    audio: np.ndarray
+    placements: list[Placement]
+
+
+def pack(
+    utterances: list[np.ndarray],
+    sample_rate: int = 16000,
+    gap_seconds: float = 1.0,
+    window_seconds: float = WINDOW_SECONDS,
+) -> list[Pack]:
+    """Group utterances, in order, into packs that fit one window.
+
+    Args:
+        utterances: Audio of each utterance (any dtype, kept as given)
+        sample_rate: Rate of the audio
+        gap_seconds: Silence between utterances in a pack
+        window_seconds: Longest pack; longer utterances get a pack each
+
+    Returns:
+        The packs, covering every utterance once
+    """
+    gap = int(gap_seconds * sample_rate)
+    limit = int(window_seconds * sample_rate)
+    groups: list[list[int]] = []
+    length = 0
+    for index, samples in enumerate(utterances):
+        needed = len(samples) + (gap if groups and groups[-1] else 0)
+        if not groups or length + needed > limit:
+            groups.append([index])
+            length = len(samples)
+        else:
+            groups[-1].append(index)
+            length += needed
+
+    packs = []
+    for group in groups:
+        pieces: list[np.ndarray] = []
+        placements = []
+        offset = 0
+        for index in group:
+            if pieces:
+                pieces.append(np.zeros(gap, dtype=utterances[index].dtype))
+                offset += gap
+            samples = utterances[index]
+            placements.append(
+                Placement(index, offset / sample_rate, (offset + len(samples)) / sample_rate)
+            )
+            pieces.append(samples)
+            offset += len(samples)
+        packs.append(Pack(np.concatenate(pieces), placements))
+    return packs
+
+
+def split_words(
+    words: Iterable[tuple[float, float, str]],
+    placements: list[Placement],
+) -> dict[int, str]:
+    """Give each timed word to the utterance its midpoint is in (or nearest).
+
+    Args:
+        words: (start, end, text) of each word, as Whisper reports them
+        placements: Where each utterance sits in the packed audio
+
+    Returns:
+        The text of each utterance, by index ("" if no words fell in it)
+    """
+    texts: dict[int, list[str]] = {placement.index: [] for placement in placements}
+    for start, end, word in words:
+        middle = (start + end) / 2
+
+        def distance(placement: Placement) -> float:
+            return max(placement.start - middle, middle - placement.end, 0.0)
+
+        nearest = min(placements, key=distance)
+        texts[nearest.index].append(word)
+    return {index: "".join(parts).strip() for index, parts in texts.items()}
@@ -0,0 +1,5 @@
+"""Transcription ports (abstract interfaces)."""
+
+from much_miller.transcription.ports.transcriber import TranscriberPort, TranscriptionError
+
+__all__ = ["TranscriberPort", "TranscriptionError"]
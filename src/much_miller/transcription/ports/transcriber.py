@@ -0,0 +1,52 @@
+"""Abstract base class for utterance transcription."""
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+
+class TranscriptionError(RuntimeError):
+    """Raised when a transcriber cannot produce text."""
+
+
+class TranscriberPort(ABC):
+    """Abstract base class for services that turn one utterance into text."""
+
+    @abstractmethod
+    def transcribe(self, samples: np.ndarray, sample_rate: int = 16000) -> str:
+        """Transcribe a complete utterance.
+
+        Args:
+            samples: Mono int16 audio
+            sample_rate: Sample rate of the audio
+
+        Returns:
+            The transcribed text (may be empty)
+
+        Raises:
+            TranscriptionError: If the audio could not be transcribed
+        """
+
+    def transcribe_batch(self, utterances: list[np.ndarray], sample_rate: int = 16000) -> list[str]:
+        """Transcribe several utterances, e.g. from different clients.
+
+        Transcribes them one at a time by default; adapters that can share
+        work between utterances override this.
+
+        Args:
+            utterances: Mono int16 audio for each utterance
+            sample_rate: Sample rate of the audio
+
+        Returns:
+            The text of each utterance, in order
+
+        Raises:
+            TranscriptionError: If the audio could not be transcribed
+        """
+        return [self.transcribe(samples, sample_rate) for samples in utterances]
+
+    def load(self) -> None:
+        """Load models up front rather than on the first utterance."""
+
+    def close(self) -> None:
+        """Release the transcriber's resources (nothing by default)."""
@@ -0,0 +1,216 @@
+"""Long-lived transcription session that survives wake cycles."""
+
+import threading
+import time
+from typing import Callable, Protocol
+
+import numpy as np
+
+from much_miller.audio.capture_hub import CaptureHub, Subscription
+from much_miller.telemetry import metrics
+
+# Audio before the wake word's detection fed to the recorder, so speech
+# that starts straight after the wake word is not clipped
+PREROLL_SECONDS = 0.3
+
+_TRANSCRIPTS = metrics.counter("much_miller_transcripts_total", "Final transcripts received")
+_RTF = metrics.histogram(
+    "much_miller_whisper_rtf",
+    "Transcription seconds per second of audio",
+    metrics.RATIO_BUCKETS,
+    stage="whisper",
+)
+_LOAD = metrics.stage_load("whisper")
+
+
+class Recorder(Protocol):
+    """The subset of RealtimeSTT's AudioToTextRecorder used by the session."""
+
+    def text(self) -> str: ...
+
+    def set_microphone(self, microphone_on: bool = True) -> None: ...
+
+    def clear_audio_queue(self) -> None: ...
+
+    def feed_audio(self, chunk: np.ndarray, original_sample_rate: int = 16000) -> None: ...
+
+    def shutdown(self) -> None: ...
+
+
+class TranscriptionSession:
+    """Keeps a speech-to-text recorder loaded between wake cycles.
+
+    Building an AudioToTextRecorder loads the Whisper model and starts its
+    worker processes, which takes seconds on a CPU-only host. The session
+    builds the recorder once and then pauses and resumes it, so a wake word
+    only has to switch the microphone feed back on.
+
+    With keep_warm=False the session rebuilds the recorder on every resume
+    and shuts it down on every pause, which is how Much used to behave.
+    This is kept so wake-to-first-transcript latency can be compared.
+
+    Given a capture hub, the session feeds the recorder itself instead of
+    letting it open the microphone. The recorder must then be built with
+    use_microphone=False. Each resume starts with a pre-roll of audio from
+    before the wake word fired, so a command said straight after the wake
+    word is not clipped.
+
+    A recorder that runs Whisper itself reports when each utterance starts
+    and ends (RealtimeSTT's on_recording_start and on_recording_stop) to
+    utterance_started() and utterance_ended(); the session then records
+    Whisper's real-time factor and load from the time text() takes to
+    return after the utterance ended.
+    """
+
+    def __init__(
+        self,
+        recorder_factory: Callable[[], Recorder],
+        keep_warm: bool = True,
+        hub: CaptureHub | None = None,
+        preroll_seconds: float = 0.0,
+    ) -> None:
+        """Initialize the session.
+
+        Args:
+            recorder_factory: Builds a new recorder (loads the model)
+            keep_warm: Keep the recorder loaded between wake cycles
+            hub: Capture hub to feed audio from, or None to let the
+                recorder use the microphone directly
+            preroll_seconds: Seconds of audio before the wake position to
+                feed on resume (only used with a hub)
+        """
+        self._recorder_factory = recorder_factory
+        self._keep_warm = keep_warm
+        self._hub = hub
+        self._preroll_seconds = preroll_seconds
+        self._recorder: Recorder | None = None
+        self._subscription: Subscription | None = None
+        self._feeder: threading.Thread | None = None
+        self._resumed_at: float | None = None
+        self._first_transcript_latency: float | None = None
+        self._utterance_started: float | None = None
+        self._utterance_ended: float | None = None
+
+    @property
+    def keep_warm(self) -> bool:
+        """Return True if the recorder is kept loaded between cycles."""
+        return self._keep_warm
+
+    @property
+    def first_transcript_latency(self) -> float | None:
+        """Seconds from the last resume to its first non-empty transcript, or None."""
+        return self._first_transcript_latency
+
+    def start(self) -> None:
+        """Load the recorder up front, with the microphone feed paused."""
+        if self._keep_warm and self._recorder is None:
+            self._recorder = self._recorder_factory()
+            if self._hub is None:
+                self._recorder.set_microphone(False)
+
+    def resume(
+        self,
+        started_at: float | None = None,
+        from_position: int | None = None,
+    ) -> None:
+        """Start transcribing again after a wake word.
+
+        Args:
+            started_at: time.perf_counter() value to measure latency from,
+                typically when the wake word fired (defaults to now)
+            from_position: Hub sample position the wake word fired at; the
+                pre-roll is taken from before it (defaults to now)
+        """
+        self._resumed_at = time.perf_counter() if started_at is None else started_at
+        self._first_transcript_latency = None
+        if self._recorder is None:
+            self._recorder = self._recorder_factory()
+        self._recorder.clear_audio_queue()
+        if self._hub is None:
+            self._recorder.set_microphone(True)
+            return
+        self._subscription = self._hub.subscribe(
+            preroll_seconds=self._preroll_seconds,
+            from_position=from_position,
+            max_frames=1024,
+        )
+        self._feeder = threading.Thread(
+            target=self._feed,
+            args=(self._recorder, self._subscription, self._hub.sample_rate),
+            name="transcription-feeder",
+            daemon=True,
+        )
+        self._feeder.start()
+
+    def text(self) -> str:
+        """Block until the next utterance has been transcribed.
+
+        Returns:
+            The transcribed text (may be empty)
+        """
+        if self._recorder is None:
+            raise RuntimeError("Transcription session is not running")
+        text = self._recorder.text()
+        finished = time.perf_counter()
+        # An empty text is a silence timeout, not a transcript
+        if text:
+            _TRANSCRIPTS.inc()
+        if text and self._first_transcript_latency is None and self._resumed_at is not None:
+            self._first_transcript_latency = finished - self._resumed_at
+        started, ended = self._utterance_started, self._utterance_ended
+        self._utterance_started = self._utterance_ended = None
+        if started is not None and ended is not None and ended > started:
+            audio_seconds = ended - started
+            _RTF.observe((finished - ended) / audio_seconds)
+            _LOAD.record(finished - ended, audio_seconds)
+        return text
+
+    def utterance_started(self) -> None:
+        """Note that the recorder has started recording an utterance."""
+        self._utterance_started = time.perf_counter()
+        self._utterance_ended = None
+
+    def utterance_ended(self) -> None:
+        """Note that the recorder has stopped recording and is transcribing."""
+        self._utterance_ended = time.perf_counter()
+
+    def clear(self) -> None:
+        """Drop audio heard since the last transcript, such as our own reply."""
+        if self._recorder is not None:
+            self._recorder.clear_audio_queue()
+
+    def pause(self) -> None:
+        """Stop transcribing until the next resume."""
+        self._stop_feeding()
+        if self._recorder is None:
+            return
+        if self._keep_warm:
+            if self._hub is None:
+                self._recorder.set_microphone(False)
+            self._recorder.clear_audio_queue()
+        else:
+            self._recorder.shutdown()
+            self._recorder = None
+
+    def shutdown(self) -> None:
+        """Release the recorder and its worker processes."""
+        self._stop_feeding()
+        if self._recorder is not None:
+            self._recorder.shutdown()
+            self._recorder = None
+
+    def _stop_feeding(self) -> None:
+        if self._subscription is not None:
+            self._subscription.close()
+            self._subscription = None
+        if self._feeder is not None:
+            self._feeder.join()
+            self._feeder = None
+
+    @staticmethod
+    def _feed(recorder: Recorder, subscription: Subscription, sample_rate: int) -> None:
+        while True:
+            frame = subscription.read()
+            if frame is None:
+                return
+            recorder.feed_audio(frame, original_sample_rate=sample_rate)
@@ -0,0 +1,105 @@
+"""Recorder that cuts fed audio into utterances for a TranscriberPort."""
+
+import queue
+
+import numpy as np
+
+from much_miller.transcription.endpointer import Endpointer
+from much_miller.transcription.ports import TranscriberPort, TranscriptionError
+
+_SHUTDOWN = None
+
+
+class UtteranceRecorder:
+    """Stands in for AudioToTextRecorder, transcribing through a TranscriberPort.
+
+    Fed frames are split into utterances by level (see Endpointer). Each
+    utterance, with a little audio from before it started, goes to the
+    transcriber in one call. It implements the Recorder protocol used by
+    TranscriptionSession and only works with hub feeding.
+    """
+
+    def __init__(
+        self,
+        transcriber: TranscriberPort,
+        sample_rate: int = 16000,
+        speech_level: float = 500.0,
+        silence_seconds: float = 0.7,
+        lead_seconds: float = 0.2,
+        max_seconds: float = 15.0,
+    ) -> None:
+        """Initialize the recorder.
+
+        Args:
+            transcriber: Turns each utterance into text
+            sample_rate: Rate of the audio that will be fed
+            speech_level: int16 RMS above which a frame counts as speech
+            silence_seconds: Quiet that ends an utterance
+            lead_seconds: Audio kept from before speech started
+            max_seconds: Longest utterance before it is cut
+        """
+        self._transcriber = transcriber
+        self._sample_rate = sample_rate
+        self._speech_level = speech_level
+        self._silence_seconds = silence_seconds
+        self._lead_seconds = lead_seconds
+        self._max_seconds = max_seconds
+        self._frames: queue.Queue[np.ndarray | None] = queue.Queue()
+
+    def text(self) -> str:
+        """Block until an utterance has ended and return its transcript.
+
+        Returns:
+            The transcribed text, or "" on shutdown or transcription failure
+        """
+        endpointer = Endpointer(
+            self._sample_rate,
+            self._speech_level,
+            self._silence_seconds,
+            self._lead_seconds,
+            self._max_seconds,
+        )
+        while True:
+            frame = self._frames.get()
+            if frame is _SHUTDOWN:
+                self._frames.put(_SHUTDOWN)
+                return ""
+            utterance = endpointer.push(frame)
+            if utterance is not None:
+                return self._transcribe(utterance)
+
+    def feed_audio(self, chunk: np.ndarray, original_sample_rate: int = 16000) -> None:
+        """Queue int16 audio; resampled if it is not at the recorder's rate."""
+        if original_sample_rate != self._sample_rate:
+            from scipy.signal import resample_poly
+
+            resampled = resample_poly(
+                chunk.astype(np.float32), self._sample_rate, original_sample_rate
+            )
+            chunk = np.clip(resampled, -32768, 32767).astype(np.int16)
+        self._frames.put(chunk)
+
+    def set_microphone(self, microphone_on: bool = True) -> None:
+        """Ignored; audio only arrives through feed_audio."""
+
+    def clear_audio_queue(self) -> None:
+        """Discard audio fed but not yet consumed."""
+        while True:
+            try:
+                if self._frames.get_nowait() is _SHUTDOWN:
+                    self._frames.put(_SHUTDOWN)
+                    return
+            except queue.Empty:
+                return
+
+    def shutdown(self) -> None:
+        """Wake any text() call and make later ones return ""."""
+        self._frames.put(_SHUTDOWN)
+        self._transcriber.close()
+
+    def _transcribe(self, samples: np.ndarray) -> str:
+        try:
+            return self._transcriber.transcribe(samples, self._sample_rate)
+        except TranscriptionError as e:
+            print(f"[Transcription failed: {e}]")
+            return ""
@@ -1,13 +1,40 @@
-"""Adapter implementations for wake word detection."""
-
-from much_miller.wake_word.adapters.sounddevice_recorder import SoundDeviceRecorder
-from much_miller.wake_word.adapters.fake_recorder import FakeRecorder
-from much_miller.wake_word.adapters.fake_speaker import FakeSpeaker
-from much_miller.wake_word.adapters.piper_speaker import PiperSpeaker
-
-__all__ = [
-    "SoundDeviceRecorder",
-    "FakeRecorder",
-    "FakeSpeaker",
-    "PiperSpeaker",
-]
+"""Adapter implementations for wake word detection.
+
+Adapters are imported when first accessed, so using one adapter does not
+pull in the heavy dependencies (sounddevice, Piper) of the others.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+_ADAPTER_MODULES = {
+    "SoundDeviceRecorder": "much_miller.wake_word.adapters.sounddevice_recorder",
+    "FakeRecorder": "much_miller.wake_word.adapters.fake_recorder",
+    "FakeSpeaker": "much_miller.wake_word.adapters.fake_speaker",
+    "HubRecorder": "much_miller.wake_word.adapters.hub_recorder",
+    "PiperSpeaker": "much_miller.wake_word.adapters.piper_speaker",
+    "QueuedSpeaker": "much_miller.wake_word.adapters.queued_speaker",
+    "SpeechQueue": "much_miller.wake_word.adapters.speech_queue",
+    "ThreadedRecorder": "much_miller.wake_word.adapters.threaded_recorder",
+    "ThreadedSpeaker": "much_miller.wake_word.adapters.threaded_speaker",
+}
+
+__all__ = list(_ADAPTER_MODULES)
+
+if TYPE_CHECKING:
+    from much_miller.wake_word.adapters.fake_recorder import FakeRecorder
+    from much_miller.wake_word.adapters.fake_speaker import FakeSpeaker
+    from much_miller.wake_word.adapters.hub_recorder import HubRecorder
+    from much_miller.wake_word.adapters.piper_speaker import PiperSpeaker
+    from much_miller.wake_word.adapters.queued_speaker import QueuedSpeaker
+    from much_miller.wake_word.adapters.sounddevice_recorder import SoundDeviceRecorder
+    from much_miller.wake_word.adapters.speech_queue import SpeechQueue
+    from much_miller.wake_word.adapters.threaded_recorder import ThreadedRecorder
+    from much_miller.wake_word.adapters.threaded_speaker import ThreadedSpeaker
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _ADAPTER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module_name), name)
@@ -1,13 +1,36 @@
 """Fake audio recorder for testing."""
 
+from pathlib import Path
+from typing import Generator
+
+import numpy as np
+
+from much_miller.audio.wav import read_wav
 from much_miller.wake_word.ports import AudioRecorderPort
 
 
 class FakeRecorder(AudioRecorderPort):
-    """Fake audio recorder that returns pre-configured WAV bytes."""
+    """Fake audio recorder that returns pre-configured WAV bytes.
+
+    frames() streams the WAV's samples in fixed-size frames through one
+    reused buffer, like a real capture stream, then stops.
+    """
 
-    def __init__(self, wav_bytes: bytes = b"") -> None:
+    def __init__(self, wav_bytes: bytes = b"", frame_size: int = 1280) -> None:
         self._wav_bytes = wav_bytes
+        self._frame_size = frame_size
+
+    @classmethod
+    def from_file(cls, path: Path, frame_size: int = 1280) -> "FakeRecorder":
+        """Create a recorder that streams a WAV file."""
+        return cls(Path(path).read_bytes(), frame_size)
+
+    @property
+    def sample_rate(self) -> int:
+        """Return the sample rate of the configured WAV (16 kHz if none)."""
+        if not self._wav_bytes:
+            return 16000
+        return read_wav(self._wav_bytes)[1]
 
     def set_wav_bytes(self, wav_bytes: bytes) -> None:
         """Set the WAV bytes to return from record_chunk."""
@@ -23,3 +46,15 @@ class FakeRecorder(AudioRecorderPort):
             The pre-configured WAV bytes
         """
         return self._wav_bytes
+
+    def frames(self) -> Generator[np.ndarray, None, None]:
+        """Yield the WAV's samples in frames; the last is zero padded."""
+        if not self._wav_bytes:
+            return
+        samples = read_wav(self._wav_bytes)[0]
+        frame = np.zeros(self._frame_size, dtype=np.int16)
+        for offset in range(0, len(samples), self._frame_size):
+            block = samples[offset:offset + self._frame_size]
+            frame[:len(block)] = block
+            frame[len(block):] = 0
+            yield frame
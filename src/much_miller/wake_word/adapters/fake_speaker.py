@@ -1,13 +1,26 @@
 """Fake speaker for testing."""
 
+import threading
+
 from much_miller.wake_word.ports import SpeakerPort
 
 
 class FakeSpeaker(SpeakerPort):
     """Fake speaker that stores spoken text for test assertions."""
 
-    def __init__(self) -> None:
+    def __init__(self, delay: float = 0.0) -> None:
+        """Initialize the fake.
+
+        Args:
+            delay: Seconds each reply takes to "play" (interruptible)
+        """
         self._spoken_text = ""
+        self._delay = delay
+        self._interrupted = threading.Event()
+        self.interruptions = 0
+        self.warm_ups = 0
+        self.replies: list[str] = []
+        self.completed: list[str] = []
 
     @property
     def spoken_text(self) -> str:
@@ -20,4 +33,18 @@ class FakeSpeaker(SpeakerPort):
         Args:
             text: Text to speak (stored for assertions)
         """
+        self._interrupted.clear()
         self._spoken_text += text
+        self.replies.append(text)
+        if self._delay and self._interrupted.wait(self._delay):
+            return
+        self.completed.append(text)
+
+    def warm_up(self) -> None:
+        """Count warm-ups, so tests can check the voice was prepared."""
+        self.warm_ups += 1
+
+    def interrupt(self) -> None:
+        """Cut the current reply short."""
+        self.interruptions += 1
+        self._interrupted.set()
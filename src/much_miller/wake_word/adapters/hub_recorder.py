@@ -0,0 +1,36 @@
+"""Audio recorder adapter that reads from the shared capture hub."""
+
+from typing import Generator
+
+import numpy as np
+
+from much_miller.audio.capture_hub import CaptureHub
+from much_miller.wake_word.ports import AudioRecorderPort
+
+
+class HubRecorder(AudioRecorderPort):
+    """Audio recorder that takes its audio from a running CaptureHub.
+
+    Unlike SoundDeviceRecorder it never opens the device itself, so it can
+    record while wake word detection and transcription are listening.
+    """
+
+    def __init__(self, hub: CaptureHub) -> None:
+        self._hub = hub
+
+    @property
+    def sample_rate(self) -> int:
+        """Return the sample rate of the hub's frames in Hz."""
+        return self._hub.sample_rate
+
+    def frames(self) -> Generator[np.ndarray, None, None]:
+        """Yield the hub's frames from now until capture stops."""
+        subscription = self._hub.subscribe()
+        try:
+            while True:
+                frame = subscription.read()
+                if frame is None:
+                    return
+                yield frame
+        finally:
+            subscription.close()
@@ -2,24 +2,95 @@
 
 import io
 import subprocess
+import threading
+import time
 import wave
 from pathlib import Path
+from typing import Any, Iterable, Iterator
 
 from piper import PiperVoice
 
+from much_miller.cpu_budget import EngineBudget, pinned
+from much_miller.telemetry import cpu_profile, metrics
+
+from much_miller.wake_word.phrase_cache import PhraseCache, voice_id_for
 from much_miller.wake_word.ports import SpeakerPort
 
+_SYNTHESIS = metrics.histogram(
+    "much_miller_tts_synthesis_seconds", "Time to synthesize a reply with the voice model"
+)
+_PLAYBACK = metrics.histogram("much_miller_tts_playback_seconds", "Time spent playing a reply")
+_LOAD = metrics.stage_load("tts")
+
 
 class PiperSpeaker(SpeakerPort):
-    """Speaker adapter using Piper TTS."""
+    """Speaker adapter using Piper TTS.
+
+    By default each reply is synthesized in full and played with aplay.
+    In streaming mode the speaker keeps one output stream open and plays
+    each synthesized chunk as soon as it is ready, so time to first sound
+    no longer grows with the length of the reply.
+
+    With a phrase cache, audio for text spoken before is played from the
+    cache without running the voice model.
 
-    def __init__(self, model_path: Path) -> None:
+    interrupt() stops a reply part way through: streaming mode checks
+    for it every 50 ms of audio, and aplay is terminated.
+    """
+
+    def __init__(
+        self,
+        model_path: Path,
+        streaming: bool = False,
+        cache: PhraseCache | None = None,
+        budget: EngineBudget | None = None,
+    ) -> None:
         """Initialize the Piper speaker.
 
         Args:
             model_path: Path to the ONNX voice model file
+            streaming: Play chunks through a persistent output stream
+            cache: Cache of previously synthesized phrases
+            budget: ONNX Runtime thread counts and CPUs for synthesis
         """
-        self._voice = PiperVoice.load(str(model_path))
+        self._budget = budget or EngineBudget()
+        with pinned(self._budget.cpus), cpu_profile.track("piper"):
+            self._voice = PiperVoice.load(str(model_path))
+            if self._budget.threads is not None or self._budget.inter_threads is not None:
+                # PiperVoice.load takes no session options, so the session
+                # is rebuilt with the budgeted thread pools
+                import onnxruntime
+
+                self._voice.session = onnxruntime.InferenceSession(
+                    str(model_path),
+                    sess_options=self._budget.session_options(),
+                    providers=["CPUExecutionProvider"],
+                )
+        self._voice_id = voice_id_for(model_path)
+        self._cache = cache
+        self._interrupted = threading.Event()
+        self._player: subprocess.Popen[bytes] | None = None
+        self._stream: Any = None
+        if streaming:
+            import sounddevice as sd
+
+            # Opened once here, so no device warm-up silence is needed later
+            self._stream = sd.RawOutputStream(
+                samplerate=self._voice.config.sample_rate,
+                channels=1,
+                dtype="int16",
+            )
+            self._stream.start()
+
+    @property
+    def sample_rate(self) -> int:
+        """Return the sample rate of the voice's audio."""
+        return self._voice.config.sample_rate
+
+    @property
+    def streaming(self) -> bool:
+        """Return True if chunks are played as they are synthesized."""
+        return self._stream is not None
 
     def say(self, text: str) -> None:
         """Speak the given text using Piper TTS.
@@ -27,17 +98,120 @@ class PiperSpeaker(SpeakerPort):
         Args:
             text: Text to speak
         """
-        audio_segments: list[bytes] = []
-        for chunk in self._voice.synthesize(text):
-            audio_segments.append(chunk.audio_int16_bytes)
+        self._interrupted.clear()
+        with pinned(self._budget.cpus), cpu_profile.track("piper"):
+            self._speak(text)
+
+    def _speak(self, text: str) -> None:
+        if self._stream is not None:
+            slice_bytes = int(self._voice.config.sample_rate * 0.05) * 2
+            playing = 0.0
+            try:
+                for audio in self._audio_chunks(text):
+                    started = time.perf_counter()
+                    for offset in range(0, len(audio), slice_bytes):
+                        if self._interrupted.is_set():
+                            return
+                        self._stream.write(audio[offset:offset + slice_bytes])
+                    playing += time.perf_counter() - started
+            finally:
+                _PLAYBACK.observe(playing)
+            return
 
-        if audio_segments:
+        audio_segments = list(self._audio_chunks(text))
+
+        if audio_segments and not self._interrupted.is_set():
             # Add 500ms silence at start to allow audio device to initialize
             silence_samples = int(self._voice.config.sample_rate * 0.5)
             silence = b"\x00\x00" * silence_samples  # 16-bit silence
             audio_data = silence + b"".join(audio_segments)
             wav_bytes = self._to_wav(audio_data)
-            subprocess.run(["aplay", "-q", "-"], input=wav_bytes, check=True)
+            started = time.perf_counter()
+            player = self._player = subprocess.Popen(["aplay", "-q", "-"], stdin=subprocess.PIPE)
+            try:
+                player.communicate(wav_bytes)
+            finally:
+                self._player = None
+            _PLAYBACK.observe(time.perf_counter() - started)
+            if player.returncode and not self._interrupted.is_set():
+                raise subprocess.CalledProcessError(player.returncode, "aplay")
+
+    def interrupt(self) -> None:
+        """Stop the reply being spoken in another thread."""
+        self._interrupted.set()
+        player = self._player
+        if player is not None and player.poll() is None:
+            player.terminate()
+
+    def render(self, text: str) -> bytes:
+        """Return int16 PCM for the text without playing it.
+
+        Used where the audio is played somewhere else, such as by a client
+        of the server.
+        """
+        with pinned(self._budget.cpus), cpu_profile.track("piper"):
+            return b"".join(self._audio_chunks(text))
+
+    def warm_up(self) -> None:
+        """Run the voice model once, bypassing the cache.
+
+        The first ONNX Runtime run allocates its buffers and is several
+        times slower than later ones; prerender() may not run the model
+        at all when every phrase is already cached.
+        """
+        with pinned(self._budget.cpus), cpu_profile.track("piper"):
+            for _ in self._voice.synthesize("Ready."):
+                pass
+
+    def prerender(self, phrases: Iterable[str]) -> int:
+        """Synthesize phrases into the cache ahead of time.
+
+        Args:
+            phrases: Phrases that are likely to be spoken
+
+        Returns:
+            The number of phrases that had to be synthesized
+        """
+        if self._cache is None:
+            return 0
+        rendered = 0
+        with pinned(self._budget.cpus), cpu_profile.track("piper"):
+            for text in phrases:
+                if not self._cache.contains(self._voice_id, text):
+                    for _ in self._audio_chunks(text):
+                        pass
+                    rendered += 1
+        return rendered
+
+    def _audio_chunks(self, text: str) -> Iterator[bytes]:
+        """Yield PCM for the text, from the cache or from the voice model."""
+        if self._cache is not None:
+            cached = self._cache.get(self._voice_id, text)
+            if cached is not None:
+                yield cached
+                return
+        segments: list[bytes] = []
+        # Time spent in the model, not in the consumer between chunks
+        synthesis = 0.0
+        started = time.perf_counter()
+        for chunk in self._voice.synthesize(text):
+            synthesis += time.perf_counter() - started
+            segments.append(chunk.audio_int16_bytes)
+            yield chunk.audio_int16_bytes
+            started = time.perf_counter()
+        synthesis += time.perf_counter() - started
+        _SYNTHESIS.observe(synthesis)
+        audio_bytes = sum(len(segment) for segment in segments)
+        _LOAD.record(synthesis, audio_bytes / 2 / self._voice.config.sample_rate)
+        if self._cache is not None and segments:
+            self._cache.put(self._voice_id, text, b"".join(segments))
+
+    def close(self) -> None:
+        """Close the output stream used in streaming mode."""
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
 
     def _to_wav(self, audio_data: bytes) -> bytes:
         """Convert raw audio bytes to WAV format."""
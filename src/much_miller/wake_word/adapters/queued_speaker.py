@@ -0,0 +1,43 @@
+"""Async speaker adapter speaking through a SpeechQueue."""
+
+import asyncio
+
+from much_miller.wake_word.adapters.speech_queue import SpeechQueue
+from much_miller.wake_word.ports import AsyncSpeakerPort
+
+
+class QueuedSpeaker(AsyncSpeakerPort):
+    """Queues each reply on a SpeechQueue and waits for it to be spoken.
+
+    The queue's worker owns the voice and warms it up before the first
+    reply. Cancelling say() interrupts the queue and waits for the reply
+    to stop or be dropped, so the next reply never talks over this one.
+    """
+
+    def __init__(self, queue: SpeechQueue, poll_seconds: float = 0.02) -> None:
+        """Initialize the adapter.
+
+        Args:
+            queue: Speech queue to speak through
+            poll_seconds: How often interrupt() is repeated while waiting
+                for a cancelled reply to stop
+        """
+        self._queue = queue
+        self._poll_seconds = poll_seconds
+
+    @property
+    def queue(self) -> SpeechQueue:
+        """Return the speech queue replies are spoken through."""
+        return self._queue
+
+    async def say(self, text: str) -> None:
+        """Queue the text and wait until it has been spoken; cancel to cut it short."""
+        spoken = asyncio.wrap_future(self._queue.speak(text))
+        try:
+            await asyncio.shield(spoken)
+        except asyncio.CancelledError:
+            # The worker may be between taking the reply and starting it
+            while not spoken.done():
+                self._queue.interrupt()
+                await asyncio.wait({spoken}, timeout=self._poll_seconds)
+            raise
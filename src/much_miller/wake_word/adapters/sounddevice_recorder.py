@@ -1,45 +1,107 @@
 """Audio recorder adapter using sounddevice."""
 
-import io
-import wave
+from typing import Any, Generator
 
 import numpy as np
-import sounddevice as sd
 
+from much_miller.audio.frame_pool import FramePool
+from much_miller.audio.resampler import Resampler, input_frame_size
 from much_miller.wake_word.ports import AudioRecorderPort
 
 
 class SoundDeviceRecorder(AudioRecorderPort):
-    """Audio recorder that captures from microphone using sounddevice."""
+    """Audio recorder that captures from microphone using sounddevice.
 
-    def __init__(self, sample_rate: int = 16000, device: int | None = None) -> None:
-        self.sample_rate = sample_rate
-        self.device = device
+    One sd.InputStream is opened on first use and kept running until
+    close(), so consecutive reads and record_chunk() calls join up with
+    no gap. The stream's callback copies each block into a FramePool of
+    preallocated frames; audio that arrives while nobody is reading fills
+    the pool and then is dropped and counted.
 
-    def record_chunk(self, duration_seconds: float) -> bytes:
-        """Record a chunk of audio from the microphone.
+    With a capture_rate (such as the device's native 48 kHz) the device
+    is opened at that rate and frames are resampled to sample_rate in the
+    reading thread, rather than by the driver.
+    """
 
-        Args:
-            duration_seconds: Duration to record
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        device: int | None = None,
+        frame_size: int = 1280,
+        pool_size: int = 16,
+        capture_rate: int | None = None,
+    ) -> None:
+        """Initialize the recorder; the stream is opened on first use.
 
-        Returns:
-            WAV-encoded audio bytes
+        Args:
+            sample_rate: Capture rate in Hz
+            device: sounddevice input device index, or None for the default
+            frame_size: Samples in each frame
+            pool_size: Frames preallocated between the callback and reader
+            capture_rate: Rate to open the device at, or None for sample_rate
         """
-        num_samples = int(self.sample_rate * duration_seconds)
-        recording = sd.rec(
-            num_samples,
-            samplerate=self.sample_rate,
+        self._sample_rate = sample_rate
+        self._capture_rate = capture_rate or sample_rate
+        self.device = device
+        self._resampler: Resampler | None = None
+        if self._capture_rate != sample_rate:
+            self._resampler = Resampler(self._capture_rate, sample_rate)
+            frame_size = input_frame_size(frame_size, self._capture_rate, sample_rate)
+        self._pool = FramePool(frame_size, pool_size)
+        self._stream: Any = None
+        self._overflows = 0
+
+    @property
+    def sample_rate(self) -> int:
+        """Return the sample rate of the frames in Hz."""
+        return self._sample_rate
+
+    @property
+    def overflows(self) -> int:
+        """Return the number of input overflows reported by the driver."""
+        return self._overflows
+
+    @property
+    def dropped(self) -> int:
+        """Return the number of frames dropped because nobody read them."""
+        return self._pool.dropped
+
+    def start(self) -> None:
+        """Open and start the input stream, if it is not already running."""
+        if self._stream is not None:
+            return
+        import sounddevice as sd
+
+        if self._resampler is not None:
+            self._resampler.reset()
+        self._stream = sd.InputStream(
+            samplerate=self._capture_rate,
+            blocksize=self._pool.frame_size,
             channels=1,
-            dtype=np.int16,
+            dtype="int16",
             device=self.device,
+            callback=self._on_audio,
         )
-        sd.wait()
+        self._stream.start()
+
+    def frames(self) -> Generator[np.ndarray, None, None]:
+        """Yield frames from the running input stream, starting it if needed."""
+        self.start()
+        while True:
+            frame = self._pool.get()
+            if frame is None:
+                return
+            yield frame if self._resampler is None else self._resampler.process(frame)
 
-        buffer = io.BytesIO()
-        with wave.open(buffer, 'wb') as wav_file:
-            wav_file.setnchannels(1)
-            wav_file.setsampwidth(2)
-            wav_file.setframerate(self.sample_rate)
-            wav_file.writeframes(recording.tobytes())
+    def close(self) -> None:
+        """Stop the input stream and end any frames() iterator."""
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
+        self._pool.close()
 
-        return buffer.getvalue()
+    def _on_audio(self, indata: np.ndarray, frame_count: int, time_info: Any, status: Any) -> None:
+        if status.input_overflow:
+            self._overflows += 1
+        self._pool.put(indata[:, 0])
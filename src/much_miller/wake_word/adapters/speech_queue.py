@@ -0,0 +1,205 @@
+"""Speech queue: replies are spoken by a worker thread, in priority order."""
+
+import itertools
+import queue
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+
+from much_miller.wake_word.ports import SpeakerPort
+
+NORMAL = 0
+URGENT = 10
+
+
+@dataclass(order=True)
+class _Reply:
+    rank: tuple[int, int]
+    text: str = field(compare=False)
+    future: "Future[bool]" = field(compare=False)
+
+
+class SpeechQueue(SpeakerPort):
+    """Speaks replies in a background thread so callers never wait for audio.
+
+    The worker owns the wrapped speaker: it warms the voice up before the
+    first reply, then speaks queued replies one at a time, most urgent
+    first and otherwise in the order they were queued.
+
+    speak() returns a future that resolves to True once the reply has been
+    spoken in full, or False if it was interrupted part way. Replies that
+    are flushed before they start are cancelled, and cancelling a future
+    yourself drops its reply. say() is speak() without the future, so a
+    SpeechQueue can stand in for any SpeakerPort.
+
+    A speaker forgets an interrupt that arrives before its say() starts,
+    so an interrupted reply is interrupted again every poll_seconds until
+    it is over.
+    """
+
+    def __init__(
+        self,
+        speaker: SpeakerPort,
+        warm_up: bool = True,
+        poll_seconds: float = 0.02,
+    ) -> None:
+        """Start the worker.
+
+        Args:
+            speaker: Blocking speaker to run; only the worker calls say()
+            warm_up: Run the voice once before the first reply, so it is
+                not slow to start
+            poll_seconds: How often an interrupt is repeated while the
+                interrupted reply is still being spoken
+        """
+        self._speaker = speaker
+        self._poll_seconds = poll_seconds
+        self._queue: queue.PriorityQueue[_Reply] = queue.PriorityQueue()
+        self._order = itertools.count()
+        self._lock = threading.Lock()
+        self._current: _Reply | None = None
+        self._interrupted = False
+        self._idle = threading.Condition(self._lock)
+        self._pending = 0
+        self._closed = False
+        self._ready = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(warm_up,), name="speech-queue", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def speaker(self) -> SpeakerPort:
+        """Return the speaker the worker drives."""
+        return self._speaker
+
+    @property
+    def pending(self) -> int:
+        """Return the number of replies queued or being spoken."""
+        return self._pending
+
+    def wait_ready(self, timeout: float | None = None) -> bool:
+        """Wait for the voice to be warmed up; return False on timeout."""
+        return self._ready.wait(timeout)
+
+    def speak(self, text: str, priority: int = NORMAL, preempt: bool = False) -> "Future[bool]":
+        """Queue a reply and return at once.
+
+        Args:
+            text: Text to speak
+            priority: Higher priorities are spoken first (see URGENT)
+            preempt: Interrupt the current reply and flush the queue first
+
+        Returns:
+            A future resolving to True if the reply was spoken in full, or
+            False if it was interrupted
+
+        Raises:
+            RuntimeError: If the queue has been closed
+        """
+        future: Future[bool] = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("speech queue is closed")
+            if preempt:
+                self._flush_locked()
+                self._interrupt_locked()
+            self._pending += 1
+            self._queue.put(_Reply((-priority, next(self._order)), text, future))
+        return future
+
+    def say(self, text: str) -> None:
+        """Queue the text to be spoken and return without waiting."""
+        self.speak(text)
+
+    def flush(self) -> int:
+        """Drop every reply not yet started; return how many were dropped."""
+        with self._lock:
+            return self._flush_locked()
+
+    def interrupt(self) -> None:
+        """Stop the current reply and drop the rest: the user is talking."""
+        with self._lock:
+            self._flush_locked()
+            self._interrupt_locked()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait until every queued reply has finished.
+
+        Returns:
+            True if the queue emptied before the timeout
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """Interrupt speech, drop queued replies and stop the worker."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._flush_locked()
+            self._interrupt_locked()
+            self._queue.put(_Reply((-URGENT - 1, -1), "", Future()))
+        self._thread.join(timeout)
+
+    def _flush_locked(self) -> int:
+        dropped = 0
+        while True:
+            try:
+                reply = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            reply.future.cancel()
+            dropped += 1
+        self._finished_locked(dropped)
+        return dropped
+
+    def _interrupt_locked(self) -> None:
+        reply = self._current
+        if reply is None or self._interrupted:
+            return
+        self._interrupted = True
+        self._speaker.interrupt()
+        threading.Thread(
+            target=self._keep_interrupting, args=(reply,), name="speech-interrupt", daemon=True
+        ).start()
+
+    def _keep_interrupting(self, reply: _Reply) -> None:
+        # Under the lock, so a later reply is never the one interrupted
+        with self._idle:
+            while True:
+                self._idle.wait(self._poll_seconds)
+                if self._current is not reply:
+                    return
+                self._speaker.interrupt()
+
+    def _finished_locked(self, count: int) -> None:
+        if count:
+            self._pending -= count
+            self._idle.notify_all()
+
+    def _run(self, warm_up: bool) -> None:
+        if warm_up:
+            self._speaker.warm_up()
+        self._ready.set()
+        while True:
+            reply = self._queue.get()
+            with self._lock:
+                if self._closed:
+                    return
+                if not reply.future.set_running_or_notify_cancel():
+                    self._finished_locked(1)
+                    continue
+                self._current = reply
+                self._interrupted = False
+            try:
+                self._speaker.say(reply.text)
+            except Exception as e:
+                reply.future.set_exception(e)
+            else:
+                reply.future.set_result(not self._interrupted)
+            finally:
+                with self._lock:
+                    self._current = None
+                    self._finished_locked(1)
@@ -0,0 +1,23 @@
+"""Async recorder adapter running a blocking AudioRecorderPort in a worker thread."""
+
+import asyncio
+
+from much_miller.wake_word.ports import AsyncAudioRecorderPort, AudioRecorderPort
+
+
+class ThreadedRecorder(AsyncAudioRecorderPort):
+    """Runs AudioRecorderPort.record_chunk in a thread."""
+
+    def __init__(self, recorder: AudioRecorderPort) -> None:
+        self._recorder = recorder
+
+    async def record_chunk(self, duration_seconds: float) -> bytes:
+        """Record a chunk of audio without blocking the event loop.
+
+        Args:
+            duration_seconds: Duration to record
+
+        Returns:
+            WAV-encoded audio bytes
+        """
+        return await asyncio.to_thread(self._recorder.record_chunk, duration_seconds)
@@ -0,0 +1,36 @@
+"""Async speaker adapter running a blocking SpeakerPort in a worker thread."""
+
+import asyncio
+
+from much_miller.wake_word.ports import AsyncSpeakerPort, SpeakerPort
+
+
+class ThreadedSpeaker(AsyncSpeakerPort):
+    """Runs SpeakerPort.say in a thread so the event loop keeps going.
+
+    Cancelling say() interrupts the wrapped speaker and waits for its
+    thread to finish, so the next reply never talks over this one.
+    """
+
+    def __init__(self, speaker: SpeakerPort, poll_seconds: float = 0.02) -> None:
+        """Initialize the adapter.
+
+        Args:
+            speaker: Blocking speaker to run
+            poll_seconds: How often interrupt() is repeated while waiting
+                for a cancelled reply to stop
+        """
+        self._speaker = speaker
+        self._poll_seconds = poll_seconds
+
+    async def say(self, text: str) -> None:
+        """Speak the text in a worker thread; cancel to cut it short."""
+        speaking = asyncio.ensure_future(asyncio.to_thread(self._speaker.say, text))
+        try:
+            await asyncio.shield(speaking)
+        except asyncio.CancelledError:
+            # The thread may not have started speaking yet, so keep asking
+            while not speaking.done():
+                self._speaker.interrupt()
+                await asyncio.wait({speaking}, timeout=self._poll_seconds)
+            raise
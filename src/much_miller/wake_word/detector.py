@@ -0,0 +1,357 @@
+"""Wake word detection on frames from the capture hub."""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Protocol
+
+import numpy as np
+
+from much_miller.audio.capture_hub import CaptureHub, Subscription
+from much_miller.cpu_budget import pinned
+from much_miller.telemetry import cpu_profile, metrics, tracing
+from much_miller.wake_word.energy_gate import EnergyGate
+
+if TYPE_CHECKING:
+    from much_miller.wake_word.duty_cycle import DutyCycler
+    from much_miller.wake_word.verification import WakeTrigger, WakeVerifier
+
+DEFAULT_THRESHOLD = 0.5
+
+_INFERENCE = metrics.histogram(
+    "much_miller_wake_inference_seconds",
+    "Wake word inference time per frame",
+    (0.001, 0.0025, 0.005, 0.01, 0.02, 0.04, 0.08, 0.16, 0.32),
+)
+_SCORE = metrics.histogram(
+    "much_miller_wake_score", "Highest wake word score per frame", metrics.SCORE_BUCKETS
+)
+_DROPPED = metrics.counter(
+    "much_miller_wake_dropped_frames_total", "Frames dropped because inference fell behind"
+)
+_GATED = metrics.counter(
+    "much_miller_wake_gated_frames_total", "Quiet frames skipped by the energy gate"
+)
+_REJECTED = metrics.counter(
+    "much_miller_wake_rejected_total", "Wake word triggers the verifier rejected"
+)
+_VERIFY = metrics.histogram(
+    "much_miller_wake_verify_seconds", "Time to verify a wake word trigger"
+)
+_LOAD = metrics.stage_load("wake")
+
+
+class WakeModel(Protocol):
+    """The part of openWakeWord's Model used for detection."""
+
+    def predict(self, x: np.ndarray) -> dict[str, float]: ...
+
+
+@dataclass
+class Detection:
+    """A wake word that fired."""
+
+    model_name: str
+    score: float
+    position: int
+
+
+@dataclass
+class WakeWordStats:
+    """Counters showing whether the wake word path keeps up with capture."""
+
+    frame_seconds: float
+    frames: int = 0
+    inference_seconds: float = 0.0
+    max_inference_seconds: float = 0.0
+    max_queue_depth: int = 0
+    dropped_frames: int = 0
+    input_overflows: int = 0
+    source_dropped: int = 0
+    gated_frames: int = 0
+    triggers: int = 0
+    rejected: int = 0
+    verify_seconds: float = 0.0
+    strided_frames: int = 0
+    duty_mode: str = "full"
+
+    @property
+    def mean_inference_ms(self) -> float:
+        """Return the mean inference time per frame in milliseconds."""
+        return self.inference_seconds / self.frames * 1000 if self.frames else 0.0
+
+    @property
+    def load(self) -> float:
+        """Return mean inference time as a fraction of frame duration."""
+        if not self.frames:
+            return 0.0
+        return self.inference_seconds / self.frames / self.frame_seconds
+
+    @property
+    def behind_realtime(self) -> bool:
+        """Return True if audio has been lost or inference is too slow."""
+        lost = self.dropped_frames + self.input_overflows + self.source_dropped
+        return lost > 0 or self.load >= 1.0
+
+    def combined(self, later: "WakeWordStats") -> "WakeWordStats":
+        """Return these counters with a later period's added on."""
+        values: dict[str, float | int | str] = {}
+        for item in fields(self):
+            earlier, value = getattr(self, item.name), getattr(later, item.name)
+            if item.name in ("frame_seconds", "duty_mode"):
+                values[item.name] = value
+            elif item.name.startswith("max_"):
+                values[item.name] = max(earlier, value)
+            else:
+                values[item.name] = earlier + value
+        return WakeWordStats(**values)  # type: ignore[arg-type]
+
+    def describe(self) -> str:
+        """Return a one-line summary."""
+        return (
+            f"frames={self.frames} inference mean={self.mean_inference_ms:.1f}ms "
+            f"max={self.max_inference_seconds * 1000:.1f}ms load={self.load:.0%} "
+            f"queue max={self.max_queue_depth} dropped={self.dropped_frames} "
+            f"overflows={self.input_overflows} source dropped={self.source_dropped} "
+            f"gated={self.gated_frames} "
+            f"rejected={self.rejected}/{self.triggers} duty={self.duty_mode}"
+        )
+
+
+def detect_wake_word(
+    predictions: dict[str, float],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> tuple[str, float] | None:
+    """Return the first wake word scoring above threshold, with its score."""
+    for model_name, score in predictions.items():
+        if score > threshold:
+            return model_name, float(score)
+    return None
+
+
+class WakeWordDetector:
+    """Runs wake word inference on frames queued by the capture hub.
+
+    Capture and inference are split: PortAudio's callback and the hub's
+    reader thread only queue frames, and inference runs in whichever
+    thread calls listen(). If inference falls behind, the hub drops the
+    oldest queued frames rather than stalling capture; the stats count
+    those drops, driver overflows, queue depth and inference time.
+
+    With a trigger and verifier, detection is two-stage (see
+    verification.py): a trigger the verifier rejects is counted and
+    listening carries on.
+
+    With a duty cycler (see duty_cycle.py), frames are scored several at
+    a time, or by fewer models, while inference lags behind capture.
+    """
+
+    def __init__(
+        self,
+        hub: CaptureHub,
+        wake_model: WakeModel,
+        threshold: float = DEFAULT_THRESHOLD,
+        max_queued_frames: int = 32,
+        gate: EnergyGate | None = None,
+        cpus: frozenset[int] | None = None,
+        trigger: "WakeTrigger | None" = None,
+        verifier: "WakeVerifier | None" = None,
+        verify_seconds: float = 1.5,
+        duty: "DutyCycler | None" = None,
+    ) -> None:
+        """Initialize the detector.
+
+        Args:
+            hub: Capture hub to read frames from
+            wake_model: openWakeWord model (or any object with predict)
+            threshold: Score above which a wake word fires
+            max_queued_frames: Frames queued before the oldest are dropped
+            gate: Skips inference on quiet frames, or None to infer on all
+            cpus: CPUs the listening thread is pinned to while it listens
+            trigger: Per-model thresholds, smoothing and persistence, or
+                None for threshold on a single frame
+            verifier: Confirms each trigger from its audio, or None
+            verify_seconds: Audio up to the trigger passed to the verifier
+            duty: Reduces the work done while inference lags, or None to
+                score every frame with every model
+        """
+        self._hub = hub
+        self._wake_model = wake_model
+        self._threshold = threshold
+        self._max_queued_frames = max_queued_frames
+        self._gate = gate
+        self._cpus = cpus
+        self._trigger = trigger
+        self._verifier = verifier
+        self._recent: deque[np.ndarray] = deque(
+            maxlen=max(1, round(verify_seconds * hub.sample_rate / hub.frame_size))
+        )
+        self._duty = duty
+        self._strided: list[np.ndarray] = []
+        self._selected: frozenset[str] | None = None
+        # Counters of the listen() in progress (or the last one), and of
+        # the listens before it
+        self._stats = WakeWordStats(frame_seconds=hub.frame_size / hub.sample_rate)
+        self._earlier = WakeWordStats(frame_seconds=self._stats.frame_seconds)
+        self._lost_at_start = (hub.overflows, hub.dropped)
+        self._lost_at_listen = self._lost_at_start
+        self._listening = False
+        # The model, gate, trigger and buffers belong to one listen() at a time
+        self._listen_lock = threading.Lock()
+
+    @property
+    def stats(self) -> WakeWordStats:
+        """Return the counters accumulated since the detector was created."""
+        stats = self._earlier.combined(self._stats)
+        stats.input_overflows = self._hub.overflows - self._lost_at_start[0]
+        stats.source_dropped = self._hub.dropped - self._lost_at_start[1]
+        return stats
+
+    @property
+    def last_listen(self) -> WakeWordStats:
+        """Return the counters of the listen() in progress, or the last one."""
+        if self._listening:
+            self._count_lost()
+        return self._stats
+
+    def _count_lost(self) -> None:
+        self._stats.input_overflows = self._hub.overflows - self._lost_at_listen[0]
+        self._stats.source_dropped = self._hub.dropped - self._lost_at_listen[1]
+
+    def listen(self, stop: threading.Event | None = None) -> Detection | None:
+        """Block until a wake word fires.
+
+        Args:
+            stop: Set from another thread to give up listening
+
+        Returns:
+            The detection, or None if capture or listening stopped first
+        """
+        with self._listen_lock, pinned(self._cpus), cpu_profile.track("wake"):
+            return self._listen(stop)
+
+    def _listen(self, stop: threading.Event | None) -> Detection | None:
+        self._earlier = self._earlier.combined(self._stats)
+        self._stats = WakeWordStats(frame_seconds=self._stats.frame_seconds)
+        self._lost_at_listen = (self._hub.overflows, self._hub.dropped)
+        self._listening = True
+        subscription = self._hub.subscribe(max_frames=self._max_queued_frames)
+        timeout = None if stop is None else 0.1
+        dropped_before = 0
+        if self._gate is not None:
+            self._gate.reset()
+        if self._trigger is not None:
+            self._trigger.reset()
+        self._recent.clear()
+        self._strided.clear()
+        try:
+            while stop is None or not stop.is_set():
+                frame = subscription.read(timeout)
+                if frame is None:
+                    if subscription.ended or timeout is None:
+                        break
+                    continue
+                self._stats.max_queue_depth = max(self._stats.max_queue_depth, subscription.depth)
+                if subscription.dropped != dropped_before:
+                    self._stats.dropped_frames += subscription.dropped - dropped_before
+                    _DROPPED.inc(subscription.dropped - dropped_before)
+                    dropped_before = subscription.dropped
+                if self._verifier is not None:
+                    self._recent.append(frame)
+                frames = [frame] if self._gate is None else self._gate.admit(frame)
+                if not frames:
+                    self._stats.gated_frames += 1
+                    _GATED.inc()
+                for admitted in frames:
+                    if self._duty is not None:
+                        admitted = self._stride(admitted, subscription)
+                        if admitted is None:
+                            continue
+                    detection = self._infer(admitted, subscription)
+                    if detection is not None:
+                        return detection
+        finally:
+            self._stats.dropped_frames += subscription.dropped - dropped_before
+            _DROPPED.inc(subscription.dropped - dropped_before)
+            subscription.close()
+            self._count_lost()
+            self._listening = False
+        return None
+
+    def _stride(self, frame: np.ndarray, subscription: Subscription) -> np.ndarray | None:
+        assert self._duty is not None
+        lag = (self._hub.position - subscription.position) / self._hub.sample_rate
+        mode = self._duty.observe(lag)
+        self._stats.duty_mode = mode.name
+        if mode.models != self._selected:
+            select = getattr(self._wake_model, "select", None)
+            if callable(select):
+                select(mode.models)
+            self._selected = mode.models
+        self._strided.append(frame)
+        if len(self._strided) < mode.stride:
+            return None
+        frames = np.concatenate(self._strided)
+        if len(self._strided) > 1:
+            self._stats.strided_frames += len(self._strided)
+        self._strided.clear()
+        return frames
+
+    def _infer(self, frame: np.ndarray, subscription: Subscription) -> Detection | None:
+        started = time.perf_counter()
+        predictions = self._wake_model.predict(frame)
+        elapsed = time.perf_counter() - started
+
+        # frame may hold several frames scored at once (see _stride)
+        frames = max(1, len(frame) // self._hub.frame_size)
+        self._stats.frames += frames
+        self._stats.inference_seconds += elapsed
+        self._stats.max_inference_seconds = max(self._stats.max_inference_seconds, elapsed)
+        _INFERENCE.observe(elapsed / frames)
+        _LOAD.record(elapsed, self._stats.frame_seconds * frames)
+        if predictions:
+            _SCORE.observe(max(predictions.values()))
+
+        if self._trigger is not None:
+            detection = self._trigger.update(predictions)
+        else:
+            detection = detect_wake_word(predictions, self._threshold)
+        if detection is None:
+            return None
+        model_name, score = detection
+        if self._verifier is not None and not self._verify(model_name):
+            return None
+        metrics.counter(
+            "much_miller_wake_detections_total", "Wake words detected", model=model_name
+        ).inc()
+        if tracing.start_trace() is not None:
+            lag = (self._hub.position - subscription.position) / self._hub.sample_rate
+            tracing.record(
+                "wake",
+                started,
+                model=model_name,
+                score=round(score, 3),
+                lag_ms=round(lag * 1000, 1),
+            )
+        return Detection(model_name, score, subscription.position)
+
+    def _verify(self, model_name: str) -> bool:
+        assert self._verifier is not None
+        self._stats.triggers += 1
+        started = time.perf_counter()
+        accepted = self._verifier.verify(
+            model_name, np.concatenate(self._recent), self._hub.sample_rate
+        )
+        elapsed = time.perf_counter() - started
+        self._stats.verify_seconds += elapsed
+        _VERIFY.observe(elapsed)
+        if not accepted:
+            self._stats.rejected += 1
+            _REJECTED.inc()
+            if self._trigger is not None:
+                self._trigger.reset()
+            reset = getattr(self._wake_model, "reset", None)
+            if callable(reset):
+                reset()
+        return accepted
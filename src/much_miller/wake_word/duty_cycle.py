@@ -0,0 +1,226 @@
+"""Doing less wake word work while the CPU is busy, and more when it is not.
+
+When Whisper or mpv saturates the CPU, wake word inference slows, frames
+queue up in the capture hub and, once the queue is full, the oldest are
+dropped. DutyCycler watches the lag between capture and inference (how
+far the hub's writer is ahead of the frame being scored) and steps
+through a ladder of cheaper modes while it is high:
+
+- stride: frames are scored n at a time. openWakeWord accepts several
+  frames in one predict() call, computing their melspectrogram at once
+  and reporting each model's highest score, so no audio is skipped; a
+  wake word is reported up to n - 1 frames later.
+- subset: only the chosen wake word models are run.
+
+It steps back towards full rate once the lag has stayed low for a while.
+Each change is recorded, counted in metrics and passed to on_change.
+"""
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from much_miller.telemetry import metrics
+
+_LEVEL = metrics.gauge(
+    "much_miller_wake_duty_level", "Wake word duty cycle level (0 is full rate)"
+)
+
+
+@dataclass(frozen=True)
+class DutyMode:
+    """How much wake word work is done for the audio captured."""
+
+    name: str
+    stride: int = 1
+    models: frozenset[str] | None = None
+
+    def describe(self) -> str:
+        """Return the mode in words, e.g. "stride-2 (every 2 frames, hey_jarvis only)"."""
+        parts = [f"every {self.stride} frames" if self.stride > 1 else "every frame"]
+        if self.models is not None:
+            parts.append(f"{', '.join(sorted(self.models))} only")
+        return f"{self.name} ({', '.join(parts)})"
+
+
+FULL = DutyMode("full")
+
+
+def default_modes(keep: list[str] | None = None) -> list[DutyMode]:
+    """Return the ladder of modes from full rate to the cheapest.
+
+    Args:
+        keep: Wake word models still run under the heaviest load, or None
+            to run every model in every mode
+    """
+    modes = [FULL, DutyMode("stride-2", 2)]
+    if keep:
+        modes.append(DutyMode("subset", 2, frozenset(keep)))
+        modes.append(DutyMode("subset-4", 4, frozenset(keep)))
+    else:
+        modes.append(DutyMode("stride-4", 4))
+    return modes
+
+
+@dataclass
+class ModeChange:
+    """A step from one duty mode to another."""
+
+    at: float
+    previous: DutyMode
+    mode: DutyMode
+    lag_seconds: float
+
+    def describe(self) -> str:
+        """Return the change in words, for the log."""
+        return (
+            f"Wake word duty {self.previous.name} -> {self.mode.describe()}, "
+            f"lag {self.lag_seconds * 1000:.0f}ms"
+        )
+
+
+class DutyCycler:
+    """Chooses a duty mode from the lag between capture and inference.
+
+    The lag is compared with two watermarks. Above high_lag_seconds the
+    next cheaper mode is taken, at most once every step_seconds so the
+    backlog has time to drain before stepping again. Below
+    low_lag_seconds for recover_seconds the next richer mode is taken.
+    Between the two the mode holds, so it does not flap.
+    """
+
+    def __init__(
+        self,
+        modes: list[DutyMode] | None = None,
+        high_lag_seconds: float = 0.32,
+        low_lag_seconds: float = 0.08,
+        step_seconds: float = 1.0,
+        recover_seconds: float = 3.0,
+        on_change: Callable[[ModeChange], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cycler at full rate.
+
+        Args:
+            modes: Modes from full rate to the cheapest (default_modes()
+                by default)
+            high_lag_seconds: Lag above which work is reduced
+            low_lag_seconds: Lag below which work may be restored
+            step_seconds: Least time between steps down
+            recover_seconds: Time the lag must stay low before a step up
+            on_change: Called with each mode change, e.g. to log it
+            clock: Monotonic time in seconds
+
+        Raises:
+            ValueError: If there are no modes or the watermarks are inverted
+        """
+        self._modes = list(modes or default_modes())
+        if not self._modes:
+            raise ValueError("at least one duty mode is needed")
+        if low_lag_seconds > high_lag_seconds:
+            raise ValueError(f"low lag {low_lag_seconds}s is above high lag {high_lag_seconds}s")
+        self._high = high_lag_seconds
+        self._low = low_lag_seconds
+        self._step_seconds = step_seconds
+        self._recover_seconds = recover_seconds
+        self._on_change = on_change
+        self._clock = clock
+        self._level = 0
+        self._changed_at = float("-inf")
+        self._calm_since: float | None = None
+        self.changes: deque[ModeChange] = deque(maxlen=100)
+        _LEVEL.set(0)
+
+    @property
+    def mode(self) -> DutyMode:
+        """Return the current mode."""
+        return self._modes[self._level]
+
+    @property
+    def level(self) -> int:
+        """Return the index of the current mode, 0 being full rate."""
+        return self._level
+
+    def observe(self, lag_seconds: float) -> DutyMode:
+        """Take the lag of the frame about to be scored.
+
+        Returns:
+            The mode to score it in
+        """
+        now = self._clock()
+        if lag_seconds > self._high:
+            self._calm_since = None
+            stepped = now - self._changed_at >= self._step_seconds
+            if stepped and self._level + 1 < len(self._modes):
+                self._change(self._level + 1, now, lag_seconds)
+        elif lag_seconds < self._low:
+            if self._calm_since is None:
+                self._calm_since = now
+            elif self._level > 0:
+                calm_for = now - max(self._calm_since, self._changed_at)
+                if calm_for >= self._recover_seconds:
+                    self._change(self._level - 1, now, lag_seconds)
+        else:
+            self._calm_since = None
+        return self.mode
+
+    def _change(self, level: int, now: float, lag_seconds: float) -> None:
+        change = ModeChange(now, self.mode, self._modes[level], lag_seconds)
+        metrics.counter(
+            "much_miller_wake_duty_changes_total",
+            "Wake word duty mode changes",
+            direction="down" if level > self._level else "up",
+        ).inc()
+        self._level = level
+        self._changed_at = now
+        self.changes.append(change)
+        _LEVEL.set(level)
+        if self._on_change is not None:
+            self._on_change(change)
+
+
+class ModelSubset:
+    """An openWakeWord Model that can run only some of its wake word models.
+
+    openWakeWord's Model.predict() runs every entry of its models dict;
+    select() narrows that dict, keeping the sessions so they can be
+    restored. Shared features are still computed for every frame, so a
+    restored model scores the latest audio straight away.
+    """
+
+    def __init__(self, model: Any) -> None:
+        """Initialize with every model selected.
+
+        Args:
+            model: openWakeWord Model
+        """
+        self._model = model
+        self._all = dict(model.models)
+
+    @property
+    def models(self) -> dict[str, Any]:
+        """Return the wake word models currently run, by name."""
+        return self._model.models
+
+    def select(self, names: frozenset[str] | None) -> None:
+        """Run only the named wake word models, or every model for None.
+
+        Raises:
+            ValueError: For a name the model does not have
+        """
+        if names is None:
+            self._model.models = dict(self._all)
+            return
+        unknown = names - self._all.keys()
+        if unknown:
+            raise ValueError(f"unknown wake word models: {sorted(unknown)}")
+        self._model.models = {name: model for name, model in self._all.items() if name in names}
+
+    def predict(self, x: Any) -> dict[str, float]:
+        """Score audio with the selected models."""
+        return self._model.predict(x)
+
+    def reset(self) -> None:
+        """Clear the model's feature and prediction buffers."""
+        self._model.reset()
@@ -0,0 +1,124 @@
+"""Energy gate that skips wake word inference on quiet frames."""
+
+from collections import deque
+from dataclasses import dataclass
+
+import numpy as np
+
+from much_miller.audio.levels import rms
+
+
+@dataclass
+class GateStats:
+    """How many frames the gate passed to the wake word model."""
+
+    frames: int = 0
+    admitted: int = 0
+
+    @property
+    def skipped_fraction(self) -> float:
+        """Return the fraction of frames that were never inferred on."""
+        return 1 - self.admitted / self.frames if self.frames else 0.0
+
+
+class EnergyGate:
+    """Lets frames through to wake word inference only around sound.
+
+    The gate opens when a frame's RMS level exceeds open_level (or
+    open_ratio times the tracked noise floor, whichever is higher) and
+    closes again after hangover_seconds of frames below close_level (or
+    close_ratio times the floor). Hysteresis keeps it from flapping on
+    speech that dips between words.
+
+    While the gate is shut, recent frames are kept in a lookback buffer.
+    When it opens, they are released before the loud frame, so the model
+    sees the silence leading into the wake word as well as its start.
+    openWakeWord's features need contiguous audio, so quiet frames are
+    skipped entirely rather than decimated.
+    """
+
+    def __init__(
+        self,
+        frame_seconds: float,
+        open_level: float = 300.0,
+        close_level: float = 200.0,
+        open_ratio: float = 3.0,
+        close_ratio: float = 2.0,
+        hangover_seconds: float = 1.0,
+        lookback_seconds: float = 1.0,
+    ) -> None:
+        """Initialize the gate, shut.
+
+        Args:
+            frame_seconds: Duration of each frame
+            open_level: Minimum int16 RMS that opens the gate
+            close_level: Minimum int16 RMS that keeps it open
+            open_ratio: Level above the noise floor that opens the gate
+            close_ratio: Level above the noise floor that keeps it open
+            hangover_seconds: Quiet time before the gate shuts
+            lookback_seconds: Audio released ahead of the frame that opens it
+        """
+        self._open_level = open_level
+        self._close_level = close_level
+        self._open_ratio = open_ratio
+        self._close_ratio = close_ratio
+        self._hangover_frames = max(1, round(hangover_seconds / frame_seconds))
+        self._lookback: deque[np.ndarray] = deque(maxlen=round(lookback_seconds / frame_seconds))
+        self._noise_floor: float | None = None
+        self._open = False
+        self._quiet_frames = 0
+        self.stats = GateStats()
+
+    @property
+    def is_open(self) -> bool:
+        """Return True while frames are being passed through."""
+        return self._open
+
+    @property
+    def noise_floor(self) -> float | None:
+        """Return the tracked level of quiet frames, if any seen yet."""
+        return self._noise_floor
+
+    def reset(self) -> None:
+        """Shut the gate and forget the lookback (the floor is kept)."""
+        self._open = False
+        self._quiet_frames = 0
+        self._lookback.clear()
+
+    def admit(self, frame: np.ndarray) -> list[np.ndarray]:
+        """Take the next frame and return the frames to run inference on.
+
+        Returns:
+            Nothing while the gate is shut; the lookback then this frame as
+            it opens; just this frame while it stays open
+        """
+        self.stats.frames += 1
+        level = rms(frame)
+        floor = self._noise_floor or 0.0
+
+        if not self._open:
+            if level > max(self._open_level, floor * self._open_ratio):
+                self._open = True
+                self._quiet_frames = 0
+                released = [*self._lookback, frame]
+                self._lookback.clear()
+                self.stats.admitted += len(released)
+                return released
+            self._track_floor(level)
+            self._lookback.append(frame)
+            return []
+
+        if level > max(self._close_level, floor * self._close_ratio):
+            self._quiet_frames = 0
+        else:
+            self._quiet_frames += 1
+            if self._quiet_frames >= self._hangover_frames:
+                self._open = False
+        self.stats.admitted += 1
+        return [frame]
+
+    def _track_floor(self, level: float) -> None:
+        if self._noise_floor is None:
+            self._noise_floor = level
+        else:
+            self._noise_floor = 0.95 * self._noise_floor + 0.05 * level
@@ -0,0 +1,299 @@
+"""Wake word detection on several microphones in one process.
+
+    python -m much_miller.wake_word.multi_detector kitchen=Samson study=USB
+
+Each device has its own capture hub. MultiStreamDetector reads the next
+frame from every hub in turn (the devices run at the same rate, so the
+streams stay in lockstep), stacks them and runs the wake word models once
+for all of them (see StackedWakeModel). Scores and cooldown are kept per
+device, and each detection names the device that heard it.
+"""
+
+import argparse
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Protocol
+
+import numpy as np
+
+from much_miller.audio.capture_hub import CaptureHub, Subscription
+from much_miller.audio.microphone import create_frame_source, find_device_by_name
+from much_miller.cpu_budget import pinned
+from much_miller.telemetry import cpu_profile, metrics
+from much_miller.wake_word.detector import DEFAULT_THRESHOLD, detect_wake_word
+
+_ROUND = metrics.histogram(
+    "much_miller_wake_round_seconds",
+    "Wake word inference time per frame of every device",
+    (0.001, 0.0025, 0.005, 0.01, 0.02, 0.04, 0.08, 0.16, 0.32),
+)
+_DROPPED = metrics.counter(
+    "much_miller_wake_stream_dropped_frames_total",
+    "Frames dropped because batched inference fell behind",
+)
+
+
+class BatchWakeModel(Protocol):
+    """Wake word models scoring the next frame of several streams at once."""
+
+    def predict_batch(self, frames: np.ndarray) -> list[dict[str, float]]: ...
+
+    def reset(self, stream: int | None = None) -> None: ...
+
+
+@dataclass
+class StreamDetection:
+    """A wake word heard on one device."""
+
+    device: str
+    model_name: str
+    score: float
+    position: int
+
+
+@dataclass
+class MultiStreamStats:
+    """Counters showing whether batched inference keeps up with every device."""
+
+    frame_seconds: float
+    streams: int
+    rounds: int = 0
+    inference_seconds: float = 0.0
+    max_inference_seconds: float = 0.0
+    dropped_frames: int = 0
+    suppressed: int = 0
+
+    @property
+    def mean_round_ms(self) -> float:
+        """Return the mean inference time per frame of every device in milliseconds."""
+        return self.inference_seconds / self.rounds * 1000 if self.rounds else 0.0
+
+    @property
+    def per_stream_ms(self) -> float:
+        """Return the mean inference time per device frame in milliseconds."""
+        return self.mean_round_ms / self.streams if self.streams else 0.0
+
+    @property
+    def load(self) -> float:
+        """Return mean inference time as a fraction of frame duration."""
+        if not self.rounds:
+            return 0.0
+        return self.inference_seconds / self.rounds / self.frame_seconds
+
+    def describe(self) -> str:
+        """Return a one-line summary."""
+        return (
+            f"streams={self.streams} rounds={self.rounds} "
+            f"inference mean={self.mean_round_ms:.1f}ms "
+            f"per stream={self.per_stream_ms:.2f}ms load={self.load:.0%} "
+            f"dropped={self.dropped_frames} suppressed={self.suppressed}"
+        )
+
+
+class MultiStreamDetector:
+    """Watches several capture hubs for wake words with one batched model.
+
+    After a device fires, its model state is cleared and further
+    detections on that device are suppressed for cooldown_seconds of its
+    audio, so one wake word is not reported twice; the other devices are
+    unaffected. If two devices fire on the same frame, both are reported,
+    the second by the next call to listen().
+    """
+
+    def __init__(
+        self,
+        hubs: dict[str, CaptureHub],
+        model: BatchWakeModel,
+        threshold: float = DEFAULT_THRESHOLD,
+        cooldown_seconds: float = 2.0,
+        max_queued_frames: int = 32,
+        cpus: frozenset[int] | None = None,
+    ) -> None:
+        """Initialize the detector.
+
+        Args:
+            hubs: Capture hub for each device, by device name; row i of
+                each batch comes from the i-th hub
+            model: Wake word models for len(hubs) streams
+            threshold: Score above which a wake word fires
+            cooldown_seconds: Audio after a detection during which the
+                same device cannot fire again
+            max_queued_frames: Frames queued per device before the oldest
+                are dropped
+            cpus: CPUs the listening thread is pinned to while it listens
+
+        Raises:
+            ValueError: If the hubs deliver different frame sizes or rates
+        """
+        formats = {(hub.sample_rate, hub.frame_size) for hub in hubs.values()}
+        if len(formats) != 1:
+            raise ValueError(f"devices must share one rate and frame size, got {formats}")
+        ((sample_rate, frame_size),) = formats
+        self._hubs = hubs
+        self._model = model
+        self._threshold = threshold
+        self._cooldown_samples = int(cooldown_seconds * sample_rate)
+        self._max_queued_frames = max_queued_frames
+        self._cpus = cpus
+        self._cooldown_until = {device: 0 for device in hubs}
+        self._scores: dict[str, dict[str, float]] = {device: {} for device in hubs}
+        self._pending: deque[StreamDetection] = deque()
+        self._stats = MultiStreamStats(frame_size / sample_rate, len(hubs))
+
+    @property
+    def devices(self) -> list[str]:
+        """Return the device names, in batch order."""
+        return list(self._hubs)
+
+    @property
+    def scores(self) -> dict[str, dict[str, float]]:
+        """Return the latest scores for each device."""
+        return {device: dict(scores) for device, scores in self._scores.items()}
+
+    @property
+    def stats(self) -> MultiStreamStats:
+        """Return the counters accumulated since the detector was created."""
+        return self._stats
+
+    def listen(self, stop: threading.Event | None = None) -> StreamDetection | None:
+        """Block until a wake word fires on any device.
+
+        Args:
+            stop: Set from another thread to give up listening
+
+        Returns:
+            The detection, or None if a device or listening stopped first
+        """
+        if self._pending:
+            return self._pending.popleft()
+        with pinned(self._cpus), cpu_profile.track("wake"):
+            return self._listen(stop)
+
+    def _listen(self, stop: threading.Event | None) -> StreamDetection | None:
+        subscriptions = [
+            hub.subscribe(max_frames=self._max_queued_frames) for hub in self._hubs.values()
+        ]
+        timeout = None if stop is None else 0.1
+        try:
+            while stop is None or not stop.is_set():
+                batch = []
+                for subscription in subscriptions:
+                    frame = self._next_frame(subscription, timeout, stop)
+                    if frame is None:
+                        return None
+                    batch.append(frame)
+                self._infer(np.stack(batch), subscriptions)
+                if self._pending:
+                    return self._pending.popleft()
+        finally:
+            for subscription in subscriptions:
+                self._stats.dropped_frames += subscription.dropped
+                _DROPPED.inc(subscription.dropped)
+                subscription.close()
+        return None
+
+    @staticmethod
+    def _next_frame(
+        subscription: Subscription, timeout: float | None, stop: threading.Event | None
+    ) -> np.ndarray | None:
+        while True:
+            frame = subscription.read(timeout)
+            if frame is not None:
+                return frame
+            if subscription.ended or timeout is None or (stop is not None and stop.is_set()):
+                return None
+
+    def _infer(self, frames: np.ndarray, subscriptions: list[Subscription]) -> None:
+        started = time.perf_counter()
+        predictions = self._model.predict_batch(frames)
+        elapsed = time.perf_counter() - started
+        self._stats.rounds += 1
+        self._stats.inference_seconds += elapsed
+        self._stats.max_inference_seconds = max(self._stats.max_inference_seconds, elapsed)
+        _ROUND.observe(elapsed)
+
+        for stream, (device, scores) in enumerate(zip(self._hubs, predictions)):
+            self._scores[device] = scores
+            detection = detect_wake_word(scores, self._threshold)
+            if detection is None:
+                continue
+            position = subscriptions[stream].position
+            if position < self._cooldown_until[device]:
+                self._stats.suppressed += 1
+                continue
+            model_name, score = detection
+            self._cooldown_until[device] = position + self._cooldown_samples
+            self._model.reset(stream)
+            metrics.counter(
+                "much_miller_wake_stream_detections_total",
+                "Wake words detected, by device",
+                device=device,
+                model=model_name,
+            ).inc()
+            self._pending.append(StreamDetection(device, model_name, score, position))
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m much_miller.wake_word.multi_detector",
+        description="Watch several microphones for wake words with one batched model.",
+    )
+    parser.add_argument(
+        "devices",
+        nargs="+",
+        metavar="NAME=DEVICE",
+        help="room name and input device (partial name or index), e.g. kitchen=Samson",
+    )
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--cooldown", type=float, default=2.0, help="seconds per device")
+    parser.add_argument(
+        "--separate", action="store_true", help="one unbatched model per device, for comparison"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Print each wake word with the device that heard it, until interrupted."""
+    import sounddevice as sd
+
+    from much_miller.wake_word.stacked_model import SeparateWakeModels, load_stacked_model
+
+    args = parse_args(argv)
+    hubs: dict[str, CaptureHub] = {}
+    for spec in args.devices:
+        name, _, device = spec.partition("=")
+        index = int(device) if device.isdigit() else find_device_by_name(device or name)
+        if index is None:
+            raise SystemExit(f"No input device matching '{device or name}' found.")
+        native_rate = int(sd.query_devices(index)["default_samplerate"])
+        hubs[name] = CaptureHub(create_frame_source(index, native_rate))
+
+    if args.separate:
+        from openwakeword.model import Model as WakeWordModel
+
+        model: BatchWakeModel = SeparateWakeModels([WakeWordModel() for _ in hubs])
+    else:
+        model = load_stacked_model(len(hubs))
+    detector = MultiStreamDetector(hubs, model, args.threshold, args.cooldown)
+    for hub in hubs.values():
+        hub.start()
+    print(f"Listening on {', '.join(hubs)}")
+    try:
+        while (detection := detector.listen()) is not None:
+            print(
+                f"*** {detection.model_name} on {detection.device} "
+                f"(score {detection.score:.2f}) *** [{detector.stats.describe()}]"
+            )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for hub in hubs.values():
+            hub.stop()
+        print(detector.stats.describe())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Disk-backed cache of synthesized speech for fixed phrases."""
+
+import hashlib
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+
+class PhraseCache:
+    """LRU cache of raw PCM audio keyed by voice model and text.
+
+    Each entry is a file in the cache directory, so the cache survives
+    restarts. A file's modification time records when it was last used;
+    when the total size passes max_bytes the least recently used entries
+    are deleted.
+    """
+
+    SUFFIX = ".pcm"
+
+    def __init__(self, directory: Path, max_bytes: int = 32 * 1024 * 1024) -> None:
+        """Initialize the cache, picking up entries already on disk.
+
+        Args:
+            directory: Directory holding the cached audio files
+            max_bytes: Total size of cached audio to keep
+        """
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        files = sorted(
+            self._directory.glob(f"*{self.SUFFIX}"),
+            key=lambda path: path.stat().st_mtime,
+        )
+        for path in files:
+            self._entries[path.stem] = path.stat().st_size
+        self._size = sum(self._entries.values())
+        self._evict()
+
+    @property
+    def size_bytes(self) -> int:
+        """Return the total size of cached audio."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def contains(self, voice_id: str, text: str) -> bool:
+        """Check if audio for the text is cached, without touching it."""
+        return self._key(voice_id, text) in self._entries
+
+    def get(self, voice_id: str, text: str) -> bytes | None:
+        """Return cached PCM for the text, or None.
+
+        Args:
+            voice_id: Identifies the voice model that rendered the audio
+            text: The phrase
+
+        Returns:
+            Raw int16 PCM bytes, or None if not cached
+        """
+        key = self._key(voice_id, text)
+        if key not in self._entries:
+            return None
+        path = self._path(key)
+        try:
+            pcm = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            self._size -= self._entries.pop(key)
+            return None
+        self._entries.move_to_end(key)
+        return pcm
+
+    def put(self, voice_id: str, text: str, pcm: bytes) -> None:
+        """Store PCM for the text, evicting old entries if needed.
+
+        Args:
+            voice_id: Identifies the voice model that rendered the audio
+            text: The phrase
+            pcm: Raw int16 PCM bytes
+        """
+        if len(pcm) > self._max_bytes:
+            return
+        key = self._key(voice_id, text)
+        path = self._path(key)
+        temp_path = path.with_suffix(".tmp")
+        temp_path.write_bytes(pcm)
+        os.replace(temp_path, path)
+        self._size += len(pcm) - self._entries.pop(key, 0)
+        self._entries[key] = len(pcm)
+        self._evict()
+
+    def _evict(self) -> None:
+        while self._size > self._max_bytes and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self._size -= size
+            self._path(key).unlink(missing_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self._directory / f"{key}{self.SUFFIX}"
+
+    @staticmethod
+    def _key(voice_id: str, text: str) -> str:
+        normalized = " ".join(text.split())
+        return hashlib.sha256(f"{voice_id}\n{normalized}".encode()).hexdigest()
+
+
+def voice_id_for(model_path: Path) -> str:
+    """Return an identifier that changes whenever the model file changes."""
+    stat = model_path.stat()
+    return f"{model_path.name}:{stat.st_size}:{int(stat.st_mtime)}"
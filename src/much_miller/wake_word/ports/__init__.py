@@ -1,9 +1,13 @@
 """Port definitions (abstract base classes) for wake word detection."""
 
+from much_miller.wake_word.ports.async_audio_recorder import AsyncAudioRecorderPort
+from much_miller.wake_word.ports.async_speaker import AsyncSpeakerPort
 from much_miller.wake_word.ports.audio_recorder import AudioRecorderPort
 from much_miller.wake_word.ports.speaker import SpeakerPort
 
 __all__ = [
+    "AsyncAudioRecorderPort",
+    "AsyncSpeakerPort",
     "AudioRecorderPort",
     "SpeakerPort",
 ]
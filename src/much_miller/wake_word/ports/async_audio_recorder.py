@@ -0,0 +1,18 @@
+"""Abstract base class for audio recording from asyncio code."""
+
+from abc import ABC, abstractmethod
+
+
+class AsyncAudioRecorderPort(ABC):
+    """Async counterpart of AudioRecorderPort."""
+
+    @abstractmethod
+    async def record_chunk(self, duration_seconds: float) -> bytes:
+        """Record a chunk of audio from the microphone.
+
+        Args:
+            duration_seconds: Duration to record
+
+        Returns:
+            WAV-encoded audio bytes
+        """
@@ -0,0 +1,19 @@
+"""Abstract base class for text-to-speech output from asyncio code."""
+
+from abc import ABC, abstractmethod
+
+
+class AsyncSpeakerPort(ABC):
+    """Async counterpart of SpeakerPort.
+
+    Cancelling the task awaiting say() stops the reply; say() does not
+    return until the audio has stopped.
+    """
+
+    @abstractmethod
+    async def say(self, text: str) -> None:
+        """Speak the given text.
+
+        Args:
+            text: Text to speak
+        """
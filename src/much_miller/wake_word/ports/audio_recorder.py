@@ -1,12 +1,40 @@
 """Abstract base class for audio recording."""
 
 from abc import ABC, abstractmethod
+from typing import Generator
+
+import numpy as np
+
+from much_miller.audio.wav import WavSink
 
 
 class AudioRecorderPort(ABC):
-    """Abstract base class for audio recording services."""
+    """Abstract base class for audio recording services.
+
+    Recorders stream fixed-size int16 frames from a capture stream that
+    stays open between reads. record_chunk() is built on the stream and
+    encodes a fixed duration as WAV.
+    """
+
+    @property
+    @abstractmethod
+    def sample_rate(self) -> int:
+        """Return the sample rate of the frames in Hz."""
 
     @abstractmethod
+    def frames(self) -> Generator[np.ndarray, None, None]:
+        """Yield mono int16 frames of a fixed size as they are captured.
+
+        Frame buffers may be reused: a frame is only valid until the next
+        one is requested, so copy any frame that must be kept. Closing
+        the iterator (or breaking out of a for loop over it) stops
+        reading; the capture stream itself may keep running, so the next
+        call continues without a gap.
+
+        Yields:
+            Frames of int16 samples
+        """
+
     def record_chunk(self, duration_seconds: float) -> bytes:
         """Record a chunk of audio from the microphone.
 
@@ -16,3 +44,15 @@ class AudioRecorderPort(ABC):
         Returns:
             WAV-encoded audio bytes
         """
+        num_samples = int(self.sample_rate * duration_seconds)
+        sink = WavSink(self.sample_rate)
+        frames = self.frames()
+        try:
+            while sink.samples < num_samples:
+                frame = next(frames, None)
+                if frame is None:
+                    break
+                sink.write(frame[:num_samples - sink.samples])
+        finally:
+            frames.close()
+        return sink.getvalue()
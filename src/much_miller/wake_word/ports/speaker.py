@@ -13,3 +13,9 @@ class SpeakerPort(ABC):
         Args:
             text: Text to speak
         """
+
+    def interrupt(self) -> None:
+        """Cut short a reply being spoken in another thread (nothing by default)."""
+
+    def warm_up(self) -> None:
+        """Prepare the voice so the first reply starts promptly (nothing by default)."""
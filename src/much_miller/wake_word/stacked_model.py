@@ -0,0 +1,271 @@
+"""openWakeWord's models run over several audio streams as one batch.
+
+openWakeWord's Model keeps one rolling window of features, so watching N
+microphones takes N models and N inference calls per 80 ms frame. Its
+three stages (melspectrogram, speech embedding, wake word classifiers)
+are ONNX models that accept a batch dimension, though, so
+StackedWakeModel keeps each stream's windows as rows of stacked arrays
+and runs every stage once per frame for all streams. The fixed cost of
+each ONNX call is paid once, not once per stream.
+
+The streaming arithmetic follows openWakeWord's AudioFeatures: each
+1280-sample frame, with 480 samples of history, gives 8 melspectrogram
+frames; the last 76 give one 96-value embedding; each classifier scores
+the last n embeddings. Scores are 0 for a stream's first 5 frames, as in
+openWakeWord.
+
+After that they still differ from openWakeWord's until a stream's
+windows hold nothing from before it started (or was reset):
+
+- openWakeWord has no history for the first frame, so it adds 5
+  melspectrogram frames where this adds 8, 3 of them from the zero
+  history; the embeddings agree from frame MEL_SETTLE_FRAMES (10) on.
+- openWakeWord fills the feature window with embeddings of random audio,
+  this with zeros; a classifier of n embeddings agrees once they all
+  come from frame 10 on, so from frame 9 + n (25 for hey_jarvis).
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+from much_miller.cpu_budget import EngineBudget
+
+FRAME_SIZE = 1280
+MEL_HISTORY = 480  # 3 hops of 160 samples
+MEL_BINS = 32
+MEL_WINDOW = 76  # melspectrogram frames per embedding
+EMBEDDING_SIZE = 96
+WARM_UP_FRAMES = 5
+MEL_SETTLE_FRAMES = 10  # first frame whose embedding has no zero history
+
+Stage = Callable[[np.ndarray], np.ndarray]
+
+
+@dataclass(frozen=True)
+class Classifier:
+    """One wake word model, scoring the last frames embeddings of each stream.
+
+    run takes (streams, frames, 96) features and returns (streams,
+    outputs) scores; labels names the outputs reported, by index.
+    """
+
+    frames: int
+    run: Stage
+    labels: dict[int, str]
+
+
+class StackedWakeModel:
+    """Wake word inference for a fixed number of streams in one batch.
+
+    predict_batch() takes the next frame from every stream and returns
+    each stream's scores, like Model.predict() for each stream in turn.
+    predict_streams() does the same for only some of the streams, and
+    add_stream() adds one, so the models can be loaded once and shared by
+    streams that come and go (see much_miller.server.wake_engine).
+    """
+
+    def __init__(
+        self,
+        streams: int,
+        melspectrogram: Stage,
+        embedding: Stage,
+        classifiers: list[Classifier],
+    ) -> None:
+        """Initialize the model with empty windows.
+
+        Args:
+            streams: Number of audio streams
+            melspectrogram: (streams, samples) float32 audio to
+                (streams, frames, 32) melspectrogram frames
+            embedding: (streams, 76, 32, 1) windows to (streams, 96)
+                embeddings
+            classifiers: The wake word models
+        """
+        self._streams = streams
+        self._melspectrogram = melspectrogram
+        self._embedding = embedding
+        self._classifiers = classifiers
+        self._feature_frames = max(classifier.frames for classifier in classifiers)
+        self._history = np.zeros((streams, MEL_HISTORY), dtype=np.float32)
+        self._mel = np.ones((streams, MEL_WINDOW, MEL_BINS), dtype=np.float32)
+        self._features = np.zeros(
+            (streams, self._feature_frames, EMBEDDING_SIZE), dtype=np.float32
+        )
+        self._frames = np.zeros(streams, dtype=np.int64)
+
+    @property
+    def streams(self) -> int:
+        """Return the number of streams."""
+        return self._streams
+
+    @property
+    def labels(self) -> list[str]:
+        """Return the wake words scored."""
+        return [label for classifier in self._classifiers for label in classifier.labels.values()]
+
+    def add_stream(self) -> int:
+        """Add a stream with empty windows and return its index."""
+        self._history = np.concatenate(
+            [self._history, np.zeros((1, MEL_HISTORY), dtype=np.float32)]
+        )
+        self._mel = np.concatenate([self._mel, np.ones((1, MEL_WINDOW, MEL_BINS), np.float32)])
+        self._features = np.concatenate(
+            [self._features, np.zeros((1, self._feature_frames, EMBEDDING_SIZE), np.float32)]
+        )
+        self._frames = np.append(self._frames, 0)
+        self._streams += 1
+        return self._streams - 1
+
+    def reset(self, stream: int | None = None) -> None:
+        """Clear one stream's windows (or every stream's), as after a wake word."""
+        rows = slice(None) if stream is None else stream
+        self._history[rows] = 0.0
+        self._mel[rows] = 1.0
+        self._features[rows] = 0.0
+        self._frames[rows] = 0
+
+    def predict_batch(self, frames: np.ndarray) -> list[dict[str, float]]:
+        """Score the next frame of every stream.
+
+        Args:
+            frames: (streams, 1280) int16, row i from stream i
+
+        Returns:
+            The scores for each stream, by wake word
+        """
+        return self.predict_streams(list(range(self._streams)), frames)
+
+    def predict_streams(self, streams: list[int], frames: np.ndarray) -> list[dict[str, float]]:
+        """Score the next frame of some of the streams, in one batch.
+
+        Args:
+            streams: Indexes of the streams, each at most once
+            frames: (len(streams), 1280) int16, row i from streams[i]
+
+        Returns:
+            The scores for each of the streams, in the same order
+        """
+        count = len(streams)
+        if frames.shape != (count, FRAME_SIZE):
+            raise ValueError(f"expected frames of shape {(count, FRAME_SIZE)}, got {frames.shape}")
+        rows = np.asarray(streams, dtype=np.int64)
+        audio = np.concatenate([self._history[rows], frames.astype(np.float32)], axis=1)
+        self._history[rows] = audio[:, -MEL_HISTORY:]
+        mel = self._melspectrogram(audio).reshape(count, -1, MEL_BINS)
+        windows = np.concatenate([self._mel[rows], mel], axis=1)[:, -MEL_WINDOW:]
+        self._mel[rows] = windows
+        embeddings = self._embedding(windows[..., None])
+        features = np.concatenate(
+            [self._features[rows], embeddings.reshape(count, 1, EMBEDDING_SIZE)], axis=1
+        )[:, -self._feature_frames:]
+        self._features[rows] = features
+        self._frames[rows] += 1
+
+        warm = self._frames[rows] > WARM_UP_FRAMES
+        scores: list[dict[str, float]] = [{} for _ in range(count)]
+        for classifier in self._classifiers:
+            outputs = classifier.run(features[:, -classifier.frames:])
+            outputs = outputs.reshape(count, -1)
+            for index, label in classifier.labels.items():
+                for row in range(count):
+                    scores[row][label] = float(outputs[row, index]) if warm[row] else 0.0
+        return scores
+
+
+class SeparateWakeModels:
+    """One openWakeWord Model per stream, run in turn: the unbatched baseline."""
+
+    def __init__(self, models: list[Any]) -> None:
+        """Initialize with one Model (or any object with predict) per stream."""
+        self._models = models
+
+    @property
+    def streams(self) -> int:
+        """Return the number of streams."""
+        return len(self._models)
+
+    def reset(self, stream: int | None = None) -> None:
+        """Clear one stream's model (or every stream's)."""
+        models = self._models if stream is None else [self._models[stream]]
+        for model in models:
+            reset = getattr(model, "reset", None)
+            if reset is not None:
+                reset()
+
+    def predict_batch(self, frames: np.ndarray) -> list[dict[str, float]]:
+        """Score the next frame of every stream, one model at a time."""
+        return [dict(model.predict(frame)) for model, frame in zip(self._models, frames)]
+
+
+def _session(path: Path, budget: EngineBudget) -> Any:
+    import onnxruntime
+
+    options = budget.session_options()
+    # One core for every stream, as openWakeWord runs each model
+    if budget.threads is None:
+        options.intra_op_num_threads = 1
+    if budget.inter_threads is None:
+        options.inter_op_num_threads = 1
+    return onnxruntime.InferenceSession(
+        str(path), sess_options=options, providers=["CPUExecutionProvider"]
+    )
+
+
+def _classifier(session: Any, labels: dict[int, str]) -> Classifier:
+    inputs = session.get_inputs()[0]
+    name = inputs.name
+
+    def run(features: np.ndarray) -> np.ndarray:
+        return session.run(None, {name: features})[0]
+
+    if inputs.shape[0] == 1:
+        # Exported with a fixed batch of one: run the streams in turn
+        def run_each(features: np.ndarray) -> np.ndarray:
+            return np.concatenate([run(features[i:i + 1]) for i in range(len(features))])
+
+        return Classifier(int(inputs.shape[1]), run_each, labels)
+    return Classifier(int(inputs.shape[1]), run, labels)
+
+
+def load_stacked_model(
+    streams: int,
+    wake_words: list[str] | None = None,
+    budget: EngineBudget | None = None,
+) -> StackedWakeModel:
+    """Load openWakeWord's ONNX models for several streams.
+
+    The ONNX files are fetched by openwakeword.utils.download_models().
+
+    Args:
+        streams: Number of audio streams
+        wake_words: Pre-trained wake word names (defaults to all of them)
+        budget: ONNX Runtime thread counts (one thread by default)
+    """
+    import openwakeword
+
+    budget = budget or EngineBudget()
+    models = Path(openwakeword.__file__).parent / "resources" / "models"
+    melspectrogram = _session(models / "melspectrogram.onnx", budget)
+    embedding = _session(models / "embedding_model.onnx", budget)
+    classifiers = []
+    for name in wake_words or list(openwakeword.MODELS):
+        path = Path(openwakeword.MODELS[name]["model_path"]).with_suffix(".onnx")
+        session = _session(path, budget)
+        mapping = openwakeword.model_class_mappings.get(name)
+        if session.get_outputs()[0].shape[1] == 1 or mapping is None:
+            labels = {0: name}
+        else:
+            labels = {int(index): label for index, label in mapping.items()}
+        classifiers.append(_classifier(session, labels))
+
+    def mel(audio: np.ndarray) -> np.ndarray:
+        spectrogram = melspectrogram.run(None, {"input": audio})[0]
+        return spectrogram.reshape(len(audio), -1, MEL_BINS) / 10 + 2
+
+    def embed(windows: np.ndarray) -> np.ndarray:
+        return embedding.run(None, {"input_1": windows.astype(np.float32)})[0]
+
+    return StackedWakeModel(streams, mel, embed, classifiers)
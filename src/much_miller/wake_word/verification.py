@@ -0,0 +1,173 @@
+"""Two-stage wake word detection, so false triggers stay cheap.
+
+A wake word starts the expensive path: the Piper greeting, a Whisper
+session and, often, mpv still decoding. A single frame over threshold is
+enough today, and TV audio sets off the built-in models. Detection is
+split in two:
+
+1. WakeTrigger: each model's score is smoothed over a few frames and must
+   stay above that model's threshold for several frames in a row.
+2. A WakeVerifier (optional) checks the buffered wake audio before the
+   pipeline runs, e.g. TranscriptVerifier, which transcribes it with a
+   tiny Whisper model and looks for the wake phrase.
+"""
+
+import re
+from collections import deque
+from dataclasses import dataclass
+from typing import Protocol
+
+import numpy as np
+
+from much_miller.phrase_matcher import PhraseMatcher
+from much_miller.transcription.ports import TranscriberPort, TranscriptionError
+from much_miller.wake_word.detector import DEFAULT_THRESHOLD
+
+DEFAULT_POLICY = "default"
+
+_VERSION = re.compile(r"_v\d+(\.\d+)*$")
+
+
+@dataclass(frozen=True)
+class WakePolicy:
+    """When one wake word model's scores count as a trigger."""
+
+    threshold: float = DEFAULT_THRESHOLD
+    smoothing_frames: int = 1
+    persist_frames: int = 1
+
+    def describe(self) -> str:
+        """Return the policy in spec form, e.g. "0.6/4/3"."""
+        return f"{self.threshold}/{self.smoothing_frames}/{self.persist_frames}"
+
+
+def parse_policies(spec: str) -> dict[str, WakePolicy]:
+    """Parse a comma- or space-separated list of model=threshold[/smoothing[/persist]].
+
+    "default" sets the policy for models not listed, e.g.
+    "alexa=0.7/4/3 default=0.5/2/2".
+
+    Raises:
+        ValueError: For a malformed entry
+    """
+    policies: dict[str, WakePolicy] = {}
+    for entry in re.split(r"[\s,]+", spec.strip(" ,")):
+        if not entry:
+            continue
+        name, _, value = entry.partition("=")
+        parts = value.split("/")
+        if not name or not value or len(parts) > 3:
+            raise ValueError(f"expected model=threshold[/smoothing[/persist]], got {entry!r}")
+        policy = WakePolicy(
+            threshold=float(parts[0]),
+            smoothing_frames=int(parts[1]) if len(parts) > 1 else 1,
+            persist_frames=int(parts[2]) if len(parts) > 2 else 1,
+        )
+        if policy.smoothing_frames < 1 or policy.persist_frames < 1:
+            raise ValueError(f"frame counts must be at least 1, got {entry!r}")
+        policies[name] = policy
+    return policies
+
+
+class WakeTrigger:
+    """Stage one: a smoothed score that persists over several frames.
+
+    Each model's scores are averaged over its last smoothing_frames; a
+    model triggers once that average has been above its threshold for
+    persist_frames frames in a row. With the default policy (one frame,
+    no smoothing) this is the same as detect_wake_word().
+    """
+
+    def __init__(self, policies: dict[str, WakePolicy] | None = None) -> None:
+        """Initialize the trigger.
+
+        Args:
+            policies: Policy per model name; "default" applies to models
+                not named
+        """
+        self._policies = dict(policies or {})
+        self._default = self._policies.pop(DEFAULT_POLICY, WakePolicy())
+        self._scores: dict[str, deque[float]] = {}
+        self._runs: dict[str, int] = {}
+
+    def policy(self, model_name: str) -> WakePolicy:
+        """Return the policy applied to a model."""
+        return self._policies.get(model_name, self._default)
+
+    def reset(self) -> None:
+        """Forget recent scores, as after a wake word or a rejected trigger."""
+        self._scores.clear()
+        self._runs.clear()
+
+    def update(self, predictions: dict[str, float]) -> tuple[str, float] | None:
+        """Take one frame's scores.
+
+        Returns:
+            The first model that triggers on this frame, with its smoothed
+            score, or None
+        """
+        triggered = None
+        for model_name, score in predictions.items():
+            policy = self.policy(model_name)
+            scores = self._scores.get(model_name)
+            if scores is None:
+                scores = self._scores[model_name] = deque(maxlen=policy.smoothing_frames)
+            scores.append(float(score))
+            smoothed = sum(scores) / len(scores)
+            run = self._runs.get(model_name, 0) + 1 if smoothed > policy.threshold else 0
+            self._runs[model_name] = run
+            if triggered is None and run >= policy.persist_frames:
+                triggered = (model_name, smoothed)
+        return triggered
+
+
+class WakeVerifier(Protocol):
+    """Stage two: confirms a trigger from the audio that set it off."""
+
+    def verify(self, model_name: str, audio: np.ndarray, sample_rate: int) -> bool: ...
+
+
+def wake_phrase(model_name: str) -> str:
+    """Return the words of a wake word model, e.g. "hey_jarvis_v0.1" -> "hey jarvis"."""
+    return _VERSION.sub("", model_name).replace("_", " ")
+
+
+class TranscriptVerifier:
+    """Confirms a trigger by transcribing the wake audio with a small model.
+
+    A trigger is confirmed if the transcript contains the wake phrase,
+    allowing the mishearings PhraseMatcher allows ("hey jervis"). If
+    transcription fails the trigger is confirmed, so a broken verifier
+    cannot stop the wake word working.
+    """
+
+    def __init__(
+        self, transcriber: TranscriberPort, phrases: dict[str, str] | None = None
+    ) -> None:
+        """Initialize the verifier.
+
+        Args:
+            transcriber: A fast transcriber, e.g. Whisper tiny.en
+            phrases: Wake phrase per model name, where it is not the
+                model name itself
+        """
+        self._transcriber = transcriber
+        self._phrases = phrases or {}
+        self._matchers: dict[str, PhraseMatcher[str]] = {}
+        self.last_text = ""
+
+    def load(self) -> None:
+        """Load the transcriber's model up front."""
+        self._transcriber.load()
+
+    def verify(self, model_name: str, audio: np.ndarray, sample_rate: int) -> bool:
+        """Return True if the wake phrase is heard in the audio."""
+        matcher = self._matchers.get(model_name)
+        if matcher is None:
+            phrase = self._phrases.get(model_name) or wake_phrase(model_name)
+            matcher = self._matchers[model_name] = PhraseMatcher({phrase: model_name})
+        try:
+            self.last_text = self._transcriber.transcribe(audio, sample_rate)
+        except TranscriptionError:
+            return True
+        return matcher.match(self.last_text) is not None
@@ -0,0 +1 @@
+"""Tests for audio module."""
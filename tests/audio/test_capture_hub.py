@@ -0,0 +1,101 @@
+"""Tests for CaptureHub."""
+
+import numpy as np
+from hamcrest import assert_that, equal_to, is_
+
+from much_miller.audio.adapters.array_frame_source import ArrayFrameSource
+from much_miller.audio.capture_hub import CaptureHub
+
+
+def numbered_frames(count: int, frame_size: int = 4) -> np.ndarray:
+    """Samples where every sample of frame n has the value n."""
+    return np.repeat(np.arange(count, dtype=np.int16), frame_size)
+
+
+class LossySource(ArrayFrameSource):
+    """Array source reporting lost audio, as a microphone source would."""
+
+    lost = 0
+
+    @property
+    def overflows(self) -> int:
+        return 2
+
+    @property
+    def dropped(self) -> int:
+        return self.lost
+
+
+class TestCaptureHub:
+    """Tests for CaptureHub."""
+
+    def test_every_subscriber_receives_every_frame(self) -> None:
+        hub = CaptureHub(ArrayFrameSource(numbered_frames(5), frame_size=4))
+        first = hub.subscribe()
+        second = hub.subscribe()
+
+        hub.start()
+        hub.wait(1.0)
+
+        assert_that([int(f[0]) for f in first], equal_to([0, 1, 2, 3, 4]))
+        assert_that([int(f[0]) for f in second], equal_to([0, 1, 2, 3, 4]))
+
+    def test_source_is_opened_once(self) -> None:
+        source = ArrayFrameSource(numbered_frames(3), frame_size=4)
+        hub = CaptureHub(source)
+        hub.start()
+        hub.start()
+
+        hub.wait(1.0)
+        hub.stop()
+
+        assert_that(hub.position, is_(12))
+
+    def test_preroll_delivers_audio_from_before_subscribing(self) -> None:
+        hub = CaptureHub(ArrayFrameSource(numbered_frames(6), frame_size=4, sample_rate=16))
+        hub.start()
+        hub.wait(1.0)
+
+        subscription = hub.subscribe(preroll_seconds=0.5)
+        subscription.close()
+
+        assert_that([int(f[0]) for f in subscription], equal_to([4, 5]))
+
+    def test_preroll_is_measured_back_from_given_position(self) -> None:
+        hub = CaptureHub(ArrayFrameSource(numbered_frames(6), frame_size=4, sample_rate=16))
+        hub.start()
+        hub.wait(1.0)
+
+        subscription = hub.subscribe(preroll_seconds=0.25, from_position=12)
+        subscription.close()
+
+        assert_that([int(f[0]) for f in subscription], equal_to([2, 3, 4, 5]))
+
+    def test_subscription_tracks_position_of_frames_read(self) -> None:
+        hub = CaptureHub(ArrayFrameSource(numbered_frames(3), frame_size=4))
+        subscription = hub.subscribe()
+        hub.start()
+
+        subscription.read(timeout=1.0)
+        subscription.read(timeout=1.0)
+
+        assert_that(subscription.position, is_(8))
+
+    def test_slow_subscriber_drops_oldest_frames(self) -> None:
+        hub = CaptureHub(ArrayFrameSource(numbered_frames(10), frame_size=4))
+        subscription = hub.subscribe(max_frames=3)
+
+        hub.start()
+        hub.wait(1.0)
+
+        assert_that(subscription.dropped, is_(8))
+        assert_that([int(f[0]) for f in subscription], equal_to([8, 9]))
+
+    def test_reports_frames_the_source_dropped(self) -> None:
+        source = LossySource(numbered_frames(3), frame_size=4)
+        hub = CaptureHub(source)
+
+        source.lost = 5
+
+        assert_that(hub.dropped, is_(5))
+        assert_that(hub.overflows, is_(2))
@@ -0,0 +1,68 @@
+"""Tests for FramePool."""
+
+import threading
+
+import numpy as np
+from hamcrest import assert_that, equal_to, is_, none
+
+from much_miller.audio.frame_pool import FramePool
+
+
+class TestFramePool:
+    """Tests for FramePool."""
+
+    def test_frames_arrive_in_order(self) -> None:
+        pool = FramePool(frame_size=4, count=4)
+        for value in range(3):
+            pool.put(np.full(4, value, dtype=np.int16))
+
+        values = []
+        for _ in range(3):
+            frame = pool.get()
+            assert frame is not None
+            values.append(int(frame[0]))
+
+        assert_that(values, equal_to([0, 1, 2]))
+
+    def test_reuses_preallocated_frames(self) -> None:
+        pool = FramePool(frame_size=4, count=2)
+        pool.put(np.ones(4, dtype=np.int16))
+        first = pool.get()
+        pool.put(np.ones(4, dtype=np.int16))
+        pool.get()
+        pool.put(np.ones(4, dtype=np.int16))
+
+        third = pool.get()
+
+        assert first is not None and third is not None
+        assert_that(np.shares_memory(first, third), is_(True))
+
+    def test_drops_rather_than_overwriting_unread_frames(self) -> None:
+        pool = FramePool(frame_size=4, count=3)
+        held = None
+        for value in range(5):
+            pool.put(np.full(4, value, dtype=np.int16))
+            if held is None:
+                held = pool.get()
+
+        assert_that(pool.dropped, is_(2))
+        assert held is not None
+        assert_that(int(held[0]), is_(0))
+
+    def test_pads_short_blocks(self) -> None:
+        pool = FramePool(frame_size=4)
+        pool.put(np.full(4, 9, dtype=np.int16))
+        pool.get()
+        pool.put(np.array([5, 5], dtype=np.int16))
+
+        frame = pool.get()
+
+        assert frame is not None
+        assert_that(frame.tolist(), equal_to([5, 5, 0, 0]))
+
+    def test_close_wakes_a_waiting_reader(self) -> None:
+        pool = FramePool(frame_size=4)
+        threading.Timer(0.05, pool.close).start()
+
+        assert_that(pool.get(timeout=2.0), is_(none()))
+        assert_that(pool.put(np.zeros(4, dtype=np.int16)), is_(False))
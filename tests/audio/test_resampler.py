@@ -0,0 +1,77 @@
+"""Tests for Resampler and ResamplingFrameSource."""
+
+import numpy as np
+import pytest
+from hamcrest import assert_that, close_to, equal_to, is_, less_than
+
+from much_miller.audio.adapters import ArrayFrameSource, ResamplingFrameSource
+from much_miller.audio.resampler import Resampler, input_frame_size
+
+
+def tone(frequency: float, rate: int, seconds: float = 1.0) -> np.ndarray:
+    t = np.arange(int(rate * seconds)) / rate
+    return (10000 * np.sin(2 * np.pi * frequency * t)).astype(np.int16)
+
+
+def level(samples: np.ndarray) -> float:
+    middle = samples[200:-200].astype(np.float64)
+    return float(np.sqrt(np.mean(middle**2)))
+
+
+class TestResampler:
+    """Tests for Resampler."""
+
+    @pytest.mark.parametrize("rate, frame_size", [(48000, 3840), (44100, 3528)])
+    def test_blocks_match_the_whole_stream(self, rate: int, frame_size: int) -> None:
+        samples = tone(440, rate, seconds=1.2)
+        whole = Resampler(rate, 16000).process(samples)
+        streaming = Resampler(rate, 16000)
+
+        blocks = [
+            streaming.process(samples[offset:offset + frame_size])
+            for offset in range(0, len(samples), frame_size)
+        ]
+
+        assert_that({len(block) for block in blocks}, equal_to({1280}))
+        assert_that(np.array_equal(np.concatenate(blocks), whole), is_(True))
+
+    def test_keeps_speech_frequencies(self) -> None:
+        resampled = Resampler(48000, 16000).process(tone(1000, 48000))
+
+        assert_that(level(resampled), close_to(level(tone(1000, 16000)), 100))
+
+    def test_removes_frequencies_above_the_new_nyquist(self) -> None:
+        resampled = Resampler(44100, 16000).process(tone(12000, 44100))
+
+        assert_that(level(resampled), less_than(300))
+
+    def test_reduces_the_ratio(self) -> None:
+        assert_that(Resampler(44100, 16000).ratio, is_((160, 441)))
+
+
+class TestInputFrameSize:
+    """Tests for input_frame_size."""
+
+    def test_scales_the_frame(self) -> None:
+        assert_that(input_frame_size(1280, 48000, 16000), is_(3840))
+
+    def test_rejects_fractional_frames(self) -> None:
+        with pytest.raises(ValueError):
+            input_frame_size(1000, 44100, 16000)
+
+
+class TestResamplingFrameSource:
+    """Tests for ResamplingFrameSource."""
+
+    def test_delivers_frames_at_the_target_rate(self) -> None:
+        native = ArrayFrameSource(tone(440, 48000), sample_rate=48000, frame_size=480)
+        source = ResamplingFrameSource(native, sample_rate=16000)
+
+        source.start()
+        frames = []
+        while (frame := source.read_frame()) is not None:
+            frames.append(frame)
+
+        assert_that(source.frame_size, is_(160))
+        assert_that(len(frames), is_(100))
+        assert_that({len(frame) for frame in frames}, equal_to({160}))
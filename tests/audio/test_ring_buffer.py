@@ -0,0 +1,42 @@
+"""Tests for RingBuffer."""
+
+import numpy as np
+from hamcrest import assert_that, equal_to, is_
+
+from much_miller.audio.ring_buffer import RingBuffer
+
+
+class TestRingBuffer:
+    """Tests for RingBuffer."""
+
+    def test_reads_back_what_was_written(self) -> None:
+        ring = RingBuffer(10)
+
+        ring.write(np.arange(4, dtype=np.int16))
+
+        assert_that(ring.read(0).tolist(), equal_to([0, 1, 2, 3]))
+        assert_that(ring.position, is_(4))
+
+    def test_keeps_only_newest_samples_when_wrapping(self) -> None:
+        ring = RingBuffer(5)
+
+        ring.write(np.arange(4, dtype=np.int16))
+        ring.write(np.arange(4, 8, dtype=np.int16))
+
+        assert_that(ring.oldest, is_(3))
+        assert_that(ring.read(0).tolist(), equal_to([3, 4, 5, 6, 7]))
+
+    def test_write_larger_than_capacity(self) -> None:
+        ring = RingBuffer(3)
+
+        ring.write(np.arange(7, dtype=np.int16))
+
+        assert_that(ring.latest(3).tolist(), equal_to([4, 5, 6]))
+        assert_that(ring.position, is_(7))
+
+    def test_reads_range_between_positions(self) -> None:
+        ring = RingBuffer(8)
+        ring.write(np.arange(6, dtype=np.int16))
+        ring.write(np.arange(6, 12, dtype=np.int16))
+
+        assert_that(ring.read(6, 9).tolist(), equal_to([6, 7, 8]))
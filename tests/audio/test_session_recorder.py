@@ -0,0 +1,122 @@
+"""Tests for SessionRecorder and load_session."""
+
+from pathlib import Path
+
+import numpy as np
+from hamcrest import assert_that, contains_exactly, equal_to, has_entries, is_
+
+from much_miller.audio.adapters.array_frame_source import ArrayFrameSource
+from much_miller.audio.capture_hub import CaptureHub
+from much_miller.audio.session_recorder import SessionRecorder, load_session
+
+
+def record(recorder: SessionRecorder, samples: np.ndarray, frame_size: int = 4) -> None:
+    """Write samples as consecutive frames starting at hub position 0."""
+    for end in range(frame_size, len(samples) + 1, frame_size):
+        recorder.write(samples[end - frame_size:end], end)
+
+
+class TestSessionRecorder:
+    """Tests for SessionRecorder."""
+
+    def test_round_trips_audio_across_segments(self, tmp_path: Path) -> None:
+        recorder = SessionRecorder(tmp_path, sample_rate=16, segment_seconds=1)
+        samples = np.arange(40, dtype=np.int16)
+        record(recorder, samples)
+        recorder.close()
+
+        session = load_session(tmp_path)
+
+        assert_that([segment.start for segment in session.segments], equal_to([0, 16, 32]))
+        assert_that(session.audio(0, 40).tolist(), equal_to(samples.tolist()))
+        assert_that(session.sample_rate, is_(16))
+
+    def test_audio_within_a_segment_is_not_copied(self, tmp_path: Path) -> None:
+        recorder = SessionRecorder(tmp_path, sample_rate=16, segment_seconds=1)
+        record(recorder, np.arange(32, dtype=np.int16))
+        recorder.close()
+
+        session = load_session(tmp_path)
+        clip = session.audio(18, 30)
+
+        assert_that(clip.tolist(), equal_to(list(range(18, 30))))
+        assert_that(np.shares_memory(clip, session.segments[1].samples), is_(True))
+        assert_that(clip.flags.writeable, is_(False))
+
+    def test_gap_in_positions_starts_a_new_segment(self, tmp_path: Path) -> None:
+        recorder = SessionRecorder(tmp_path, sample_rate=16, segment_seconds=1)
+        recorder.write(np.full(4, 1, dtype=np.int16), 4)
+        recorder.write(np.full(4, 2, dtype=np.int16), 12)
+        recorder.close()
+
+        session = load_session(tmp_path)
+
+        assert_that([segment.start for segment in session.segments], equal_to([0, 8]))
+        assert_that(session.audio(0, 12).tolist(), equal_to([1] * 4 + [0] * 4 + [2] * 4))
+
+    def test_audio_outside_the_segments_is_silence(self, tmp_path: Path) -> None:
+        recorder = SessionRecorder(tmp_path, sample_rate=16, segment_seconds=1)
+        recorder.write(np.full(4, 1, dtype=np.int16), 8)
+        recorder.write(np.full(4, 2, dtype=np.int16), 16)
+        recorder.close()
+
+        session = load_session(tmp_path)
+
+        assert_that(
+            session.audio(2, 20).tolist(),
+            equal_to([0] * 2 + [1] * 4 + [0] * 4 + [2] * 4 + [0] * 4),
+        )
+        assert_that(session.audio(16, 20).tolist(), equal_to([0] * 4))
+
+    def test_oldest_segments_are_deleted_to_stay_within_budget(self, tmp_path: Path) -> None:
+        # Each full segment is 16 samples, 32 bytes
+        recorder = SessionRecorder(tmp_path, sample_rate=16, segment_seconds=1, max_bytes=64)
+        record(recorder, np.arange(80, dtype=np.int16))
+        recorder.close()
+
+        session = load_session(tmp_path)
+
+        assert_that([segment.start for segment in session.segments], equal_to([48, 64]))
+        assert_that(recorder.deleted_segments, is_(3))
+
+    def test_events_share_the_audio_timeline(self, tmp_path: Path) -> None:
+        recorder = SessionRecorder(tmp_path, sample_rate=16, segment_seconds=1)
+        record(recorder, np.arange(8, dtype=np.int16))
+        recorder.mark("wake", 6, model="hey_jarvis")
+        recorder.mark("command", text="play radio four")
+        recorder.close()
+
+        session = load_session(tmp_path)
+
+        assert_that([event.kind for event in session.events], equal_to(["wake", "command"]))
+        assert_that(session.events_of("wake")[0].position, is_(6))
+        assert_that(session.events_of("wake")[0].attributes, has_entries(model="hey_jarvis"))
+        assert_that(session.events_of("command")[0].position, is_(8))
+
+    def test_later_run_continues_the_timeline(self, tmp_path: Path) -> None:
+        first = SessionRecorder(tmp_path, sample_rate=16, segment_seconds=1)
+        record(first, np.full(8, 1, dtype=np.int16))
+        first.close()
+        second = SessionRecorder(tmp_path, sample_rate=16, segment_seconds=1)
+        record(second, np.full(8, 2, dtype=np.int16))
+        second.mark("wake", 4)
+        second.close()
+
+        session = load_session(tmp_path)
+
+        assert_that(session.audio(0, 16).tolist(), equal_to([1] * 8 + [2] * 8))
+        assert_that(session.events_of("wake")[0].position, is_(12))
+
+    def test_records_frames_from_the_capture_hub(self, tmp_path: Path) -> None:
+        samples = np.arange(24, dtype=np.int16)
+        hub = CaptureHub(ArrayFrameSource(samples, frame_size=4, sample_rate=16))
+        recorder = SessionRecorder(tmp_path, sample_rate=16, segment_seconds=1)
+        recorder.attach(hub)
+
+        hub.start()
+        hub.wait(1.0)
+        recorder.close()
+
+        session = load_session(tmp_path)
+        assert_that([segment.start for segment in session.segments], contains_exactly(0, 16))
+        assert_that(session.audio(0, 24).tolist(), equal_to(samples.tolist()))
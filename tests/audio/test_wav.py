@@ -0,0 +1,30 @@
+"""Tests for WAV encoding and WavSink."""
+
+import io
+
+import numpy as np
+from hamcrest import assert_that, equal_to, is_
+
+from much_miller.audio.wav import WavSink, encode_wav, read_wav
+
+
+class TestWavSink:
+    """Tests for WavSink."""
+
+    def test_round_trips_streamed_frames(self) -> None:
+        sink = WavSink(16000)
+        sink.write(np.arange(4, dtype=np.int16))
+        sink.write(np.arange(4, 8, dtype=np.int16))
+
+        samples, sample_rate = read_wav(sink.getvalue())
+
+        assert_that(samples.tolist(), equal_to(list(range(8))))
+        assert_that(sample_rate, is_(16000))
+
+    def test_writes_to_a_file(self) -> None:
+        target = io.BytesIO()
+        sink = WavSink(8000, target)
+        sink.write(np.ones(10, dtype=np.int16))
+        sink.close()
+
+        assert_that(target.getvalue(), equal_to(encode_wav(np.ones(10, np.int16), 8000)))
@@ -0,0 +1,96 @@
+"""Tests for the duty cycling benchmark."""
+
+import numpy as np
+from hamcrest import (
+    assert_that,
+    close_to,
+    contains_string,
+    greater_than,
+    has_length,
+    is_,
+    less_than,
+    starts_with,
+)
+
+from much_miller.bench.duty_cycle import SlowedWakeModel, replay_under_load
+from much_miller.wake_word.duty_cycle import FULL, DutyCycler, DutyMode, ModelSubset
+
+
+class LoudnessWakeModel:
+    """Fake wake model that fires on any loud audio."""
+
+    def predict(self, x: np.ndarray) -> dict[str, float]:
+        return {"hey_jarvis": 1.0 if np.abs(x).max() > 1000 else 0.0}
+
+
+def wake_audio() -> np.ndarray:
+    """Two seconds of silence with a loud frame at 1.5 seconds."""
+    samples = np.zeros(32000, dtype=np.int16)
+    samples[24000:24160] = 5000
+    return samples
+
+
+def slowed() -> SlowedWakeModel:
+    """For the first 0.6 s each call takes 20 ms plus 2.5 ms per 10 ms frame.
+
+    One frame per call is 2.25x real time; four frames per call, 0.75x.
+    """
+    return SlowedWakeModel(LoudnessWakeModel(), 0.02, load_seconds=0.6, call_seconds=0.02)
+
+
+class TwoWakeModels:
+    """Fake openWakeWord Model with two wake word models."""
+
+    def __init__(self) -> None:
+        self.models = {"alexa": object(), "hey_jarvis": object()}
+
+    def predict(self, x: np.ndarray) -> dict[str, float]:
+        return {name: 0.0 for name in self.models}
+
+    def reset(self) -> None:
+        pass
+
+
+class TestSlowedWakeModel:
+    """Tests for SlowedWakeModel."""
+
+    def test_delay_grows_with_audio_and_models_scored(self) -> None:
+        subset = ModelSubset(TwoWakeModels())
+        slow = SlowedWakeModel(subset, 0.01, call_seconds=0.005)
+
+        full = slow.delay(np.zeros(1280, dtype=np.int16))
+        strided = slow.delay(np.zeros(2560, dtype=np.int16))
+        subset.select(frozenset({"hey_jarvis"}))
+        narrowed = slow.delay(np.zeros(2560, dtype=np.int16))
+
+        assert_that(full, close_to(0.025, 1e-9))
+        assert_that(strided, close_to(0.045, 1e-9))
+        assert_that(narrowed, close_to(0.025, 1e-9))
+
+
+class TestReplayUnderLoad:
+    """Tests for replay_under_load."""
+
+    def test_full_rate_falls_behind_and_drops_audio(self) -> None:
+        result = replay_under_load(wake_audio(), slowed(), frame_size=160)
+
+        assert_that(result.dropped_frames, greater_than(0))
+
+    def test_duty_cycling_keeps_up_then_returns_to_full_rate(self) -> None:
+        duty = DutyCycler(
+            [FULL, DutyMode("stride-4", 4), DutyMode("stride-8", 8)],
+            high_lag_seconds=0.05,
+            low_lag_seconds=0.02,
+            step_seconds=0.1,
+            recover_seconds=0.2,
+        )
+
+        result = replay_under_load(wake_audio(), slowed(), duty, frame_size=160)
+
+        assert_that(result.dropped_frames, is_(0))
+        assert_that(result.strided_frames, greater_than(0))
+        assert_that(result.final_mode, is_("full"))
+        assert_that(result.changes[0], starts_with("Wake word duty full -> stride-4"))
+        assert_that(result.changes[-1], contains_string("-> full"))
+        assert_that(result.detections, has_length(1))
+        assert_that(abs(result.detections[0] - 1.51), less_than(0.05))
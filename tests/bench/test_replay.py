@@ -0,0 +1,184 @@
+"""Tests for the offline replay benchmark."""
+
+import io
+import json
+import wave
+from pathlib import Path
+
+import numpy as np
+from hamcrest import assert_that, close_to, empty, has_item, is_, starts_with
+
+from much_miller.bench.replay import ReplayBenchmark, compare, compare_staged, load_manifest
+from much_miller.wake_word.energy_gate import EnergyGate
+from much_miller.wake_word.verification import WakePolicy, WakeTrigger
+
+
+def write_wav(path: Path, samples: np.ndarray, sample_rate: int = 16000) -> None:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(samples.astype(np.int16).tobytes())
+    path.write_bytes(buffer.getvalue())
+
+
+class LoudnessWakeModel:
+    """Fake wake model that fires on any loud frame."""
+
+    def __init__(self) -> None:
+        self.frames = 0
+
+    def predict(self, x: np.ndarray) -> dict[str, float]:
+        self.frames += 1
+        return {"hey_jarvis": 1.0 if np.abs(x).max() > 1000 else 0.0}
+
+
+def make_fixtures(tmp_path: Path) -> Path:
+    quiet = np.zeros(16000, dtype=np.int16)
+    loud = np.concatenate([quiet, np.full(1280, 5000, dtype=np.int16), quiet])
+    write_wav(tmp_path / "wake.wav", loud)
+    write_wav(tmp_path / "silence.wav", quiet)
+    manifest = {
+        "fixtures": [
+            {"wav": "wake.wav", "wake": True, "wake_end": 1.0, "command": "play bbc_radio_three"},
+            {"wav": "silence.wav", "wake": False},
+        ]
+    }
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps(manifest))
+    return path
+
+
+def make_staged_fixtures(tmp_path: Path) -> Path:
+    """A sustained wake word, and TV audio with a one-frame spike."""
+    quiet = np.zeros(16000, dtype=np.int16)
+    wake = np.concatenate([quiet, np.full(1280 * 4, 5000, dtype=np.int16), quiet])
+    tv = np.concatenate([quiet, np.full(1280, 5000, dtype=np.int16), quiet])
+    write_wav(tmp_path / "wake.wav", wake)
+    write_wav(tmp_path / "tv.wav", tv)
+    manifest = {
+        "fixtures": [
+            {"wav": "wake.wav", "wake": True, "command": "play bbc_radio_three"},
+            {"wav": "tv.wav", "wake": False},
+        ]
+    }
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps(manifest))
+    return path
+
+
+class RejectingVerifier:
+    """Fake verifier that rejects every trigger."""
+
+    def verify(self, model_name: str, audio: np.ndarray, sample_rate: int) -> bool:
+        return False
+
+
+class TestReplayBenchmark:
+    """Tests for ReplayBenchmark."""
+
+    def test_detects_wake_word_and_runs_command(self, tmp_path: Path) -> None:
+        fixtures = load_manifest(make_fixtures(tmp_path))
+        benchmark = ReplayBenchmark(LoudnessWakeModel(), lambda samples: "Play radio 3.")
+
+        report = benchmark.run(fixtures)
+
+        assert_that(report.results[0].detected, is_("hey_jarvis"))
+        assert_that(report.results[0].command, is_("play bbc_radio_three"))
+        assert_that(report.command_accuracy, is_(1.0))
+        assert_that(report.false_accepts, is_(0))
+        assert_that(report.false_rejects, is_(0))
+
+    def test_measures_detection_latency(self, tmp_path: Path) -> None:
+        fixtures = load_manifest(make_fixtures(tmp_path))
+        benchmark = ReplayBenchmark(LoudnessWakeModel())
+
+        report = benchmark.run(fixtures)
+
+        # The first frame holding loud samples ends at 1.04 s
+        assert_that(report.mean_latency, close_to(0.04, 0.001))
+
+    def test_counts_false_rejects(self, tmp_path: Path) -> None:
+        fixtures = load_manifest(make_fixtures(tmp_path))
+        benchmark = ReplayBenchmark(LoudnessWakeModel(), threshold=2.0)
+
+        report = benchmark.run(fixtures)
+
+        assert_that(report.false_rejects, is_(1))
+        assert_that(report.command_accuracy, is_(0.0))
+
+    def test_runs_every_frame_of_silence(self, tmp_path: Path) -> None:
+        fixtures = load_manifest(make_fixtures(tmp_path))
+        model = LoudnessWakeModel()
+
+        ReplayBenchmark(model).run(fixtures[1:])
+
+        # The last partial frame is padded with silence, as the detector sees it
+        assert_that(model.frames, is_(-(-16000 // 1280)))
+
+    def test_gate_skips_silence_but_still_detects(self, tmp_path: Path) -> None:
+        fixtures = load_manifest(make_fixtures(tmp_path))
+        model = LoudnessWakeModel()
+        benchmark = ReplayBenchmark(model, gate=EnergyGate(0.08, lookback_seconds=0.16))
+
+        report = benchmark.run(fixtures)
+
+        assert_that(report.results[0].detected, is_("hey_jarvis"))
+        assert_that(report.mean_latency, close_to(0.04, 0.001))
+        # Two lookback frames and the loud frame, out of 26 frames in total
+        assert_that(model.frames, is_(3))
+        assert_that(report.inference_saved, close_to(1 - 3 / 26, 0.001))
+
+
+    def test_persistence_removes_false_accepts(self, tmp_path: Path) -> None:
+        fixtures = load_manifest(make_staged_fixtures(tmp_path))
+        trigger = WakeTrigger({"hey_jarvis": WakePolicy(0.5, persist_frames=3)})
+
+        single = ReplayBenchmark(LoudnessWakeModel()).run(fixtures)
+        staged = ReplayBenchmark(LoudnessWakeModel(), trigger=trigger).run(fixtures)
+
+        assert_that(single.false_accept_rate, is_(1.0))
+        assert_that(staged.false_accept_rate, is_(0.0))
+        assert_that(staged.false_rejects, is_(0))
+
+    def test_rejected_triggers_skip_the_pipeline(self, tmp_path: Path) -> None:
+        fixtures = load_manifest(make_staged_fixtures(tmp_path))
+        transcribed: list[int] = []
+
+        def transcribe(samples: np.ndarray) -> str:
+            transcribed.append(len(samples))
+            return "Play radio 3."
+
+        single = ReplayBenchmark(LoudnessWakeModel(), transcribe).run(fixtures)
+        staged = ReplayBenchmark(
+            LoudnessWakeModel(), transcribe, verifier=RejectingVerifier()
+        ).run(fixtures)
+
+        assert_that(len(transcribed), is_(2))
+        assert_that(staged.pipeline_runs, is_(0))
+        assert_that(staged.rejected, is_(staged.triggers))
+        comparison = compare_staged(staged, single)
+        assert_that(comparison["pipeline_runs"], is_("2 -> 0"))
+        assert_that(comparison["cpu_seconds_saved"] is not None, is_(True))
+
+
+class TestCompare:
+    """Tests for baseline comparison."""
+
+    def test_no_regressions_against_itself(self) -> None:
+        summary = {"wake_rtf": 0.1, "transcribe_rtf": 0.5, "mean_latency": 0.2,
+                   "false_accepts": 0, "false_rejects": 1, "command_accuracy": 0.9}
+
+        assert_that(compare(summary, summary), is_(empty()))
+
+    def test_reports_slower_and_less_accurate_runs(self) -> None:
+        baseline = {"wake_rtf": 0.1, "transcribe_rtf": 0.5, "mean_latency": 0.2,
+                    "false_accepts": 0, "false_rejects": 1, "command_accuracy": 0.9}
+        summary = dict(baseline, wake_rtf=0.2, false_accepts=2, command_accuracy=0.8)
+
+        regressions = compare(summary, baseline)
+
+        assert_that(regressions, has_item(starts_with("wake_rtf")))
+        assert_that(regressions, has_item(starts_with("false_accepts")))
+        assert_that(regressions, has_item(starts_with("command_accuracy")))
@@ -0,0 +1,31 @@
+"""Tests for the server load benchmark."""
+
+from hamcrest import assert_that, equal_to, greater_than, is_, not_none
+
+from much_miller.bench.server_load import percentile, run_clients
+from much_miller.server.transcription_queue import TranscriptionQueue
+from much_miller.server.wake_engine import WakeEngine
+from much_miller.transcription.adapters import FakeTranscriber
+from tests.server.rooms import FakeWakeModel, room_audio
+
+
+class TestServerLoad:
+    """Tests for run_clients()."""
+
+    async def test_reports_latency_and_batching_for_each_client_count(self) -> None:
+        wake = WakeEngine(FakeWakeModel())
+        transcription = TranscriptionQueue(FakeTranscriber("stop"), batch_seconds=0.05)
+        transcription.start()
+        try:
+            one = await run_clients(wake, transcription, [room_audio()], 1, speed=0)
+            four = await run_clients(wake, transcription, [room_audio()], 4, speed=0)
+        finally:
+            transcription.close()
+
+        assert_that(one.transcripts, equal_to(1))
+        assert_that(four.transcripts, equal_to(4))
+        assert_that(four.p95_latency, is_(not_none()))
+        assert_that(four.mean_wake_batch, greater_than(one.mean_wake_batch))
+
+    def test_percentile_of_nothing_is_none(self) -> None:
+        assert_that(percentile([], 0.5), is_(None))
@@ -0,0 +1,49 @@
+"""Stand-in for mpv that serves its JSON IPC protocol without playing anything.
+
+Usage: python fake_mpv.py [--startup-delay=SECONDS] [--log=PATH] --input-ipc-server=PATH
+
+Each command received is appended to the log as a JSON line.
+"""
+
+import json
+import socket
+import sys
+import time
+
+
+def main() -> None:
+    options = dict(arg[2:].split("=", 1) for arg in sys.argv[1:] if "=" in arg)
+    time.sleep(float(options.get("startup-delay", "0")))
+    log_path = options.get("log")
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(options["input-ipc-server"])
+    server.listen(1)
+    path = None
+    while True:
+        connection, _ = server.accept()
+        with connection, connection.makefile("rb") as reader:
+            for line in reader:
+                request = json.loads(line)
+                command = request["command"]
+                if log_path:
+                    with open(log_path, "a") as log:
+                        log.write(json.dumps(command) + "\n")
+                reply = {"request_id": request["request_id"], "error": "success"}
+                if command[0] == "loadfile":
+                    path = command[1]
+                    connection.sendall(b'{"event":"start-file"}\n')
+                elif command[0] == "stop":
+                    path = None
+                elif command[0] == "get_property" and command[1] == "path":
+                    reply["data"] = path
+                elif command[0] == "quit":
+                    connection.sendall((json.dumps(reply) + "\n").encode())
+                    return
+                else:
+                    reply["error"] = "invalid parameter"
+                connection.sendall((json.dumps(reply) + "\n").encode())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""Tests for MpvIpcRadioPlayer against a fake mpv IPC server."""
+
+import json
+import os
+import signal
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from hamcrest import assert_that, equal_to, is_, less_than, none, not_
+
+from much_miller.radio.adapters.mpv_ipc_radio_player import MpvIpcRadioPlayer, stream_url
+
+FAKE_MPV = Path(__file__).parent / "fake_mpv.py"
+STARTUP_DELAY = 0.3
+
+
+class Resolver:
+    """Counts URL lookups instead of touching the network."""
+
+    def __init__(self) -> None:
+        self.lookups: list[str] = []
+
+    def __call__(self, station_id: str) -> str:
+        self.lookups.append(station_id)
+        return resolver_url(station_id)
+
+
+def resolver_url(station_id: str) -> str:
+    return f"https://example.invalid/{station_id}.m3u8"
+
+
+@pytest.fixture
+def log_path(tmp_path: Path) -> Path:
+    return tmp_path / "mpv.log"
+
+
+@pytest.fixture
+def resolver() -> Resolver:
+    return Resolver()
+
+
+@pytest.fixture
+def player(log_path: Path, resolver: Resolver) -> Iterator[MpvIpcRadioPlayer]:
+    player = MpvIpcRadioPlayer(
+        mpv_command=[
+            sys.executable,
+            str(FAKE_MPV),
+            f"--startup-delay={STARTUP_DELAY}",
+            f"--log={log_path}",
+        ],
+        resolve_url=resolver,
+    )
+    yield player
+    player.close()
+
+
+def logged_commands(log_path: Path) -> list[list[str]]:
+    return [json.loads(line) for line in log_path.read_text().splitlines()]
+
+
+class TestMpvIpcRadioPlayer:
+    """Tests for MpvIpcRadioPlayer."""
+
+    def test_initially_not_playing(self, player: MpvIpcRadioPlayer) -> None:
+        assert_that(player.is_playing(), is_(False))
+        assert_that(player.current_station, is_(none()))
+        assert_that(player.process_id, is_(none()))
+
+    def test_play_loads_the_resolved_url(
+        self, player: MpvIpcRadioPlayer, log_path: Path
+    ) -> None:
+        player.play("bbc_radio_three", "radio 3")
+
+        assert_that(player.is_playing(), is_(True))
+        assert_that(player.current_station, is_("radio 3"))
+        assert_that(
+            logged_commands(log_path),
+            equal_to([["loadfile", "https://example.invalid/bbc_radio_three.m3u8", "replace"]]),
+        )
+
+    def test_switching_station_reuses_the_process(self, player: MpvIpcRadioPlayer) -> None:
+        player.play("bbc_radio_three", "radio 3")
+        pid = player.process_id
+
+        player.play("bbc_radio_fourfm", "radio 4")
+
+        assert_that(player.process_id, is_(pid))
+        assert_that(player.command("get_property", "path"), is_(
+            "https://example.invalid/bbc_radio_fourfm.m3u8"
+        ))
+
+    def test_switching_station_does_not_pay_startup(self, player: MpvIpcRadioPlayer) -> None:
+        player.start()
+
+        started = time.perf_counter()
+        player.play("bbc_radio_three", "radio 3")
+        player.play("bbc_radio_fourfm", "radio 4")
+        elapsed = time.perf_counter() - started
+
+        assert_that(elapsed, less_than(STARTUP_DELAY))
+
+    def test_resolves_each_station_once(
+        self, player: MpvIpcRadioPlayer, resolver: Resolver
+    ) -> None:
+        player.play("bbc_radio_three", "radio 3")
+        player.play("bbc_radio_fourfm", "radio 4")
+        player.play("bbc_radio_three", "radio 3")
+
+        assert_that(resolver.lookups, equal_to(["bbc_radio_three", "bbc_radio_fourfm"]))
+
+    def test_prefetch_resolves_in_background(
+        self, player: MpvIpcRadioPlayer, resolver: Resolver
+    ) -> None:
+        player.prefetch(["bbc_radio_three", "bbc_world_service"]).join()
+
+        assert_that(resolver.lookups, equal_to(["bbc_radio_three", "bbc_world_service"]))
+
+    def test_stop_leaves_mpv_idle(self, player: MpvIpcRadioPlayer, log_path: Path) -> None:
+        player.play("bbc_radio_three", "radio 3")
+        pid = player.process_id
+
+        player.stop()
+
+        assert_that(player.is_playing(), is_(False))
+        assert_that(player.process_id, is_(pid))
+        assert_that(logged_commands(log_path)[-1], equal_to(["stop"]))
+
+    def test_restarts_mpv_after_it_dies(self, player: MpvIpcRadioPlayer) -> None:
+        player.play("bbc_radio_three", "radio 3")
+        pid = player.process_id
+        os.kill(pid, signal.SIGKILL)
+        time.sleep(0.1)
+
+        assert_that(player.is_playing(), is_(False))
+        player.play("bbc_radio_fourfm", "radio 4")
+
+        assert_that(player.process_id, is_(not_(pid)))
+        assert_that(player.is_playing(), is_(True))
+        with pytest.raises(ChildProcessError):
+            os.waitpid(pid, os.WNOHANG)
+
+    def test_close_quits_and_reaps_mpv(self, player: MpvIpcRadioPlayer) -> None:
+        player.play("bbc_radio_three", "radio 3")
+        pid = player.process_id
+
+        player.close()
+
+        assert_that(player.process_id, is_(none()))
+        with pytest.raises(ChildProcessError):
+            os.waitpid(pid, os.WNOHANG)
+
+    def test_commands_from_several_threads_each_get_their_reply(
+        self, player: MpvIpcRadioPlayer
+    ) -> None:
+        player.play("bbc_radio_three", "radio 3")
+        replies: list[str] = []
+
+        def query() -> None:
+            for _ in range(25):
+                replies.append(player.command("get_property", "path"))
+
+        threads = [threading.Thread(target=query, daemon=True) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5.0)
+
+        assert_that(any(thread.is_alive() for thread in threads), is_(False))
+        assert_that(replies, equal_to([resolver_url("bbc_radio_three")] * 100))
+
+    def test_mpv_errors_are_raised(self, player: MpvIpcRadioPlayer) -> None:
+        with pytest.raises(RuntimeError):
+            player.command("no-such-command")
+
+
+class TestStreamUrl:
+    """Tests for stream_url."""
+
+    def test_names_station_and_bitrate(self) -> None:
+        assert_that(
+            stream_url("bbc_radio_three"),
+            equal_to("https://lsn.lv/bbcradio.m3u8?station=bbc_radio_three&bitrate=320000"),
+        )
@@ -0,0 +1 @@
+"""Tests for server mode."""
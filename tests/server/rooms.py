@@ -0,0 +1,42 @@
+"""Simulated room audio and a wake word model that hears it."""
+
+import numpy as np
+
+RATE = 16000
+FRAME = 1280
+
+
+class FakeWakeModel:
+    """Fires for each stream whose frame is loud enough to be the wake word."""
+
+    def __init__(self) -> None:
+        self.streams = 0
+        self.resets: list[int | None] = []
+        self.batches: list[list[int]] = []
+
+    def add_stream(self) -> int:
+        self.streams += 1
+        return self.streams - 1
+
+    def reset(self, stream: int | None = None) -> None:
+        self.resets.append(stream)
+
+    def predict_streams(self, streams: list[int], frames: np.ndarray) -> list[dict[str, float]]:
+        self.batches.append(streams)
+        return [
+            {"hey_jarvis": 0.9 if np.abs(frame.astype(np.int32)).mean() > 8000 else 0.0}
+            for frame in frames
+        ]
+
+
+def room_audio() -> np.ndarray:
+    """Silence, the wake word, a pause, a command, then silence."""
+    return np.concatenate(
+        [
+            np.zeros(FRAME * 12, dtype=np.int16),
+            np.full(FRAME, 10000, dtype=np.int16),
+            np.zeros(RATE // 2, dtype=np.int16),
+            np.full(RATE, 2000, dtype=np.int16),
+            np.zeros(RATE * 3 // 2, dtype=np.int16),
+        ]
+    )
@@ -0,0 +1,50 @@
+"""Tests for TranscriptionQueue."""
+
+import numpy as np
+from hamcrest import assert_that, equal_to, is_
+
+from much_miller.server.transcription_queue import TranscriptionQueue
+from much_miller.transcription.adapters import FakeTranscriber
+
+
+def utterance() -> np.ndarray:
+    return np.full(16000, 2000, dtype=np.int16)
+
+
+class TestTranscriptionQueue:
+    """Tests for TranscriptionQueue."""
+
+    def test_utterances_arriving_together_share_a_batch(self) -> None:
+        transcriber = FakeTranscriber("stop")
+        queue = TranscriptionQueue(transcriber, max_batch=4, batch_seconds=0.2)
+        queue.start()
+
+        futures = [queue.submit(utterance()) for _ in range(3)]
+
+        assert_that([f.result(timeout=2.0) for f in futures], equal_to(["stop"] * 3))
+        assert_that(transcriber.batches, equal_to([3]))
+        assert_that(queue.stats.mean_batch, equal_to(3.0))
+        queue.close()
+
+    def test_batches_hold_at_most_max_batch(self) -> None:
+        transcriber = FakeTranscriber("stop")
+        queue = TranscriptionQueue(transcriber, max_batch=2, batch_seconds=0.2)
+        queue.start()
+
+        futures = [queue.submit(utterance()) for _ in range(5)]
+        for future in futures:
+            future.result(timeout=2.0)
+
+        assert_that(transcriber.batches, equal_to([2, 2, 1]))
+        queue.close()
+
+    def test_failures_reach_every_caller_in_the_batch(self) -> None:
+        transcriber = FakeTranscriber("stop")
+        transcriber.failing = True
+        queue = TranscriptionQueue(transcriber, batch_seconds=0.1)
+        queue.start()
+
+        futures = [queue.submit(utterance()) for _ in range(2)]
+
+        assert_that(all(f.exception(timeout=2.0) is not None for f in futures), is_(True))
+        queue.close()
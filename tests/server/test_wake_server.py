@@ -0,0 +1,187 @@
+"""End-to-end tests for WakeServer, with simulated rooms over TCP."""
+
+import asyncio
+import json
+import threading
+import time
+
+import numpy as np
+
+from hamcrest import assert_that, contains_string, equal_to, has_length, is_, less_than
+
+from much_miller.server.protocol import EVENT, HELLO, encode, encode_json, read_message
+from much_miller.server.replay_client import replay
+from much_miller.server.transcription_queue import TranscriptionQueue
+from much_miller.server.wake_engine import WakeEngine
+from much_miller.server.wake_server import WakeServer, interpret
+from much_miller.transcription.adapters import FakeTranscriber
+from tests.server.rooms import FRAME, FakeWakeModel, room_audio
+
+
+class SlowWakeModel(FakeWakeModel):
+    """FakeWakeModel that takes a while over each batch."""
+
+    def __init__(self, delay: float) -> None:
+        super().__init__()
+        self.delay = delay
+
+    def predict_streams(self, streams: list[int], frames: np.ndarray) -> list[dict[str, float]]:
+        time.sleep(self.delay)
+        return super().predict_streams(streams, frames)
+
+
+class FakeSynthesizer:
+    """Renders a reply as a tenth of a second of silence."""
+
+    sample_rate = 22050
+
+    def render(self, text: str) -> bytes:
+        return bytes(2205 * 2)
+
+
+async def started_server(
+    transcriber: FakeTranscriber, synthesizer: FakeSynthesizer | None = None
+) -> tuple[WakeServer, TranscriptionQueue, int]:
+    queue = TranscriptionQueue(transcriber, batch_seconds=0.05)
+    queue.start()
+    server = WakeServer(WakeEngine(FakeWakeModel()), queue, synthesizer)
+    return server, queue, await server.start_tcp("127.0.0.1", 0)
+
+
+class TestInterpret:
+    """Tests for interpret()."""
+
+    def test_play_names_the_station_for_the_client(self) -> None:
+        reply = interpret("Play Radio 4.")
+
+        assert_that(reply.action, is_("play"))
+        assert_that(reply.text, contains_string("Playing"))
+
+    def test_over_ends_the_conversation(self) -> None:
+        assert_that(interpret("Thanks, over.").action, is_("over"))
+
+
+class TestWakeEngine:
+    """Tests for WakeEngine."""
+
+    def test_clients_share_one_model_in_one_batch(self) -> None:
+        model = FakeWakeModel()
+        wake = WakeEngine(model)
+        wake.add("kitchen")
+        wake.add("hall")
+
+        detections = wake.predict_batch(
+            {"kitchen": np.zeros(FRAME, dtype=np.int16), "hall": np.full(FRAME, 10000, np.int16)}
+        )
+
+        assert_that(model.batches, equal_to([[0, 1]]))
+        assert_that(detections, equal_to({"hall": ("hey_jarvis", 0.9)}))
+
+    def test_a_departed_clients_stream_is_cleared_and_reused(self) -> None:
+        model = FakeWakeModel()
+        wake = WakeEngine(model)
+        wake.add("kitchen")
+        wake.remove("kitchen")
+        wake.add("hall")
+
+        assert_that(model.streams, is_(1))
+        assert_that(model.resets, equal_to([0]))
+
+    def test_remove_does_not_wait_for_a_batch(self) -> None:
+        wake = WakeEngine(SlowWakeModel(0.5))
+        wake.add("kitchen")
+        wake.add("hall")
+        batch = threading.Thread(
+            target=wake.predict_batch, args=({"hall": np.zeros(FRAME, dtype=np.int16)},)
+        )
+        batch.start()
+        time.sleep(0.05)
+
+        started = time.perf_counter()
+        wake.remove("kitchen")
+        elapsed = time.perf_counter() - started
+        batch.join()
+
+        assert_that(elapsed, less_than(0.1))
+        assert_that(wake.clients, equal_to(["hall"]))
+
+
+class TestWakeServer:
+    """End-to-end tests for WakeServer."""
+
+    async def test_clients_are_woken_transcribed_and_answered(self) -> None:
+        transcriber = FakeTranscriber("play radio four")
+        server, queue, port = await started_server(transcriber)
+        try:
+            results = await asyncio.gather(
+                *[replay(room_audio(), f"room-{i}", port, speed=0) for i in range(3)]
+            )
+        finally:
+            await server.close()
+            queue.close()
+
+        for result in results:
+            assert_that([e["event"] for e in result.of("wake")], equal_to(["wake"]))
+            assert_that(result.of("transcript")[0]["text"], is_("play radio four"))
+            assert_that(result.of("reply")[0]["action"], is_("play"))
+            assert_that(result.latencies, has_length(1))
+            assert_that(result.events[-1]["event"], is_("bye"))
+        assert_that(sum(transcriber.batches), equal_to(3))
+
+    async def test_wake_inference_is_batched_across_clients(self) -> None:
+        server, queue, port = await started_server(FakeTranscriber("stop"))
+        wake = server._wake
+        try:
+            await asyncio.gather(
+                *[replay(room_audio(), f"room-{i}", port, speed=4.0) for i in range(4)]
+            )
+        finally:
+            await server.close()
+            queue.close()
+
+        assert_that(wake.stats.mean_batch > 1.0, is_(True))
+
+    async def test_replies_are_spoken_when_asked_for(self) -> None:
+        server, queue, port = await started_server(
+            FakeTranscriber("play radio four"), FakeSynthesizer()
+        )
+        try:
+            result = await replay(room_audio(), "kitchen", port, speed=0, speech=True)
+        finally:
+            await server.close()
+            queue.close()
+
+        assert_that(result.speech_seconds, equal_to(0.1))
+
+    async def test_a_second_client_with_the_same_name_is_refused(self) -> None:
+        server, queue, port = await started_server(FakeTranscriber())
+        try:
+            _, first = await asyncio.open_connection("127.0.0.1", port)
+            first.write(encode_json(HELLO, {"name": "kitchen"}))
+            reader, second = await asyncio.open_connection("127.0.0.1", port)
+            await asyncio.sleep(0.05)
+            second.write(encode_json(HELLO, {"name": "kitchen"}))
+            message = await read_message(reader)
+            first.close()
+            second.close()
+        finally:
+            await server.close()
+            queue.close()
+
+        assert message is not None
+        assert_that(message[0], equal_to(EVENT))
+        assert_that(json.loads(message[1])["event"], is_("error"))
+
+    async def test_audio_before_hello_is_refused(self) -> None:
+        server, queue, port = await started_server(FakeTranscriber())
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(encode(b"A", bytes(FRAME * 2)))
+            message = await read_message(reader)
+            writer.close()
+        finally:
+            await server.close()
+            queue.close()
+
+        assert message is not None
+        assert_that(json.loads(message[1])["message"], contains_string("HELLO"))
@@ -0,0 +1 @@
+"""Tests for telemetry module."""
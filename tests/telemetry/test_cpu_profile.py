@@ -0,0 +1,82 @@
+"""Tests for per-engine CPU profiling."""
+
+import sys
+import threading
+import time
+
+import pytest
+from hamcrest import assert_that, greater_than, has_key, is_, less_than, not_
+
+from much_miller.telemetry import cpu_profile
+from much_miller.telemetry.cpu_profile import CpuProfiler
+
+linux_only = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Uses /proc")
+
+
+def spin(seconds: float) -> None:
+    deadline = time.thread_time() + seconds
+    while time.thread_time() < deadline:
+        pass
+
+
+class TestCpuProfiler:
+    """Tests for CpuProfiler."""
+
+    def test_attributes_the_tracked_block(self) -> None:
+        profiler = CpuProfiler()
+
+        with profiler.track("wake"):
+            spin(0.05)
+
+        assert_that(profiler.usage()["wake"], greater_than(0.04))
+
+    @linux_only
+    def test_attributes_threads_started_in_the_block(self) -> None:
+        profiler = CpuProfiler()
+        done = threading.Event()
+
+        def pool_thread() -> None:
+            spin(0.1)
+            done.wait()
+
+        with profiler.track("whisper"):
+            worker = threading.Thread(target=pool_thread)
+            worker.start()
+        time.sleep(0.15)
+        usage = profiler.usage()
+        done.set()
+        worker.join()
+
+        assert_that(usage["whisper"], greater_than(0.05))
+
+    def test_untracked_work_is_other(self) -> None:
+        profiler = CpuProfiler()
+
+        spin(0.05)
+
+        assert_that(profiler.usage()["other"], greater_than(0.04))
+        assert_that(profiler.usage(), not_(has_key("wake")))
+
+
+class TestModuleFunctions:
+    """Tests for the module-level profiler."""
+
+    def test_track_is_free_until_configured(self) -> None:
+        cpu_profile.configure(False)
+
+        with cpu_profile.track("piper"):
+            pass
+
+        assert_that(cpu_profile.report(), is_(""))
+
+    def test_report_lists_engines(self) -> None:
+        cpu_profile.configure(True)
+        try:
+            with cpu_profile.track("piper"):
+                spin(0.02)
+            report = cpu_profile.report()
+        finally:
+            cpu_profile.configure(False)
+
+        assert_that("piper" in report, is_(True))
+        assert_that(len(report.splitlines()), less_than(6))
@@ -0,0 +1,141 @@
+"""Tests for live metrics and the health check."""
+
+import threading
+import urllib.error
+import urllib.request
+
+from hamcrest import assert_that, contains_string, empty, equal_to, has_item, is_, less_than
+
+from much_miller.telemetry.metrics import LossCheck, MetricsServer, Registry, StageLoad
+
+
+def fetch(server: MetricsServer, path: str) -> tuple[int, str]:
+    """GET a path from the server, returning status and body."""
+    url = f"http://127.0.0.1:{server.port}{path}"
+    try:
+        with urllib.request.urlopen(url, timeout=2) as response:
+            return response.status, response.read().decode()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read().decode()
+
+
+class TestRegistry:
+    """Tests for Registry."""
+
+    def test_counter_sums_updates_from_every_thread(self) -> None:
+        registry = Registry()
+        counter = registry.counter("frames_total", "Frames")
+
+        def count() -> None:
+            for _ in range(1000):
+                counter.inc()
+
+        threads = [threading.Thread(target=count) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert_that(counter.value, equal_to(4000))
+
+    def test_ended_threads_are_folded_into_the_total(self) -> None:
+        histogram = Registry().histogram("seconds", "Seconds", (1.0,))
+
+        for _ in range(20):
+            thread = threading.Thread(target=histogram.observe, args=(0.5,))
+            thread.start()
+            thread.join()
+
+        assert_that(histogram.count, equal_to(20))
+        assert_that(histogram._cells.threads, less_than(2))
+
+    def test_same_name_and_labels_return_the_same_metric(self) -> None:
+        registry = Registry()
+
+        first = registry.counter("starts_total", "Starts", engine="mpv")
+
+        assert_that(registry.counter("starts_total", "Starts", engine="mpv"), is_(first))
+
+    def test_renders_histogram_buckets_cumulatively(self) -> None:
+        registry = Registry()
+        histogram = registry.histogram("inference_seconds", "Inference", (0.01, 0.1))
+        histogram.observe(0.005)
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+
+        text = registry.render()
+
+        assert_that(text, contains_string("# TYPE inference_seconds histogram"))
+        assert_that(text, contains_string('inference_seconds_bucket{le="0.01"} 1\n'))
+        assert_that(text, contains_string('inference_seconds_bucket{le="0.1"} 2\n'))
+        assert_that(text, contains_string('inference_seconds_bucket{le="+Inf"} 3\n'))
+        assert_that(text, contains_string("inference_seconds_count 3\n"))
+
+    def test_renders_labels_and_function_gauges(self) -> None:
+        registry = Registry()
+        registry.counter("detections_total", "Detections", model="hey_jarvis").inc(2)
+        registry.gauge("overflows_total", "Overflows", lambda: 7, "counter")
+
+        text = registry.render()
+
+        assert_that(text, contains_string('detections_total{model="hey_jarvis"} 2\n'))
+        assert_that(text, contains_string("# TYPE overflows_total counter"))
+        assert_that(text, contains_string("overflows_total 7\n"))
+
+    def test_healthy_while_stages_keep_up(self) -> None:
+        registry = Registry()
+        registry.stage_load("wake").record(0.01, 0.08)
+
+        assert_that(registry.health(), is_(empty()))
+
+    def test_stage_behind_real_time_is_unhealthy(self) -> None:
+        registry = Registry()
+        registry.stage_load("whisper").record(3.0, 2.0)
+
+        assert_that(registry.health(), has_item(contains_string("whisper behind real time")))
+
+    def test_stage_load_expires_once_the_stage_is_quiet(self) -> None:
+        now = [0.0]
+        load = StageLoad("load", "Load", {"stage": "whisper"}, quiet_seconds=60.0,
+                         clock=lambda: now[0])
+        load.record(3.0, 2.0)
+
+        now[0] = 59.0
+        assert_that(load.value, is_(1.5))
+        now[0] = 61.0
+        assert_that(load.value, is_(0.0))
+        load.record(0.1, 1.0)
+        assert_that(load.value, is_(0.1))
+
+    def test_recent_losses_are_unhealthy(self) -> None:
+        registry = Registry()
+        overflows = [0]
+        registry.add_check("capture", LossCheck(lambda: overflows[0], "input overflows"))
+        assert_that(registry.health(), is_(empty()))
+
+        overflows[0] = 1
+
+        assert_that(registry.health(), equal_to(["capture: input overflows in the last 60s"]))
+
+
+class TestMetricsServer:
+    """Tests for MetricsServer."""
+
+    def test_serves_metrics_and_health(self) -> None:
+        registry = Registry()
+        registry.counter("transcripts_total", "Transcripts").inc()
+        server = MetricsServer(registry, port=0)
+        server.start()
+        try:
+            status, body = fetch(server, "/metrics")
+            assert_that(status, is_(200))
+            assert_that(body, contains_string("transcripts_total 1\n"))
+
+            assert_that(fetch(server, "/health"), equal_to((200, "ok\n")))
+
+            registry.stage_load("tts").record(2.0, 1.0)
+            status, body = fetch(server, "/health")
+            assert_that(status, is_(503))
+            assert_that(body, contains_string("tts behind real time"))
+        finally:
+            server.stop()
@@ -0,0 +1,37 @@
+"""Tests for trace_summary."""
+
+import json
+from pathlib import Path
+
+from hamcrest import assert_that, contains_string, equal_to, is_
+
+from much_miller.telemetry.trace_summary import load_durations, percentile, summarise
+
+
+class TestTraceSummary:
+    """Tests for the trace summary tool."""
+
+    def test_nearest_rank_percentile(self) -> None:
+        values = [float(v) for v in range(1, 101)]
+
+        assert_that(percentile(values, 50), is_(50.0))
+        assert_that(percentile(values, 95), is_(95.0))
+        assert_that(percentile(values, 99), is_(99.0))
+
+    def test_reads_rotated_files(self, tmp_path: Path) -> None:
+        path = tmp_path / "traces.jsonl"
+        path.write_text(json.dumps({"stage": "greet", "ms": 1.0}) + "\n")
+        (tmp_path / "traces.jsonl.1").write_text(json.dumps({"stage": "greet", "ms": 2.0}) + "\n")
+
+        durations = load_durations([path])
+
+        assert_that(sorted(durations["greet"]), equal_to([1.0, 2.0]))
+
+    def test_summary_has_a_row_per_stage(self, tmp_path: Path) -> None:
+        durations = {"wake": [5.0, 7.0], "radio.play": [40.0]}
+
+        table = summarise(durations)
+
+        assert_that(table, contains_string("wake"))
+        assert_that(table, contains_string("radio.play"))
+        assert_that(table, contains_string("p99 ms"))
@@ -0,0 +1,69 @@
+"""Tests for tracing."""
+
+import json
+import time
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from hamcrest import assert_that, equal_to, has_entries, has_length, is_, none
+
+from much_miller.telemetry import tracing
+
+
+@pytest.fixture
+def trace_path(tmp_path: Path) -> Iterator[Path]:
+    path = tmp_path / "traces.jsonl"
+    tracing.configure(path)
+    yield path
+    tracing.configure(None)
+
+
+def read_spans(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestTracing:
+    """Tests for the tracing module."""
+
+    def test_spans_without_trace_are_not_written(self, trace_path: Path) -> None:
+        with tracing.span("greet"):
+            pass
+        tracing.configure(None)
+
+        assert_that(trace_path.read_text(), equal_to(""))
+
+    def test_spans_share_the_trace_id(self, trace_path: Path) -> None:
+        trace = tracing.start_trace()
+        assert trace is not None
+
+        tracing.record("wake", time.perf_counter(), model="alexa")
+        with tracing.span("command") as span:
+            span["handled"] = True
+        tracing.configure(None)
+
+        spans = read_spans(trace_path)
+        assert_that(spans, has_length(2))
+        assert_that(spans[0], has_entries(trace=trace.trace_id, stage="wake", model="alexa"))
+        assert_that(spans[1], has_entries(trace=trace.trace_id, stage="command", handled=True))
+
+    def test_span_records_duration(self, trace_path: Path) -> None:
+        tracing.start_trace()
+
+        with tracing.span("greet"):
+            time.sleep(0.01)
+        tracing.configure(None)
+
+        assert_that(read_spans(trace_path)[0]["ms"] >= 10, is_(True))
+
+    def test_end_trace_clears_current_trace(self, trace_path: Path) -> None:
+        tracing.start_trace()
+
+        tracing.end_trace()
+
+        assert_that(tracing.current_trace(), is_(none()))
+
+    def test_disabled_tracing_starts_no_trace(self) -> None:
+        tracing.configure(None)
+
+        assert_that(tracing.start_trace(), is_(none()))
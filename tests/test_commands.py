@@ -0,0 +1,35 @@
+"""Tests for parse_command and Command."""
+
+from hamcrest import assert_that, equal_to, is_
+
+from much_miller.commands import OVER, PLAY, STOP, Command, parse_command
+
+
+class TestParseCommand:
+    """Tests for parse_command."""
+
+    def test_play_names_the_station(self) -> None:
+        command = parse_command("Play radio for.")
+
+        assert_that(command, equal_to(Command(PLAY, "bbc_radio_fourfm", "radio 4")))
+        assert_that(command.reply, is_("Playing radio 4"))
+        assert_that(command.key, is_("play bbc_radio_fourfm"))
+
+    def test_play_of_an_unknown_station_runs_nothing(self) -> None:
+        command = parse_command("play jazz")
+
+        assert_that(command.known, is_(False))
+        assert_that(command.reply, is_("I don't know that station"))
+        assert_that(command.key, is_(None))
+
+    def test_stop(self) -> None:
+        assert_that(parse_command("Stop the radio").action, is_(STOP))
+
+    def test_over_ends_the_conversation_despite_punctuation(self) -> None:
+        command = parse_command("Play radio 3, over.")
+
+        assert_that(command.action, is_(OVER))
+        assert_that(command.reply, is_(""))
+
+    def test_anything_else_is_not_a_command(self) -> None:
+        assert_that(parse_command("what time is it"), is_(None))
@@ -0,0 +1,71 @@
+"""Tests for CpuBudget and CPU pinning."""
+
+import os
+
+import pytest
+from hamcrest import assert_that, equal_to, is_, none
+
+from much_miller.cpu_budget import CpuBudget, EngineBudget, parse_cpus, pinned
+
+
+class TestParseCpus:
+    """Tests for parse_cpus."""
+
+    def test_parses_lists_and_ranges(self) -> None:
+        assert_that(parse_cpus("0,2-4"), equal_to(frozenset({0, 2, 3, 4})))
+
+    def test_rejects_an_empty_list(self) -> None:
+        with pytest.raises(ValueError):
+            parse_cpus(" , ")
+
+
+class TestCpuBudget:
+    """Tests for CpuBudget."""
+
+    def test_parses_threads_inter_threads_and_cpus(self) -> None:
+        budget = CpuBudget.parse("wake=@0, whisper=3@1-3, piper=2/1@1,3 mpv=@3")
+
+        assert_that(budget.get("wake"), equal_to(EngineBudget(cpus=frozenset({0}))))
+        assert_that(budget.get("whisper").threads, is_(3))
+        assert_that(
+            budget.get("piper"),
+            equal_to(EngineBudget(threads=2, inter_threads=1, cpus=frozenset({1, 3}))),
+        )
+        assert_that(budget.get("mpv").cpus, equal_to(frozenset({3})))
+
+    def test_unset_engines_keep_their_defaults(self) -> None:
+        budget = CpuBudget.parse("")
+
+        assert_that(budget.get("whisper"), equal_to(EngineBudget()))
+        assert_that(budget.describe(), is_("wake=default whisper=default piper=default mpv=default"))
+
+    def test_rejects_unknown_engines(self) -> None:
+        with pytest.raises(ValueError):
+            CpuBudget.parse("tts=2")
+
+    def test_keeps_other_engines_off_the_wake_word_cores(self) -> None:
+        budget = CpuBudget.parse("wake=@0 whisper=2@3").resolved(frozenset(range(4)))
+
+        assert_that(budget.get("piper").cpus, equal_to(frozenset({1, 2, 3})))
+        assert_that(budget.get("mpv").cpus, equal_to(frozenset({1, 2, 3})))
+        assert_that(budget.get("whisper").cpus, equal_to(frozenset({3})))
+
+    def test_nothing_is_reserved_without_wake_cpus(self) -> None:
+        budget = CpuBudget.parse("whisper=2").resolved(frozenset(range(4)))
+
+        assert_that(budget.get("piper").cpus, is_(none()))
+
+
+class TestPinned:
+    """Tests for pinned."""
+
+    @pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="No affinity support")
+    def test_pins_and_restores_the_calling_thread(self) -> None:
+        before = os.sched_getaffinity(0)
+        cpu = min(before)
+
+        with pinned(frozenset({cpu})):
+            inside = os.sched_getaffinity(0)
+
+        assert_that(inside, equal_to({cpu}))
+        assert_that(os.sched_getaffinity(0), equal_to(before))
@@ -0,0 +1,326 @@
+"""Tests for the asyncio Orchestrator."""
+
+import asyncio
+import threading
+import time
+from typing import Callable
+
+from hamcrest import assert_that, equal_to, greater_than, is_, less_than
+
+from much_miller.commands import command_key
+from much_miller.orchestrator import Orchestrator
+from much_miller.radio.adapters import FakeRadioPlayer, ThreadedRadioPlayer
+from much_miller.transcription.eager import EagerCommandDispatcher
+from much_miller.transcription.session import TranscriptionSession
+from much_miller.wake_word.adapters import (
+    FakeRecorder,
+    FakeSpeaker,
+    QueuedSpeaker,
+    SpeechQueue,
+    ThreadedRecorder,
+    ThreadedSpeaker,
+)
+from much_miller.wake_word.detector import Detection
+
+
+class ScriptedListener:
+    """Wake listener that fires after each scripted delay, then stops."""
+
+    def __init__(self, delays: list[float]) -> None:
+        self.delays = delays
+
+    def listen(self, stop: threading.Event | None = None) -> Detection | None:
+        if not self.delays:
+            return None
+        delay = self.delays.pop(0)
+        if stop is not None and stop.wait(delay):
+            return None
+        return Detection("hey_jarvis", 0.9, 0)
+
+
+class IdleListener:
+    """Wake listener that never fires until stopped."""
+
+    def listen(self, stop: threading.Event | None = None) -> Detection | None:
+        assert stop is not None
+        stop.wait()
+        return None
+
+
+class LingeringListener:
+    """Wake listener that fires once, then is slow to notice it was stopped."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.active = 0
+        self.most_active = 0
+        self.lock = threading.Lock()
+
+    def listen(self, stop: threading.Event | None = None) -> Detection | None:
+        assert stop is not None
+        with self.lock:
+            self.calls += 1
+            call = self.calls
+            self.active += 1
+            self.most_active = max(self.most_active, self.active)
+        try:
+            if call == 1:
+                return Detection("hey_jarvis", 0.9, 0)
+            if call == 2:
+                # The barge-in listen: a frame read and predict still in hand
+                stop.wait()
+                time.sleep(0.2)
+            return None
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+class ScriptedRecorder:
+    """Recorder that returns each scripted text after its delay."""
+
+    def __init__(self, script: list[tuple[float, str]]) -> None:
+        self.script = script
+        self.shut_down = threading.Event()
+
+    def text(self) -> str:
+        if not self.script:
+            self.shut_down.wait()
+            return ""
+        delay, text = self.script.pop(0)
+        self.shut_down.wait(delay)
+        return text
+
+    def set_microphone(self, microphone_on: bool = True) -> None:
+        pass
+
+    def clear_audio_queue(self) -> None:
+        pass
+
+    def shutdown(self) -> None:
+        self.shut_down.set()
+
+
+class EchoingRecorder(ScriptedRecorder):
+    """Scripted recorder that also hears what the speaker says, until cleared."""
+
+    def __init__(self, script: list[tuple[float, str]], speaker: FakeSpeaker) -> None:
+        super().__init__(script)
+        self.speaker = speaker
+        self.heard = 0
+
+    def text(self) -> str:
+        self.shut_down.wait(0.05)
+        if self.heard < len(self.speaker.replies):
+            self.heard += 1
+            return self.speaker.replies[self.heard - 1]
+        return super().text()
+
+    def clear_audio_queue(self) -> None:
+        self.heard = len(self.speaker.replies)
+
+
+class PartialsRecorder(ScriptedRecorder):
+    """Scripted recorder that reports two agreeing partials before each text."""
+
+    def __init__(self, script: list[tuple[float, str]]) -> None:
+        super().__init__(script)
+        self.on_partial: Callable[[str], None] = lambda text: None
+
+    def text(self) -> str:
+        if self.script:
+            for _ in range(2):
+                self.on_partial(self.script[0][1])
+        return super().text()
+
+
+class SlowRadioPlayer(FakeRadioPlayer):
+    """Fake radio that takes a while to start a station."""
+
+    def __init__(self, delay: float) -> None:
+        super().__init__()
+        self.delay = delay
+
+    def play(self, station_id: str, station_name: str) -> None:
+        time.sleep(self.delay)
+        super().play(station_id, station_name)
+
+
+def orchestrator(
+    script: list[tuple[float, str]],
+    listener: object | None = None,
+    speaker: FakeSpeaker | None = None,
+    radio: FakeRadioPlayer | None = None,
+) -> Orchestrator:
+    recorder = ScriptedRecorder(script)
+    return Orchestrator(
+        listener or IdleListener(),  # type: ignore[arg-type]
+        TranscriptionSession(lambda: recorder),
+        ThreadedRadioPlayer(radio or FakeRadioPlayer()),
+        ThreadedSpeaker(speaker or FakeSpeaker()),
+    )
+
+
+class TestOrchestrator:
+    """Tests for Orchestrator."""
+
+    async def test_transcribes_while_greeting_plays(self) -> None:
+        speaker = FakeSpeaker(delay=1.0)
+        radio = FakeRadioPlayer()
+        much = orchestrator([(0.05, "play radio 3"), (0.0, "over")], speaker=speaker, radio=radio)
+
+        started = time.perf_counter()
+        await much.turn(Detection("hey_jarvis", 0.9, 0))
+
+        # The greeting is cut short and only the reply plays out (1 s);
+        # greeting first, then transcribing, would take over 2 s
+        assert_that(time.perf_counter() - started, less_than(1.5))
+        assert_that(radio.play_calls, equal_to([("bbc_radio_three", "radio 3")]))
+        assert_that(speaker.interruptions, greater_than(0))
+        assert_that(much.barge_ins, greater_than(0))
+
+    async def test_reply_and_radio_change_overlap(self) -> None:
+        speaker = FakeSpeaker(delay=0.2)
+        radio = SlowRadioPlayer(delay=0.2)
+        much = orchestrator([], speaker=speaker, radio=radio)
+
+        started = time.perf_counter()
+        await much.handle_command("play radio 4")
+        await much.finish_speaking()
+
+        assert_that(time.perf_counter() - started, less_than(0.35))
+        assert_that(speaker.spoken_text, is_("Playing radio 4"))
+
+    async def test_reply_is_not_heard_as_a_command(self) -> None:
+        speaker = FakeSpeaker()
+        radio = FakeRadioPlayer()
+        recorder = EchoingRecorder([(0.0, "play radio 3"), (0.0, "over")], speaker)
+        much = Orchestrator(
+            IdleListener(),
+            TranscriptionSession(lambda: recorder),
+            ThreadedRadioPlayer(radio),
+            ThreadedSpeaker(speaker),
+        )
+
+        await asyncio.wait_for(much.turn(Detection("hey_jarvis", 0.9, 0)), timeout=2.0)
+
+        assert_that(speaker.replies, equal_to(["Hello Romilly", "Playing radio 3"]))
+        assert_that(radio.play_calls, equal_to([("bbc_radio_three", "radio 3")]))
+        assert_that(much.barge_ins, is_(0))
+
+    async def test_eager_command_is_not_run_again_from_final_text(self) -> None:
+        radio = FakeRadioPlayer()
+        recorder = PartialsRecorder([(0.0, "play radio 3"), (0.0, "over")])
+        dispatcher = EagerCommandDispatcher(command_key)
+        recorder.on_partial = dispatcher.on_partial
+        much = Orchestrator(
+            IdleListener(),
+            TranscriptionSession(lambda: recorder),
+            ThreadedRadioPlayer(radio),
+            ThreadedSpeaker(FakeSpeaker()),
+            dispatcher=dispatcher,
+        )
+
+        await asyncio.wait_for(much.turn(Detection("hey_jarvis", 0.9, 0)), timeout=2.0)
+
+        assert_that(dispatcher.eager_commands, is_(1))
+        assert_that(radio.play_calls, equal_to([("bbc_radio_three", "radio 3")]))
+
+    async def test_stop_command(self) -> None:
+        radio = FakeRadioPlayer()
+        radio.play("bbc_radio_three", "radio 3")
+        much = orchestrator([], radio=radio)
+
+        assert_that(await much.handle_command("stop"), is_(True))
+        assert_that(radio.is_playing(), is_(False))
+
+    async def test_unknown_text_is_not_a_command(self) -> None:
+        much = orchestrator([])
+
+        assert_that(await much.handle_command("what time is it"), is_(False))
+
+    async def test_wake_word_interrupts_speech(self) -> None:
+        speaker = FakeSpeaker(delay=1.0)
+        much = orchestrator(
+            [(0.3, "over")], listener=ScriptedListener([0.1]), speaker=speaker
+        )
+
+        started = time.perf_counter()
+        await much.turn(Detection("hey_jarvis", 0.9, 0))
+
+        assert_that(time.perf_counter() - started, less_than(0.6))
+        assert_that(much.barge_ins, is_(1))
+
+    async def test_run_returns_when_capture_stops(self) -> None:
+        much = orchestrator([(0.0, "over")], listener=ScriptedListener([0.0]))
+
+        await asyncio.wait_for(much.run(), timeout=2.0)
+
+    async def test_cancelled_barge_in_listen_finishes_before_the_next(self) -> None:
+        listener = LingeringListener()
+        much = orchestrator([(0.1, "over")], listener=listener)
+
+        await asyncio.wait_for(much.run(), timeout=2.0)
+
+        assert_that(listener.calls, is_(3))
+        assert_that(listener.most_active, is_(1))
+
+    async def test_cancelling_run_shuts_down_session(self) -> None:
+        recorder = ScriptedRecorder([])
+        much = Orchestrator(
+            ScriptedListener([0.0]),
+            TranscriptionSession(lambda: recorder),
+            ThreadedRadioPlayer(FakeRadioPlayer()),
+            None,
+        )
+        task = asyncio.create_task(much.run())
+        await asyncio.sleep(0.1)
+
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        assert_that(recorder.shut_down.is_set(), is_(True))
+
+
+class TestThreadedAdapters:
+    """Tests for the thread-backed async adapters."""
+
+    async def test_cancelled_speech_stops_before_say_returns(self) -> None:
+        speaker = FakeSpeaker(delay=5.0)
+        task = asyncio.create_task(ThreadedSpeaker(speaker).say("Hello Romilly"))
+        await asyncio.sleep(0.05)
+
+        started = time.perf_counter()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        assert_that(time.perf_counter() - started, less_than(0.5))
+        assert_that(task.cancelled(), is_(True))
+
+    async def test_queued_speech_waits_for_the_reply(self) -> None:
+        speaker = FakeSpeaker(delay=0.1)
+        queue = SpeechQueue(speaker, warm_up=False)
+
+        await QueuedSpeaker(queue).say("Playing radio 3")
+        queue.close()
+
+        assert_that(speaker.completed, equal_to(["Playing radio 3"]))
+
+    async def test_cancelled_queued_speech_stops_before_say_returns(self) -> None:
+        speaker = FakeSpeaker(delay=5.0)
+        queue = SpeechQueue(speaker, warm_up=False)
+        task = asyncio.create_task(QueuedSpeaker(queue).say("Hello Romilly"))
+        await asyncio.sleep(0.05)
+
+        started = time.perf_counter()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        queue.close()
+
+        assert_that(time.perf_counter() - started, less_than(0.5))
+        assert_that(speaker.completed, equal_to([]))
+
+    async def test_recorder_runs_in_thread(self) -> None:
+        recorder = ThreadedRecorder(FakeRecorder(b"RIFF"))
+
+        assert_that(await recorder.record_chunk(1.0), is_(b"RIFF"))
@@ -0,0 +1,98 @@
+"""Tests for PhraseMatcher and station parsing."""
+
+from hamcrest import assert_that, contains_inanyorder, equal_to, is_, none
+
+from much_miller.bench.matcher import catalogue, linear_scan
+from much_miller.commands import parse_station
+from much_miller.phrase_matcher import PhraseMatcher, edit_distance
+
+STATIONS = {
+    "radio 4": "r4",
+    "radio four": "r4",
+    "news": "news",
+    "bbc news": "bbc_news",
+    "world service": "ws",
+}
+
+
+class TestPhraseMatcher:
+    """Tests for PhraseMatcher."""
+
+    def test_finds_phrase_in_text(self) -> None:
+        matcher = PhraseMatcher(STATIONS)
+
+        match = matcher.match("play world service please")
+
+        assert_that(match.value, is_("ws"))
+        assert_that((match.start, match.end), equal_to((1, 3)))
+
+    def test_returns_none_without_a_phrase(self) -> None:
+        matcher = PhraseMatcher(STATIONS)
+
+        assert_that(matcher.match("play some jazz"), is_(none()))
+
+    def test_longest_match_wins(self) -> None:
+        matcher = PhraseMatcher(STATIONS)
+
+        assert_that(matcher.match("play bbc news").value, is_("bbc_news"))
+
+    def test_finds_overlapping_phrases(self) -> None:
+        matcher = PhraseMatcher(STATIONS)
+
+        values = [match.value for match in matcher.find_all("play bbc news")]
+
+        assert_that(values, contains_inanyorder("bbc_news", "news"))
+
+    def test_matches_whole_words_only(self) -> None:
+        matcher = PhraseMatcher(STATIONS)
+
+        assert_that(matcher.match("play newsround"), is_(none()))
+
+    def test_number_homophones_match_digits(self) -> None:
+        matcher = PhraseMatcher(STATIONS)
+
+        assert_that(matcher.match("play radio for").value, is_("r4"))
+        assert_that(matcher.match("play radio four").phrase, is_("radio 4"))
+
+    def test_tolerates_one_edit_in_a_word(self) -> None:
+        matcher = PhraseMatcher(STATIONS)
+
+        assert_that(matcher.match("play the world servise").value, is_("ws"))
+
+    def test_does_not_guess_between_equally_close_words(self) -> None:
+        matcher = PhraseMatcher({"bark": 1, "park": 2})
+
+        assert_that(matcher.match("dark"), is_(none()))
+
+    def test_keeps_first_of_phrases_that_normalise_alike(self) -> None:
+        matcher = PhraseMatcher(STATIONS)
+
+        assert_that(matcher.phrases(), equal_to(["radio 4", "news", "bbc news", "world service"]))
+
+    def test_agrees_with_linear_scan_on_exact_names(self) -> None:
+        stations = catalogue(500)
+        matcher = PhraseMatcher(stations)
+
+        for name, station_id in list(stations.items())[:100]:
+            text = f"play {name}"
+            assert_that(matcher.match(text).value, is_(linear_scan({name: station_id}, text)))
+
+
+class TestEditDistance:
+    """Tests for edit_distance."""
+
+    def test_counts_edits(self) -> None:
+        assert_that(edit_distance("radeo", "radio", 2), is_(1))
+
+    def test_stops_past_limit(self) -> None:
+        assert_that(edit_distance("podcast", "radio", 1), is_(2))
+
+
+class TestParseStation:
+    """Tests for parse_station."""
+
+    def test_misheard_radio_four(self) -> None:
+        assert_that(parse_station("play radio for"), equal_to(("bbc_radio_fourfm", "radio 4")))
+
+    def test_prefers_bbc_news_to_news(self) -> None:
+        assert_that(parse_station("play bbc news"), equal_to(("bbc_sounds_news", "bbc news")))
@@ -0,0 +1,41 @@
+"""Tests for StartupProfiler."""
+
+from hamcrest import assert_that, contains_string, empty, greater_than, is_
+
+from much_miller.startup_profile import StartupProfiler, process_age, resident_memory_bytes
+
+
+class TestStartupProfiler:
+    """Tests for StartupProfiler."""
+
+    def test_records_named_phases(self) -> None:
+        profiler = StartupProfiler()
+
+        with profiler.phase("wake word models"):
+            pass
+        profiler.mark("ready")
+
+        assert_that([p.name for p in profiler.phases], is_(["wake word models", "ready"]))
+        assert_that(profiler.phases[1].started, is_(0.0))
+
+    def test_report_lists_each_phase(self) -> None:
+        profiler = StartupProfiler()
+
+        with profiler.phase("whisper"):
+            pass
+
+        assert_that(profiler.report(), contains_string("whisper"))
+        assert_that(profiler.report(), contains_string("RSS MB"))
+
+    def test_disabled_profiler_records_nothing(self) -> None:
+        profiler = StartupProfiler(enabled=False)
+
+        with profiler.phase("whisper"):
+            pass
+        profiler.mark("ready")
+
+        assert_that(profiler.phases, is_(empty()))
+
+    def test_process_age_and_memory_are_positive(self) -> None:
+        assert_that(process_age(), greater_than(0.0))
+        assert_that(resident_memory_bytes(), greater_than(0))
@@ -0,0 +1 @@
+"""Tests for transcription module."""
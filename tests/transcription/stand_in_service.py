@@ -0,0 +1,78 @@
+"""Local stand-in for the transcription-service HTTP API."""
+
+import io
+import json
+import threading
+import time
+import wave
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StandInService:
+    """Serves /api/transcribe and /health on localhost for tests.
+
+    Replies with a fixed text, after an optional delay, and records the
+    WAV audio it received and how many TCP connections were made.
+    """
+
+    def __init__(self, text: str = "play radio 3", delay: float = 0.0) -> None:
+        self.text = text
+        self.delay = delay
+        self.status = 200
+        self.drop_idle_connections = False
+        self.received: list[tuple[int, int]] = []  # (sample_rate, frames)
+        self.connections = 0
+        service = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self) -> None:
+                service.connections += 1
+                super().setup()
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                self._reply(200 if self.path == "/health" else 404, {"status": "ok"})
+
+            def do_POST(self) -> None:
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                with wave.open(io.BytesIO(body), "rb") as wav_file:
+                    service.received.append((wav_file.getframerate(), wav_file.getnframes()))
+                time.sleep(service.delay)
+                self._reply(service.status, {"text": service.text, "language": "en"})
+
+            def _reply(self, status: int, payload: dict[str, str]) -> None:
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                # Like an idle timeout: close without saying so in the reply
+                self.close_connection = service.drop_idle_connections
+
+        class Server(ThreadingHTTPServer):
+            def handle_error(self, request: object, client_address: object) -> None:
+                pass  # clients that time out leave broken pipes behind
+
+        self._server = Server(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StandInService":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
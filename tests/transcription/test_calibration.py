@@ -0,0 +1,116 @@
+"""Tests for Whisper calibration."""
+
+from pathlib import Path
+
+import numpy as np
+from hamcrest import assert_that, close_to, contains_exactly, is_, none
+
+from much_miller.audio.wav import encode_wav
+from much_miller.transcription.adapters import FakeTranscriber
+from much_miller.transcription.calibration import (
+    CalibrationCache,
+    CalibrationResult,
+    Clip,
+    WhisperConfig,
+    calibrate,
+    choose,
+    recorded_clips,
+    word_error_rate,
+)
+from much_miller.transcription.ports import TranscriberPort
+
+
+def result(model: str, compute: str, rtf: float, wer: float) -> CalibrationResult:
+    return CalibrationResult(model, compute, rtf=rtf, wer=wer, load_seconds=1.0)
+
+
+class TestWordErrorRate:
+    """Tests for word_error_rate."""
+
+    def test_ignores_case_punctuation_and_number_words(self) -> None:
+        assert_that(word_error_rate("Play radio four.", "play Radio 4"), is_(0.0))
+
+    def test_counts_substitutions_and_deletions(self) -> None:
+        assert_that(word_error_rate("stop the radio now", "stop radio no"), is_(0.5))
+
+
+class TestChoose:
+    """Tests for choose."""
+
+    def test_picks_the_most_accurate_that_is_fast_enough(self) -> None:
+        results = [
+            result("medium.en", "int8", rtf=1.2, wer=0.02),
+            result("small.en", "int8", rtf=0.4, wer=0.05),
+            result("base.en", "int8", rtf=0.1, wer=0.12),
+        ]
+
+        assert_that(choose(results, 0.5).config, is_(WhisperConfig("small.en", "int8")))
+
+    def test_ties_go_to_the_larger_model(self) -> None:
+        results = [
+            result("base.en", "int8", rtf=0.1, wer=0.0),
+            result("small.en", "int8", rtf=0.3, wer=0.0),
+        ]
+
+        assert_that(choose(results, 0.5).model_size, is_("small.en"))
+
+    def test_falls_back_to_the_fastest(self) -> None:
+        results = [result("small.en", "int8", 1.5, 0.0), result("tiny.en", "int8", 0.9, 0.2)]
+
+        assert_that(choose(results, 0.5).model_size, is_("tiny.en"))
+
+    def test_nothing_to_choose_from(self) -> None:
+        assert_that(choose([], 0.5), is_(none()))
+
+
+class TestCalibrationCache:
+    """Tests for CalibrationCache."""
+
+    def test_results_are_kept_per_host(self, tmp_path: Path) -> None:
+        cache = CalibrationCache(tmp_path / "calibration.json")
+        cache.save("trend", [result("small.en", "int8", 0.4, 0.05)])
+        cache.save("xavier", [result("base.en", "int8", 0.2, 0.1)])
+
+        loaded = cache.load("trend")
+
+        assert loaded is not None
+        assert_that([r.model_size for r in loaded], contains_exactly("small.en"))
+        assert_that(cache.load("pi5"), is_(none()))
+
+
+class TestCalibrate:
+    """Tests for calibrate."""
+
+    def test_measures_accuracy_and_skips_larger_models_once_too_slow(self) -> None:
+        clips = [Clip(np.zeros(8000, dtype=np.int16), "play radio three")]
+        created: list[str] = []
+
+        def create(config: WhisperConfig) -> TranscriberPort:
+            created.append(config.model_size)
+            delay = {"tiny.en": 0.0, "base.en": 0.2}.get(config.model_size, 0.0)
+            return FakeTranscriber("play radio 3", delay=delay)
+
+        results = calibrate(
+            clips,
+            create,
+            [WhisperConfig(size, "int8") for size in ("small.en", "base.en", "tiny.en")],
+            give_up_rtf=0.1,
+        )
+
+        assert_that(created, contains_exactly("tiny.en", "base.en"))
+        assert_that(results[0].wer, is_(0.0))
+        assert_that(results[1].rtf, close_to(0.4, 0.1))
+
+
+class TestRecordedClips:
+    """Tests for recorded_clips."""
+
+    def test_reads_wavs_with_transcripts(self, tmp_path: Path) -> None:
+        (tmp_path / "stop.wav").write_bytes(encode_wav(np.zeros(4800, np.int16), 48000))
+        (tmp_path / "stop.txt").write_text("Stop.\n")
+        (tmp_path / "untranscribed.wav").write_bytes(encode_wav(np.zeros(10, np.int16), 16000))
+
+        clips = recorded_clips(tmp_path)
+
+        assert_that([clip.text for clip in clips], contains_exactly("Stop."))
+        assert_that(clips[0].seconds, close_to(0.1, 0.001))
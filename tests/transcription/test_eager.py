@@ -0,0 +1,227 @@
+"""Tests for EagerCommandDispatcher."""
+
+import threading
+import time
+
+from hamcrest import assert_that, equal_to, is_, less_than
+
+from much_miller.commands import command_key
+from much_miller.main import transcribe_until_over
+from much_miller.radio.adapters import FakeRadioPlayer
+from much_miller.transcription.eager import EagerCommandDispatcher
+from much_miller.transcription.session import TranscriptionSession
+from much_miller.wake_word.adapters import FakeSpeaker, SpeechQueue
+
+
+class PartialRecorder:
+    """Recorder stand-in that reports partials before each final text."""
+
+    def __init__(self, utterances: list[tuple[list[str], str]]) -> None:
+        self.utterances = utterances
+        self.on_partial = lambda text: None
+
+    def text(self) -> str:
+        partials, final = self.utterances.pop(0)
+        for partial in partials:
+            self.on_partial(partial)
+        return final
+
+    def set_microphone(self, microphone_on: bool = True) -> None:
+        pass
+
+    def clear_audio_queue(self) -> None:
+        self.on_clear()
+
+    def on_clear(self) -> None:
+        pass
+
+    def shutdown(self) -> None:
+        pass
+
+
+class TestEagerCommandDispatcher:
+    """Tests for EagerCommandDispatcher."""
+
+    def setup_method(self) -> None:
+        self.handled: list[str] = []
+        self.dispatcher = EagerCommandDispatcher(command_key, stable_updates=2)
+        self.dispatcher.begin(self.handled.append)
+
+    def test_runs_command_once_partials_agree(self) -> None:
+        self.dispatcher.on_partial("play radio")
+        self.dispatcher.on_partial("play radio 3")
+        assert_that(self.handled, equal_to([]))
+
+        self.dispatcher.on_partial("play radio three")
+
+        assert_that(self.handled, equal_to(["play radio three"]))
+
+    def test_runs_at_most_one_command_per_utterance(self) -> None:
+        for partial in ["stop", "stop", "stop the", "stop the radio"]:
+            self.dispatcher.on_partial(partial)
+
+        assert_that(self.handled, equal_to(["stop"]))
+
+    def test_final_text_matching_eager_command_is_not_handled_again(self) -> None:
+        self.dispatcher.on_partial("play radio 4")
+        self.dispatcher.on_partial("play radio 4")
+
+        assert_that(self.dispatcher.claim_final("Play radio four."), is_(False))
+
+    def test_final_text_for_a_different_command_is_handled(self) -> None:
+        self.dispatcher.on_partial("play radio 3")
+        self.dispatcher.on_partial("play radio 3")
+
+        assert_that(self.dispatcher.claim_final("play radio 4"), is_(True))
+        assert_that(self.dispatcher.corrections, is_(1))
+
+    def test_final_text_without_eager_command_is_handled(self) -> None:
+        self.dispatcher.on_partial("play radio 3")
+
+        assert_that(self.dispatcher.claim_final("play radio 3"), is_(True))
+        assert_that(self.handled, equal_to([]))
+
+    def test_claim_final_starts_the_next_utterance(self) -> None:
+        self.dispatcher.on_partial("stop")
+        self.dispatcher.on_partial("stop")
+        self.dispatcher.claim_final("stop")
+
+        self.dispatcher.on_partial("play news")
+        self.dispatcher.on_partial("play news")
+
+        assert_that(self.handled, equal_to(["stop", "play news"]))
+
+    def test_ignores_partials_outside_a_cycle(self) -> None:
+        self.dispatcher.end()
+
+        self.dispatcher.on_partial("stop")
+        self.dispatcher.on_partial("stop")
+
+        assert_that(self.handled, equal_to([]))
+
+    def test_final_text_is_not_held_up_by_a_running_command(self) -> None:
+        release = threading.Event()
+        dispatcher = EagerCommandDispatcher(command_key, stable_updates=2)
+        dispatcher.begin(lambda text: release.wait(5.0))
+        partials = threading.Thread(
+            target=lambda: [dispatcher.on_partial("stop") for _ in range(2)]
+        )
+        partials.start()
+        time.sleep(0.05)
+
+        started = time.perf_counter()
+        needs_handling = dispatcher.claim_final("stop")
+        dispatcher.end()
+        elapsed = time.perf_counter() - started
+        release.set()
+        partials.join()
+
+        assert_that(needs_handling, is_(False))
+        assert_that(elapsed, less_than(0.5))
+
+    def test_correction_waits_for_the_running_command(self) -> None:
+        release = threading.Event()
+        finished: list[str] = []
+
+        def handle(text: str) -> None:
+            release.wait(5.0)
+            finished.append(text)
+
+        dispatcher = EagerCommandDispatcher(command_key, stable_updates=2)
+        dispatcher.begin(handle)
+        partials = threading.Thread(
+            target=lambda: [dispatcher.on_partial("play radio 3") for _ in range(2)]
+        )
+        partials.start()
+        time.sleep(0.05)
+        threading.Timer(0.1, release.set).start()
+
+        needs_handling = dispatcher.claim_final("play radio 4")
+        finished_first = list(finished)
+        partials.join()
+
+        assert_that(needs_handling, is_(True))
+        assert_that(finished_first, equal_to(["play radio 3"]))
+
+
+class TestTranscribeUntilOverWithEagerCommands:
+    """Tests for transcribe_until_over with a dispatcher."""
+
+    def test_command_runs_from_partials_and_not_again_from_final_text(self) -> None:
+        dispatcher = EagerCommandDispatcher(command_key)
+        recorder = PartialRecorder([
+            (["play", "play radio 3", "play radio 3"], "Play radio 3."),
+            ([], "over"),
+        ])
+        recorder.on_partial = dispatcher.on_partial
+        radio = FakeRadioPlayer()
+
+        transcribe_until_over(TranscriptionSession(lambda: recorder), radio, None,
+                              dispatcher=dispatcher)
+
+        assert_that(radio.play_calls, equal_to([("bbc_radio_three", "radio 3")]))
+
+    def test_misheard_partial_is_corrected_by_final_text(self) -> None:
+        dispatcher = EagerCommandDispatcher(command_key)
+        recorder = PartialRecorder([
+            (["play radio 3", "play radio 3"], "play radio 4"),
+            ([], "over"),
+        ])
+        recorder.on_partial = dispatcher.on_partial
+        radio = FakeRadioPlayer()
+
+        transcribe_until_over(TranscriptionSession(lambda: recorder), radio, None,
+                              dispatcher=dispatcher)
+
+        assert_that([call[0] for call in radio.play_calls],
+                    equal_to(["bbc_radio_three", "bbc_radio_fourfm"]))
+
+
+class TestTranscribeUntilOverWithSpeechQueue:
+    """Tests for transcribe_until_over with queued replies."""
+
+    def test_reply_finishes_and_is_dropped_before_listening_again(self) -> None:
+        speaker = FakeSpeaker(delay=0.1)
+        speech = SpeechQueue(speaker, warm_up=False)
+        recorder = PartialRecorder([([], "play radio 4"), ([], "over")])
+        heard_when_cleared: list[list[str]] = []
+        recorder.on_clear = lambda: heard_when_cleared.append(list(speaker.completed))
+        radio = FakeRadioPlayer()
+
+        transcribe_until_over(TranscriptionSession(lambda: recorder), radio, speech)
+        speech.close()
+
+        # Cleared on resume, after the reply and on pause
+        assert_that(heard_when_cleared, equal_to([[], ["Playing radio 4"], ["Playing radio 4"]]))
+
+    def test_over_cuts_a_reply_short(self) -> None:
+        speaker = FakeSpeaker(delay=5.0)
+        speech = SpeechQueue(speaker, warm_up=False)
+        dispatcher = EagerCommandDispatcher(command_key)
+        recorder = PartialRecorder([(["play radio 4", "play radio 4"], "play radio 4 over")])
+        recorder.on_partial = dispatcher.on_partial
+        radio = FakeRadioPlayer()
+
+        started = time.perf_counter()
+        transcribe_until_over(TranscriptionSession(lambda: recorder), radio, speech,
+                              dispatcher=dispatcher)
+        speech.wait(1.0)
+        elapsed = time.perf_counter() - started
+        speech.close()
+
+        assert_that(radio.play_calls, equal_to([("bbc_radio_fourfm", "radio 4")]))
+        assert_that(speaker.completed, equal_to([]))
+        assert_that(elapsed, less_than(1.0))
+
+
+class TestCommandKey:
+    """Tests for command_key."""
+
+    def test_play_known_station(self) -> None:
+        assert_that(command_key("Play BBC news"), is_("play bbc_sounds_news"))
+
+    def test_unknown_station_is_not_eager(self) -> None:
+        assert_that(command_key("play jazz"), is_(None))
+
+    def test_stop(self) -> None:
+        assert_that(command_key("stop the radio"), is_("stop"))
@@ -0,0 +1,45 @@
+"""Tests for Endpointer."""
+
+import numpy as np
+from hamcrest import assert_that, equal_to, is_, none
+
+from much_miller.transcription.endpointer import Endpointer
+
+FRAME = 1600  # 0.1 s at 16 kHz
+
+
+def frames(level: int, count: int) -> list[np.ndarray]:
+    return [np.full(FRAME, level, dtype=np.int16) for _ in range(count)]
+
+
+def push_all(endpointer: Endpointer, stream: list[np.ndarray]) -> list[np.ndarray]:
+    return [u for frame in stream if (u := endpointer.push(frame)) is not None]
+
+
+class TestEndpointer:
+    """Tests for Endpointer."""
+
+    def test_cuts_each_utterance_with_its_lead(self) -> None:
+        endpointer = Endpointer(silence_seconds=0.3, lead_seconds=0.2)
+        stream = frames(0, 5) + frames(3000, 4) + frames(0, 6) + frames(3000, 2) + frames(0, 3)
+
+        utterances = push_all(endpointer, stream)
+
+        # 0.2 s lead + speech + 0.3 s silence each time
+        assert_that([len(u) for u in utterances], equal_to([9 * FRAME, 7 * FRAME]))
+
+    def test_long_speech_is_cut_at_max_seconds(self) -> None:
+        endpointer = Endpointer(lead_seconds=0.0, max_seconds=1.0)
+
+        utterances = push_all(endpointer, frames(3000, 25))
+
+        assert_that([len(u) for u in utterances], equal_to([10 * FRAME, 10 * FRAME]))
+        assert_that(endpointer.in_utterance, is_(True))
+
+    def test_reset_drops_the_utterance_in_progress(self) -> None:
+        endpointer = Endpointer(silence_seconds=0.3)
+        push_all(endpointer, frames(3000, 3))
+        endpointer.reset()
+
+        assert_that(endpointer.in_utterance, is_(False))
+        assert_that(endpointer.push(frames(0, 1)[0]), is_(none()))
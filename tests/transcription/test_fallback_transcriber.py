@@ -0,0 +1,93 @@
+"""Tests for FallbackTranscriber."""
+
+import time
+
+import numpy as np
+from hamcrest import assert_that, close_to, is_
+
+from much_miller.transcription.adapters import (
+    FakeTranscriber,
+    FallbackTranscriber,
+    HttpTranscriber,
+)
+
+from tests.transcription.stand_in_service import StandInService
+
+ONE_SECOND = np.zeros(16000, dtype=np.int16)
+
+
+class TestFallbackTranscriber:
+    """Tests for FallbackTranscriber."""
+
+    def setup_method(self) -> None:
+        self.remote = FakeTranscriber("remote")
+        self.local = FakeTranscriber("local")
+
+    def test_uses_remote_when_healthy(self) -> None:
+        router = FallbackTranscriber(self.remote, self.local)
+
+        assert_that(router.transcribe(ONE_SECOND), is_("remote"))
+        assert_that(len(self.local.calls), is_(0))
+
+    def test_falls_back_when_remote_fails(self) -> None:
+        self.remote.failing = True
+        router = FallbackTranscriber(self.remote, self.local)
+
+        assert_that(router.transcribe(ONE_SECOND), is_("local"))
+        assert_that(router.remote_failures, is_(1))
+
+    def test_avoids_failed_remote_until_cooldown(self) -> None:
+        self.remote.failing = True
+        router = FallbackTranscriber(self.remote, self.local, cooldown=60.0)
+        router.transcribe(ONE_SECOND)
+        self.remote.failing = False
+
+        assert_that(router.transcribe(ONE_SECOND), is_("local"))
+        assert_that(len(self.remote.calls), is_(1))
+
+    def test_probes_remote_after_cooldown(self) -> None:
+        self.remote.failing = True
+        router = FallbackTranscriber(self.remote, self.local, cooldown=0.05)
+        router.transcribe(ONE_SECOND)
+        self.remote.failing = False
+        time.sleep(0.06)
+
+        assert_that(router.transcribe(ONE_SECOND), is_("remote"))
+
+    def test_avoids_slow_remote(self) -> None:
+        self.remote.delay = 0.1
+        router = FallbackTranscriber(self.remote, self.local, slow_rtf=0.05, cooldown=60.0)
+
+        assert_that(router.transcribe(ONE_SECOND), is_("remote"))
+        assert_that(router.remote_rtf, close_to(0.1, 0.05))
+        assert_that(router.prefers_remote(), is_(False))
+        assert_that(router.transcribe(ONE_SECOND), is_("local"))
+
+    def test_avoids_remote_slower_than_local(self) -> None:
+        self.remote.failing = True
+        router = FallbackTranscriber(self.remote, self.local, cooldown=0.0)
+        router.transcribe(ONE_SECOND)  # measures local
+        self.remote.failing = False
+        self.remote.delay = 0.05
+
+        router.transcribe(ONE_SECOND)
+
+        assert_that(router.prefers_remote(), is_(True))  # cooldown 0 probes again
+        assert_that(router.remote_rtf > router.local_rtf, is_(True))
+
+    def test_falls_back_when_service_is_missing(self) -> None:
+        service = StandInService().start()
+        url = service.url
+        service.stop()
+        router = FallbackTranscriber(HttpTranscriber(url, timeout=0.5), self.local)
+
+        assert_that(router.transcribe(ONE_SECOND), is_("local"))
+
+    def test_uses_stand_in_service(self) -> None:
+        service = StandInService(text="stop").start()
+        try:
+            router = FallbackTranscriber(HttpTranscriber(service.url), self.local)
+
+            assert_that(router.transcribe(ONE_SECOND), is_("stop"))
+        finally:
+            service.stop()
@@ -0,0 +1,91 @@
+"""Tests for HttpTranscriber against a local stand-in service."""
+
+import socket
+from typing import Iterator
+
+import numpy as np
+import pytest
+from hamcrest import assert_that, equal_to, is_
+
+from much_miller.transcription.adapters import HttpTranscriber
+from much_miller.transcription.ports import TranscriptionError
+
+from tests.transcription.stand_in_service import StandInService
+
+
+@pytest.fixture
+def service() -> Iterator[StandInService]:
+    service = StandInService().start()
+    yield service
+    service.stop()
+
+
+def unused_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+class TestHttpTranscriber:
+    """Tests for HttpTranscriber."""
+
+    def test_returns_text_from_service(self, service: StandInService) -> None:
+        transcriber = HttpTranscriber(service.url)
+
+        text = transcriber.transcribe(np.zeros(16000, dtype=np.int16))
+
+        assert_that(text, is_("play radio 3"))
+
+    def test_sends_whole_utterance_as_wav(self, service: StandInService) -> None:
+        transcriber = HttpTranscriber(service.url)
+
+        transcriber.transcribe(np.zeros(100_000, dtype=np.int16), sample_rate=16000)
+
+        assert_that(service.received, equal_to([(16000, 100_000)]))
+
+    def test_reuses_one_connection(self, service: StandInService) -> None:
+        transcriber = HttpTranscriber(service.url)
+
+        for _ in range(3):
+            transcriber.transcribe(np.zeros(1600, dtype=np.int16))
+
+        assert_that(service.connections, is_(1))
+        assert_that(transcriber.connections_opened, is_(1))
+
+    def test_retries_when_pooled_connection_was_closed(self, service: StandInService) -> None:
+        service.drop_idle_connections = True
+        transcriber = HttpTranscriber(service.url)
+        transcriber.transcribe(np.zeros(1600, dtype=np.int16))
+
+        text = transcriber.transcribe(np.zeros(1600, dtype=np.int16))
+
+        assert_that(text, is_("play radio 3"))
+        assert_that(transcriber.connections_opened, is_(2))
+
+    def test_error_status_raises(self, service: StandInService) -> None:
+        service.status = 500
+        transcriber = HttpTranscriber(service.url)
+
+        with pytest.raises(TranscriptionError):
+            transcriber.transcribe(np.zeros(1600, dtype=np.int16))
+
+    def test_missing_service_raises(self) -> None:
+        transcriber = HttpTranscriber(f"http://127.0.0.1:{unused_port()}")
+
+        with pytest.raises(TranscriptionError):
+            transcriber.transcribe(np.zeros(1600, dtype=np.int16))
+
+    def test_slow_service_times_out(self, service: StandInService) -> None:
+        service.delay = 0.5
+        transcriber = HttpTranscriber(service.url, timeout=0.1)
+
+        with pytest.raises(TranscriptionError):
+            transcriber.transcribe(np.zeros(1600, dtype=np.int16))
+
+    def test_health_check(self, service: StandInService) -> None:
+        assert_that(HttpTranscriber(service.url).healthy(), is_(True))
+        assert_that(HttpTranscriber(f"http://127.0.0.1:{unused_port()}").healthy(), is_(False))
+
+    def test_rejects_non_http_url(self) -> None:
+        with pytest.raises(ValueError):
+            HttpTranscriber("polwarth:8000")
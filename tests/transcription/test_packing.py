@@ -0,0 +1,55 @@
+"""Tests for packing utterances into one Whisper window."""
+
+import numpy as np
+from hamcrest import assert_that, equal_to
+
+from much_miller.transcription.packing import Placement, pack, split_words
+
+RATE = 16000
+
+
+def seconds(length: float, level: int = 1000) -> np.ndarray:
+    return np.full(int(length * RATE), level, dtype=np.int16)
+
+
+class TestPack:
+    """Tests for pack()."""
+
+    def test_lays_utterances_end_to_end_with_gaps(self) -> None:
+        packs = pack([seconds(2), seconds(1.5)], RATE, gap_seconds=1.0)
+
+        assert_that(len(packs), equal_to(1))
+        assert_that(len(packs[0].audio), equal_to(int(4.5 * RATE)))
+        assert_that(
+            packs[0].placements, equal_to([Placement(0, 0.0, 2.0), Placement(1, 3.0, 4.5)])
+        )
+        assert_that(int(packs[0].audio[int(2.5 * RATE)]), equal_to(0))
+
+    def test_starts_a_new_pack_when_the_window_is_full(self) -> None:
+        packs = pack([seconds(10), seconds(10), seconds(10), seconds(40)], RATE, window_seconds=28)
+
+        assert_that(
+            [[p.index for p in each.placements] for each in packs], equal_to([[0, 1], [2], [3]])
+        )
+
+
+class TestSplitWords:
+    """Tests for split_words()."""
+
+    def test_gives_each_word_to_its_utterance(self) -> None:
+        placements = [Placement(0, 0.0, 2.0), Placement(1, 3.0, 4.5)]
+        words = [
+            (0.1, 0.5, " Play"),
+            (0.5, 1.0, " radio"),
+            (1.8, 2.3, " four."),
+            (3.1, 3.6, " Stop."),
+        ]
+
+        assert_that(
+            split_words(words, placements), equal_to({0: "Play radio four.", 1: "Stop."})
+        )
+
+    def test_utterances_without_words_are_empty(self) -> None:
+        placements = [Placement(0, 0.0, 2.0), Placement(1, 3.0, 4.5)]
+
+        assert_that(split_words([(3.2, 3.5, " Over")], placements), equal_to({0: "", 1: "Over"}))
@@ -0,0 +1,190 @@
+"""Tests for TranscriptionSession."""
+
+import time
+
+import numpy as np
+from hamcrest import (
+    assert_that,
+    equal_to,
+    greater_than,
+    greater_than_or_equal_to,
+    is_,
+    none,
+)
+
+from much_miller.audio.adapters.array_frame_source import ArrayFrameSource
+from much_miller.audio.capture_hub import CaptureHub
+from much_miller.telemetry import metrics
+from much_miller.transcription.session import TranscriptionSession
+
+
+class StubRecorder:
+    """Recorder stand-in that records how it was driven."""
+
+    def __init__(self, texts: list[str] | None = None) -> None:
+        self.texts = texts if texts is not None else ["hello"]
+        self.microphone_on = True
+        self.clears = 0
+        self.shut_down = False
+
+    def text(self) -> str:
+        return self.texts.pop(0) if self.texts else ""
+
+    def set_microphone(self, microphone_on: bool = True) -> None:
+        self.microphone_on = microphone_on
+
+    def clear_audio_queue(self) -> None:
+        self.clears += 1
+
+    def shutdown(self) -> None:
+        self.shut_down = True
+
+
+class RecorderFactory:
+    """Builds StubRecorders and remembers them."""
+
+    def __init__(self) -> None:
+        self.built: list[StubRecorder] = []
+
+    def __call__(self) -> StubRecorder:
+        recorder = StubRecorder(["one", "two", "three"])
+        self.built.append(recorder)
+        return recorder
+
+
+class TestTranscriptionSession:
+    """Tests for TranscriptionSession."""
+
+    def test_start_builds_recorder_with_microphone_paused(self) -> None:
+        factory = RecorderFactory()
+        session = TranscriptionSession(factory)
+
+        session.start()
+
+        assert_that(len(factory.built), is_(1))
+        assert_that(factory.built[0].microphone_on, is_(False))
+
+    def test_warm_session_reuses_recorder_across_cycles(self) -> None:
+        factory = RecorderFactory()
+        session = TranscriptionSession(factory)
+        session.start()
+
+        for _ in range(3):
+            session.resume()
+            session.text()
+            session.pause()
+
+        assert_that(len(factory.built), is_(1))
+        assert_that(factory.built[0].shut_down, is_(False))
+        assert_that(factory.built[0].microphone_on, is_(False))
+
+    def test_resume_turns_microphone_on_with_empty_queue(self) -> None:
+        factory = RecorderFactory()
+        session = TranscriptionSession(factory)
+        session.start()
+
+        session.resume()
+
+        assert_that(factory.built[0].microphone_on, is_(True))
+        assert_that(factory.built[0].clears, is_(1))
+
+    def test_cold_session_rebuilds_recorder_each_cycle(self) -> None:
+        factory = RecorderFactory()
+        session = TranscriptionSession(factory, keep_warm=False)
+        session.start()
+
+        for _ in range(2):
+            session.resume()
+            session.text()
+            session.pause()
+
+        assert_that(len(factory.built), is_(2))
+        assert_that(all(r.shut_down for r in factory.built), is_(True))
+
+    def test_measures_latency_to_first_transcript(self) -> None:
+        session = TranscriptionSession(RecorderFactory())
+        session.start()
+        session.resume(started_at=0.0)
+
+        assert_that(session.first_transcript_latency, is_(none()))
+        session.text()
+
+        assert_that(session.first_transcript_latency, greater_than_or_equal_to(0.0))
+
+    def test_empty_text_is_not_the_first_transcript(self) -> None:
+        session = TranscriptionSession(lambda: StubRecorder(["", "hello"]))
+        session.start()
+        session.resume(started_at=0.0)
+
+        session.text()
+        assert_that(session.first_transcript_latency, is_(none()))
+        session.text()
+
+        assert_that(session.first_transcript_latency, greater_than_or_equal_to(0.0))
+
+    def test_shutdown_releases_recorder(self) -> None:
+        factory = RecorderFactory()
+        session = TranscriptionSession(factory)
+        session.start()
+
+        session.shutdown()
+
+        assert_that(factory.built[0].shut_down, is_(True))
+
+
+class FeedableRecorder(StubRecorder):
+    """StubRecorder that also accepts fed audio."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.fed: list[int] = []
+
+    def feed_audio(self, chunk: np.ndarray, original_sample_rate: int = 16000) -> None:
+        self.fed.append(int(chunk[0]))
+
+
+class TestTranscriptionSessionWithHub:
+    """Tests for TranscriptionSession fed from a CaptureHub."""
+
+    def test_feeds_preroll_from_before_wake_position(self) -> None:
+        samples = np.repeat(np.arange(6, dtype=np.int16), 4)
+        hub = CaptureHub(ArrayFrameSource(samples, sample_rate=16, frame_size=4))
+        recorder = FeedableRecorder()
+        session = TranscriptionSession(lambda: recorder, hub=hub, preroll_seconds=0.25)
+        session.start()
+        hub.start()
+        hub.wait(1.0)
+
+        session.resume(from_position=16)
+        session.pause()
+
+        assert_that(recorder.fed, equal_to([3, 4, 5]))
+
+    def test_does_not_touch_recorder_microphone(self) -> None:
+        hub = CaptureHub(ArrayFrameSource(np.zeros(8, dtype=np.int16), frame_size=4))
+        recorder = FeedableRecorder()
+        session = TranscriptionSession(lambda: recorder, hub=hub)
+
+        session.start()
+        session.resume()
+        session.pause()
+
+        assert_that(recorder.microphone_on, is_(True))
+
+    def test_records_whisper_load_from_reported_utterances(self) -> None:
+        rtf = metrics.histogram(
+            "much_miller_whisper_rtf", "", metrics.RATIO_BUCKETS, stage="whisper"
+        )
+        observed = rtf.count
+        session = TranscriptionSession(RecorderFactory())
+        session.start()
+        session.resume()
+
+        session.utterance_started()
+        time.sleep(0.02)
+        session.utterance_ended()
+        session.text()
+        session.text()
+
+        assert_that(rtf.count, is_(observed + 1))
+        assert_that(metrics.stage_load("whisper").value, greater_than(0.0))
@@ -0,0 +1,93 @@
+"""Tests for UtteranceRecorder."""
+
+import threading
+
+import numpy as np
+from hamcrest import assert_that, equal_to, is_
+
+from much_miller.transcription.adapters import FakeTranscriber
+from much_miller.transcription.ports import TranscriberPort
+from much_miller.transcription.utterance_recorder import UtteranceRecorder
+
+FRAME = 1600  # 0.1 s at 16 kHz
+
+
+def frames(level: int, count: int) -> list[np.ndarray]:
+    return [np.full(FRAME, level, dtype=np.int16) for _ in range(count)]
+
+
+def recorder_for(transcriber: TranscriberPort) -> UtteranceRecorder:
+    return UtteranceRecorder(transcriber, silence_seconds=0.3, lead_seconds=0.2)
+
+
+class TestUtteranceRecorder:
+    """Tests for UtteranceRecorder."""
+
+    def test_transcribes_speech_ended_by_silence(self) -> None:
+        transcriber = FakeTranscriber("play news")
+        recorder = recorder_for(transcriber)
+        for frame in frames(0, 5) + frames(3000, 4) + frames(0, 3):
+            recorder.feed_audio(frame)
+
+        assert_that(recorder.text(), is_("play news"))
+        # 0.2 s lead, 0.4 s speech, 0.3 s silence
+        assert_that(transcriber.calls, equal_to([(9 * FRAME, 16000)]))
+
+    def test_waits_for_the_silence(self) -> None:
+        transcriber = FakeTranscriber("stop")
+        recorder = recorder_for(transcriber)
+        result: list[str] = []
+        thread = threading.Thread(target=lambda: result.append(recorder.text()))
+        thread.start()
+        for frame in frames(3000, 3) + frames(0, 2):
+            recorder.feed_audio(frame)
+        thread.join(0.1)
+        assert_that(result, equal_to([]))
+
+        recorder.feed_audio(frames(0, 1)[0])
+        thread.join(1.0)
+
+        assert_that(result, equal_to(["stop"]))
+
+    def test_cuts_long_utterances(self) -> None:
+        transcriber = FakeTranscriber("blah")
+        recorder = UtteranceRecorder(transcriber, max_seconds=1.0)
+        for frame in frames(3000, 12):
+            recorder.feed_audio(frame)
+
+        recorder.text()
+
+        assert_that(transcriber.calls[0][0], is_(10 * FRAME))
+
+    def test_failed_transcription_gives_empty_text(self) -> None:
+        transcriber = FakeTranscriber("stop")
+        transcriber.failing = True
+        recorder = recorder_for(transcriber)
+        for frame in frames(3000, 2) + frames(0, 3):
+            recorder.feed_audio(frame)
+
+        assert_that(recorder.text(), is_(""))
+
+    def test_shutdown_wakes_text(self) -> None:
+        recorder = recorder_for(FakeTranscriber())
+        result: list[str] = []
+        thread = threading.Thread(target=lambda: result.append(recorder.text()))
+        thread.start()
+
+        recorder.shutdown()
+        thread.join(1.0)
+
+        assert_that(result, equal_to([""]))
+
+    def test_clear_discards_queued_audio(self) -> None:
+        transcriber = FakeTranscriber("stop")
+        recorder = recorder_for(transcriber)
+        for frame in frames(3000, 4):
+            recorder.feed_audio(frame)
+
+        recorder.clear_audio_queue()
+        for frame in frames(3000, 1) + frames(0, 3):
+            recorder.feed_audio(frame)
+        recorder.text()
+
+        assert_that(transcriber.calls[0][0], is_(4 * FRAME))
@@ -3,6 +3,7 @@
 import wave
 import io
 
+import numpy as np
 import pytest
 from hamcrest import assert_that, greater_than, is_
 
@@ -41,3 +42,14 @@ class TestSoundDeviceRecorder:
             assert_that(wav_file.getsampwidth(), is_(2))
             assert_that(wav_file.getframerate(), is_(16000))
             assert_that(wav_file.getnframes(), greater_than(0))
+
+    @requires_microphone
+    def test_frames_are_fixed_size_int16(self) -> None:
+        recorder = SoundDeviceRecorder(frame_size=160)
+        try:
+            frames = [frame.copy() for frame, _ in zip(recorder.frames(), range(5))]
+        finally:
+            recorder.close()
+
+        assert_that([len(frame) for frame in frames], is_([160] * 5))
+        assert_that(frames[0].dtype, is_(np.dtype(np.int16)))
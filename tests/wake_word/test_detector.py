@@ -0,0 +1,191 @@
+"""Tests for WakeWordDetector."""
+
+import threading
+import time
+
+import numpy as np
+from hamcrest import assert_that, greater_than, is_, none
+
+from much_miller.audio.adapters.array_frame_source import ArrayFrameSource
+from much_miller.audio.capture_hub import CaptureHub
+from much_miller.wake_word.detector import WakeWordDetector, detect_wake_word
+from much_miller.wake_word.energy_gate import EnergyGate
+from much_miller.wake_word.verification import WakePolicy, WakeTrigger
+
+
+class ScriptedWakeModel:
+    """Fake wake model that fires on a chosen frame."""
+
+    def __init__(self, fire_on: int | None, delay: float = 0.0) -> None:
+        self.fire_on = fire_on
+        self.delay = delay
+        self.frames = 0
+
+    def predict(self, x: np.ndarray) -> dict[str, float]:
+        self.frames += 1
+        if self.delay:
+            time.sleep(self.delay)
+        return {"alexa": 0.9 if self.frames == self.fire_on else 0.1}
+
+
+def silent_hub(frames: int, realtime: bool = True) -> CaptureHub:
+    samples = np.zeros(frames * 160, dtype=np.int16)
+    return CaptureHub(
+        ArrayFrameSource(samples, sample_rate=16000, frame_size=160, realtime=realtime)
+    )
+
+
+class ScoreSequenceModel:
+    """Fake wake model that returns scripted scores, then the last one."""
+
+    def __init__(self, scores: list[float]) -> None:
+        self.scores = scores
+        self.frames = 0
+
+    def predict(self, x: np.ndarray) -> dict[str, float]:
+        self.frames += 1
+        return {"alexa": self.scores[min(self.frames, len(self.scores)) - 1]}
+
+
+class RecordingVerifier:
+    """Fake verifier that rejects the first triggers."""
+
+    def __init__(self, reject: int) -> None:
+        self.reject = reject
+        self.audio: list[int] = []
+
+    def verify(self, model_name: str, audio: np.ndarray, sample_rate: int) -> bool:
+        self.audio.append(len(audio))
+        return len(self.audio) > self.reject
+
+
+def stop_after(seconds: float) -> threading.Event:
+    stop = threading.Event()
+    threading.Timer(seconds, stop.set).start()
+    return stop
+
+
+class TestDetectWakeWord:
+    """Tests for detect_wake_word."""
+
+    def test_returns_first_model_over_threshold(self) -> None:
+        assert_that(detect_wake_word({"alexa": 0.2, "hey_jarvis": 0.7}), is_(("hey_jarvis", 0.7)))
+
+    def test_returns_none_below_threshold(self) -> None:
+        assert_that(detect_wake_word({"alexa": 0.5}), is_(none()))
+
+
+class TestWakeWordDetector:
+    """Tests for WakeWordDetector."""
+
+    def test_reports_detection_and_position(self) -> None:
+        hub = silent_hub(10)
+        detector = WakeWordDetector(hub, ScriptedWakeModel(fire_on=3))
+        hub.start()
+
+        detection = detector.listen()
+        hub.stop()
+
+        assert detection is not None
+        assert_that(detection.model_name, is_("alexa"))
+        assert_that(detection.position, is_(3 * 160))
+
+    def test_returns_none_when_capture_ends(self) -> None:
+        hub = silent_hub(5)
+        detector = WakeWordDetector(hub, ScriptedWakeModel(fire_on=None))
+        hub.start()
+
+        assert_that(detector.listen(), is_(none()))
+
+    def test_stops_listening_when_asked(self) -> None:
+        hub = silent_hub(1000)
+        detector = WakeWordDetector(hub, ScriptedWakeModel(fire_on=None))
+        stop = threading.Event()
+        hub.start()
+        threading.Timer(0.05, stop.set).start()
+
+        started = time.perf_counter()
+        detection = detector.listen(stop)
+        hub.stop()
+
+        assert_that(detection, is_(none()))
+        assert_that(time.perf_counter() - started < 0.5, is_(True))
+
+    def test_counts_inference_time(self) -> None:
+        hub = silent_hub(10)
+        detector = WakeWordDetector(hub, ScriptedWakeModel(fire_on=4, delay=0.001))
+        hub.start()
+
+        detector.listen()
+        hub.stop()
+
+        assert_that(detector.stats.frames, is_(4))
+        assert_that(detector.stats.mean_inference_ms, greater_than(0.5))
+
+    def test_counts_frames_dropped_by_slow_inference(self) -> None:
+        hub = silent_hub(40)
+        detector = WakeWordDetector(
+            hub, ScriptedWakeModel(fire_on=None, delay=0.03), max_queued_frames=4
+        )
+        hub.start()
+
+        detector.listen()
+
+        assert_that(detector.stats.dropped_frames, greater_than(0))
+        assert_that(detector.stats.behind_realtime, is_(True))
+
+    def test_last_listen_counts_only_that_listen(self) -> None:
+        hub = silent_hub(40)
+        model = ScriptedWakeModel(fire_on=None, delay=0.03)
+        detector = WakeWordDetector(hub, model, max_queued_frames=4)
+        hub.start()
+        detector.listen(stop=stop_after(0.2))
+        model.delay = 0.0
+
+        detector.listen(stop=stop_after(0.1))
+        hub.stop()
+
+        assert_that(detector.stats.dropped_frames, greater_than(0))
+        assert_that(detector.last_listen.dropped_frames, is_(0))
+        assert_that(detector.last_listen.behind_realtime, is_(False))
+        assert_that(detector.stats.frames, greater_than(detector.last_listen.frames))
+
+    def test_gate_skips_inference_on_silence(self) -> None:
+        hub = silent_hub(20)
+        model = ScriptedWakeModel(fire_on=None)
+        detector = WakeWordDetector(hub, model, gate=EnergyGate(0.01))
+        hub.start()
+
+        detector.listen()
+
+        assert_that(model.frames, is_(0))
+        assert_that(detector.stats.gated_frames, greater_than(0))
+
+    def test_trigger_needs_a_persistent_score(self) -> None:
+        hub = silent_hub(10)
+        model = ScoreSequenceModel([0.9, 0.1, 0.9, 0.9, 0.9])
+        trigger = WakeTrigger({"alexa": WakePolicy(0.5, persist_frames=3)})
+        detector = WakeWordDetector(hub, model, trigger=trigger)
+        hub.start()
+
+        detection = detector.listen()
+        hub.stop()
+
+        assert detection is not None
+        assert_that(detection.position, is_(5 * 160))
+
+    def test_verifier_rejections_keep_listening(self) -> None:
+        hub = silent_hub(20)
+        model = ScoreSequenceModel([0.9])
+        verifier = RecordingVerifier(reject=2)
+        detector = WakeWordDetector(hub, model, verifier=verifier, verify_seconds=0.03)
+        hub.start()
+
+        detection = detector.listen()
+        hub.stop()
+
+        assert detection is not None
+        assert_that(detection.position, is_(3 * 160))
+        assert_that(verifier.audio, is_([160, 320, 480]))
+        assert_that(detector.stats.rejected, is_(2))
+        assert_that(detector.stats.triggers, is_(3))
@@ -0,0 +1,178 @@
+"""Tests for adaptive wake word duty cycling."""
+
+import numpy as np
+import pytest
+from hamcrest import assert_that, contains_exactly, empty, has_length, is_
+
+from much_miller.audio.adapters.array_frame_source import ArrayFrameSource
+from much_miller.audio.capture_hub import CaptureHub
+from much_miller.wake_word.detector import WakeWordDetector
+from much_miller.wake_word.duty_cycle import (
+    FULL,
+    DutyCycler,
+    DutyMode,
+    ModelSubset,
+    default_modes,
+)
+
+MODES = [FULL, DutyMode("stride-2", 2), DutyMode("subset", 4, frozenset({"alexa"}))]
+
+
+class FakeClock:
+    """Clock advanced by hand."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def silent_hub(frames: int) -> CaptureHub:
+    samples = np.zeros(frames * 160, dtype=np.int16)
+    return CaptureHub(
+        ArrayFrameSource(samples, sample_rate=16000, frame_size=160, realtime=True)
+    )
+
+
+def cycler(clock: FakeClock, **kwargs: object) -> DutyCycler:
+    return DutyCycler(
+        MODES,
+        high_lag_seconds=0.3,
+        low_lag_seconds=0.1,
+        step_seconds=1.0,
+        recover_seconds=2.0,
+        clock=clock,
+        **kwargs,
+    )
+
+
+class FakeOpenWakeWordModel:
+    """Fake openWakeWord Model that scores each model in its models dict."""
+
+    def __init__(self) -> None:
+        self.models = {"alexa": object(), "hey_jarvis": object()}
+        self.calls: list[int] = []
+
+    def predict(self, x: np.ndarray) -> dict[str, float]:
+        self.calls.append(len(x))
+        return {name: 0.0 for name in self.models}
+
+    def reset(self) -> None:
+        pass
+
+
+class TestDutyCycler:
+    """Tests for DutyCycler."""
+
+    def test_steps_down_while_lag_is_high(self) -> None:
+        clock = FakeClock()
+        duty = cycler(clock)
+
+        assert_that(duty.observe(0.5).name, is_("stride-2"))
+        clock.now = 0.5
+        assert_that(duty.observe(0.5).name, is_("stride-2"))
+        clock.now = 1.0
+        assert_that(duty.observe(0.5).name, is_("subset"))
+        clock.now = 5.0
+        assert_that(duty.observe(0.5).name, is_("subset"))
+
+    def test_steps_up_after_lag_stays_low(self) -> None:
+        clock = FakeClock()
+        duty = cycler(clock)
+        duty.observe(0.5)
+
+        clock.now = 1.0
+        assert_that(duty.observe(0.05).name, is_("stride-2"))
+        clock.now = 2.5
+        assert_that(duty.observe(0.05).name, is_("stride-2"))
+        clock.now = 3.0
+        assert_that(duty.observe(0.05), is_(FULL))
+
+    def test_holds_between_watermarks(self) -> None:
+        clock = FakeClock()
+        duty = cycler(clock)
+        duty.observe(0.5)
+
+        for step in range(10):
+            clock.now = step
+            duty.observe(0.05 if step % 2 else 0.2)
+
+        assert_that(duty.mode.name, is_("stride-2"))
+
+    def test_reports_each_change(self) -> None:
+        clock = FakeClock()
+        changes = []
+        duty = cycler(clock, on_change=changes.append)
+
+        duty.observe(0.5)
+        clock.now = 1.0
+        duty.observe(0.05)
+        clock.now = 3.0
+        duty.observe(0.05)
+
+        steps = [(change.previous.name, change.mode.name) for change in changes]
+        assert_that(steps, contains_exactly(("full", "stride-2"), ("stride-2", "full")))
+        assert_that(list(duty.changes), is_(changes))
+        message = "Wake word duty full -> stride-2 (every 2 frames), lag 500ms"
+        assert_that(changes[0].describe(), is_(message))
+
+    def test_rejects_inverted_watermarks(self) -> None:
+        with pytest.raises(ValueError):
+            DutyCycler(high_lag_seconds=0.1, low_lag_seconds=0.2)
+
+    def test_default_modes_keep_models_last(self) -> None:
+        assert_that([mode.models for mode in default_modes()], is_([None, None, None]))
+        assert_that(default_modes(["hey_jarvis"])[-1].models, is_(frozenset({"hey_jarvis"})))
+
+
+class TestModelSubset:
+    """Tests for ModelSubset."""
+
+    def test_runs_only_selected_models(self) -> None:
+        subset = ModelSubset(FakeOpenWakeWordModel())
+
+        subset.select(frozenset({"alexa"}))
+        narrowed = subset.predict(np.zeros(1280, dtype=np.int16))
+        subset.select(None)
+        restored = subset.predict(np.zeros(1280, dtype=np.int16))
+
+        assert_that(list(narrowed), is_(["alexa"]))
+        assert_that(list(restored), is_(["alexa", "hey_jarvis"]))
+
+    def test_rejects_unknown_models(self) -> None:
+        subset = ModelSubset(FakeOpenWakeWordModel())
+
+        with pytest.raises(ValueError):
+            subset.select(frozenset({"computer"}))
+
+
+class TestDetectorDutyCycling:
+    """Tests for WakeWordDetector with a duty cycler."""
+
+    def test_scores_frames_together_in_stride_mode(self) -> None:
+        hub = silent_hub(8)
+        model = FakeOpenWakeWordModel()
+        duty = DutyCycler([DutyMode("stride-4", 4, frozenset({"alexa"}))])
+        detector = WakeWordDetector(hub, ModelSubset(model), duty=duty)
+        hub.start()
+
+        detector.listen()
+
+        assert_that(model.calls, is_([640, 640]))
+        assert_that(model.models, has_length(1))
+        assert_that(detector.stats.frames, is_(8))
+        assert_that(detector.stats.strided_frames, is_(8))
+        assert_that(detector.stats.duty_mode, is_("stride-4"))
+
+    def test_scores_every_frame_at_full_rate(self) -> None:
+        hub = silent_hub(8)
+        model = FakeOpenWakeWordModel()
+        duty = DutyCycler()
+        detector = WakeWordDetector(hub, model, duty=duty)
+        hub.start()
+
+        detector.listen()
+
+        assert_that(model.calls, has_length(8))
+        assert_that(list(duty.changes), is_(empty()))
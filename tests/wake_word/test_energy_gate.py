@@ -0,0 +1,70 @@
+"""Tests for EnergyGate."""
+
+import numpy as np
+from hamcrest import assert_that, close_to, empty, is_, none
+
+from much_miller.wake_word.energy_gate import EnergyGate
+
+
+def frame(level: int) -> np.ndarray:
+    return np.full(160, level, dtype=np.int16)
+
+
+class TestEnergyGate:
+    """Tests for EnergyGate."""
+
+    def test_stays_shut_on_silence(self) -> None:
+        gate = EnergyGate(0.01)
+
+        for _ in range(50):
+            assert_that(gate.admit(frame(10)), is_(empty()))
+
+        assert_that(gate.is_open, is_(False))
+        assert_that(gate.stats.skipped_fraction, is_(1.0))
+
+    def test_releases_lookback_when_it_opens(self) -> None:
+        gate = EnergyGate(0.01, lookback_seconds=0.03)
+        for level in (1, 2, 3, 4):
+            gate.admit(frame(level))
+
+        released = gate.admit(frame(1000))
+
+        assert_that([int(f[0]) for f in released], is_([2, 3, 4, 1000]))
+        assert_that(gate.is_open, is_(True))
+
+    def test_stays_open_through_short_pauses(self) -> None:
+        gate = EnergyGate(0.01, hangover_seconds=0.05)
+        gate.admit(frame(1000))
+
+        for _ in range(4):
+            assert_that(len(gate.admit(frame(0))), is_(1))
+        gate.admit(frame(0))
+
+        assert_that(gate.is_open, is_(False))
+
+    def test_hysteresis_keeps_it_open_below_open_level(self) -> None:
+        gate = EnergyGate(0.01, open_level=300, close_level=200, hangover_seconds=0.02)
+        gate.admit(frame(1000))
+
+        for _ in range(10):
+            gate.admit(frame(250))
+
+        assert_that(gate.is_open, is_(True))
+
+    def test_noise_floor_raises_the_opening_level(self) -> None:
+        gate = EnergyGate(0.01, open_level=300, open_ratio=3)
+        assert_that(gate.noise_floor, is_(none()))
+        for _ in range(20):
+            gate.admit(frame(200))
+
+        assert_that(gate.noise_floor, close_to(200, 0.01))
+        assert_that(gate.admit(frame(500)), is_(empty()))
+        assert_that(len(gate.admit(frame(700))), is_(gate.stats.admitted))
+
+    def test_reset_shuts_the_gate(self) -> None:
+        gate = EnergyGate(0.01)
+        gate.admit(frame(1000))
+
+        gate.reset()
+
+        assert_that(gate.is_open, is_(False))
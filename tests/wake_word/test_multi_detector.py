@@ -0,0 +1,110 @@
+"""Tests for MultiStreamDetector."""
+
+import threading
+
+import numpy as np
+import pytest
+from hamcrest import assert_that, equal_to, is_, none
+
+from much_miller.audio.adapters.array_frame_source import ArrayFrameSource
+from much_miller.audio.capture_hub import CaptureHub
+from much_miller.wake_word.multi_detector import MultiStreamDetector
+from much_miller.wake_word.stacked_model import SeparateWakeModels
+
+FRAME = 160
+
+
+class LoudWakeModel:
+    """Fires on loud frames; counts resets."""
+
+    def __init__(self) -> None:
+        self.resets = 0
+
+    def predict(self, x: np.ndarray) -> dict[str, float]:
+        return {"hey_jarvis": 0.9 if np.abs(x).mean() > 8000 else 0.1}
+
+    def reset(self) -> None:
+        self.resets += 1
+
+
+def hub_firing_on(frames: int, *loud: int, sample_rate: int = 16000) -> CaptureHub:
+    samples = np.zeros(frames * FRAME, dtype=np.int16)
+    for index in loud:
+        samples[index * FRAME:(index + 1) * FRAME] = 10000
+    return CaptureHub(
+        ArrayFrameSource(samples, sample_rate=sample_rate, frame_size=FRAME, realtime=True)
+    )
+
+
+def detector_for(hubs: dict[str, CaptureHub], cooldown_seconds: float = 2.0) -> MultiStreamDetector:
+    model = SeparateWakeModels([LoudWakeModel() for _ in hubs])
+    return MultiStreamDetector(hubs, model, cooldown_seconds=cooldown_seconds)
+
+
+def start(hubs: dict[str, CaptureHub]) -> None:
+    for hub in hubs.values():
+        hub.start()
+
+
+def stop(hubs: dict[str, CaptureHub]) -> None:
+    for hub in hubs.values():
+        hub.stop()
+
+
+class TestMultiStreamDetector:
+    """Tests for MultiStreamDetector."""
+
+    def test_reports_the_device_that_heard_the_wake_word(self) -> None:
+        hubs = {"kitchen": hub_firing_on(30), "study": hub_firing_on(30, 10)}
+        detector = detector_for(hubs)
+        start(hubs)
+
+        detection = detector.listen()
+        stop(hubs)
+
+        assert detection is not None
+        assert_that(detection.device, is_("study"))
+        assert_that(detection.model_name, is_("hey_jarvis"))
+        assert_that(detector.scores["kitchen"], equal_to({"hey_jarvis": 0.1}))
+
+    def test_cooldown_is_per_device(self) -> None:
+        hubs = {"kitchen": hub_firing_on(40, 5, 8, 20), "study": hub_firing_on(40, 12)}
+        detector = detector_for(hubs, cooldown_seconds=0.1)
+        start(hubs)
+
+        devices = []
+        while (detection := detector.listen()) is not None:
+            devices.append((detection.device, detection.position // FRAME))
+        stop(hubs)
+
+        assert_that(devices, equal_to([("kitchen", 6), ("study", 13), ("kitchen", 21)]))
+        assert_that(detector.stats.suppressed, equal_to(1))
+
+    def test_devices_firing_together_are_both_reported(self) -> None:
+        hubs = {"kitchen": hub_firing_on(30, 10), "study": hub_firing_on(30, 10)}
+        detector = detector_for(hubs)
+        start(hubs)
+
+        first = detector.listen()
+        second = detector.listen()
+        stop(hubs)
+
+        assert first is not None and second is not None
+        assert_that({first.device, second.device}, equal_to({"kitchen", "study"}))
+
+    def test_stop_ends_listening(self) -> None:
+        hubs = {"kitchen": hub_firing_on(200), "study": hub_firing_on(200)}
+        detector = detector_for(hubs)
+        start(hubs)
+        stopping = threading.Event()
+        threading.Timer(0.1, stopping.set).start()
+
+        detection = detector.listen(stopping)
+        stop(hubs)
+
+        assert_that(detection, is_(none()))
+        assert_that(detector.stats.rounds > 0, is_(True))
+
+    def test_devices_must_share_a_rate(self) -> None:
+        with pytest.raises(ValueError):
+            detector_for({"kitchen": hub_firing_on(1), "study": hub_firing_on(1, sample_rate=8000)})
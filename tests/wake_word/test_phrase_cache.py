@@ -0,0 +1,58 @@
+"""Tests for PhraseCache."""
+
+from pathlib import Path
+
+from hamcrest import assert_that, equal_to, is_, none
+
+from much_miller.wake_word.phrase_cache import PhraseCache
+
+
+class TestPhraseCache:
+    """Tests for PhraseCache."""
+
+    def test_returns_none_for_unknown_phrase(self, tmp_path: Path) -> None:
+        cache = PhraseCache(tmp_path)
+
+        assert_that(cache.get("voice", "Stopped"), is_(none()))
+
+    def test_returns_stored_audio(self, tmp_path: Path) -> None:
+        cache = PhraseCache(tmp_path)
+
+        cache.put("voice", "Stopped", b"\x01\x02")
+
+        assert_that(cache.get("voice", "Stopped"), equal_to(b"\x01\x02"))
+
+    def test_entries_are_keyed_by_voice(self, tmp_path: Path) -> None:
+        cache = PhraseCache(tmp_path)
+
+        cache.put("alan", "Stopped", b"\x01\x02")
+
+        assert_that(cache.get("jenny", "Stopped"), is_(none()))
+
+    def test_survives_restart(self, tmp_path: Path) -> None:
+        PhraseCache(tmp_path).put("voice", "Hello Romilly", b"\x01\x02")
+
+        cache = PhraseCache(tmp_path)
+
+        assert_that(cache.get("voice", "Hello Romilly"), equal_to(b"\x01\x02"))
+        assert_that(cache.size_bytes, is_(2))
+
+    def test_evicts_least_recently_used_when_over_size(self, tmp_path: Path) -> None:
+        cache = PhraseCache(tmp_path, max_bytes=4)
+        cache.put("voice", "one", b"\x00\x00")
+        cache.put("voice", "two", b"\x00\x00")
+        cache.get("voice", "one")
+
+        cache.put("voice", "three", b"\x00\x00")
+
+        assert_that(cache.contains("voice", "one"), is_(True))
+        assert_that(cache.contains("voice", "two"), is_(False))
+        assert_that(cache.contains("voice", "three"), is_(True))
+        assert_that(len(list(tmp_path.glob("*.pcm"))), is_(2))
+
+    def test_ignores_extra_whitespace_in_text(self, tmp_path: Path) -> None:
+        cache = PhraseCache(tmp_path)
+
+        cache.put("voice", "Playing  radio 3 ", b"\x01\x02")
+
+        assert_that(cache.get("voice", "Playing radio 3"), equal_to(b"\x01\x02"))
@@ -0,0 +1,50 @@
+"""Tests for streaming from the recorder adapters."""
+
+from pathlib import Path
+
+import numpy as np
+from hamcrest import assert_that, equal_to, is_
+
+from much_miller.audio.adapters.array_frame_source import ArrayFrameSource
+from much_miller.audio.capture_hub import CaptureHub
+from much_miller.audio.wav import encode_wav, read_wav
+from much_miller.wake_word.adapters import FakeRecorder, HubRecorder
+
+
+class TestFakeRecorder:
+    """Tests for FakeRecorder streaming."""
+
+    def test_streams_a_file_in_fixed_frames(self, tmp_path: Path) -> None:
+        path = tmp_path / "speech.wav"
+        path.write_bytes(encode_wav(np.arange(10, dtype=np.int16), 8000))
+        recorder = FakeRecorder.from_file(path, frame_size=4)
+
+        frames = [frame.tolist() for frame in recorder.frames()]
+
+        assert_that(frames, equal_to([[0, 1, 2, 3], [4, 5, 6, 7], [8, 9, 0, 0]]))
+        assert_that(recorder.sample_rate, is_(8000))
+
+    def test_reuses_one_frame_buffer(self) -> None:
+        recorder = FakeRecorder(encode_wav(np.arange(8, dtype=np.int16), 16000), frame_size=4)
+
+        buffers = {id(frame) for frame in recorder.frames()}
+
+        assert_that(len(buffers), is_(1))
+
+
+class TestHubRecorder:
+    """Tests for HubRecorder."""
+
+    def test_record_chunk_encodes_the_requested_duration(self) -> None:
+        samples = np.arange(2000, dtype=np.int16)
+        hub = CaptureHub(
+            ArrayFrameSource(samples, sample_rate=16000, frame_size=100, realtime=True)
+        )
+        hub.start()
+
+        recording, sample_rate = read_wav(HubRecorder(hub).record_chunk(0.025))
+        hub.stop()
+
+        assert_that(sample_rate, is_(16000))
+        assert_that(len(recording), is_(400))
+        assert_that(np.diff(recording).tolist(), equal_to([1] * 399))
@@ -1,11 +1,17 @@
 """Tests for speaker adapters."""
 
+import subprocess
+import sys
+import types
 from pathlib import Path
+from typing import Callable, Iterator
 
 import pytest
-from hamcrest import assert_that, contains_string, instance_of
+from hamcrest import assert_that, contains_string, empty, has_length, instance_of, is_
 
 from much_miller.wake_word.adapters import FakeSpeaker, PiperSpeaker
+from much_miller.wake_word.adapters import piper_speaker
+from much_miller.wake_word.phrase_cache import PhraseCache
 
 
 class TestFakeSpeaker:
@@ -41,3 +47,198 @@ class TestPiperSpeaker:
         speaker = PiperSpeaker(model_path=model_path)
 
         assert_that(speaker, instance_of(PiperSpeaker))
+
+
+class FakeChunk:
+    """One chunk of synthesized audio, as PiperVoice.synthesize() yields."""
+
+    def __init__(self, audio: bytes) -> None:
+        self.audio_int16_bytes = audio
+
+
+class FakeVoice:
+    """Fake PiperVoice that yields the same chunks for any text."""
+
+    def __init__(self, chunks: list[bytes]) -> None:
+        self.config = types.SimpleNamespace(sample_rate=1000)
+        self.chunks = chunks
+        self.synthesized: list[str] = []
+
+    def synthesize(self, text: str) -> Iterator[FakeChunk]:
+        self.synthesized.append(text)
+        for chunk in self.chunks:
+            yield FakeChunk(chunk)
+
+
+class FakeOutputStream:
+    """Fake sounddevice.RawOutputStream that records what is written."""
+
+    instances: list["FakeOutputStream"] = []
+
+    def __init__(self, samplerate: int, channels: int, dtype: str) -> None:
+        self.writes: list[bytes] = []
+        self.started = False
+        self.closed = False
+        self.on_write: Callable[[], None] | None = None
+        FakeOutputStream.instances.append(self)
+
+    def start(self) -> None:
+        self.started = True
+
+    def write(self, data: bytes) -> None:
+        self.writes.append(bytes(data))
+        if self.on_write is not None:
+            self.on_write()
+
+    def stop(self) -> None:
+        self.started = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakePlayer:
+    """Fake aplay process."""
+
+    instances: list["FakePlayer"] = []
+    returncode_to_give = 0
+    on_communicate: Callable[[], None] | None = None
+
+    def __init__(self, args: list[str], stdin: int) -> None:
+        self.input = b""
+        self.returncode: int | None = None
+        self.terminated = False
+        FakePlayer.instances.append(self)
+
+    def communicate(self, data: bytes) -> None:
+        self.input = data
+        if FakePlayer.on_communicate is not None:
+            FakePlayer.on_communicate()
+        self.returncode = -15 if self.terminated else FakePlayer.returncode_to_give
+
+    def poll(self) -> int | None:
+        return self.returncode
+
+    def terminate(self) -> None:
+        self.terminated = True
+
+
+CHUNKS = [b"\x01\x00" * 125, b"\x02\x00" * 125]  # 250 bytes each, 100-byte slices
+
+
+@pytest.fixture
+def voice(monkeypatch: pytest.MonkeyPatch) -> FakeVoice:
+    voice = FakeVoice(CHUNKS)
+    monkeypatch.setattr(piper_speaker.PiperVoice, "load", lambda path: voice)
+    sounddevice = types.ModuleType("sounddevice")
+    sounddevice.RawOutputStream = FakeOutputStream  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "sounddevice", sounddevice)
+    monkeypatch.setattr(subprocess, "Popen", FakePlayer)
+    FakeOutputStream.instances = []
+    FakePlayer.instances = []
+    FakePlayer.returncode_to_give = 0
+    FakePlayer.on_communicate = None
+    return voice
+
+
+def fake_model(tmp_path: Path) -> Path:
+    model_path = tmp_path / "voice.onnx"
+    model_path.write_bytes(b"model")
+    return model_path
+
+
+class TestPiperSpeakerStreaming:
+    """Tests for PiperSpeaker's streaming playback, with a fake voice and stream."""
+
+    def test_plays_each_chunk_in_slices(self, voice: FakeVoice, tmp_path: Path) -> None:
+        speaker = PiperSpeaker(fake_model(tmp_path), streaming=True)
+
+        speaker.say("Playing Radio 4")
+
+        (stream,) = FakeOutputStream.instances
+        assert_that([len(write) for write in stream.writes], is_([100, 100, 50, 100, 100, 50]))
+        assert_that(b"".join(stream.writes), is_(b"".join(CHUNKS)))
+
+    def test_keeps_the_stream_open_across_replies(
+        self, voice: FakeVoice, tmp_path: Path
+    ) -> None:
+        speaker = PiperSpeaker(fake_model(tmp_path), streaming=True)
+
+        speaker.say("Playing Radio 4")
+        speaker.say("Stopping")
+
+        assert_that(FakeOutputStream.instances, has_length(1))
+        stream = FakeOutputStream.instances[0]
+        assert_that(stream.started and not stream.closed, is_(True))
+        assert_that(stream.writes, has_length(12))
+        speaker.close()
+        assert_that(stream.closed, is_(True))
+
+    def test_interrupt_stops_a_reply_part_way(self, voice: FakeVoice, tmp_path: Path) -> None:
+        speaker = PiperSpeaker(fake_model(tmp_path), streaming=True)
+        stream = FakeOutputStream.instances[0]
+        stream.on_write = speaker.interrupt
+
+        speaker.say("A long reply")
+        stream.on_write = None
+        speaker.say("Next reply")
+
+        assert_that(stream.writes, has_length(1 + 6))
+
+    def test_plays_cached_phrases_without_the_voice_model(
+        self, voice: FakeVoice, tmp_path: Path
+    ) -> None:
+        cache = PhraseCache(tmp_path / "cache")
+        speaker = PiperSpeaker(fake_model(tmp_path), streaming=True, cache=cache)
+
+        speaker.say("Yes?")
+        speaker.say("Yes?")
+        speaker.say("Stopping")
+
+        stream = FakeOutputStream.instances[0]
+        assert_that(voice.synthesized, is_(["Yes?", "Stopping"]))
+        assert_that(b"".join(stream.writes), is_(b"".join(CHUNKS) * 3))
+
+    def test_render_returns_audio_without_playing_it(
+        self, voice: FakeVoice, tmp_path: Path
+    ) -> None:
+        speaker = PiperSpeaker(fake_model(tmp_path), streaming=True)
+
+        audio = speaker.render("Playing Radio 4")
+
+        assert_that(audio, is_(b"".join(CHUNKS)))
+        assert_that(FakeOutputStream.instances[0].writes, is_(empty()))
+
+
+class TestPiperSpeakerAplay:
+    """Tests for PiperSpeaker's aplay playback, with a fake voice and aplay."""
+
+    def test_plays_the_reply_through_aplay(self, voice: FakeVoice, tmp_path: Path) -> None:
+        speaker = PiperSpeaker(fake_model(tmp_path))
+
+        speaker.say("Playing Radio 4")
+
+        (player,) = FakePlayer.instances
+        assert_that(player.input[:4], is_(b"RIFF"))
+        assert_that(player.input.endswith(b"".join(CHUNKS)), is_(True))
+
+    def test_interrupt_terminates_aplay_quietly(self, voice: FakeVoice, tmp_path: Path) -> None:
+        speaker = PiperSpeaker(fake_model(tmp_path))
+        FakePlayer.on_communicate = speaker.interrupt
+
+        speaker.say("A long reply")
+
+        assert_that(FakePlayer.instances[0].terminated, is_(True))
+
+    def test_failed_aplay_leaves_no_player_to_interrupt(
+        self, voice: FakeVoice, tmp_path: Path
+    ) -> None:
+        speaker = PiperSpeaker(fake_model(tmp_path))
+        FakePlayer.returncode_to_give = 1
+
+        with pytest.raises(subprocess.CalledProcessError):
+            speaker.say("Playing Radio 4")
+        FakePlayer.instances[0].returncode = None
+        speaker.interrupt()
+
+        assert_that(FakePlayer.instances[0].terminated, is_(False))
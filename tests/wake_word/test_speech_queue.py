@@ -0,0 +1,126 @@
+"""Tests for SpeechQueue."""
+
+import time
+
+from hamcrest import assert_that, equal_to, is_, less_than
+
+from much_miller.wake_word.adapters import FakeSpeaker, SpeechQueue
+from much_miller.wake_word.adapters.speech_queue import URGENT
+
+
+class SlowToStartSpeaker(FakeSpeaker):
+    """Fake speaker that takes a while to reach say(), like a busy worker."""
+
+    def say(self, text: str) -> None:
+        time.sleep(0.1)
+        super().say(text)
+
+
+class TestSpeechQueue:
+    """Tests for SpeechQueue."""
+
+    def test_say_returns_before_the_reply_is_spoken(self) -> None:
+        speaker = FakeSpeaker(delay=0.5)
+        speech = SpeechQueue(speaker)
+
+        started = time.perf_counter()
+        speech.say("Playing Radio 4")
+
+        assert_that(time.perf_counter() - started, less_than(0.1))
+        speech.close()
+
+    def test_warms_up_the_voice_before_speaking(self) -> None:
+        speaker = FakeSpeaker()
+        speech = SpeechQueue(speaker)
+
+        assert_that(speech.wait_ready(1.0), is_(True))
+        assert_that(speaker.warm_ups, is_(1))
+        speech.close()
+
+    def test_future_resolves_when_reply_is_spoken(self) -> None:
+        speaker = FakeSpeaker()
+        speech = SpeechQueue(speaker)
+
+        assert_that(speech.speak("Stopped").result(timeout=1.0), is_(True))
+        assert_that(speaker.completed, equal_to(["Stopped"]))
+        speech.close()
+
+    def test_urgent_replies_jump_the_queue(self) -> None:
+        speaker = FakeSpeaker(delay=0.1)
+        speech = SpeechQueue(speaker)
+        speech.wait_ready(1.0)
+        speech.say("first")
+        time.sleep(0.05)
+        speech.say("second")
+        speech.speak("urgent", priority=URGENT)
+
+        assert_that(speech.wait(2.0), is_(True))
+        assert_that(speaker.replies, equal_to(["first", "urgent", "second"]))
+        speech.close()
+
+    def test_interrupt_stops_the_reply_and_drops_the_rest(self) -> None:
+        speaker = FakeSpeaker(delay=1.0)
+        speech = SpeechQueue(speaker)
+        speech.wait_ready(1.0)
+        current = speech.speak("a long reply")
+        queued = speech.speak("another")
+        time.sleep(0.05)
+
+        speech.interrupt()
+
+        assert_that(current.result(timeout=1.0), is_(False))
+        assert_that(queued.cancelled(), is_(True))
+        assert_that(speech.wait(1.0), is_(True))
+        assert_that(speaker.replies, equal_to(["a long reply"]))
+        speech.close()
+
+    def test_interrupt_before_the_speaker_starts_is_not_lost(self) -> None:
+        speaker = SlowToStartSpeaker(delay=5.0)
+        speech = SpeechQueue(speaker, warm_up=False)
+        current = speech.speak("a long reply")
+        time.sleep(0.05)
+
+        speech.interrupt()
+
+        assert_that(current.result(timeout=1.0), is_(False))
+        assert_that(speaker.completed, equal_to([]))
+        speech.close()
+
+    def test_flush_keeps_the_current_reply(self) -> None:
+        speaker = FakeSpeaker(delay=0.2)
+        speech = SpeechQueue(speaker)
+        speech.wait_ready(1.0)
+        current = speech.speak("current")
+        speech.say("later")
+        time.sleep(0.05)
+
+        assert_that(speech.flush(), is_(1))
+        assert_that(current.result(timeout=1.0), is_(True))
+        assert_that(speaker.completed, equal_to(["current"]))
+        speech.close()
+
+    def test_cancelled_future_is_not_spoken(self) -> None:
+        speaker = FakeSpeaker(delay=0.1)
+        speech = SpeechQueue(speaker)
+        speech.wait_ready(1.0)
+        speech.say("first")
+        skipped = speech.speak("skipped")
+        skipped.cancel()
+
+        assert_that(speech.wait(1.0), is_(True))
+        assert_that(speaker.replies, equal_to(["first"]))
+        speech.close()
+
+    def test_preempt_replaces_whatever_is_being_said(self) -> None:
+        speaker = FakeSpeaker(delay=0.3)
+        speech = SpeechQueue(speaker)
+        speech.wait_ready(1.0)
+        speech.say("a long reply")
+        time.sleep(0.05)
+
+        done = speech.speak("Stopped", preempt=True)
+
+        assert_that(done.result(timeout=2.0), is_(True))
+        assert_that(speaker.replies, equal_to(["a long reply", "Stopped"]))
+        assert_that(speaker.completed, equal_to(["Stopped"]))
+        speech.close()
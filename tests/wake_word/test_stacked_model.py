@@ -0,0 +1,172 @@
+"""Tests for StackedWakeModel."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+from hamcrest import assert_that, close_to, equal_to, greater_than, is_
+
+from much_miller.wake_word.stacked_model import (
+    MEL_SETTLE_FRAMES,
+    WARM_UP_FRAMES,
+    Classifier,
+    SeparateWakeModels,
+    StackedWakeModel,
+    load_stacked_model,
+)
+
+FRAME = 1280
+
+
+class Stages:
+    """numpy stand-ins for the ONNX models, recording each batch size."""
+
+    def __init__(self) -> None:
+        self.batches: list[int] = []
+
+    def melspectrogram(self, audio: np.ndarray) -> np.ndarray:
+        self.batches.append(len(audio))
+        hops = np.abs(audio[:, 480:]).reshape(len(audio), 8, 160).mean(axis=2) / 10000
+        return np.repeat(hops[:, :, None], 32, axis=2)
+
+    def embedding(self, windows: np.ndarray) -> np.ndarray:
+        return np.repeat(windows[:, -8:, 0, 0].mean(axis=1)[:, None], 96, axis=1)
+
+    def model(self, streams: int) -> StackedWakeModel:
+        classifier = Classifier(
+            4, lambda features: features.mean(axis=(1, 2))[:, None], {0: "alexa"}
+        )
+        return StackedWakeModel(streams, self.melspectrogram, self.embedding, [classifier])
+
+
+def frames(*levels: int) -> np.ndarray:
+    return np.stack([np.full(FRAME, level, dtype=np.int16) for level in levels])
+
+
+class TestStackedWakeModel:
+    """Tests for StackedWakeModel."""
+
+    def test_runs_every_stream_in_one_batch(self) -> None:
+        stages = Stages()
+        model = stages.model(3)
+        for _ in range(4):
+            model.predict_batch(frames(0, 0, 0))
+
+        assert_that(stages.batches, equal_to([3, 3, 3, 3]))
+
+    def test_each_stream_is_scored_on_its_own_audio(self) -> None:
+        model = Stages().model(3)
+        for _ in range(8):
+            scores = model.predict_batch(frames(0, 10000, 0))
+
+        assert_that(scores[1]["alexa"], greater_than(0.5))
+        assert_that([scores[0]["alexa"], scores[2]["alexa"]], equal_to([0.0, 0.0]))
+
+    def test_scores_are_zero_while_warming_up(self) -> None:
+        model = Stages().model(1)
+        scores = [model.predict_batch(frames(10000))[0]["alexa"] for _ in range(6)]
+
+        assert_that(scores[:5], equal_to([0.0] * 5))
+        assert_that(scores[5], greater_than(0.5))
+
+    def test_batching_does_not_change_scores(self) -> None:
+        levels = [(0, 3000, 9000), (500, 0, 9000), (4000, 200, 0)] * 3
+        batched = Stages().model(3)
+        alone = [Stages().model(1) for _ in range(3)]
+        for row in levels:
+            together = batched.predict_batch(frames(*row))
+            for stream, level in enumerate(row):
+                single = alone[stream].predict_batch(frames(level))[0]
+                assert_that(together[stream]["alexa"], close_to(single["alexa"], 1e-6))
+
+    def test_reset_clears_one_stream(self) -> None:
+        model = Stages().model(2)
+        for _ in range(8):
+            model.predict_batch(frames(10000, 10000))
+        model.reset(0)
+
+        scores = model.predict_batch(frames(10000, 10000))
+        assert_that(scores[0]["alexa"], is_(0.0))
+        assert_that(scores[1]["alexa"], greater_than(0.5))
+
+    def test_streams_can_be_added_and_scored_on_their_own(self) -> None:
+        stages = Stages()
+        model = stages.model(0)
+        quiet, loud = model.add_stream(), model.add_stream()
+        alone = Stages().model(1)
+        for _ in range(8):
+            scores = model.predict_streams([loud], frames(10000))
+            expected = alone.predict_batch(frames(10000))
+
+        assert_that(scores[0]["alexa"], close_to(expected[0]["alexa"], 1e-6))
+        assert_that(stages.batches, equal_to([1] * 8))
+        assert_that(model.predict_streams([quiet, loud], frames(0, 10000))[0]["alexa"], is_(0.0))
+
+    def test_rejects_the_wrong_number_of_streams(self) -> None:
+        with pytest.raises(ValueError):
+            Stages().model(2).predict_batch(frames(0, 0, 0))
+
+
+class TestOpenWakeWordParity:
+    """StackedWakeModel against openWakeWord itself, when it is installed."""
+
+    def test_scores_match_openwakeword_after_warm_up(self) -> None:
+        openwakeword = pytest.importorskip("openwakeword")
+        from openwakeword.model import Model
+
+        models = Path(openwakeword.__file__).parent / "resources" / "models"
+        if not (models / "hey_jarvis_v0.1.onnx").exists():
+            pytest.skip("openWakeWord models not downloaded")
+        reference = Model(wakeword_models=["hey_jarvis"], inference_framework="onnx")
+        stacked = load_stacked_model(1, ["hey_jarvis"])
+        rng = np.random.default_rng(0)
+        envelope = np.abs(np.sin(np.linspace(0, 12 * np.pi, FRAME * 60)))
+        audio = np.clip(rng.normal(0, 4000, FRAME * 60) * envelope, -32768, 32767)
+        audio = audio.astype(np.int16)
+
+        pairs = []
+        for start in range(0, len(audio), FRAME):
+            frame = audio[start:start + FRAME]
+            expected = next(iter(reference.predict(frame).values()))
+            pairs.append((stacked.predict_batch(frame[None])[0]["hey_jarvis"], expected))
+
+        assert_that(pairs[:WARM_UP_FRAMES], equal_to([(0.0, 0.0)] * WARM_UP_FRAMES))
+        # Until hey_jarvis's 16 embeddings all come from frame MEL_SETTLE_FRAMES on,
+        # they include openWakeWord's random start and this model's zero history
+        settled = MEL_SETTLE_FRAMES + 16 - 1
+        for actual, expected in pairs[settled - 1:]:
+            assert_that(actual, close_to(expected, 1e-4))
+
+
+class Loudness:
+    """Unbatched model scoring a frame by its level."""
+
+    def predict(self, x: np.ndarray) -> dict[str, float]:
+        return {"alexa": float(np.abs(x).mean()) / 10000}
+
+
+class TestSeparateWakeModels:
+    """Tests for SeparateWakeModels."""
+
+    def test_runs_one_model_per_stream(self) -> None:
+        scores = SeparateWakeModels([Loudness(), Loudness()]).predict_batch(frames(0, 5000))
+
+        assert_that(scores, equal_to([{"alexa": 0.0}, {"alexa": 0.5}]))
+
+
+class TestMultiWakeBench:
+    """Tests for the per-device cost benchmark."""
+
+    def test_reports_both_models_for_each_stream_count(self) -> None:
+        from much_miller.bench.multi_wake import compare
+
+        stages = Stages()
+        rows = compare(
+            np.zeros(FRAME * 3, dtype=np.int16),
+            [1, 2],
+            stages.model,
+            lambda streams: SeparateWakeModels([Loudness() for _ in range(streams)]),
+        )
+
+        assert_that([row["streams"] for row in rows], equal_to([1, 2]))
+        assert_that(stages.batches, equal_to([1, 1, 1, 2, 2, 2]))
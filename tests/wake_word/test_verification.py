@@ -0,0 +1,93 @@
+"""Tests for two-stage wake word detection."""
+
+import numpy as np
+import pytest
+from hamcrest import assert_that, close_to, equal_to, is_, none
+
+from much_miller.transcription.adapters import FakeTranscriber
+from much_miller.wake_word.verification import (
+    TranscriptVerifier,
+    WakePolicy,
+    WakeTrigger,
+    parse_policies,
+    wake_phrase,
+)
+
+AUDIO = np.zeros(16000, dtype=np.int16)
+
+
+def run(trigger: WakeTrigger, scores: list[float], model: str = "alexa") -> list[int]:
+    """Return the frames on which the trigger fired."""
+    return [i for i, score in enumerate(scores) if trigger.update({model: score}) is not None]
+
+
+class TestWakeTrigger:
+    """Tests for WakeTrigger."""
+
+    def test_default_policy_fires_on_one_frame(self) -> None:
+        assert_that(run(WakeTrigger(), [0.1, 0.9, 0.1]), equal_to([1]))
+
+    def test_score_must_persist(self) -> None:
+        trigger = WakeTrigger({"alexa": WakePolicy(0.5, persist_frames=3)})
+
+        assert_that(run(trigger, [0.9, 0.9, 0.1, 0.9, 0.9, 0.9]), equal_to([5]))
+
+    def test_smoothing_ignores_a_single_spike(self) -> None:
+        trigger = WakeTrigger({"alexa": WakePolicy(0.5, smoothing_frames=4)})
+
+        assert_that(run(trigger, [0.0, 0.0, 0.0, 1.0, 0.0]), equal_to([]))
+        assert_that(run(trigger, [0.8, 0.8, 0.8]), equal_to([1, 2]))
+
+    def test_policies_are_per_model(self) -> None:
+        trigger = WakeTrigger({"alexa": WakePolicy(0.8), "default": WakePolicy(0.3)})
+
+        assert_that(trigger.update({"alexa": 0.6, "hey_jarvis": 0.0}), is_(none()))
+        detection = trigger.update({"alexa": 0.6, "hey_jarvis": 0.4})
+        assert detection is not None
+        assert_that(detection[0], is_("hey_jarvis"))
+        assert_that(detection[1], close_to(0.4, 1e-9))
+
+    def test_reset_forgets_recent_scores(self) -> None:
+        trigger = WakeTrigger({"alexa": WakePolicy(0.5, persist_frames=2)})
+        trigger.update({"alexa": 0.9})
+        trigger.reset()
+
+        assert_that(trigger.update({"alexa": 0.9}), is_(none()))
+
+
+class TestParsePolicies:
+    """Tests for parse_policies()."""
+
+    def test_parses_models_and_default(self) -> None:
+        policies = parse_policies("alexa=0.7/4/3, default=0.5/2")
+
+        assert_that(policies["alexa"], equal_to(WakePolicy(0.7, 4, 3)))
+        assert_that(policies["default"], equal_to(WakePolicy(0.5, 2, 1)))
+
+    @pytest.mark.parametrize("spec", ["alexa", "alexa=0.5/1/1/1", "alexa=0.5/0"])
+    def test_rejects_malformed_entries(self, spec: str) -> None:
+        with pytest.raises(ValueError):
+            parse_policies(spec)
+
+
+class TestTranscriptVerifier:
+    """Tests for TranscriptVerifier."""
+
+    def test_wake_phrase_comes_from_the_model_name(self) -> None:
+        assert_that(wake_phrase("hey_jarvis_v0.1"), is_("hey jarvis"))
+
+    def test_confirms_when_the_wake_phrase_is_heard(self) -> None:
+        verifier = TranscriptVerifier(FakeTranscriber("Hey, Jervis."))
+
+        assert_that(verifier.verify("hey_jarvis", AUDIO, 16000), is_(True))
+
+    def test_rejects_other_speech(self) -> None:
+        verifier = TranscriptVerifier(FakeTranscriber("and the weather for tomorrow"))
+
+        assert_that(verifier.verify("hey_jarvis", AUDIO, 16000), is_(False))
+
+    def test_confirms_when_transcription_fails(self) -> None:
+        transcriber = FakeTranscriber()
+        transcriber.failing = True
+
+        assert_that(TranscriptVerifier(transcriber).verify("alexa", AUDIO, 16000), is_(True))